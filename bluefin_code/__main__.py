@@ -0,0 +1,5 @@
+import sys
+
+from bluefin_code.cli import main
+
+sys.exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+"""Single ``bluefin`` command for the data pipelines.
+
+Usage::
+
+    python -m bluefin_code fetch bpro --date 2024-12-06
+    python -m bluefin_code process ssim --date 2024-12-06 --force
+    python -m bluefin_code backfill nba --start 2024-11-01 --end 2024-11-07
+    python -m bluefin_code view --date 2024-12-06 --market pts
+    python -m bluefin_code stats --last 3
+    python -m bluefin_code bench --suite --scale 2
+    python -m bluefin_code backtest --start 2024-11-01 --by market --out /tmp/backtest
+    python -m bluefin_code --replay http://127.0.0.1:8765 backfill bpro --start 2024-12-01 --end 2024-12-06
+    python -m bluefin_code --progress --log-level nba_com=DEBUG backfill nba --start 2024-11-01
+
+Only argparse is imported up front. Each subcommand imports its pipeline
+modules (pandas, nba_api, requests, ...) when it runs, so ``--help`` and
+short cron invocations do not pay for every dependency.
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ['bpro', 'ssim', 'nba']
+
+# Modules each subcommand imports, timed by ``bench``
+COMMAND_MODULES = {
+    'fetch': ['bluefin_code.nba.bettingpros.fetch', 'bluefin_code.nba.ssim.fetch',
+              'bluefin_code.nba.nba_com.daily_update'],
+    'process': ['bluefin_code.nba.bettingpros.process', 'bluefin_code.nba.ssim.process'],
+    'view': ['bluefin_code.nba.dataview'],
+    'backtest': ['bluefin_code.nba.backtest'],
+}
+
+# Commands whose stage timings are written to bluefin_data/runs
+RECORDED_COMMANDS = ['fetch', 'process', 'backfill']
+
+def today() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+def date_range(start: str, end: Optional[str] = None) -> List[str]:
+    """Dates from start to end inclusive (end defaults to today)."""
+    current = datetime.strptime(start, "%Y-%m-%d")
+    last = datetime.strptime(end or today(), "%Y-%m-%d")
+    dates = []
+    while current <= last:
+        dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return dates
+
+def fetch_bpro(date: str, force: bool) -> None:
+    from bluefin_code.nba.bettingpros.fetch import create_default_config, fetch_events, fetch_sportsbook_data
+
+    config = create_default_config()
+    fetch_events(date, config, force=force)
+    for book in config.sportsbooks:
+        fetch_sportsbook_data(book, date, config, force=force)
+
+def fetch_ssim(date: str, force: bool) -> None:
+    from bluefin_code.nba import rawstore
+    from bluefin_code.nba.ssim.fetch import fetch_projections, save_raw_data
+    from bluefin_code.nba.ssim.process import get_raw_file_path
+
+    if not force and rawstore.exists(get_raw_file_path(date)):
+        logger.info(f"SaberSim projections for {date} already fetched (--force to refetch)")
+        return
+    data = fetch_projections(date)
+    if not data:
+        raise RuntimeError(f"No SaberSim projections for {date}")
+    save_raw_data(data, date)
+
+def fetch_nba(date: str, force: bool) -> None:
+    from bluefin_code.nba.nba_com.daily_update import collect_daily_data
+
+    collect_daily_data(date, force)
+
+def process_bpro(date: str, force: bool) -> None:
+    from bluefin_code.nba.bettingpros.process import get_output_dir, process_date
+
+    if not force and (get_output_dir(date) / f"{date}.csv").exists():
+        logger.info(f"BettingPros props for {date} already processed (--force to reprocess)")
+        return
+    process_date(date)
+
+def process_ssim(date: str, force: bool) -> None:
+    from bluefin_code.nba.ssim.process import process_date
+
+    process_date(date, force)
+
+def process_nba(date: str, force: bool) -> None:
+    logger.info("NBA.com data is processed as it is fetched; nothing to do")
+
+FETCHERS: Dict[str, Callable[[str, bool], None]] = {'bpro': fetch_bpro, 'ssim': fetch_ssim, 'nba': fetch_nba}
+PROCESSORS: Dict[str, Callable[[str, bool], None]] = {'bpro': process_bpro, 'ssim': process_ssim, 'nba': process_nba}
+
+def _run(pipelines: List[List[Callable[[str, bool], None]]], dates: List[str], force: bool) -> int:
+    """Run each source's pipeline for each date.
+
+    A failed step is logged and skips the rest of that source's pipeline for
+    the date (e.g. processing after a failed fetch); other sources and dates
+    continue.
+    """
+    from bluefin_code.core.instrument import stage
+    from bluefin_code.core.logs import track
+
+    failed = 0
+    # A single date leaves the progress line to the step (e.g. NBA games)
+    for date in (track(dates, 'dates') if len(dates) > 1 else dates):
+        for steps in pipelines:
+            for step in steps:
+                try:
+                    with stage(step.__name__, key=date):
+                        step(date, force)
+                except Exception as e:
+                    logger.error(f"{step.__name__} failed for {date}: {e}")
+                    failed += 1
+                    break
+    return 1 if failed else 0
+
+def cmd_fetch(args: argparse.Namespace) -> int:
+    return _run([[FETCHERS[s]] for s in args.sources], [args.date], args.force)
+
+def cmd_process(args: argparse.Namespace) -> int:
+    return _run([[PROCESSORS[s]] for s in args.sources], [args.date], args.force)
+
+def cmd_backfill(args: argparse.Namespace) -> int:
+    pipelines = [[FETCHERS[s], PROCESSORS[s]] for s in args.sources]
+    return _run(pipelines, date_range(args.start, args.end), args.force)
+
+def cmd_view(args: argparse.Namespace) -> int:
+    from bluefin_code.nba.dataview import query
+
+    df = query(args.start or args.date, args.end, players=args.player, markets=args.market,
+               books=args.book, refresh=not args.no_refresh)
+    if args.csv:
+        df.to_csv(sys.stdout, index=False)
+    else:
+        print(df.head(args.limit).to_string(index=False))
+        print(f"{len(df)} rows")
+    return 0
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    from bluefin_code.core.instrument import load_events, run_files, summarize
+
+    paths = run_files(args.runs_dir)
+    if args.run:
+        paths = [p for p in paths if p.stem.startswith(args.run)]
+    elif not args.all:
+        paths = paths[-args.last:]
+    if not paths:
+        print("No recorded runs")
+        return 1
+    events = load_events(paths)
+    for event in events:
+        if event.get('event') == 'start':
+            print(f"{event['run_id']}  {event.get('command', '')}")
+    ends = [e for e in events if e.get('event') == 'end']
+    print(f"{len(paths)} runs, {sum(e['elapsed'] for e in ends):.1f}s total\n")
+    print(summarize(events).to_string(index=False))
+    return 0
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    if args.suite:
+        from bluefin_code.nba.bench import suite
+
+        return suite.run(args)
+    for command in args.commands or COMMAND_MODULES:
+        start = time.perf_counter()
+        for module in COMMAND_MODULES.get(command, []):
+            importlib.import_module(module)
+        print(f"{command:<10} imports {time.perf_counter() - start:.3f}s")
+    return 0
+
+def cmd_backtest(args: argparse.Namespace) -> int:
+    from bluefin_code.nba.backtest import engine
+
+    return engine.run(args)
+
+def _choice(choices: List[str]) -> Callable[[str], str]:
+    """Argument type limited to choices (``choices=`` rejects an empty ``nargs='*'``)."""
+    def check(value: str) -> str:
+        if value not in choices:
+            raise argparse.ArgumentTypeError(f"invalid choice {value!r} (choose from {', '.join(choices)})")
+        return value
+    return check
+
+def add_backtest_arguments(p: argparse.ArgumentParser) -> None:
+    """Backtest options, shared with ``python -m bluefin_code.nba.backtest.engine``."""
+    p.add_argument('--start', help='First date (YYYY-MM-DD, default: all data)')
+    p.add_argument('--end', help='Last date, inclusive')
+    p.add_argument('--by', action='append', choices=['market', 'book', 'ev_bucket', 'result', 'pick'],
+                   help='Summary grouping (repeatable, default market book ev_bucket)')
+    p.add_argument('--model', choices=['bp', 'ssim'], default='bp',
+                   help='bp: BettingPros projection and probability; ssim: SaberSim distributions')
+    p.add_argument('--proj', default='bp_proj', help='Projection column that picks the side')
+    p.add_argument('--prob', default='bp_prob', help='Probability column for calibration')
+    p.add_argument('--out', help='Directory for graded.csv and report CSVs')
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='bluefin', description='Bluefin data pipelines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Debug logging')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only warnings and errors')
+    parser.add_argument('--progress', action='store_true', help='Only warnings and errors, plus one progress line')
+    parser.add_argument('--log-level', action='append', default=[], metavar='MODULE=LEVEL',
+                        help='Per-module level, e.g. nba_com=DEBUG (repeatable; also BLUEFIN_LOG_LEVELS)')
+    parser.add_argument('--replay', metavar='URL',
+                        help='Fetch from a replay server (python -m bluefin_code.nba.replay) instead of the live APIs')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_sources(p: argparse.ArgumentParser, choices: List[str]) -> None:
+        p.add_argument('sources', nargs='*', type=_choice(choices), metavar='source',
+                       help=f"{' | '.join(choices)} (default: all)")
+        p.set_defaults(all_sources=choices)
+        p.add_argument('--force', action='store_true', help='Refetch/reprocess existing data')
+
+    p = sub.add_parser('fetch', help='Fetch raw data for a date')
+    add_sources(p, SOURCES)
+    p.add_argument('--date', default=today(), help='Date (YYYY-MM-DD, default today)')
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser('process', help='Process raw data for a date')
+    add_sources(p, ['bpro', 'ssim'])
+    p.add_argument('--date', default=today(), help='Date (YYYY-MM-DD, default today)')
+    p.set_defaults(func=cmd_process)
+
+    p = sub.add_parser('backfill', help='Fetch and process a date range')
+    add_sources(p, SOURCES)
+    p.add_argument('--start', required=True, help='First date (YYYY-MM-DD)')
+    p.add_argument('--end', help='Last date, inclusive (default today)')
+    p.set_defaults(func=cmd_backfill)
+
+    p = sub.add_parser('view', help='Query the merged SaberSim + BettingPros view')
+    p.add_argument('--date', default=today(), help='Date (YYYY-MM-DD, default today)')
+    p.add_argument('--start', help='First date of a range (overrides --date)')
+    p.add_argument('--end', help='Last date of a range')
+    p.add_argument('--player', action='append', help='Player name (repeatable)')
+    p.add_argument('--market', action='append', help='Market code or name (repeatable)')
+    p.add_argument('--book', action='append', help='Book abbreviation (repeatable)')
+    p.add_argument('--no-refresh', action='store_true', help='Read existing views without rebuilding')
+    p.add_argument('--csv', action='store_true', help='Write rows as CSV')
+    p.add_argument('--limit', type=int, default=50, help='Rows to print')
+    p.set_defaults(func=cmd_view)
+
+    p = sub.add_parser('stats', help='Summarize stage timings of recorded runs')
+    p.add_argument('--last', type=int, default=1, help='Number of most recent runs (default 1)')
+    p.add_argument('--all', action='store_true', help='Every recorded run')
+    p.add_argument('--run', help='Run id (or prefix, e.g. a date 20241206)')
+    p.add_argument('--runs-dir', help='Run log directory (default bluefin_data/runs)')
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser('bench', help='Time subcommand imports, or the pipeline suite with --suite')
+    p.add_argument('commands', nargs='*', type=_choice(list(COMMAND_MODULES)), metavar='command',
+                   help=f"{' | '.join(COMMAND_MODULES)} (default: all)")
+    p.add_argument('--suite', action='store_true', help='Benchmark processing hot paths on synthetic data')
+    p.add_argument('--scale', type=float, default=1.0, help='Suite slate size; 1.0 is a 10-game night')
+    p.add_argument('--repeat', type=int, default=3, help='Suite timed runs per case')
+    p.add_argument('--seed', type=int, default=0, help='Suite synthetic data seed')
+    p.add_argument('--case', action='append', help='Only suite cases whose name contains this (repeatable)')
+    p.add_argument('--out', help='Suite results file (default bluefin_data/nba/bench/)')
+    p.add_argument('--compare', help='Earlier suite results file to compare against')
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser('backtest', help='Grade BettingPros props against NBA.com game logs')
+    add_backtest_arguments(p)
+    p.set_defaults(func=cmd_backtest)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = build_parser().parse_args(argv)
+    if getattr(args, 'sources', None) == []:
+        args.sources = args.all_sources
+    if args.replay:
+        from bluefin_code.nba.replay import replay_env
+        from bluefin_code.nba.urls import apply_nba_url
+
+        os.environ.update(replay_env(args.replay))
+        apply_nba_url()
+    from bluefin_code.core.logs import configure, parse_levels
+
+    configure(logging.DEBUG if args.verbose else logging.INFO, parse_levels(','.join(args.log_level)),
+              quiet=args.quiet, progress=args.progress)
+    if args.command not in RECORDED_COMMANDS:
+        return args.func(args)
+
+    from bluefin_code.core.instrument import end_run, start_run
+
+    start_run(' '.join(['bluefin'] + list(argv if argv is not None else sys.argv[1:])))
+    status = 'error'
+    try:
+        code = args.func(args)
+        status = 'ok' if code == 0 else 'failed'
+        return code
+    finally:
+        path = end_run(status)
+        logger.info(f"Stage timings written to {path}")
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,25 @@
+"""Stage timing instrumentation package."""
+
+from bluefin_code.core.instrument.stages import (
+    Stage,
+    stage,
+    timed,
+    start_run,
+    end_run,
+    current_run,
+    run_files,
+    load_events,
+    summarize
+)
+
+__all__ = [
+    'Stage',
+    'stage',
+    'timed',
+    'start_run',
+    'end_run',
+    'current_run',
+    'run_files',
+    'load_events',
+    'summarize'
+]
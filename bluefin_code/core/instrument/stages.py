@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""Stage timing and throughput records for pipeline runs.
+
+Wrap pipeline steps in ``stage`` (or decorate them with ``timed``) and
+fill in what is known about the step::
+
+    with stage('fetch', source='bpro', key='dk') as s:
+        response = requests.get(url, params=params)
+        s.bytes = len(response.content)
+        s.api_latency = response.elapsed.total_seconds()
+        s.rows = len(response.json()['props'])
+
+    @timed('parse', source='ssim')
+    def process_data(data): ...
+
+Between ``start_run`` and ``end_run`` every finished stage is appended as
+one JSON line to ``bluefin_data/runs/YYYY-MM/{run_id}.jsonl``; outside a
+run stages are timed and dropped. ``summarize`` aggregates the lines per
+stage and source (``bluefin stats``).
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+RUNS_DIR = DATA_ROOT / "runs"
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Stage:
+    """One timed pipeline step, written as a JSON line when it finishes."""
+    stage: str
+    source: Optional[str] = None
+    key: Optional[str] = None
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    api_latency: Optional[float] = None
+    cache_hit: Optional[bool] = None
+    elapsed: Optional[float] = None
+    status: str = 'ok'
+    error: Optional[str] = None
+    parent: Optional[str] = None
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class Run:
+    """An instrumented run and its JSONL file."""
+    run_id: str
+    command: str
+    path: Path
+    started: float = field(default_factory=time.perf_counter)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps({'run_id': self.run_id, **record}, default=str)
+        with self.lock, open(self.path, 'a') as f:
+            f.write(line + '\n')
+
+_run: Optional[Run] = None
+_current: ContextVar[Optional[Stage]] = ContextVar('bluefin_stage', default=None)
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+
+def start_run(command: str, runs_dir: Optional[Path] = None) -> Run:
+    """Start recording stages to a new JSONL file."""
+    global _run
+    now = datetime.now()
+    run_id = f"{now:%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+    path = (Path(runs_dir) if runs_dir else RUNS_DIR) / f"{now:%Y-%m}" / f"{run_id}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _run = Run(run_id, command, path)
+    _run.write({'event': 'start', 'ts': _now(), 'command': command, 'pid': os.getpid()})
+    return _run
+
+def end_run(status: str = 'ok') -> Optional[Path]:
+    """Finish the current run; returns its file."""
+    global _run
+    run, _run = _run, None
+    if run is None:
+        return None
+    run.write({'event': 'end', 'ts': _now(), 'status': status,
+               'elapsed': round(time.perf_counter() - run.started, 6)})
+    return run.path
+
+def current_run() -> Optional[Run]:
+    return _run
+
+@contextmanager
+def stage(name: str, source: Optional[str] = None, key: Optional[str] = None, **tags: Any) -> Iterator[Stage]:
+    """Time a block; set ``rows``, ``bytes``, ``api_latency`` or ``cache_hit`` on the yielded stage."""
+    parent = _current.get()
+    record = Stage(name, source if source is not None else getattr(parent, 'source', None),
+                   key if key is not None else getattr(parent, 'key', None),
+                   parent=parent.stage if parent else None, tags=tags)
+    token = _current.set(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record.status, record.error = 'error', f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record.elapsed = round(time.perf_counter() - start, 6)
+        _current.reset(token)
+        if _run is not None:
+            try:
+                _run.write({'event': 'stage', 'ts': _now(), **asdict(record)})
+            except OSError as e:
+                logger.debug(f"Could not record stage {name}: {e}")
+
+def timed(name: str, source: Optional[str] = None, **tags: Any) -> Callable:
+    """Decorator form of ``stage``; ``rows`` is taken from a sized return value."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name, source, **tags) as record:
+                result = func(*args, **kwargs)
+                if record.rows is None and hasattr(result, '__len__') and not isinstance(result, (str, bytes)):
+                    record.rows = len(result)
+                return result
+        return wrapper
+    return decorate
+
+def run_files(runs_dir: Optional[Path] = None) -> List[Path]:
+    """Run files, oldest first."""
+    base = Path(runs_dir) if runs_dir else RUNS_DIR
+    return sorted(base.glob("*/*.jsonl"), key=lambda p: p.stem)
+
+def load_events(paths: Iterable[Path]) -> List[Dict[str, Any]]:
+    """Records from run files, skipping lines cut off by a crash."""
+    events = []
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+    return events
+
+def summarize(events: List[Dict[str, Any]]):
+    """Per stage/source totals: calls, time, rows, bytes, API latency and cache hit rate."""
+    import pandas as pd
+
+    df = pd.DataFrame([e for e in events if e.get('event') == 'stage'])
+    columns = ['stage', 'source', 'calls', 'errors', 'seconds', 'mean', 'max', 'rows', 'rows_per_sec',
+               'mb', 'api_latency', 'cache_hit_rate']
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    for col in ['rows', 'bytes', 'api_latency', 'cache_hit']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['source'] = df['source'].fillna('')
+    df['failed'] = df['status'] == 'error'
+    out = df.groupby(['stage', 'source'], sort=False).agg(
+        calls=('elapsed', 'size'), errors=('failed', 'sum'), seconds=('elapsed', 'sum'),
+        mean=('elapsed', 'mean'), max=('elapsed', 'max'), rows=('rows', 'sum'),
+        bytes=('bytes', 'sum'), api_latency=('api_latency', 'mean'), cache_hit_rate=('cache_hit', 'mean'),
+    ).reset_index()
+    out['rows_per_sec'] = (out['rows'] / out['seconds'].where(out['seconds'] > 0)).round(1)
+    out['mb'] = (out['bytes'] / 1e6).round(3)
+    out = out.sort_values('seconds', ascending=False)
+    return out[columns].round({'seconds': 3, 'mean': 4, 'max': 4, 'api_latency': 4, 'cache_hit_rate': 3})
@@ -0,0 +1 @@
+"""Instrumentation tests package."""
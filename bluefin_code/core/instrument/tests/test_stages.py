@@ -0,0 +1,65 @@
+"""Test stage timing records and run summaries."""
+
+import pytest
+
+from .. import stages
+from ..stages import end_run, load_events, run_files, stage, start_run, summarize, timed
+
+@pytest.fixture
+def run(tmp_path):
+    """An active run writing under tmp_path."""
+    start_run('test', tmp_path)
+    yield tmp_path
+    end_run()
+
+def test_stages_written_to_run(run):
+    """Test nested stages, decorator row counts and failures are recorded."""
+    @timed('parse', source='bpro')
+    def parse(n):
+        return list(range(n))
+
+    with stage('fetch', source='bpro', key='dk') as s:
+        s.bytes, s.api_latency, s.cache_hit = 2048, 0.25, False
+        with stage('decode') as inner:
+            inner.rows = 3
+    parse(5)
+    with pytest.raises(ValueError):
+        with stage('write', source='ssim'):
+            raise ValueError('disk full')
+    path = end_run('ok')
+
+    events = load_events([path])
+    assert [e['event'] for e in events] == ['start', 'stage', 'stage', 'stage', 'stage', 'end']
+    decode, fetch, parsed, write = events[1:5]
+    assert (decode['stage'], decode['source'], decode['key'], decode['parent']) == ('decode', 'bpro', 'dk', 'fetch')
+    assert fetch['elapsed'] >= decode['elapsed']
+    assert parsed['rows'] == 5
+    assert (write['status'], write['error']) == ('error', 'ValueError: disk full')
+    assert run_files(run) == [path]
+
+def test_stages_outside_run_are_dropped(tmp_path):
+    """Test stages without an active run write nothing."""
+    assert stages.current_run() is None
+    with stage('fetch') as s:
+        s.rows = 1
+    assert s.elapsed is not None
+    assert run_files(tmp_path) == []
+
+def test_summarize():
+    """Test totals per stage and source."""
+    events = [
+        {'event': 'stage', 'stage': 'fetch', 'source': 'bpro', 'elapsed': 1.0, 'rows': 100, 'bytes': 1_000_000,
+         'api_latency': 0.5, 'cache_hit': False, 'status': 'ok'},
+        {'event': 'stage', 'stage': 'fetch', 'source': 'bpro', 'elapsed': 0.0, 'rows': None, 'bytes': None,
+         'api_latency': None, 'cache_hit': True, 'status': 'ok'},
+        {'event': 'stage', 'stage': 'parse', 'source': 'bpro', 'elapsed': 0.5, 'rows': 100, 'bytes': None,
+         'api_latency': None, 'cache_hit': None, 'status': 'error'},
+        {'event': 'end', 'elapsed': 2.0},
+    ]
+    df = summarize(events).set_index('stage')
+    assert df.index.tolist() == ['fetch', 'parse']
+    assert df.loc['fetch', 'calls'] == 2
+    assert df.loc['fetch', 'cache_hit_rate'] == 0.5
+    assert df.loc['fetch', 'mb'] == 1.0
+    assert df.loc['parse', 'errors'] == 1
+    assert df.loc['parse', 'rows_per_sec'] == 200
@@ -0,0 +1,15 @@
+"""Logging configuration and progress display package."""
+
+from bluefin_code.core.logs.config import (
+    configure,
+    parse_levels,
+    progress_enabled
+)
+from bluefin_code.core.logs.progress import track
+
+__all__ = [
+    'configure',
+    'parse_levels',
+    'progress_enabled',
+    'track'
+]
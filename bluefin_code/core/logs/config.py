@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""Central logging setup with per-module levels and a progress mode.
+
+Modules log through ``logging.getLogger(__name__)``; entry points call
+``configure`` once::
+
+    configure('INFO')                               # timestamped INFO lines
+    configure('INFO', {'nba_com': 'DEBUG'})         # one package at DEBUG
+    configure(quiet=True)                           # warnings and errors only
+    configure(progress=True)                        # warnings + one progress line
+
+Per-module levels can also come from ``BLUEFIN_LOG_LEVELS``, e.g.
+``nba_com=DEBUG,bettingpros.fetch=WARNING``; names without the
+``bluefin_code.`` prefix are taken relative to the package.
+
+Per-call chatter in the collectors is logged at DEBUG with %-style
+arguments, so with DEBUG off the message is never formatted.
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, Mapping, Optional, TextIO, Union
+
+FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+PACKAGE = 'bluefin_code'
+LEVELS_ENV = 'BLUEFIN_LOG_LEVELS'
+
+# Third-party loggers that are chatty at INFO/DEBUG
+QUIET_LIBRARIES = ['urllib3', 'requests', 'asyncio']
+
+_progress = False
+
+class ProgressHandler(logging.StreamHandler):
+    """Stream handler that clears an active progress line before each record."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        from bluefin_code.core.logs.progress import clear_line
+
+        clear_line(self.stream)
+        super().emit(record)
+
+def level_of(level: Union[int, str]) -> int:
+    """Logging level from a number or a name like 'debug'."""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(level.strip().upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
+
+def logger_name(module: str) -> str:
+    """Full logger name; 'nba_com' becomes 'bluefin_code.nba.nba_com'."""
+    module = module.strip()
+    if module == PACKAGE or module.startswith(PACKAGE + '.'):
+        return module
+    if module.startswith('nba.') or module == 'nba' or module.startswith('core.') or module == 'cli':
+        return f"{PACKAGE}.{module}"
+    return f"{PACKAGE}.nba.{module}"
+
+def parse_levels(spec: Optional[str]) -> Dict[str, int]:
+    """Parse 'module=LEVEL,module=LEVEL' into logger names and levels."""
+    levels = {}
+    for item in (spec or '').split(','):
+        if not item.strip():
+            continue
+        module, sep, level = item.partition('=')
+        if not sep:
+            raise ValueError(f"Expected module=LEVEL, got {item!r}")
+        levels[logger_name(module)] = level_of(level)
+    return levels
+
+def configure(level: Union[int, str] = logging.INFO,
+              modules: Optional[Mapping[str, Union[int, str]]] = None,
+              quiet: bool = False,
+              progress: bool = False,
+              stream: Optional[TextIO] = None) -> None:
+    """Set up the root handler and per-module levels.
+
+    quiet and progress raise the root level to WARNING; progress also turns
+    on the single-line progress display (``progress.track``).
+    """
+    global _progress
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    handler = ProgressHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.WARNING if quiet or progress else level_of(level))
+    for name in QUIET_LIBRARIES:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    levels = parse_levels(os.environ.get(LEVELS_ENV))
+    levels.update({logger_name(name): level_of(lvl) for name, lvl in (modules or {}).items()})
+    for name, lvl in levels.items():
+        logging.getLogger(name).setLevel(lvl)
+    _progress = progress and not quiet
+
+def progress_enabled() -> bool:
+    return _progress
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""Single-line progress display for long loops.
+
+``track`` wraps an iterable; in progress mode (``configure(progress=True)``)
+it redraws one stderr line at most every ``PROGRESS_INTERVAL`` seconds::
+
+    gamelog 2024-12-06  143/260  55%  11.8/s  eta 10s
+
+Otherwise, and inside another ``track`` loop (one line at a time), it
+yields the items untouched and logs one DEBUG summary.
+"""
+
+import logging
+import sys
+import time
+from typing import Iterable, Iterator, Optional, Sized, TextIO, TypeVar
+
+from bluefin_code.core.logs.config import progress_enabled
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_INTERVAL = 0.1
+
+T = TypeVar('T')
+
+_active: Optional[TextIO] = None
+
+def clear_line(stream: Optional[TextIO] = None) -> None:
+    """Erase the progress line so a log record starts on a clean line."""
+    if _active is not None and (stream is None or stream is _active):
+        _active.write('\r\033[K')
+
+def format_line(desc: str, done: int, total: Optional[int], elapsed: float) -> str:
+    rate = done / elapsed if elapsed > 0 else 0.0
+    parts = [desc] if desc else []
+    if total:
+        parts += [f"{done}/{total}", f"{done / total:.0%}"]
+    else:
+        parts.append(str(done))
+    parts.append(f"{rate:.1f}/s")
+    if total and rate > 0 and done < total:
+        parts.append(f"eta {(total - done) / rate:.0f}s")
+    return '  '.join(parts)
+
+def track(items: Iterable[T], desc: str = '', total: Optional[int] = None,
+          stream: Optional[TextIO] = None) -> Iterator[T]:
+    """Yield items, showing a progress line in progress mode."""
+    global _active
+    if total is None and isinstance(items, Sized):
+        total = len(items)
+    start = time.perf_counter()
+    done = 0
+    if not progress_enabled() or _active is not None:
+        for item in items:
+            yield item
+            done += 1
+        logger.debug("%s: %d items in %.1fs", desc or 'progress', done, time.perf_counter() - start)
+        return
+
+    out = stream or sys.stderr
+    outer, _active = _active, out
+    last = 0.0
+    try:
+        for item in items:
+            yield item
+            done += 1
+            now = time.perf_counter()
+            if now - last >= PROGRESS_INTERVAL:
+                last = now
+                out.write('\r\033[K' + format_line(desc, done, total, now - start))
+                out.flush()
+    finally:
+        out.write('\r\033[K' + format_line(desc, done, total, time.perf_counter() - start) + '\n')
+        out.flush()
+        _active = outer
@@ -0,0 +1 @@
+"""Logging configuration tests package."""
@@ -0,0 +1,64 @@
+"""Test logging configuration and the progress line."""
+
+import io
+import logging
+
+import pytest
+
+from bluefin_code.core.logs import config
+from bluefin_code.core.logs.config import configure, parse_levels
+from bluefin_code.core.logs.progress import track
+
+@pytest.fixture(autouse=True)
+def restore_logging(monkeypatch):
+    """Put the root logger back the way pytest had it."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    monkeypatch.delenv(config.LEVELS_ENV, raising=False)
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    for name in ['bluefin_code.nba.nba_com', 'bluefin_code.nba.bettingpros.fetch']:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    config._progress = False
+
+def test_parse_levels():
+    """Test short module names and level names."""
+    assert parse_levels('nba_com=debug, bettingpros.fetch=WARNING,') == {
+        'bluefin_code.nba.nba_com': logging.DEBUG,
+        'bluefin_code.nba.bettingpros.fetch': logging.WARNING,
+    }
+    assert parse_levels('core.instrument=INFO') == {'bluefin_code.core.instrument': logging.INFO}
+    with pytest.raises(ValueError):
+        parse_levels('nba_com')
+    with pytest.raises(ValueError):
+        parse_levels('nba_com=LOUD')
+
+def test_configure_levels(monkeypatch):
+    """Test quiet mode, module overrides and the environment variable."""
+    stream = io.StringIO()
+    monkeypatch.setenv(config.LEVELS_ENV, 'bettingpros.fetch=ERROR')
+    configure(quiet=True, modules={'nba_com': 'DEBUG'}, stream=stream)
+    logging.getLogger('bluefin_code.nba.ssim.fetch').info('hidden')
+    logging.getLogger('bluefin_code.nba.nba_com.get_game_ids').debug('shown %s', 1)
+    logging.getLogger('bluefin_code.nba.bettingpros.fetch').warning('hidden too')
+    out = stream.getvalue()
+    assert 'shown 1' in out and 'hidden' not in out
+    assert not config.progress_enabled()
+
+def test_track_progress_line():
+    """Test one redrawn line in progress mode and pass-through otherwise."""
+    stream = io.StringIO()
+    assert list(track(range(3), 'games', stream=stream)) == [0, 1, 2]
+    assert stream.getvalue() == ''
+
+    configure(progress=True, stream=stream)
+    assert list(track(range(3), 'games', stream=stream)) == [0, 1, 2]
+    final = stream.getvalue().split('\r\033[K')[-1]
+    assert final.startswith('games  3/3') and final.endswith('\n')
+
+    # Nested loops keep a single line
+    stream = io.StringIO()
+    for _ in track(range(2), 'dates', stream=stream):
+        list(track(range(5), 'games', stream=stream))
+    assert 'games' not in stream.getvalue()
@@ -0,0 +1 @@
+"""Cross-source standardization package."""
@@ -66,6 +66,37 @@ MARKET_TYPES = {
     "blocks-steals": "blocks_steals"
 }
 
+# Short market codes used in processed prop files and the merged data view
+MARKET_CODES = {
+    "pts": "pts",
+    "points": "pts",
+    "reb": "reb",
+    "rebounds": "reb",
+    "ast": "ast",
+    "assists": "ast",
+    "stl": "stl",
+    "steals": "stl",
+    "blk": "blk",
+    "blocks": "blk",
+    "to": "to",
+    "tov": "to",
+    "turnovers": "to",
+    "3pm": "3pm",
+    "threes": "3pm",
+    "threesm": "3pm",
+    "three_pointers_made": "3pm",
+    "pr": "pr",
+    "points_rebounds": "pr",
+    "pa": "pa",
+    "points_assists": "pa",
+    "ra": "ra",
+    "rebounds_assists": "ra",
+    "pra": "pra",
+    "points_rebounds_assists": "pra",
+    "stocks": "stocks",
+    "blocks_steals": "stocks",
+}
+
 def normalize_market_name(market: Union[int, str]) -> Optional[str]:
     """Convert market ID or name to standard name."""
     if isinstance(market, str):
@@ -82,4 +113,10 @@ def get_component_markets(market: str) -> list[str]:
         "points_rebounds_assists": ["points", "rebounds", "assists"],
         "blocks_steals": ["blocks", "steals"]
     }
-    return COMPONENTS.get(market, [market]) 
\ No newline at end of file
+    return COMPONENTS.get(market, [market])
+
+def normalize_market_code(market: str) -> Optional[str]:
+    """Convert a market abbreviation or name to its short code (pts, reb, 3pm, ...)."""
+    if not isinstance(market, str):
+        return None
+    return MARKET_CODES.get(market.strip().lower().replace("-", "_").replace(" ", "_"))
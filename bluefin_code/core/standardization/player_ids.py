@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+"""Cross-source player identity index.
+
+Maps every source's player name or id to one canonical NBA.com
+``player_id``. The index is seeded from ``nba_api``'s static player list;
+source-specific aliases (e.g. SaberSim ``pid``) and fuzzy-match results
+are persisted to ``bluefin_data/nba/player_index.csv`` so each miss is
+only resolved once per seed; misses are retried when the seed changes.
+"""
+
+import difflib
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from bluefin_code.core.standardization.player_names import name_key
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+
+logger = logging.getLogger(__name__)
+
+INDEX_COLUMNS = ['source', 'alias', 'player_id', 'method']
+
+# Names a source uses that no fuzzy match will find
+KNOWN_ALIASES = {
+    'Carlton Carrington': 1642267,  # Bub Carrington
+}
+
+# Minimum difflib ratio for a fuzzy name match
+FUZZY_CUTOFF = 0.88
+
+def get_index_path() -> Path:
+    """Get persisted alias file."""
+    return DATA_ROOT / "nba" / "player_index.csv"
+
+@lru_cache(maxsize=65536)
+def normalize_name(name: str) -> str:
+    """``player_names.name_key`` of a single name."""
+    return name_key(pd.Series([name])).iloc[0]
+
+class PlayerIndex:
+    """Resolve player names and source ids to NBA.com player_ids."""
+
+    def __init__(self, path: Optional[Path] = None,
+                 players: Optional[Iterable[Tuple[int, str, bool]]] = None):
+        """
+        Args:
+            path: Persisted alias file (default ``get_index_path()``)
+            players: (player_id, full_name, is_active) seed rows; defaults
+                to nba_api's static player list
+        """
+        self.path = Path(path) if path else get_index_path()
+        self.names: Dict[str, int] = {}
+        self.aliases: Dict[Tuple[str, str], Optional[int]] = {}
+        self._new = []
+        self._saved_rows = 0
+
+        if players is None:
+            from nba_api.stats.static import players as static_players
+            players = [(p['id'], p['full_name'], p['is_active'])
+                       for p in static_players.get_players()]
+        # Active players win name collisions with retired ones
+        players = sorted(players, key=lambda p: p[2])
+        keys = name_key(pd.Series([full_name for _, full_name, _ in players], dtype=object))
+        for (player_id, _, _), key in zip(players, keys):
+            self.names[key] = int(player_id)
+        for name, player_id in KNOWN_ALIASES.items():
+            self.names.setdefault(normalize_name(name), player_id)
+        self._keys = list(self.names)
+        # Misses are only valid for the seed they were searched against
+        seed = '\n'.join(f"{key}={player_id}" for key, player_id in sorted(self.names.items()))
+        self._seed = hashlib.md5(seed.encode()).hexdigest()[:8]
+        self.miss_method = f"miss:{self._seed}"
+
+        if self.path.exists():
+            saved = pd.read_csv(self.path, dtype={'source': str, 'alias': str, 'method': str}) \
+                .astype({'player_id': 'Int64'})
+            self._saved_rows = len(saved)
+            for source, alias, player_id, method in saved[INDEX_COLUMNS].itertuples(index=False):
+                if pd.isna(player_id):
+                    if method == self.miss_method:
+                        self.aliases[(source, alias)] = None
+                    else:
+                        # Searched against an older seed - resolve again
+                        self.aliases.pop((source, alias), None)
+                else:
+                    self.aliases[(source, alias)] = int(player_id)
+
+    @property
+    def dirty(self) -> bool:
+        """True when there are unsaved aliases."""
+        return bool(self._new)
+
+    @property
+    def version(self) -> str:
+        """Seed hash and persisted row count; changes whenever ``save()`` adds aliases."""
+        return f"{self._seed}:{self._saved_rows}"
+
+    def link(self, source: str, alias: str, player_id: Optional[int], method: str = 'manual') -> None:
+        """Record a source alias for a player_id (None records a known miss)."""
+        key = (source, str(alias))
+        if key in self.aliases and self.aliases[key] == player_id:
+            return
+        self.aliases[key] = player_id
+        self._new.append((source, str(alias), player_id, method))
+
+    def resolve(self, name: str, source: str = 'name') -> Optional[int]:
+        """Resolve one name (or source id) to a player_id.
+
+        Checks source aliases, then the normalized name, then falls back to
+        a fuzzy match whose result (hit or miss) is remembered.
+        """
+        if name is None or (isinstance(name, float) and pd.isna(name)):
+            return None
+        name = str(name)
+        alias = self.aliases.get((source, name), -1)
+        if alias != -1:
+            return alias
+
+        key = normalize_name(name)
+        player_id = self.names.get(key)
+        if player_id is not None:
+            return player_id
+
+        match = difflib.get_close_matches(key, self._keys, n=1, cutoff=FUZZY_CUTOFF)
+        player_id = self.names[match[0]] if match else None
+        if match:
+            logger.info(f"Fuzzy matched {name!r} to {match[0]!r} ({player_id})")
+        self.link(source, name, player_id, method='fuzzy' if match else self.miss_method)
+        return player_id
+
+    def resolve_series(self, names: pd.Series, source: str = 'name') -> pd.Series:
+        """Resolve a column of names, looking up each distinct value once."""
+        uniques = names.dropna().unique()
+        lookup = {name: self.resolve(name, source) for name in uniques}
+        return names.map(lookup).astype('Int64')
+
+    def save(self) -> None:
+        """Append new aliases to the persisted index."""
+        if not self._new:
+            return
+        new = pd.DataFrame(self._new, columns=INDEX_COLUMNS).astype({'player_id': 'Int64'})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new.to_csv(self.path, mode='a', header=not self.path.exists(), index=False)
+        logger.info(f"Saved {len(new)} player aliases to {self.path}")
+        self._saved_rows += len(new)
+        self._new = []
+
+@lru_cache(maxsize=None)
+def get_player_index() -> PlayerIndex:
+    """Shared index loaded on first use."""
+    return PlayerIndex()
@@ -1,27 +1,35 @@
 #!/usr/bin/env python3
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
+import pandas as pd
+
+# Suffixes dropped when building join keys
+SUFFIX_PATTERN = r'\s+(?:jr|sr|ii|iii|iv|v)\.?$'
+
+# Display-name suffixes removed by PlayerNameStandardizer
+DISPLAY_SUFFIX_RE = re.compile(r'\s+(?:Jr\.|Sr\.|II|III|IV)$')
+
 class PlayerNameStandardizer:
     """Standardize player names across data sources."""
     
     def __init__(self):
-        self.suffixes = {'Jr.', 'Sr.', 'II', 'III', 'IV'}
         self.nickname_map = {
             # Add known nicknames
             'Moe': 'Maurice',
             'PJ': 'P.J.',
             # Add more as needed
         }
+        # Cached per instance so repeated names skip the regex work
+        self.standardize = lru_cache(maxsize=8192)(self._standardize)
     
     def remove_suffix(self, name: str) -> str:
         """Remove suffixes like Jr., III etc."""
-        for suffix in self.suffixes:
-            name = re.sub(f' {suffix}$', '', name)
-        return name.strip()
+        return DISPLAY_SUFFIX_RE.sub('', name).strip()
     
-    def standardize(self, name: str) -> str:
+    def _standardize(self, name: str) -> str:
         """Convert name to standard format."""
         # Remove suffixes
         name = self.remove_suffix(name)
@@ -37,4 +45,24 @@ class PlayerNameStandardizer:
         """Check if two names refer to the same player."""
         std1 = self.standardize(name1)
         std2 = self.standardize(name2)
-        return std1 == std2 
\ No newline at end of file
+        return std1 == std2
+
+def name_key(names: pd.Series) -> pd.Series:
+    """Build a join key from a column of player names.
+    
+    Lowercases, strips accents, punctuation and generational suffixes so
+    "Trey Murphy III" and "Trey Murphy" share a key.
+    """
+    keys = (
+        names.fillna('').astype(str)
+        .str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore')
+        .str.decode('ascii')
+        .str.lower()
+        .str.replace(r"[.'\u2019]", '', regex=True)
+        .str.replace('-', ' ', regex=False)
+        .str.strip()
+        .str.replace(SUFFIX_PATTERN, '', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+    )
+    return keys
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
 
 class TeamStandardizer:
     """Standardize NBA team codes and names."""
@@ -21,6 +24,9 @@ class TeamStandardizer:
         'NOR': 'NOP',  # New Orleans
         'NO': 'NOP',   # New Orleans
         'GS': 'GSW',   # Golden State
+        'SA': 'SAS',   # San Antonio
+        'NY': 'NYK',   # New York
+        'UTH': 'UTA',  # Utah (BettingPros)
         'PHX': 'PHX',  # Phoenix (self-mapping for consistency)
         'NOP': 'NOP',  # New Orleans (self-mapping for consistency)
     }
@@ -106,4 +112,40 @@ class TeamStandardizer:
             return False
         std1 = self.standardize_code(team1)
         std2 = self.standardize_code(team2)
-        return std1 != std2  # Teams can't play themselves 
\ No newline at end of file
+        return std1 != std2  # Teams can't play themselves 
+
+# Shared dtype for team code columns in processed tables
+TEAM_DTYPE = pd.CategoricalDtype(sorted(TeamStandardizer.TEAM_CODES))
+
+# Upper-cased code, variation or full name -> standard code
+TEAM_LOOKUP = {
+    **{code: code for code in TeamStandardizer.TEAM_CODES},
+    **TeamStandardizer.VARIATIONS,
+    **{name.upper(): code for name, code in TeamStandardizer.NAMES_TO_CODES.items()},
+}
+
+def standardize_codes(teams: pd.Series) -> pd.Series:
+    """Map a column of team codes or names to ``TEAM_DTYPE``.
+
+    Each distinct value is normalized once and the result is broadcast
+    back through its factorized codes; unknown values become NaN.
+    """
+    if isinstance(teams.dtype, pd.CategoricalDtype) and teams.dtype == TEAM_DTYPE:
+        return teams
+    codes, uniques = pd.factorize(teams)
+    mapped = pd.Index(uniques).astype(str).str.strip().str.upper().map(TEAM_LOOKUP)
+    # Trailing -1 so missing values (factorize code -1) stay NaN
+    category_codes = np.append(pd.Categorical(mapped, dtype=TEAM_DTYPE).codes, -1)
+    return pd.Series(pd.Categorical.from_codes(category_codes[codes], dtype=TEAM_DTYPE),
+                     index=teams.index, name=teams.name)
+
+def unmapped_codes(teams: pd.Series, standardized: pd.Series) -> List[str]:
+    """Distinct non-null values in ``teams`` that ``standardize_codes`` turned into NaN."""
+    lost = teams.notna() & standardized.isna()
+    return sorted(teams[lost].astype(str).unique())
+
+def validate_matchups(teams: pd.Series, opponents: pd.Series) -> pd.Series:
+    """Column-wise matchup check: both teams known and not the same team."""
+    teams = standardize_codes(teams)
+    opponents = standardize_codes(opponents)
+    return teams.notna() & opponents.notna() & (teams.cat.codes != opponents.cat.codes)
@@ -0,0 +1 @@
+"""Standardization tests package."""
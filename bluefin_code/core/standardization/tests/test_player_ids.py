@@ -0,0 +1,65 @@
+"""Test player identity resolution and persistence."""
+
+import pytest
+import pandas as pd
+
+from ..player_ids import PlayerIndex, normalize_name
+
+PLAYERS = [
+    (201566, 'Russell Westbrook', True),
+    (1630530, 'Trey Murphy III', True),
+    (1629029, 'Luka Dončić', True),
+    (77777, 'Luka Doncic', False),
+]
+
+@pytest.fixture
+def index(tmp_path) -> PlayerIndex:
+    """Create an index persisted under a temporary directory."""
+    return PlayerIndex(tmp_path / "player_index.csv", players=PLAYERS)
+
+def test_normalize_name():
+    """Test accents, punctuation and suffixes normalize away."""
+    assert normalize_name("Luka Dončić") == 'luka doncic'
+    assert normalize_name("D'Angelo Russell") == 'dangelo russell'
+    assert normalize_name("Trey Murphy III") == 'trey murphy'
+    assert normalize_name("Karl-Anthony Towns") == 'karl anthony towns'
+
+def test_resolve(index):
+    """Test exact, suffix, active-preference and fuzzy resolution."""
+    assert index.resolve('Trey Murphy') == 1630530
+    assert index.resolve('Luka Doncic') == 1629029
+    assert not index.dirty
+
+    assert index.resolve('Russel Westbrook', source='bettingpros') == 201566
+    assert index.resolve('Nobody Here') is None
+    assert index.dirty
+
+    ids = index.resolve_series(pd.Series(['Trey Murphy', None, 'Trey Murphy']))
+    assert ids.tolist() == [1630530, pd.NA, 1630530]
+
+def test_persisted_aliases(index, tmp_path):
+    """Test fuzzy results and source links survive a reload."""
+    index.resolve('Russel Westbrook', source='bettingpros')
+    index.link('ssim_pid', 'c9b3cbbe', 1630530)
+    version = index.version
+    index.save()
+    assert not index.dirty
+    assert index.version != version
+    assert PlayerIndex(tmp_path / "player_index.csv", players=PLAYERS).version == index.version
+
+    reloaded = PlayerIndex(tmp_path / "player_index.csv", players=[])
+    assert reloaded.resolve('Russel Westbrook', source='bettingpros') == 201566
+    assert reloaded.resolve('c9b3cbbe', source='ssim_pid') == 1630530
+    assert not reloaded.dirty
+
+def test_misses_retried_after_reseed(index, tmp_path):
+    """Test a persisted miss is reused for the same seed and retried for a new one."""
+    assert index.resolve('Stephon Castle', source='ssim') is None
+    index.save()
+
+    same = PlayerIndex(tmp_path / "player_index.csv", players=PLAYERS)
+    assert same.resolve('Stephon Castle', source='ssim') is None
+    assert not same.dirty
+
+    reseeded = PlayerIndex(tmp_path / "player_index.csv", players=PLAYERS + [(1642264, 'Stephon Castle', True)])
+    assert reseeded.resolve('Stephon Castle', source='ssim') == 1642264
@@ -0,0 +1,33 @@
+"""Test vectorized team code standardization."""
+
+import numpy as np
+import pandas as pd
+
+from ..teams import TEAM_DTYPE, TeamStandardizer, standardize_codes, unmapped_codes, validate_matchups
+
+def test_standardize_codes():
+    """Test codes, variations and names map to the shared dtype."""
+    teams = pd.Series(['gs', ' NOR', 'Utah Jazz', 'PHO', None, 'XXX', np.nan], index=list('abcdefg'))
+    result = standardize_codes(teams)
+
+    assert result.dtype == TEAM_DTYPE
+    assert result.index.equals(teams.index)
+    assert result.tolist()[:4] == ['GSW', 'NOP', 'UTA', 'PHX']
+    assert result.iloc[4:].isna().all()
+
+    # Matches the scalar API and is a no-op on already standardized columns
+    scalar = TeamStandardizer()
+    assert result.iloc[0] == scalar.standardize_code('gs')
+    assert standardize_codes(result) is result
+    assert standardize_codes(pd.Series([None, None])).isna().all()
+
+def test_validate_matchups():
+    """Test column-wise matchup validation."""
+    teams = pd.Series(['GS', 'BOS', 'BOS', None])
+    opponents = pd.Series(['GSW', 'XXX', 'LAL', 'LAL'])
+    assert validate_matchups(teams, opponents).tolist() == [False, False, True, False]
+
+def test_unmapped_codes():
+    """Test only known-bad values are reported, not missing ones."""
+    raw = pd.Series(['BOS', 'XYZ', None, 'xyz ', 'Utah Jazz', 'XYZ'])
+    assert unmapped_codes(raw, standardize_codes(raw)) == ['XYZ', 'xyz ']
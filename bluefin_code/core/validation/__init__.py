@@ -0,0 +1,17 @@
+"""Schema validation package."""
+
+from bluefin_code.core.validation.schema import (
+    Schema,
+    ValidationReport,
+    load_column_schema,
+    load_yaml,
+    percentile_orderings
+)
+
+__all__ = [
+    'Schema',
+    'ValidationReport',
+    'load_column_schema',
+    'load_yaml',
+    'percentile_orderings'
+]
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""Compiled DataFrame schemas with structured validation reports."""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+
+ERROR_COLUMNS = ['check', 'column', 'severity', 'count', 'message']
+
+# YAML type names -> dtype predicate
+DTYPE_CHECKS = {
+    'str': lambda s: pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s),
+    'float': pd.api.types.is_numeric_dtype,
+    'int': pd.api.types.is_integer_dtype,
+    'bool': pd.api.types.is_bool_dtype,
+    'datetime': pd.api.types.is_datetime64_any_dtype,
+}
+
+@dataclass
+class ValidationReport:
+    """Result of validating one frame against a schema."""
+    schema: str
+    rows: int
+    errors: pd.DataFrame
+
+    @property
+    def ok(self) -> bool:
+        """True when there are no error-severity records."""
+        return not (self.errors['severity'] == 'error').any()
+
+    @property
+    def messages(self) -> List[str]:
+        return self.errors['message'].tolist()
+
+    def log(self, logger: Optional[logging.Logger] = None) -> None:
+        """Log every record at its severity."""
+        logger = logger or logging.getLogger(__name__)
+        for severity, message in zip(self.errors['severity'], self.errors['message']):
+            logger.log(logging.ERROR if severity == 'error' else logging.WARNING, message)
+
+    def raise_for_errors(self) -> None:
+        """Raise ValueError listing every error-severity record."""
+        if not self.ok:
+            errors = self.errors[self.errors['severity'] == 'error']
+            raise ValueError("; ".join(errors['message']))
+
+class Schema:
+    """DataFrame schema compiled once and reused across validations.
+
+    Args:
+        name: Schema name used in reports
+        required: Column groups that must be present, keyed by label
+            (used in the "Missing {label}" message)
+        dtypes: Expected type name per column (see ``DTYPE_CHECKS``)
+        not_null: Columns that may not contain nulls
+        allowed: Allowed values per column
+        ranges: Inclusive (min, max) bounds per column; either bound may be None
+        orderings: Column sequences that must be non-decreasing row-wise,
+            keyed by label (e.g. percentile ladders)
+        severity: Per-check severity overrides (default ``error``)
+    """
+
+    def __init__(self, name: str,
+                 required: Optional[Dict[str, Sequence[str]]] = None,
+                 dtypes: Optional[Dict[str, str]] = None,
+                 not_null: Iterable[str] = (),
+                 allowed: Optional[Dict[str, Iterable]] = None,
+                 ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+                 orderings: Optional[Dict[str, Sequence[str]]] = None,
+                 severity: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.required = {label: list(cols) for label, cols in (required or {}).items()}
+        self.dtypes = dict(dtypes or {})
+        self.not_null = list(not_null)
+        self.allowed = {col: frozenset(values) for col, values in (allowed or {}).items()}
+        self.ranges = dict(ranges or {})
+        self.orderings = {label: list(cols) for label, cols in (orderings or {}).items()}
+        self.severity = dict(severity or {})
+
+        unknown = set(self.dtypes.values()) - set(DTYPE_CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown dtypes in schema {name}: {sorted(unknown)}")
+        self._dtype_checks = {col: DTYPE_CHECKS[dtype] for col, dtype in self.dtypes.items()}
+
+    @property
+    def columns(self) -> List[str]:
+        """All columns the schema requires."""
+        return list(dict.fromkeys(col for cols in self.required.values() for col in cols))
+
+    def validate(self, df: pd.DataFrame) -> ValidationReport:
+        """Validate df and return a structured report."""
+        records = []
+
+        def add(check: str, column: Optional[str], count: int, message: str) -> None:
+            records.append((check, column, self.severity.get(check, 'error'), count, message))
+
+        present = set(df.columns)
+        for label, cols in self.required.items():
+            missing = [col for col in cols if col not in present]
+            if missing:
+                add('missing', None, len(missing), f"Missing {label}: {missing}")
+
+        for col, is_valid in self._dtype_checks.items():
+            if col in present and not is_valid(df[col]):
+                add('dtype', col, len(df),
+                    f"Invalid dtype for {col}: expected {self.dtypes[col]}, got {df[col].dtype}")
+
+        for col in self.not_null:
+            if col in present:
+                nulls = int(df[col].isna().sum())
+                if nulls:
+                    add('null', col, nulls, f"Found {nulls} null values in {col}")
+
+        for col, values in self.allowed.items():
+            if col in present:
+                invalid = ~df[col].isin(values)
+                if invalid.any():
+                    add('allowed', col, int(invalid.sum()),
+                        f"Invalid {col} values: {df.loc[invalid, col].unique().tolist()}")
+
+        range_cols = [col for col in self.ranges if col in present]
+        if range_cols:
+            values = df[range_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+            lo = np.array([np.nan if self.ranges[c][0] is None else self.ranges[c][0] for c in range_cols])
+            hi = np.array([np.nan if self.ranges[c][1] is None else self.ranges[c][1] for c in range_cols])
+            with np.errstate(invalid='ignore'):
+                out = (values < lo) | (values > hi)
+            for col, count in zip(range_cols, out.sum(axis=0)):
+                if count:
+                    low, high = self.ranges[col]
+                    add('range', col, int(count), f"{count} {col} values outside [{low}, {high}]")
+
+        # Orderings of equal length are checked together in one array pass
+        by_length = defaultdict(list)
+        for label, cols in self.orderings.items():
+            cols = [col for col in cols if col in present]
+            if len(cols) > 1:
+                by_length[len(cols)].append((label, cols))
+        for length, groups in by_length.items():
+            flat = [col for _, cols in groups for col in cols]
+            values = df[flat].to_numpy(dtype=float).reshape(len(df), len(groups), length)
+            with np.errstate(invalid='ignore'):
+                bad = (np.diff(values, axis=2) < 0).any(axis=2).sum(axis=0)
+            for (label, _), count in zip(groups, bad):
+                if count:
+                    add('ordering', label, int(count), f"Invalid percentile ordering for {label}")
+
+        errors = pd.DataFrame.from_records(records, columns=ERROR_COLUMNS)
+        return ValidationReport(self.name, len(df), errors)
+
+def percentile_orderings(columns: Iterable[str]) -> Dict[str, List[str]]:
+    """Group ``{base}_{pct}`` columns into ladders sorted by percentile."""
+    ladders = defaultdict(list)
+    for col in columns:
+        base, _, pct = col.rpartition('_')
+        if base and pct.isdigit():
+            ladders[base].append((int(pct), col))
+    return {base: [col for _, col in sorted(cols)] for base, cols in ladders.items()}
+
+@lru_cache(maxsize=None)
+def load_yaml(path: str) -> dict:
+    """Parse a YAML file once per process."""
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+@lru_cache(maxsize=None)
+def load_column_schema(path: str, name: str, required_groups: Tuple[Tuple[str, str], ...],
+                       ordering_groups: Tuple[str, ...] = ()) -> Schema:
+    """Compile a column-definition YAML (section -> {column: type}) into a Schema.
+
+    Args:
+        path: YAML file path
+        name: Schema name
+        required_groups: (section, label) pairs whose columns are required
+        ordering_groups: Sections holding ``{base}_{pct}`` percentile columns
+    """
+    spec = load_yaml(str(Path(path)))
+    required = {label: list(spec.get(section) or {}) for section, label in required_groups}
+    dtypes = {col: dtype for section, _ in required_groups
+              for col, dtype in (spec.get(section) or {}).items() if dtype in DTYPE_CHECKS}
+    orderings = {}
+    for section in ordering_groups:
+        orderings.update(percentile_orderings(spec.get(section) or {}))
+    return Schema(name, required=required, dtypes=dtypes, orderings=orderings)
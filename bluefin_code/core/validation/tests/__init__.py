@@ -0,0 +1 @@
+"""Validation tests package."""
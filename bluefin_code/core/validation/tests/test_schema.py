@@ -0,0 +1,78 @@
+"""Test compiled schema validation."""
+
+import pytest
+import pandas as pd
+
+from ..schema import Schema, load_column_schema, percentile_orderings
+
+@pytest.fixture
+def schema() -> Schema:
+    """Create a schema exercising every check."""
+    return Schema(
+        'test',
+        required={'core field': ['name', 'points']},
+        dtypes={'name': 'str', 'points': 'float'},
+        not_null=['name'],
+        allowed={'status': ['ACTIVE', 'OUT']},
+        ranges={'points': (0, 100)},
+        orderings=percentile_orderings(['pts_75', 'pts_25', 'pts_50', 'reb_25', 'reb_75']),
+        severity={'range': 'warning'},
+    )
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    """Create a frame that passes the schema."""
+    return pd.DataFrame({
+        'name': ['Player 1', 'Player 2'],
+        'points': [20.5, 25.0],
+        'status': ['ACTIVE', 'OUT'],
+        'pts_25': [15.0, 20.0],
+        'pts_50': [20.0, 25.0],
+        'pts_75': [25.0, 30.0],
+        'reb_25': [3.0, 4.0],
+        'reb_75': [6.0, 8.0],
+    })
+
+def test_valid_frame(schema, frame):
+    """Test a valid frame produces an empty report."""
+    report = schema.validate(frame)
+    assert report.ok
+    assert report.errors.empty
+    report.raise_for_errors()
+
+def test_report_records(schema, frame):
+    """Test each failing check produces one structured record."""
+    bad = frame.copy()
+    bad.loc[0, 'name'] = None
+    bad.loc[1, 'status'] = 'INVALID'
+    bad.loc[1, 'points'] = 150.0
+    bad.loc[0, 'pts_50'] = 30.0
+    errors = schema.validate(bad).errors.set_index('check')
+
+    assert errors.loc['null', 'message'] == "Found 1 null values in name"
+    assert errors.loc['allowed', 'message'] == "Invalid status values: ['INVALID']"
+    assert errors.loc['range', 'severity'] == 'warning'
+    assert errors.loc['ordering', 'column'] == 'pts'
+    assert errors.loc['ordering', 'count'] == 1
+
+    with pytest.raises(ValueError, match="Missing core field: \\['points'\\]"):
+        schema.validate(frame.drop(columns='points')).raise_for_errors()
+
+def test_empty_frame(schema, frame):
+    """Test a frame with no rows validates without errors."""
+    report = schema.validate(frame.iloc[:0])
+    assert report.ok
+    assert report.errors.empty
+
+def test_load_column_schema(tmp_path):
+    """Test YAML specs compile once and map dtypes."""
+    spec = tmp_path / "columns.yaml"
+    spec.write_text("core:\n  name: str\n  ts: datetime\npercentiles:\n  pts_25: float\n  pts_75: float\n")
+    args = (str(spec), 'yaml', (('core', 'core field'),), ('percentiles',))
+
+    schema = load_column_schema(*args)
+    assert load_column_schema(*args) is schema
+    assert schema.orderings == {'pts': ['pts_25', 'pts_75']}
+
+    report = schema.validate(pd.DataFrame({'name': ['a'], 'ts': ['2024-01-01']}))
+    assert report.messages == ["Invalid dtype for ts: expected datetime, got object"]
@@ -0,0 +1,14 @@
+"""Prop backtesting against NBA.com game logs."""
+
+from .engine import (
+    MARKET_STATS,
+    load_props,
+    load_gamelogs,
+    join_outcomes,
+    check_markets,
+    grade,
+    summarize,
+    calibration,
+    report,
+    run_backtest
+)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""Backtest player props against what actually happened.
+
+Every processed BettingPros prop is joined to the player's box score line
+from the NBA.com game logs on (``player_id``, date), with names resolved
+through the player identity index. Props are then graded in one
+vectorized pass:
+
+- ``result``: over, under, push, or void when the player did not play
+- ``pick``: the side a projection favors (BettingPros ``bp_proj`` by default)
+- ``won`` and ``profit``: per unit staked at the pick's listed odds
+
+``report`` summarizes hit rate, ROI and calibration overall and by market,
+book and EV bucket::
+
+    python -m bluefin_code.nba.backtest.engine --start 2023-10-24 --end 2024-12-31
+    python -m bluefin_code.nba.backtest.engine --start 2024-11-01 --by market --by book --out /tmp/bt
+    python -m bluefin_code.nba.backtest.engine --model ssim --start 2024-10-22
+"""
+
+import argparse
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.core.standardization.player_ids import PlayerIndex, get_player_index
+from bluefin_code.nba import sql
+from bluefin_code.nba.dataview.merge import prepare_bpro
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_DATA_DIR = DATA_ROOT / "nba"
+
+logger = logging.getLogger(__name__)
+
+# Market code -> game-log columns summed for the graded stat
+MARKET_STATS = {
+    'pts': ('points',),
+    'reb': ('rebounds',),
+    'ast': ('assists',),
+    'stl': ('steals',),
+    'blk': ('blocks',),
+    'to': ('turnovers',),
+    '3pm': ('three_pointers_made',),
+    'pr': ('points', 'rebounds'),
+    'pa': ('points', 'assists'),
+    'ra': ('rebounds', 'assists'),
+    'pra': ('points', 'rebounds', 'assists'),
+    'stocks': ('steals', 'blocks'),
+}
+
+STAT_COLUMNS = sorted({col for cols in MARKET_STATS.values() for col in cols})
+GAMELOG_COLUMNS = ['game_date', 'minutes', *STAT_COLUMNS]
+
+PROP_COLUMNS = ['date', 'player', 'player_id', 'team', 'market', 'book', 'line', 'o_odds', 'u_odds',
+                'bp_proj', 'bp_value', 'bp_prob', 'bp_rating']
+
+# Odds assumed when a book's price is missing or invalid
+DEFAULT_ODDS = -110
+
+# Expected value (BettingPros ``projected_ev``) buckets
+EV_BINS = [-np.inf, 0.0, 0.05, 0.10, 0.20, np.inf]
+EV_LABELS = ['<0', '0-5%', '5-10%', '10-20%', '20%+']
+
+# Probability buckets for calibration
+PROB_BINS = np.round(np.linspace(0.0, 1.0, 21), 2)
+
+DEFAULT_BY = ['market', 'book', 'ev_bucket']
+
+PROPS_RE = re.compile(r'^(?:props_)?(\d{4}-\d{2}-\d{2})\.csv$')
+
+def _in_range(date: str, start: Optional[str], end: Optional[str]) -> bool:
+    return (start is None or date >= start) and (end is None or date <= end)
+
+def prop_files(start: Optional[str] = None, end: Optional[str] = None,
+               root: Optional[Path] = None) -> Dict[str, Path]:
+    """Processed BettingPros file per date, preferring the full ``props_{date}.csv`` export."""
+    base = (Path(root) if root else NBA_DATA_DIR) / "bettingpros" / "processed"
+    found: Dict[str, Path] = {}
+    for path in sorted(base.glob("*/*.csv")):
+        match = PROPS_RE.match(path.name)
+        if not match or not _in_range(match.group(1), start, end):
+            continue
+        date = match.group(1)
+        if date not in found or path.name.startswith('props_'):
+            found[date] = path
+    return dict(sorted(found.items()))
+
+def load_props(start: Optional[str] = None, end: Optional[str] = None, root: Optional[Path] = None,
+               index: Optional[PlayerIndex] = None) -> pd.DataFrame:
+    """Processed props between start and end with view keys (player_id, market code, book)."""
+    frames = []
+    for date, path in prop_files(start, end, root).items():
+        df = pd.read_csv(path)
+        df['date'] = date
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=PROP_COLUMNS)
+    props = prepare_bpro(pd.concat(frames, ignore_index=True), index or get_player_index())
+    props = props[PROP_COLUMNS].reset_index(drop=True)
+    for col in ['line', 'o_odds', 'u_odds', 'bp_proj', 'bp_value', 'bp_prob']:
+        props[col] = pd.to_numeric(props[col], errors='coerce')
+    return props
+
+def load_gamelogs(start: Optional[str] = None, end: Optional[str] = None,
+                  root: Optional[Path] = None) -> pd.DataFrame:
+    """Player game logs (one row per player and game date) for seasons overlapping start..end."""
+    frames = []
+    for path in sql.files(sql.DATASETS['gamelogs'], start, end, root):
+        df = pd.read_csv(path, usecols=lambda col: col in GAMELOG_COLUMNS)
+        df['player_id'] = int(path.stem.split('_')[1])
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=['player_id', *GAMELOG_COLUMNS])
+    logs = pd.concat(frames, ignore_index=True)
+    if start:
+        logs = logs[logs['game_date'] >= start]
+    if end:
+        logs = logs[logs['game_date'] <= end]
+    return logs.drop_duplicates(['player_id', 'game_date']).reset_index(drop=True)
+
+def join_outcomes(props: pd.DataFrame, gamelogs: pd.DataFrame) -> pd.DataFrame:
+    """Add each prop's actual stat (``actual``) and ``minutes``; NaN when the player has no game."""
+    logs = gamelogs.rename(columns={'game_date': 'date'})
+    logs = logs.astype({'player_id': 'Int64'})
+    df = props.merge(logs, on=['player_id', 'date'], how='left', validate='many_to_one')
+
+    actual = np.full(len(df), np.nan)
+    market = df['market'].to_numpy()
+    for code, cols in MARKET_STATS.items():
+        mask = market == code
+        if mask.any():
+            actual[mask] = df.loc[mask, list(cols)].to_numpy(dtype=float).sum(axis=1)
+    df['actual'] = actual
+    return df.drop(columns=STAT_COLUMNS)
+
+def check_markets(joined: pd.DataFrame, tolerance: float = 2.0) -> pd.DataFrame:
+    """Median line vs median actual per market; warns where they differ by more than tolerance x.
+
+    Lines sit near the typical outcome, so a large gap means the market
+    label does not match the stat being graded (e.g. a points line filed
+    under rebounds).
+    """
+    played = joined[joined['actual'].notna()]
+    out = played.groupby('market').agg(props=('line', 'size'), line=('line', 'median'),
+                                       actual=('actual', 'median')).reset_index()
+    ratio = (out['line'] + 0.5) / (out['actual'] + 0.5)
+    out['suspect'] = (ratio > tolerance) | (ratio < 1 / tolerance)
+    for row in out[out['suspect']].itertuples():
+        logger.warning(f"Market {row.market}: median line {row.line} vs median actual {row.actual}; "
+                       f"check the market labels of the processed props")
+    return out
+
+def american_profit(odds: np.ndarray) -> np.ndarray:
+    """Profit per unit staked on a win at American odds."""
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 0, odds / 100, 100 / np.abs(odds))
+
+def grade(df: pd.DataFrame, proj_col: str = 'bp_proj', prob_col: Optional[str] = 'bp_prob',
+          over_col: Optional[str] = None) -> pd.DataFrame:
+    """Grade joined props.
+
+    Adds ``result`` (over/under/push/void), ``pick`` (side of proj_col
+    against the line, None when level), ``odds`` (the pick's price),
+    ``won`` (NaN unless decided), ``profit`` per unit, ``prob`` (the pick's
+    probability from prob_col) and ``ev_bucket``.
+
+    With over_col (a column of over probabilities) the pick is the more
+    likely side and prob its probability; proj_col and prob_col are unused.
+    """
+    df = df.copy()
+    actual, line = df['actual'].to_numpy(dtype=float), df['line'].to_numpy(dtype=float)
+    played = ~np.isnan(actual) & (df['minutes'].fillna(0).to_numpy() > 0)
+    df['result'] = np.select([~played, actual > line, actual < line], ['void', 'over', 'under'], 'push')
+
+    if over_col:
+        p_over = pd.to_numeric(df[over_col], errors='coerce').to_numpy(dtype=float)
+        df['pick'] = np.select([p_over > 0.5, p_over < 0.5], ['over', 'under'], None)
+    else:
+        proj = pd.to_numeric(df[proj_col], errors='coerce').to_numpy(dtype=float)
+        df['pick'] = np.select([proj > line, proj < line], ['over', 'under'], None)
+    has_pick = df['pick'].notna().to_numpy()
+
+    odds = np.where(df['pick'] == 'over', df['o_odds'], df['u_odds']).astype(float)
+    # Missing prices, and the 0 some books report, are not valid American odds
+    df['odds'] = np.where(np.isnan(odds) | (np.abs(odds) < 100), DEFAULT_ODDS, odds)
+
+    result = df['result'].to_numpy()
+    decided = has_pick & np.isin(result, ['over', 'under'])
+    won = decided & (df['pick'].to_numpy() == result)
+    df['won'] = np.where(decided, won.astype(float), np.nan)
+    df['profit'] = np.where(won, american_profit(df['odds']), np.where(decided, -1.0, 0.0))
+    df['staked'] = has_pick & (decided | (result == 'push'))
+
+    if over_col:
+        df['prob'] = np.where(df['pick'] == 'under', 1 - p_over, p_over)
+    else:
+        df['prob'] = pd.to_numeric(df[prob_col], errors='coerce') if prob_col else np.nan
+    df['ev_bucket'] = pd.cut(df['bp_value'], EV_BINS, labels=EV_LABELS, right=False)
+    return df
+
+def summarize(graded: pd.DataFrame, by: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Hit rate, ROI and probability error per group (overall when by is empty)."""
+    df = graded.assign(
+        decided=graded['won'].notna(),
+        push=graded['result'].eq('push') & graded['pick'].notna(),
+        over=graded['result'].eq('over'),
+        under=graded['result'].eq('under'),
+        sq_err=(graded['prob'] - graded['won']) ** 2,
+    )
+    keys = list(by or [])
+    grouped = df.groupby(keys, observed=True, sort=True) if keys else df.groupby(lambda _: 'all')
+    out = grouped.agg(
+        props=('result', 'size'), bets=('decided', 'sum'), pushes=('push', 'sum'),
+        wins=('won', 'sum'), overs=('over', 'sum'), unders=('under', 'sum'),
+        staked=('staked', 'sum'), units=('profit', 'sum'),
+        mean_prob=('prob', 'mean'), brier=('sq_err', 'mean'),
+    )
+    out['hit_rate'] = out['wins'] / out['bets'].where(out['bets'] > 0)
+    out['over_rate'] = out['overs'] / (out['overs'] + out['unders']).where(out['overs'] + out['unders'] > 0)
+    out['roi'] = out['units'] / out['staked'].where(out['staked'] > 0)
+    out = out.drop(columns=['overs', 'unders'])
+    out = out.reset_index() if keys else out.reset_index(drop=True)
+    return out.round({'units': 2, 'mean_prob': 4, 'brier': 4, 'hit_rate': 4, 'over_rate': 4, 'roi': 4})
+
+def calibration(graded: pd.DataFrame, by: Optional[Sequence[str]] = None,
+                bins: Iterable[float] = PROB_BINS) -> pd.DataFrame:
+    """Predicted vs observed hit rate per probability bucket (decided bets only)."""
+    df = graded[graded['won'].notna() & graded['prob'].notna()].copy()
+    df['prob_bucket'] = pd.cut(df['prob'], list(bins), include_lowest=True)
+    keys = [*(by or []), 'prob_bucket']
+    out = df.groupby(keys, observed=True).agg(bets=('won', 'size'), predicted=('prob', 'mean'),
+                                              observed=('won', 'mean')).reset_index()
+    out['gap'] = out['observed'] - out['predicted']
+    out['prob_bucket'] = out['prob_bucket'].astype(str)
+    return out.round({'predicted': 4, 'observed': 4, 'gap': 4})
+
+def report(graded: pd.DataFrame, by: Sequence[str] = DEFAULT_BY) -> Dict[str, pd.DataFrame]:
+    """Overall summary, one summary per grouping and the calibration table."""
+    tables = {'overall': summarize(graded)}
+    for key in by:
+        tables[key] = summarize(graded, [key])
+    tables['calibration'] = calibration(graded)
+    return tables
+
+def run_backtest(start: Optional[str] = None, end: Optional[str] = None, root: Optional[Path] = None,
+                 proj_col: str = 'bp_proj', prob_col: Optional[str] = 'bp_prob',
+                 scorer: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+                 index: Optional[PlayerIndex] = None, over_col: Optional[str] = None) -> pd.DataFrame:
+    """Load, join and grade every prop between start and end.
+
+    scorer, when given, receives the joined props and returns them with
+    extra projection/probability columns to grade by (name them with
+    proj_col and prob_col, or over_col).
+    """
+    props = load_props(start, end, root, index)
+    gamelogs = load_gamelogs(start or props['date'].min(), end or props['date'].max(), root)
+    joined = join_outcomes(props, gamelogs)
+    missing = joined['actual'].isna().sum()
+    if missing:
+        logger.info(f"{missing} of {len(joined)} props have no game log (did not play or not collected)")
+    check_markets(joined)
+    if scorer is not None:
+        joined = scorer(joined)
+    return grade(joined, proj_col, prob_col, over_col)
+
+def save_report(graded: pd.DataFrame, tables: Dict[str, pd.DataFrame], out_dir: Path) -> List[Path]:
+    """Write the graded props and report tables as CSVs."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = [out_dir / "graded.csv"]
+    graded.to_csv(paths[0], index=False)
+    for name, table in tables.items():
+        path = out_dir / f"{name}.csv"
+        table.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+def run(args: argparse.Namespace) -> int:
+    """Run a backtest from parsed arguments (shared with ``bluefin backtest``)."""
+    start_time = datetime.now()
+    if getattr(args, 'model', 'bp') == 'ssim':
+        from bluefin_code.nba.ssim.metrics.distribution import backtest_scorer
+
+        graded = run_backtest(args.start, args.end, scorer=backtest_scorer, over_col='ss_over')
+        graded = graded[graded['ss_over'].notna()].reset_index(drop=True)
+    else:
+        graded = run_backtest(args.start, args.end, proj_col=args.proj, prob_col=args.prob)
+    if graded.empty:
+        print("No props in range")
+        return 1
+    tables = report(graded, args.by or DEFAULT_BY)
+    for name, table in tables.items():
+        print(f"\n{name}\n{table.to_string(index=False)}")
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"\n{len(graded)} props {graded['date'].min()}..{graded['date'].max()} graded in {elapsed:.1f}s")
+    if args.out:
+        paths = save_report(graded, tables, Path(args.out))
+        print(f"Saved {len(paths)} files to {args.out}")
+    return 0
+
+def main() -> int:
+    """Main entry point."""
+    from bluefin_code.cli import add_backtest_arguments
+
+    parser = argparse.ArgumentParser(description='Backtest BettingPros props against game logs')
+    add_backtest_arguments(parser)
+    args = parser.parse_args()
+    configure()
+    return run(args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
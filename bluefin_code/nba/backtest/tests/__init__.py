@@ -0,0 +1 @@
+"""Backtest tests package."""
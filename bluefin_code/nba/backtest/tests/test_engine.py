@@ -0,0 +1,75 @@
+"""Test joining props to game logs and grading them."""
+
+import pandas as pd
+import pytest
+
+from .. import engine
+from bluefin_code.core.standardization.player_ids import PlayerIndex
+
+DATE = "2024-12-06"
+
+@pytest.fixture
+def nba_dir(tmp_path):
+    """A processed props file and two players' game logs."""
+    props = tmp_path / "bettingpros" / "processed" / "2024-12"
+    props.mkdir(parents=True)
+    pd.DataFrame({
+        'player': ['Nikola Jokic', 'Nikola Jokic', 'Nikola Jokic', 'Trey Murphy III', 'Jamal Murray'],
+        'team': ['DEN', 'DEN', 'DEN', 'NOP', 'DEN'],
+        'prop_type': ['pts', 'pra', 'reb', 'pts', 'pts'],
+        'line': [29.5, 50.5, 12.0, 17.5, 20.5],
+        'over_odds': [-120, 110, -110, None, -110],
+        'under_odds': [100, -130, -110, None, -110],
+        'sportsbook': ['dk', 'dk', 'fd', 'dk', 'dk'],
+        'projected_value': [31.0, 48.0, 13.0, 16.0, 22.0],
+        'projected_probability': [0.6, 0.55, 0.58, 0.52, 0.6],
+        'projected_ev': [0.08, -0.02, 0.03, 0.0, 0.15],
+    }).to_csv(props / f"props_{DATE}.csv", index=False)
+
+    logs = tmp_path / "nba_com" / "playergamelog" / "processed" / "2024-25"
+    logs.mkdir(parents=True)
+    for player_id, line in [(203999, [DATE, 36.0, 32, 12, 10, 1, 1, 3, 2]),
+                            (1630530, [DATE, 0.0, 0, 0, 0, 0, 0, 0, 0])]:
+        pd.DataFrame([line], columns=['game_date', 'minutes', 'points', 'rebounds', 'assists', 'steals',
+                                      'blocks', 'turnovers', 'three_pointers_made']
+                     ).to_csv(logs / f"gamelog_{player_id}_2024-25.csv", index=False)
+    return tmp_path
+
+@pytest.fixture
+def index(tmp_path) -> PlayerIndex:
+    return PlayerIndex(tmp_path / "player_index.csv", players=[
+        (203999, 'Nikola Jokic', True),
+        (1630530, 'Trey Murphy III', True),
+        (1627750, 'Jamal Murray', True),
+    ])
+
+def test_grades_joined_props(nba_dir, index):
+    graded = engine.run_backtest(DATE, DATE, root=nba_dir, index=index)
+    graded = graded.set_index(['player', 'market'])
+
+    jokic_pra = graded.loc[('Nikola Jokic', 'pra')]
+    assert jokic_pra['actual'] == 54
+    assert (jokic_pra['result'], jokic_pra['pick'], jokic_pra['won']) == ('over', 'under', 0.0)
+    assert jokic_pra['profit'] == -1.0
+
+    jokic_pts = graded.loc[('Nikola Jokic', 'pts')]
+    assert jokic_pts['won'] == 1.0
+    assert jokic_pts['profit'] == pytest.approx(100 / 120)
+
+    assert graded.loc[('Nikola Jokic', 'reb'), 'result'] == 'push'
+    assert pd.isna(graded.loc[('Nikola Jokic', 'reb'), 'won'])
+    # Zero minutes and no game log both void the prop
+    assert graded.loc[('Trey Murphy III', 'pts'), 'result'] == 'void'
+    assert graded.loc[('Jamal Murray', 'pts'), 'result'] == 'void'
+    assert graded['profit'].sum() == pytest.approx(100 / 120 - 1)
+
+def test_report_summaries(nba_dir, index):
+    graded = engine.run_backtest(DATE, DATE, root=nba_dir, index=index)
+    tables = engine.report(graded, by=['market'])
+
+    overall = tables['overall'].iloc[0]
+    assert (overall['props'], overall['bets'], overall['pushes'], overall['staked']) == (5, 2, 1, 3)
+    assert overall['hit_rate'] == 0.5
+    assert overall['roi'] == pytest.approx((100 / 120 - 1) / 3, abs=1e-4)
+    assert set(tables['market']['market']) == {'pts', 'pra', 'reb'}
+    assert tables['calibration']['bets'].sum() == 2
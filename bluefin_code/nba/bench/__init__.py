@@ -0,0 +1,9 @@
+"""Synthetic data and benchmarks for the pipeline hot paths."""
+
+from .suite import (
+    CASES,
+    run_suite,
+    save_results,
+    load_results,
+    compare
+)
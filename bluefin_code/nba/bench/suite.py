@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+"""Benchmark suite for the pipeline hot paths.
+
+Each case times one processing function on synthetic input (see
+``synthetic``) and the run is written to JSON so results can be compared
+across commits::
+
+    python -m bluefin_code.nba.bench.suite --scale 2 --repeat 5
+    python -m bluefin_code.nba.bench.suite --compare bluefin_data/nba/bench/<earlier>.json
+
+Inputs are built once per case, outside the timed region. Output printed
+and logged by the functions under test is suppressed while timing.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.bench import synthetic
+from bluefin_code.nba.nba_com.archive import to_frames
+from bluefin_code.nba.utils import books_config
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+RESULTS_DIR = DATA_ROOT / "nba" / "bench"
+
+logger = logging.getLogger(__name__)
+
+BENCH_DATE = '2024-12-06'
+
+@dataclass
+class Case:
+    """A timed call: ``setup(players)`` builds the input, ``run(input)`` is timed."""
+    name: str
+    setup: Callable[[pd.DataFrame], Any]
+    run: Callable[[Any], Any]
+    items: Callable[[Any], int] = len
+
+def _bpro_books(players: pd.DataFrame) -> Dict[str, Any]:
+    return {
+        'games': synthetic.bpro_games(players, BENCH_DATE),
+        'payloads': {book: synthetic.bpro_props(players, book, BENCH_DATE) for book in books_config()['sportsbooks']},
+    }
+
+def _process_books(data: Dict[str, Any]) -> int:
+    from bluefin_code.nba.bettingpros import process
+
+    records = 0
+    for book, payload in data['payloads'].items():
+        with mock.patch.object(process, 'load_book_data', return_value=payload):
+            records += len(process.process_book_data(BENCH_DATE, book, data['games']))
+    return records
+
+def _ssim_process(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from bluefin_code.nba.ssim.process import process_data
+
+    return process_data(payload)
+
+def _ssim_frame(players: pd.DataFrame) -> pd.DataFrame:
+    from bluefin_code.nba.ssim.process import process_data
+
+    df = pd.DataFrame(process_data(synthetic.ssim_payload(players, BENCH_DATE)))
+    return df.assign(status='ACTIVE', version='2.0')
+
+def _analysis_input(players: pd.DataFrame) -> tuple:
+    props = synthetic.props_frame(players, BENCH_DATE, books=['dk'])
+    return _ssim_frame(players), props
+
+def _analyze(data: tuple) -> None:
+    from bluefin_code.nba.ssim.metrics.analysis import analyze_all_props
+
+    analyze_all_props(*data)
+
+def _sim_input(players: pd.DataFrame) -> tuple:
+    from bluefin_code.nba.ssim.metrics.simulate import SSIM_COLUMNS
+
+    props = synthetic.props_frame(players, BENCH_DATE, books=['dk']).rename(columns={'prop_type': 'market'})
+    means = players.set_index('player_id')[list(SSIM_COLUMNS.values())]
+    return props, means.rename(columns={v: k for k, v in SSIM_COLUMNS.items()})
+
+def _simulate(data: tuple) -> pd.DataFrame:
+    from bluefin_code.nba.ssim.metrics.simulate import SimModel, over_probabilities
+
+    return over_probabilities(*data, SimModel.independent())
+
+def _validation_frame(players: pd.DataFrame) -> pd.DataFrame:
+    return synthetic.validation_frame(synthetic.props_frame(players, BENCH_DATE))
+
+def _bpro_check(name: str) -> Callable[[pd.DataFrame], Any]:
+    def run(df: pd.DataFrame) -> Any:
+        from bluefin_code.nba.bettingpros import validate
+        return getattr(validate, name)(df)
+    return run
+
+def _ssim_check(name: str) -> Callable[[pd.DataFrame], Any]:
+    def run(df: pd.DataFrame) -> Any:
+        from bluefin_code.nba.ssim import validate
+        return getattr(validate, name)(df)
+    return run
+
+def _nba_frames(endpoint: str) -> Callable[[pd.DataFrame], List[Dict[str, pd.DataFrame]]]:
+    """Result-set frames per game, as ``archive.fetch_frames`` returns them."""
+    def setup(players: pd.DataFrame) -> List[Dict[str, pd.DataFrame]]:
+        return [to_frames(synthetic.nba_response(endpoint, players, game_id, BENCH_DATE))
+                for game_id in players['game_id'].unique()]
+    return setup
+
+def _gamelogs(players: pd.DataFrame) -> List[pd.DataFrame]:
+    """A season log per starter."""
+    starters = players[players['starter']]
+    return [to_frames(synthetic.nba_response('playergamelog', starters.iloc[[i]], game_id, BENCH_DATE))['PlayerGameLog']
+            for i, game_id in enumerate(starters['game_id'])]
+
+def _each(process: Callable[[Any], Any], pick: Callable[[Dict[str, pd.DataFrame]], Any]) -> Callable[[List], int]:
+    def run(games: List[Dict[str, pd.DataFrame]]) -> int:
+        return sum(1 for frames in games if process(pick(frames)) is not None)
+    return run
+
+def _collector(endpoint: str, function: str) -> Callable[[Any], Any]:
+    def process(data: Any) -> Any:
+        module = importlib.import_module(f"bluefin_code.nba.nba_com.{endpoint}.collector")
+        return getattr(module, function)(data)
+    return process
+
+def _rows(games: List[Dict[str, pd.DataFrame]]) -> int:
+    return sum(len(frame) for frames in games for frame in frames.values())
+
+CASES = [
+    Case('bettingpros.process_book_data', _bpro_books, _process_books,
+         lambda d: sum(len(p['props']) for p in d['payloads'].values())),
+    Case('ssim.process_data', lambda players: synthetic.ssim_payload(players, BENCH_DATE),
+         _ssim_process, lambda payload: len(payload['players'])),
+    Case('ssim.analyze_all_props', _analysis_input, _analyze, lambda d: len(d[1])),
+    Case('ssim.simulate.over_probabilities', _sim_input, _simulate, lambda d: len(d[0])),
+    Case('bettingpros.check_game_data', _validation_frame, _bpro_check('check_game_data')),
+    Case('bettingpros.check_player_data', _validation_frame, _bpro_check('check_player_data')),
+    Case('bettingpros.validate_output', _validation_frame, _bpro_check('validate_output')),
+    Case('ssim.check_raw_data', _ssim_frame, _ssim_check('check_raw_data')),
+    Case('ssim.check_player_data', _ssim_frame, _ssim_check('check_player_data')),
+    Case('ssim.check_output_format', _ssim_frame, _ssim_check('check_output_format')),
+    Case('nba_com.process_advanced_stats', _nba_frames('boxscoreadvancedv2'),
+         _each(_collector('boxscoreadvancedv2', 'process_advanced_stats'), lambda f: f['PlayerStats']), _rows),
+    Case('nba_com.process_four_factors_stats', _nba_frames('boxscorefourfactorsv2'),
+         _each(_collector('boxscorefourfactorsv2', 'process_four_factors_stats'),
+               lambda f: f['sqlPlayersFourFactors']), _rows),
+    Case('nba_com.process_scoring_stats', _nba_frames('boxscorescoringv2'),
+         _each(_collector('boxscorescoringv2', 'process_scoring_stats'), lambda f: f['sqlPlayersScoring']), _rows),
+    Case('nba_com.process_usage_stats', _nba_frames('boxscoreusagev2'),
+         _each(_collector('boxscoreusagev2', 'process_usage_stats'), lambda f: f['sqlPlayersUsage']), _rows),
+    Case('nba_com.process_summary_stats', _nba_frames('boxscoresummaryv2'),
+         _each(_collector('boxscoresummaryv2', 'process_summary_stats'),
+               lambda f: {'summary': f['GameSummary'], 'line': f['LineScore']}), _rows),
+    Case('nba_com.process_rotation_stats', _nba_frames('gamerotation'),
+         _each(_collector('gamerotation', 'process_rotation_stats'),
+               lambda f: {'home': f['HomeTeam'], 'away': f['AwayTeam']}), _rows),
+    Case('nba_com.process_gamelog', _gamelogs,
+         _each(_collector('playergamelog', 'process_gamelog'), lambda df: df),
+         lambda logs: sum(len(df) for df in logs)),
+]
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence stdout and INFO/WARNING logging from the code under test."""
+    logging.disable(logging.WARNING)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def time_case(case: Case, players: pd.DataFrame, repeat: int = 3) -> Dict[str, Any]:
+    """Time a case ``repeat`` times on one input."""
+    with _quiet():
+        data = case.setup(players)
+        case.run(data)  # warm-up: imports, caches
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case.run(data)
+            runs.append(time.perf_counter() - start)
+    items = case.items(data)
+    best = min(runs)
+    return {
+        'items': items,
+        'best': round(best, 6),
+        'median': round(statistics.median(runs), 6),
+        'runs': [round(r, 6) for r in runs],
+        'items_per_sec': round(items / best, 1) if best > 0 else None,
+    }
+
+def git_commit() -> Optional[str]:
+    """Short hash of HEAD, or None outside a git checkout."""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+def run_suite(scale: float = 1.0, repeat: int = 3, seed: int = 0,
+              cases: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run the benchmark cases (all, or those whose name contains any of ``cases``)."""
+    players = synthetic.slate(scale, seed)
+    results = {}
+    for case in CASES:
+        if cases and not any(pattern in case.name for pattern in cases):
+            continue
+        results[case.name] = time_case(case, players, repeat)
+        logger.info(f"{case.name:<40} {results[case.name]['best']:.4f}s ({results[case.name]['items']} items)")
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'scale': scale,
+        'players': len(players),
+        'repeat': repeat,
+        'seed': seed,
+        'cases': results,
+    }
+
+def save_results(results: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    """Write results to JSON (default ``bluefin_data/nba/bench/{timestamp}_{commit}.json``)."""
+    if path is None:
+        stamp = results['timestamp'].replace(':', '').replace('-', '')
+        path = RESULTS_DIR / f"{stamp}_{results['commit'] or 'nogit'}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> pd.DataFrame:
+    """Best times per case in two runs; ``ratio`` > 1 means new is slower."""
+    names = [name for name in new['cases'] if name in old['cases']]
+    df = pd.DataFrame({
+        'case': names,
+        'old': [old['cases'][name]['best'] for name in names],
+        'new': [new['cases'][name]['best'] for name in names],
+    })
+    df['ratio'] = (df['new'] / df['old']).round(3)
+    return df
+
+def format_results(results: Dict[str, Any]) -> str:
+    rows = [{'case': name, 'items': r['items'], 'best': r['best'], 'median': r['median'],
+             'items/s': r['items_per_sec']} for name, r in results['cases'].items()]
+    header = f"commit {results['commit']}  scale {results['scale']}  players {results['players']}  repeat {results['repeat']}"
+    return header + "\n" + pd.DataFrame(rows).to_string(index=False)
+
+def run(args: argparse.Namespace) -> int:
+    """Run the suite from parsed arguments (shared with ``bluefin bench --suite``)."""
+    results = run_suite(args.scale, args.repeat, args.seed, args.case)
+    path = save_results(results, args.out)
+    print(format_results(results))
+    print(f"Saved results to {path}")
+    if args.compare:
+        print(compare(load_results(args.compare), results).to_string(index=False))
+    return 0
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark pipeline hot paths on synthetic data')
+    parser.add_argument('--scale', type=float, default=1.0, help='Slate size; 1.0 is a 10-game night')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic data seed')
+    parser.add_argument('--case', action='append', help='Only cases whose name contains this (repeatable)')
+    parser.add_argument('--out', type=Path, help='Results file (default bluefin_data/nba/bench/)')
+    parser.add_argument('--compare', type=Path, help='Earlier results file to compare against')
+    args = parser.parse_args()
+    configure()
+    return run(args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+"""Synthetic payloads shaped like the real sources.
+
+Everything is built from a seeded ``slate``: one row per player with a
+team, opponent, game id and projected stat means. ``scale=1`` is a typical
+10-game night (~260 players); larger scales add games, and teams repeat
+once a slate has more than 15 games. From the slate:
+
+- ``bpro_props`` / ``bpro_games``: a BettingPros ``{date}_{book}.json``
+  payload and the team -> game mapping ``process_book_data`` takes
+- ``ssim_payload``: a SaberSim ``NBA_{date}_raw.json`` payload
+- ``props_frame`` / ``validation_frame``: processed props and the
+  ``plyr``/``mkt_type`` frame the BettingPros validators check
+- ``nba_response``: an nba_api ``get_dict()`` response for an endpoint and
+  game, with every result set and the endpoint's real headers
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from nba_api.stats.endpoints import (
+    boxscoreadvancedv2, boxscorefourfactorsv2, boxscorescoringv2, boxscoresummaryv2,
+    boxscoreusagev2, gamerotation, playergamelog,
+)
+from nba_api.stats.static import teams as nba_teams
+
+from bluefin_code.nba.utils import books_config, markets_config
+
+SLATE_GAMES = 10
+ROSTER_SIZE = 13
+SEASON = '2024-25'
+
+FIRST_NAMES = ['James', 'Anthony', 'Jalen', 'Tyrese', 'Jaylen', 'Devin', 'Marcus', 'Kevin', 'Luka',
+               'Nikola', 'Josh', 'Scottie', 'Tyler', 'Derrick', 'Mikal', 'Desmond', 'Cameron',
+               'Isaiah', 'Jordan', 'Brandon', 'Trey', 'Keegan', 'Aaron', 'Franz', 'Paolo']
+LAST_NAMES = ['Williams', 'Johnson', 'Brown', 'Jones', 'Davis', 'Miller', 'Wilson', 'Moore', 'Taylor',
+              'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson', 'Robinson', 'Clark',
+              'Lewis', 'Walker', 'Allen', 'Young', 'King', 'Wright', 'Green', 'Adams', 'Baker',
+              'Nelson', 'Carter', 'Mitchell', 'Roberts']
+POSITIONS = ['G', 'G', 'F', 'F', 'C']
+
+# Per-minute stat rates (low, high) for slate players
+RATES = {
+    'points': (0.25, 0.85),
+    'rebounds': (0.08, 0.40),
+    'assists': (0.03, 0.30),
+    'steals': (0.01, 0.05),
+    'blocks': (0.005, 0.08),
+    'turnovers': (0.02, 0.10),
+    'three_pt_fg': (0.0, 0.12),
+}
+
+# nba_api endpoint classes by collector directory
+ENDPOINTS = {
+    'boxscoreadvancedv2': boxscoreadvancedv2.BoxScoreAdvancedV2,
+    'boxscorefourfactorsv2': boxscorefourfactorsv2.BoxScoreFourFactorsV2,
+    'boxscorescoringv2': boxscorescoringv2.BoxScoreScoringV2,
+    'boxscoreusagev2': boxscoreusagev2.BoxScoreUsageV2,
+    'boxscoresummaryv2': boxscoresummaryv2.BoxScoreSummaryV2,
+    'gamerotation': gamerotation.GameRotation,
+    'playergamelog': playergamelog.PlayerGameLog,
+}
+
+def player_name(i: int) -> str:
+    """Unique synthetic player name for index i."""
+    first, rest = FIRST_NAMES[i % len(FIRST_NAMES)], i // len(FIRST_NAMES)
+    name = f"{first} {LAST_NAMES[rest % len(LAST_NAMES)]}"
+    suffix = rest // len(LAST_NAMES)
+    return f"{name} {suffix + 1}" if suffix else name
+
+def game_count(scale: float) -> int:
+    return max(int(round(SLATE_GAMES * scale)), 1)
+
+def slate(scale: float = 1.0, seed: int = 0) -> pd.DataFrame:
+    """Players for a synthetic slate, one row per player."""
+    rng = np.random.default_rng(seed)
+    league = nba_teams.get_teams()
+    games = game_count(scale)
+    rows = []
+    for g in range(games):
+        home, away = league[(2 * g) % len(league)], league[(2 * g + 1) % len(league)]
+        game_id = f"00224{g + 1:05d}"
+        for team, opp, is_home in [(home, away, True), (away, home, False)]:
+            for slot in range(ROSTER_SIZE):
+                rows.append({
+                    'game_id': game_id,
+                    'team_id': team['id'],
+                    'team': team['abbreviation'],
+                    'team_city': team['city'],
+                    'team_name': team['nickname'],
+                    'opponent': opp['abbreviation'],
+                    'is_home': is_home,
+                    'position': POSITIONS[slot % len(POSITIONS)],
+                    'starter': slot < 5,
+                })
+    df = pd.DataFrame(rows)
+    n = len(df)
+    df.insert(0, 'player_id', 1630000 + np.arange(n))
+    df.insert(1, 'player', [player_name(i) for i in range(n)])
+    # Starters play ~34 minutes, the bench tapers off to garbage time
+    df['minutes'] = np.where(df['starter'], rng.uniform(28, 38, n), rng.uniform(4, 26, n)).round(2)
+    for stat, (lo, hi) in RATES.items():
+        df[stat] = (df['minutes'] * rng.uniform(lo, hi, n)).round(3)
+    return df
+
+def bpro_games(players: pd.DataFrame, date: str) -> Dict[str, Dict[str, Any]]:
+    """Team -> game mapping in the shape ``load_events`` returns."""
+    teams = players.drop_duplicates('team')
+    return {
+        row.team: {'opponent': row.opponent, 'is_home': bool(row.is_home), 'scheduled': f"{date} 19:00:00"}
+        for row in teams.itertuples(index=False)
+    }
+
+def _market_means(players: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Projected mean per market abbreviation (combos summed)."""
+    p, r, a = players['points'].to_numpy(), players['rebounds'].to_numpy(), players['assists'].to_numpy()
+    return {
+        'pts': p, 'reb': r, 'ast': a, 'pra': p + r + a, 'pr': p + r, 'pa': p + a,
+        'stl': players['steals'].to_numpy(), 'blk': players['blocks'].to_numpy(),
+        '3pm': players['three_pt_fg'].to_numpy(), 'to': players['turnovers'].to_numpy(),
+        'stocks': (players['steals'] + players['blocks']).to_numpy(),
+    }
+
+def _american(prob: np.ndarray) -> np.ndarray:
+    """American odds for win probabilities (vig included by the caller)."""
+    return np.where(prob >= 0.5, -100 * prob / (1 - prob), 100 * (1 - prob) / prob).round().astype(int)
+
+def prop_rows(players: pd.DataFrame, book: str, seed: int = 0) -> pd.DataFrame:
+    """Flat prop rows for one book: players with 15+ minutes x every market."""
+    rng = np.random.default_rng([seed, sum(map(ord, book))])
+    listed = players[players['minutes'] >= 15].reset_index(drop=True)
+    means = _market_means(listed)
+    book_id = int(books_config()['sportsbooks'][book]['book_id'])
+    frames = []
+    for market in markets_config()['markets'].values():
+        mean = means[market['abbreviation']]
+        n = len(mean)
+        line = np.maximum(np.round(mean * rng.normal(1, 0.05, n) * 2) / 2, 0.5)
+        line = np.where(line % 1 == 0, line + 0.5, line)
+        over_prob = np.clip(rng.normal(0.52, 0.03, n), 0.3, 0.7)
+        projected = (mean * rng.normal(1, 0.08, n)).round(1)
+        frames.append(pd.DataFrame({
+            'player': listed['player'], 'team': listed['team'], 'opponent': listed['opponent'],
+            'game_id': listed['game_id'], 'player_id': listed['player_id'],
+            'position': listed['position'], 'market_id': int(market['market_id']),
+            'prop_type': market['abbreviation'], 'sportsbook': book, 'book_id': book_id,
+            'line': line, 'over_odds': _american(over_prob), 'under_odds': _american(1.05 - over_prob),
+            'projected_value': projected,
+            'projected_probability': np.clip(rng.normal(0.55, 0.08, n), 0.05, 0.95),
+            'projected_ev': rng.normal(0.05, 0.12, n),
+            'bet_rating': rng.integers(1, 6, n),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+def bpro_props(players: pd.DataFrame, book: str, date: str, seed: int = 0) -> Dict[str, Any]:
+    """BettingPros props payload for one book, as saved by ``fetch``."""
+    rows = prop_rows(players, book, seed)
+    props = []
+    for row in rows.to_dict('records'):
+        first, last = row['player'].split(' ', 1)
+        side = 'over' if row['projected_value'] >= row['line'] else 'under'
+        props.append({
+            'sport': 'NBA',
+            'market_id': row['market_id'],
+            'event_id': int(row['game_id'][-5:]),
+            'participant': {
+                'id': str(row['player_id']),
+                'name': row['player'],
+                'player': {'first_name': first, 'last_name': last, 'position': row['position'],
+                           'team': row['team'], 'slug': row['player'].lower().replace(' ', '-')},
+            },
+            'over': {'line': row['line'], 'odds': row['over_odds'], 'book': row['book_id'],
+                     'consensus_line': row['line'], 'consensus_odds': row['over_odds']},
+            'under': {'line': row['line'], 'odds': row['under_odds'], 'book': row['book_id'],
+                      'consensus_line': row['line'], 'consensus_odds': row['under_odds']},
+            'projection': {'recommended_side': side, 'value': row['projected_value'],
+                           'probability': row['projected_probability'],
+                           'expected_value': row['projected_ev'], 'bet_rating': row['bet_rating'],
+                           'diff': round(row['projected_value'] - row['line'], 1)},
+        })
+    return {'props': props, 'ts': f"{date}T12:00:00", '_parameters': {'date': date, 'book_id': book}}
+
+def props_frame(players: pd.DataFrame, date: str, books: Optional[List[str]] = None,
+                seed: int = 0) -> pd.DataFrame:
+    """Processed props (``props_{date}.csv`` columns) across books."""
+    books = books or list(books_config()['sportsbooks'])
+    df = pd.concat([prop_rows(players, book, seed) for book in books], ignore_index=True)
+    df['game_date'] = date
+    return df
+
+def validation_frame(props: pd.DataFrame) -> pd.DataFrame:
+    """Props renamed to the columns the BettingPros validators check."""
+    df = props.rename(columns={'player': 'plyr', 'market_id': 'mkt_type', 'over_odds': 'o_odds',
+                               'under_odds': 'u_odds', 'sportsbook': 'book'})
+    df['book_id'] = df['book_id'].astype(str)
+    df['ts'] = pd.Timestamp(props['game_date'].iloc[0])
+    df['source'] = 'bettingpros'
+    return df
+
+def ssim_payload(players: pd.DataFrame, date: str, seed: int = 0) -> Dict[str, Any]:
+    """SaberSim projections payload, as saved by ``fetch``."""
+    rng = np.random.default_rng(seed)
+    n = len(players)
+    threes = players['three_pt_fg'].to_numpy()
+    three_att = threes * rng.uniform(2.4, 3.2, n)
+    fta = players['points'].to_numpy() * rng.uniform(0.1, 0.3, n)
+    ftm = fta * rng.uniform(0.65, 0.9, n)
+    two_fg = np.maximum((players['points'].to_numpy() - 3 * threes - ftm) / 2, 0)
+    dk = (players['points'] + 1.25 * players['rebounds'] + 1.5 * players['assists']
+          + 2 * (players['steals'] + players['blocks']) - 0.5 * players['turnovers']).to_numpy()
+    dk_std = dk * rng.uniform(0.3, 0.45, n)
+    z = {25: -0.674, 50: 0.0, 75: 0.674, 85: 1.036, 95: 1.645, 99: 2.326}
+
+    records = players.assign(
+        three_pt_attempts=three_att, two_pt_fg=two_fg, two_pt_attempts=two_fg * rng.uniform(1.7, 2.2, n),
+        free_throws_made=ftm, free_throw_attempts=fta,
+        offensive_rebounds=players['rebounds'] * 0.25, defensive_rebounds=players['rebounds'] * 0.75,
+        fouls=rng.uniform(1, 4, n), possessions=players['minutes'] * 2.0,
+        dk_points=dk, dk_std=dk_std, price=(3000 + dk * 180).round(-2).astype(int),
+        proj_own=rng.uniform(0, 0.4, n), double_doubles=rng.uniform(0, 0.4, n),
+        triple_doubles=rng.uniform(0, 0.05, n),
+        **{f"dk_{p}_percentile": np.maximum(dk + zs * dk_std, 0).round(2) for p, zs in z.items()},
+    ).round(5)
+
+    out = []
+    for player in records.to_dict('records'):
+        player['opp'] = player.pop('opponent')
+        player['name'] = player.pop('player')
+        player['roster_pos'] = player['position']
+        player['pid'] = str(player.pop('player_id'))
+        player['gid'] = player.pop('game_id')
+        player.update({'value': player['dk_points'] / player['price'] * 1000, 'injury': '',
+                       'injury_notes': '', 'injury_confirmed': False, 'confirmed': True,
+                       'site': 'dk', 'slate': 'main', 'num_games': 3000, 'date': date.replace('-', '')})
+        for key in ['team_id', 'team_city', 'team_name', 'is_home', 'starter']:
+            player.pop(key)
+        out.append(player)
+    timestamp = str(int(pd.Timestamp(date).timestamp() * 1000))
+    return {
+        'players': out,
+        'timestamp': timestamp,
+        'metadata': {'date': date, 'num_players': len(out), 'version': '2.0', 'source': 'sabersim',
+                     'sport': 'nba'},
+    }
+
+def _clock(minutes: np.ndarray) -> List[str]:
+    whole = minutes.astype(int)
+    return [f"{m}:{s:02d}" for m, s in zip(whole, ((minutes - whole) * 60).astype(int))]
+
+def _fill(headers: List[str], rows: pd.DataFrame, rng: np.random.Generator, date: str) -> List[List[Any]]:
+    """Row set for headers, taking known columns from rows and filling the rest."""
+    n = len(rows)
+    last = rows['player'].str.split(' ', n=1).str[1] if 'player' in rows else None
+    known = {
+        'GAME_ID': rows['game_id'], 'Game_ID': rows['game_id'],
+        'TEAM_ID': rows['team_id'], 'TEAM_ABBREVIATION': rows['team'],
+        'TEAM_CITY': rows['team_city'], 'TEAM_CITY_NAME': rows['team_city'],
+        'TEAM_NAME': rows['team_name'], 'TEAM_NICKNAME': rows['team_name'],
+        'GAME_DATE_EST': pd.Series([f"{date}T00:00:00"] * n),
+        'GAME_DATE': pd.Series([pd.Timestamp(date).strftime('%b %d, %Y').upper()] * n),
+        'SEASON': pd.Series([SEASON[:4]] * n), 'SEASON_ID': pd.Series([f"2{SEASON[:4]}"] * n),
+        'GAME_STATUS_TEXT': pd.Series(['Final'] * n), 'GAMECODE': pd.Series([date.replace('-', '')] * n),
+        'TEAM_WINS_LOSSES': pd.Series(['10-5'] * n),
+    }
+    if 'player' in rows:
+        known.update({
+            'PLAYER_ID': rows['player_id'], 'PERSON_ID': rows['player_id'], 'Player_ID': rows['player_id'],
+            'PLAYER_NAME': rows['player'], 'PLAYER_FIRST': rows['player'].str.split(' ').str[0],
+            'PLAYER_LAST': last, 'START_POSITION': rows['position'].where(rows['starter'], ''),
+            'COMMENT': pd.Series([''] * n), 'MIN': pd.Series(_clock(rows['minutes'].to_numpy())),
+            'PTS': rows['points'].round().astype(int),
+            'MATCHUP': rows['team'] + np.where(rows['is_home'], ' vs. ', ' @ ') + rows['opponent'],
+            'WL': pd.Series(rng.choice(['W', 'L'], n)),
+        })
+    columns = []
+    for header in headers:
+        if header in known:
+            columns.append(pd.Series(known[header]).tolist())
+        elif 'PCT' in header or 'RATE' in header or header in ('PIE', 'AST_RATIO'):
+            columns.append(rng.uniform(0, 1, n).round(3).tolist())
+        else:
+            columns.append(rng.integers(0, 40, n).tolist())
+    return [list(row) for row in zip(*columns)]
+
+def _stints(players: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """Two or three rotation stints per player (IN/OUT_TIME_REAL in tenths of a second)."""
+    stints = players.loc[players.index.repeat(rng.integers(2, 4, len(players)))].reset_index(drop=True)
+    start = rng.integers(0, 24000, len(stints))
+    stints['IN_TIME_REAL'] = start
+    stints['OUT_TIME_REAL'] = np.minimum(start + rng.integers(1200, 7200, len(stints)), 28800)
+    return stints
+
+def nba_response(endpoint: str, players: pd.DataFrame, game_id: str, date: str,
+                 seed: int = 0, games: int = 82) -> Dict[str, Any]:
+    """nba_api ``get_dict()`` response for one game (or, for playergamelog, one player).
+
+    Player result sets get a row per player in the game, team result sets a
+    row per team and game-level sets a single row. ``playergamelog`` takes
+    the first player of ``players`` and returns ``games`` rows.
+    """
+    rng = np.random.default_rng([seed, int(game_id)])
+    game = players[players['game_id'] == game_id].reset_index(drop=True)
+    team_rows = game.drop_duplicates('team').drop(columns=['player']).reset_index(drop=True)
+    result_sets = []
+    for name, headers in ENDPOINTS[endpoint].expected_data.items():
+        if endpoint == 'playergamelog':
+            log = players.iloc[[0] * games].reset_index(drop=True)
+            log['game_id'] = [f"00224{i + 1:05d}" for i in range(games)]
+            log['minutes'] = rng.uniform(10, 40, games)
+            rows = _fill(headers, log, rng, date)
+        elif endpoint == 'gamerotation':
+            side = game[game['is_home'] == (name == 'HomeTeam')].reset_index(drop=True)
+            stints = _stints(side, rng)
+            rows = _fill(headers, stints, rng, date)
+            for row, (t_in, t_out) in zip(rows, stints[['IN_TIME_REAL', 'OUT_TIME_REAL']].to_numpy()):
+                row[headers.index('IN_TIME_REAL')], row[headers.index('OUT_TIME_REAL')] = int(t_in), int(t_out)
+        elif 'Player' in name:
+            rows = _fill(headers, game, rng, date)
+        elif 'Team' in name or name == 'LineScore':
+            rows = _fill(headers, team_rows, rng, date)
+        else:
+            rows = _fill(headers, team_rows.iloc[:1].reset_index(drop=True), rng, date)
+        result_sets.append({'name': name, 'headers': headers, 'rowSet': rows})
+    return {'resource': endpoint, 'parameters': {'GameID': game_id}, 'resultSets': result_sets}
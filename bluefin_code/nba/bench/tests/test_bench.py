@@ -0,0 +1,50 @@
+"""Test synthetic payloads and the benchmark suite."""
+
+import json
+from unittest import mock
+
+from .. import synthetic
+from ..suite import compare, run_suite, save_results, load_results
+from ...bettingpros import process
+from ...nba_com.archive import to_frames
+from ...nba_com.boxscoreadvancedv2.collector import process_advanced_stats
+from ...ssim.process import process_data
+
+DATE = '2024-12-06'
+
+def test_slate_scale():
+    """Test scale sets the number of games and players are unique."""
+    players = synthetic.slate(0.2)
+    assert players['game_id'].nunique() == 2
+    assert len(players) == 2 * 2 * synthetic.ROSTER_SIZE
+    assert players['player'].is_unique
+    assert synthetic.slate(0.2).equals(players)
+
+def test_payloads_feed_processors():
+    """Test synthetic payloads are JSON-serializable and parse like real ones."""
+    players = synthetic.slate(0.1)
+    payload = synthetic.bpro_props(players, 'dk', DATE)
+    json.dumps(payload)
+    with mock.patch.object(process, 'load_book_data', return_value=payload):
+        records = process.process_book_data(DATE, 'dk', synthetic.bpro_games(players, DATE))
+    assert len(records) == len(payload['props'])
+
+    ssim = synthetic.ssim_payload(players, DATE)
+    json.dumps(ssim)
+    assert len(process_data(ssim)) == len(players)
+
+    response = synthetic.nba_response('boxscoreadvancedv2', players, players['game_id'][0], DATE)
+    json.dumps(response)
+    df = process_advanced_stats(to_frames(response)['PlayerStats'])
+    assert len(df) == len(players)
+    assert df['game_id'].str.len().eq(10).all()
+
+def test_run_and_compare(tmp_path):
+    """Test a filtered run is saved and compared by case."""
+    results = run_suite(scale=0.1, repeat=1, cases=['ssim.process_data'])
+    assert list(results['cases']) == ['ssim.process_data']
+    assert results['cases']['ssim.process_data']['items'] == results['players']
+
+    path = save_results(results, tmp_path / "run.json")
+    diff = compare(load_results(path), results)
+    assert diff['ratio'].tolist() == [1.0]
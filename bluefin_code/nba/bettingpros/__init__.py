@@ -5,6 +5,8 @@ from .validate import (
     validate_game_data,
     validate_player_data,
     validate_output,
+    check_game_data,
+    check_player_data,
     MARKET_TYPES,
     SPORTSBOOKS
 ) 
\ No newline at end of file
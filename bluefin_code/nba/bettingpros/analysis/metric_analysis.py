@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
@@ -14,15 +14,18 @@ SAMPLE_DATES = [
     "2024-12-06"
 ]
 
-def load_sample_data(date: str) -> pd.DataFrame:
-    """Load BettingPros data for analysis"""
-    year_month = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
-    file_path = DATA_ROOT / "nba" / "bettingpros" / "processed" / year_month / f"props_{date}.csv"
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"No data file found for date: {date}")
-        
-    return pd.read_csv(file_path)
+PROP_COLUMNS = ['date', 'player', 'prop_type', 'line', 'over_odds', 'under_odds',
+                'projected_value', 'projected_probability', 'projected_ev', 'bet_rating']
+
+def load_sample_data(start: str, end: str) -> pd.DataFrame:
+    """Load BettingPros props for a date range in one query over the sql props view"""
+    from bluefin_code.nba import sql
+    if not sql.files(sql.DATASETS['props'], start, end):
+        return pd.DataFrame(columns=PROP_COLUMNS)
+    df = sql.query("SELECT * FROM props", start, end)
+    df = df.rename(columns={'market': 'prop_type'}).reindex(columns=PROP_COLUMNS)
+    df['date'] = df['date'].astype(str)
+    return df.astype({col: 'float64' for col in PROP_COLUMNS[3:]})
 
 def analyze_single_bet(row):
     """Deep analysis of a single bet's metrics"""
@@ -86,13 +89,20 @@ def analyze_metrics(df: pd.DataFrame) -> None:
         print(df[metric].describe())
 
 def main():
-    for date in SAMPLE_DATES:
+    parser = argparse.ArgumentParser(description="Analyze BettingPros metrics")
+    parser.add_argument("--start", help="First date to analyze (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last date to analyze (YYYY-MM-DD)")
+    args = parser.parse_args()
+    
+    start, end = (args.start, args.end) if args.start else (SAMPLE_DATES[0], SAMPLE_DATES[-1])
+    df = load_sample_data(start, end)
+    if df.empty:
+        print("No data found for the requested dates")
+        return
+    
+    for date, day in df.groupby('date', sort=True):
         print(f"\nAnalyzing {date}:")
-        try:
-            df = load_sample_data(date)
-            analyze_metrics(df)
-        except FileNotFoundError:
-            print(f"No data found for {date}")
+        analyze_metrics(day)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,7 +2,6 @@
 
 import argparse
 from pathlib import Path
-import json
 import logging
 import time
 from datetime import datetime, timedelta
@@ -17,6 +16,9 @@ from os.path import dirname, abspath
 sys.path.append(dirname(dirname(dirname(dirname(abspath(__file__))))))
 
 from bluefin_code.nba.utils import MARKETS_CONFIG, BOOKS_CONFIG
+from bluefin_code.nba import catalog, rawstore
+from bluefin_code.nba.urls import bpro_url
+from bluefin_code.core.instrument import stage
 from bluefin_code.core.output import print_header, print_section, print_subsection, print_warning
 
 # Configure logging
@@ -61,9 +63,7 @@ def create_default_config() -> Config:
         'Sec-Fetch-Site': 'same-origin'
     }
     
-    base_url = "https://api.bettingpros.com/v3/props"
-    
-    return Config(sportsbooks=sportsbooks, headers=headers, base_url=base_url)
+    return Config(sportsbooks=sportsbooks, headers=headers, base_url=bpro_url())
 
 def get_data_dir(date: str) -> Path:
     """Get data directory for a given date."""
@@ -77,9 +77,12 @@ def fetch_sportsbook_data(book: Sportsbook, date: str, config: Config, force: bo
     
     output_file = output_dir / f"{date}_{book.abbreviation}.json"
     
-    # Skip if file exists and not forcing
-    if output_file.exists() and not force:
+    # Skip if already collected and not forcing
+    if not force and (catalog.has('bettingpros', 'props', book.abbreviation, date=date)
+                      or rawstore.exists(output_file)):
         logger.info(f"Skipping {book.name} - file exists")
+        with stage('fetch', source='bpro', key=book.abbreviation) as s:
+            s.cache_hit = True
         return None, {}
         
     # Construct params
@@ -94,16 +97,22 @@ def fetch_sportsbook_data(book: Sportsbook, date: str, config: Config, force: bo
     }
     
     try:
-        # Make request
-        response = requests.get(config.base_url, headers=config.headers, params=params)
-        response.raise_for_status()
-        
-        # Parse response
-        data = response.json()
+        with stage('fetch', source='bpro', key=book.abbreviation) as s:
+            s.cache_hit = False
+            # Make request
+            response = requests.get(config.base_url, headers=config.headers, params=params)
+            s.api_latency = response.elapsed.total_seconds()
+            s.bytes = len(response.content)
+            response.raise_for_status()
+            
+            # Parse response
+            data = response.json()
+            s.rows = len(data.get('props', []))
         
         # Save to file
-        with open(output_file, 'w') as f:
-            json.dump(data, f)
+        with stage('write', source='bpro', key=book.abbreviation) as s:
+            s.bytes = rawstore.save_json(output_file, data)['stored']
+        catalog.record(output_file, date, len(data.get('props', [])))
             
         logger.info(f"Fetched {book.name} data")
         
@@ -126,9 +135,11 @@ def fetch_events(date: str, config: Config, force: bool = False) -> Optional[Pat
     
     output_file = output_dir / f"{date}_events.json"
     
-    # Skip if file exists and not forcing
-    if output_file.exists() and not force:
+    # Skip if already collected and not forcing
+    if not force and (catalog.has('bettingpros', 'events', 'events', date=date) or rawstore.exists(output_file)):
         logger.info(f"Skipping events - file exists")
+        with stage('fetch', source='bpro', key='events') as s:
+            s.cache_hit = True
         return None
         
     # Construct params
@@ -142,21 +153,26 @@ def fetch_events(date: str, config: Config, force: bool = False) -> Optional[Pat
     }
     
     try:
-        # Make request
-        response = requests.get(
-            config.base_url,  # Use the same base URL as props
-            headers=config.headers,
-            params=params
-        )
-        response.raise_for_status()
-        
-        # Parse response and extract events
-        data = response.json()
-        events_data = {'events': data.get('events', [])}
+        with stage('fetch', source='bpro', key='events') as s:
+            s.cache_hit = False
+            # Make request
+            response = requests.get(
+                config.base_url,  # Use the same base URL as props
+                headers=config.headers,
+                params=params
+            )
+            s.api_latency = response.elapsed.total_seconds()
+            s.bytes = len(response.content)
+            response.raise_for_status()
+            
+            # Parse response and extract events
+            data = response.json()
+            events_data = {'events': data.get('events', [])}
+            s.rows = len(events_data['events'])
         
         # Save to file
-        with open(output_file, 'w') as f:
-            json.dump(events_data, f)
+        rawstore.save_json(output_file, events_data)
+        catalog.record(output_file, date, len(events_data['events']))
             
         logger.info(f"Fetched events data")
         return output_file
@@ -174,11 +190,20 @@ def main():
     
     config = create_default_config()
     
+    # One catalog query for what the date still lacks
+    books = [book.abbreviation for book in config.sportsbooks]
+    todo = catalog.missing(args.date, game_ids=[], books=books)
+    todo = set(todo.loc[todo['source'] == 'bettingpros', 'key'])
+    
     # Fetch events first
-    events_file = fetch_events(args.date, config, force=args.force)
+    if args.force or 'events' in todo:
+        fetch_events(args.date, config, force=args.force)
     
     # Fetch each sportsbook
     for book in config.sportsbooks:
+        if not args.force and book.abbreviation not in todo:
+            logger.info(f"Skipping {book.name} - already collected")
+            continue
         fetch_sportsbook_data(book, args.date, config, force=args.force)
         time.sleep(1)  # Be nice to the API
 
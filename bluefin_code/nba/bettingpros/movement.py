@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""Line movement history for BettingPros props.
+
+Every observed change to a (player, market, book) line is appended to a
+per-date time series under ``bluefin_data/nba/bettingpros/movement/``::
+
+    YYYY-MM/{date}/part-{ts}.parquet   # append-only change records
+    YYYY-MM/{date}/latest.parquet      # latest line per key
+
+Parts only hold rows that changed since the previous snapshot, so a poll
+that sees no movement writes nothing.
+"""
+
+import logging
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMNS = ['player', 'market', 'book']
+VALUE_COLUMNS = ['line', 'over_odds', 'under_odds']
+HISTORY_COLUMNS = ['ts', *KEY_COLUMNS, *VALUE_COLUMNS, 'status']
+
+# Compact on-disk dtypes
+HISTORY_DTYPES = {
+    'player': 'category',
+    'market': 'category',
+    'book': 'category',
+    'line': 'float32',
+    'over_odds': 'Int16',
+    'under_odds': 'Int16',
+    'status': 'category',
+}
+
+# Line changes smaller than this are treated as noise
+LINE_TOLERANCE = 0.1
+
+def get_movement_dir(date: str) -> Path:
+    """Get movement directory for date."""
+    return DATA_ROOT / "nba" / "bettingpros" / "movement" / date[:7] / date
+
+def get_latest_path(date: str) -> Path:
+    """Get latest-line index for date."""
+    return get_movement_dir(date) / "latest.parquet"
+
+def list_parts(date: str) -> List[Path]:
+    """List change record files for date in time order."""
+    movement_dir = get_movement_dir(date)
+    if not movement_dir.exists():
+        return []
+    return sorted(movement_dir.glob("part-*.parquet"))
+
+def _snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """Reduce props to one row per key with numeric values."""
+    snap = df[KEY_COLUMNS + VALUE_COLUMNS].copy()
+    for col in KEY_COLUMNS:
+        snap[col] = snap[col].astype(str)
+    for col in VALUE_COLUMNS:
+        snap[col] = pd.to_numeric(snap[col], errors='coerce').astype('float64')
+    return snap.drop_duplicates(KEY_COLUMNS, keep='last')
+
+def diff_snapshots(old: Optional[pd.DataFrame], new: pd.DataFrame,
+                   include_removed: bool = True) -> pd.DataFrame:
+    """Diff two prop snapshots.
+
+    Returns one row per changed key with ``old_*``/``new_*`` values, a
+    ``line_move`` delta and a ``status`` of ``new``, ``moved`` or ``removed``.
+    """
+    new = _snapshot(new)
+    if old is None or old.empty:
+        old = pd.DataFrame(columns=KEY_COLUMNS + VALUE_COLUMNS)
+    old = _snapshot(old)
+
+    df = old.merge(new, on=KEY_COLUMNS, how='outer', suffixes=('_old', '_new'), indicator=True)
+    df = df.rename(columns={f'{c}_old': f'old_{c}' for c in VALUE_COLUMNS})
+    df = df.rename(columns={f'{c}_new': f'new_{c}' for c in VALUE_COLUMNS})
+
+    old_line, new_line = df['old_line'], df['new_line']
+    line_moved = ((new_line - old_line).abs() > LINE_TOLERANCE) | (old_line.isna() != new_line.isna())
+    odds_moved = np.zeros(len(df), dtype=bool)
+    for col in ['over_odds', 'under_odds']:
+        old_val, new_val = df[f'old_{col}'], df[f'new_{col}']
+        odds_moved |= (old_val != new_val) & ~(old_val.isna() & new_val.isna())
+
+    df['status'] = np.select(
+        [df['_merge'] == 'right_only', df['_merge'] == 'left_only', line_moved | odds_moved],
+        ['new', 'removed', 'moved'],
+        default='',
+    )
+    if not include_removed:
+        df = df[df['status'] != 'removed']
+    df = df[df['status'] != ''].drop(columns='_merge')
+    df['line_move'] = df['new_line'] - df['old_line']
+
+    columns = [*KEY_COLUMNS, 'status',
+               *[f'old_{c}' for c in VALUE_COLUMNS], *[f'new_{c}' for c in VALUE_COLUMNS],
+               'line_move']
+    return df[columns].sort_values(KEY_COLUMNS, ignore_index=True)
+
+def _to_history(changes: pd.DataFrame, ts: pd.Timestamp) -> pd.DataFrame:
+    """Convert diff rows to compact history records."""
+    records = changes[KEY_COLUMNS + ['status']].copy()
+    for col in VALUE_COLUMNS:
+        # Removed keys are stored as tombstones with empty values
+        records[col] = changes[f'new_{col}'].where(changes['status'] != 'removed')
+    for col in ['over_odds', 'under_odds']:
+        records[col] = records[col].round()
+    records['ts'] = ts
+    return records[HISTORY_COLUMNS].astype(HISTORY_DTYPES)
+
+def latest(date: str) -> pd.DataFrame:
+    """Get the latest known line per key for date."""
+    latest_file = get_latest_path(date)
+    if not latest_file.exists():
+        return pd.DataFrame(columns=HISTORY_COLUMNS).astype(HISTORY_DTYPES)
+    return pd.read_parquet(latest_file)
+
+def record_snapshot(date: str, props: pd.DataFrame, ts: Optional[datetime] = None,
+                    books: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Record a props snapshot for date and return what changed.
+
+    Changed keys are appended as a new part and the latest index is
+    rewritten; nothing is written when the snapshot matches the index.
+
+    Only keys for ``books`` (default: the books in ``props``) can be
+    removed, so a snapshot of one book leaves the other books' lines alone.
+    Pass ``books`` to mark a book whose lines were all pulled.
+    """
+    ts = pd.Timestamp(ts or datetime.now(timezone.utc))
+    if ts.tzinfo is None:
+        ts = ts.tz_localize('UTC')
+
+    current = latest(date)
+    scope = set(props['book'].astype(str) if books is None else books)
+    changes = diff_snapshots(current[current['book'].astype(str).isin(scope)], props)
+    if changes.empty:
+        logger.debug(f"No line movement for {date}")
+        return changes
+
+    records = _to_history(changes, ts)
+    movement_dir = get_movement_dir(date)
+    movement_dir.mkdir(parents=True, exist_ok=True)
+    part_file = movement_dir / f"part-{ts.strftime('%Y%m%dT%H%M%S%f')}.parquet"
+    records.to_parquet(part_file, index=False)
+
+    # Replace changed keys in the index and drop removed ones
+    keys = pd.MultiIndex.from_frame(records[KEY_COLUMNS].astype(str))
+    unchanged = ~pd.MultiIndex.from_frame(current[KEY_COLUMNS].astype(str)).isin(keys)
+    frames = [current[unchanged], records[records['status'] != 'removed']]
+    index_df = pd.concat([f.astype({c: str for c in KEY_COLUMNS}) for f in frames if not f.empty],
+                         ignore_index=True)
+    index_df = index_df.sort_values(KEY_COLUMNS, ignore_index=True).astype(HISTORY_DTYPES)
+    index_df.to_parquet(get_latest_path(date), index=False)
+
+    logger.info(f"Recorded {len(changes)} line changes for {date}")
+    return changes
+
+def history(date: str, player: Optional[str] = None, market: Optional[str] = None,
+            book: Optional[str] = None) -> pd.DataFrame:
+    """Get change history for date, optionally for a single key."""
+    parts = list_parts(date)
+    if not parts:
+        return pd.DataFrame(columns=HISTORY_COLUMNS).astype(HISTORY_DTYPES)
+
+    filters = [(col, '==', val) for col, val in
+               zip(KEY_COLUMNS, [player, market, book]) if val is not None]
+    df = pd.read_parquet(parts, filters=filters or None)
+    return df.sort_values(['ts', *KEY_COLUMNS], ignore_index=True)
+
+def compact(date: str) -> Optional[Path]:
+    """Merge all change parts for date into a single part."""
+    parts = list_parts(date)
+    if len(parts) < 2:
+        return parts[0] if parts else None
+
+    df = history(date).astype(HISTORY_DTYPES)
+    merged_file = parts[-1].with_name(parts[-1].stem + "-c.parquet")
+    df.to_parquet(merged_file, index=False)
+    for part in parts:
+        part.unlink()
+    logger.info(f"Compacted {len(parts)} parts for {date}")
+    return merged_file
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import json
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -14,6 +13,12 @@ from os.path import dirname, abspath
 sys.path.append(dirname(dirname(dirname(dirname(abspath(__file__))))))
 
 from bluefin_code.nba.utils import BOOKS_CONFIG, MARKETS_CONFIG
+from bluefin_code.core.standardization.teams import standardize_codes, unmapped_codes
+from bluefin_code.nba.bettingpros.movement import (
+    KEY_COLUMNS, VALUE_COLUMNS, LINE_TOLERANCE, diff_snapshots, record_snapshot
+)
+from bluefin_code.core.instrument import stage
+from bluefin_code.nba import rawstore
 from bluefin_code.core.output import print_header, print_section, print_subsection, print_warning, format_change, format_player_update
 
 # Configure logging
@@ -39,13 +44,12 @@ def load_events(date: str) -> Dict:
     data_dir = get_data_dir(date)
     events_file = data_dir / f"{date}_events.json"
     
-    if not events_file.exists():
+    if not rawstore.exists(events_file):
         logger.error(f"Events file not found: {events_file}")
         return {}
         
     try:
-        with open(events_file) as f:
-            events_data = json.load(f)
+        events_data = rawstore.load_json(events_file)
             
         # Create a mapping of team abbreviations to game info
         games = {}
@@ -76,13 +80,12 @@ def load_book_data(date: str, book_abbrev: str) -> Optional[Dict]:
     data_dir = get_data_dir(date)
     book_file = data_dir / f"{date}_{book_abbrev}.json"
     
-    if not book_file.exists():
+    if not rawstore.exists(book_file):
         logger.warning(f"Book file not found: {book_file}")
         return None
         
     try:
-        with open(book_file) as f:
-            return json.load(f)
+        return rawstore.load_json(book_file)
     except Exception as e:
         logger.error(f"Error loading book data: {str(e)}")
         return None
@@ -202,7 +205,9 @@ def process_date(date: str) -> None:
     print_header(f"Processing data for {date}")
     
     # Load events first
-    games = load_events(date)
+    with stage('load', source='bpro', key='events') as s:
+        games = load_events(date)
+        s.rows = len(games) // 2
     if not games:
         print_warning(f"No games found for {date}")
         return
@@ -211,7 +216,9 @@ def process_date(date: str) -> None:
     all_records = []
     for book_abbrev, book_info in BOOKS_CONFIG['sportsbooks'].items():
         print_section(f"Processing {book_info['name']}")
-        records = process_book_data(date, book_abbrev, games)
+        with stage('parse', source='bpro', key=book_abbrev) as s:
+            records = process_book_data(date, book_abbrev, games)
+            s.rows = len(records)
         all_records.extend(records)
         print_subsection(f"Found {len(records)} records")
     
@@ -224,36 +231,53 @@ def process_date(date: str) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Save to CSV
-    df = pd.DataFrame(all_records)
+    with stage('normalize', source='bpro') as s:
+        df = pd.DataFrame(all_records)
+        for col in ['team', 'opponent']:
+            codes = standardize_codes(df[col])
+            unmapped = unmapped_codes(df[col], codes)
+            if unmapped:
+                logger.warning(f"Unmapped {col} codes for {date}: {unmapped}")
+            df[col] = codes
+        s.rows = len(df)
     output_file = output_dir / f"{date}.csv"
-    df.to_csv(output_file, index=False)
+    with stage('write', source='bpro') as s:
+        df.to_csv(output_file, index=False)
+        s.rows, s.bytes = len(df), output_file.stat().st_size
     print_section(f"Saved {len(df)} records to {output_file}")
 
+    with stage('movement', source='bpro') as s:
+        changes = record_snapshot(date, df)
+        s.rows = len(changes)
+    if not changes.empty:
+        print_subsection(f"Recorded {len(changes)} line changes")
+
+def odds_changed(old: Any, new: Any) -> bool:
+    """Whether odds moved; two missing values are unchanged, one missing value is a move."""
+    if pd.isna(old) or pd.isna(new):
+        return not (pd.isna(old) and pd.isna(new))
+    return old != new
+
 def process_data(data: List[Dict[str, Any]], old_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
-    """Process raw data and show changes."""
-    processed = []
-    
-    if old_data is not None:
-        old_lines = {
-            (row['player'], row['market'], row['book']): row 
-            for _, row in old_data.iterrows()
-        }
-        
-        for prop in data:
-            key = (prop['player'], prop['market'], prop['book'])
-            if key in old_lines:
-                old = old_lines[key]
-                updates = {}
-                
-                if abs(prop['line'] - old['line']) > 0.1:
-                    updates['line'] = (old['line'], prop['line'])
-                if prop['over_odds'] != old['over_odds']:
-                    updates['over_odds'] = (old['over_odds'], prop['over_odds'])
-                    
-                if updates:
-                    print(format_player_update(f"{prop['player']} ({prop['market']} {prop['book']})", updates))
-                    
-    return pd.DataFrame(processed)
+    """Process raw data and show changes.
+
+    Returns the vectorized diff against ``old_data`` (see ``movement.diff_snapshots``).
+    """
+    changes = diff_snapshots(old_data, pd.DataFrame(data, columns=KEY_COLUMNS + VALUE_COLUMNS),
+                             include_removed=False)
+    moved = changes[changes['status'] == 'moved']
+
+    for row in moved.itertuples(index=False):
+        updates = {}
+        if abs(row.line_move) > LINE_TOLERANCE:
+            updates['line'] = (row.old_line, row.new_line)
+        if odds_changed(row.old_over_odds, row.new_over_odds):
+            updates['over_odds'] = (row.old_over_odds, row.new_over_odds)
+        if odds_changed(row.old_under_odds, row.new_under_odds):
+            updates['under_odds'] = (row.old_under_odds, row.new_under_odds)
+        print(format_player_update(f"{row.player} ({row.market} {row.book})", updates))
+
+    return changes
 
 def main():
     """Main function."""
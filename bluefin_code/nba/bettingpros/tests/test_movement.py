@@ -0,0 +1,112 @@
+"""Test line movement diffing and storage."""
+
+from datetime import datetime
+
+import pytest
+import pandas as pd
+
+from .. import movement
+
+DATE = "2024-12-06"
+
+@pytest.fixture
+def props() -> pd.DataFrame:
+    """Create sample props snapshot."""
+    return pd.DataFrame({
+        'player': ['Nikola Jokic', 'Nikola Jokic', 'Jayson Tatum'],
+        'market': ['PTS', 'REB', 'PTS'],
+        'book': ['DraftKings', 'DraftKings', 'FanDuel'],
+        'line': [29.5, 12.5, 27.5],
+        'over_odds': [-110, -120, -105],
+        'under_odds': [-110, -100, -115],
+    })
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    """Point movement storage at a temporary data root."""
+    monkeypatch.setattr(movement, 'DATA_ROOT', tmp_path)
+    return tmp_path
+
+def test_diff_snapshots(props):
+    """Test new, moved and removed keys are detected."""
+    new = props.copy()
+    new.loc[0, 'line'] = 30.5
+    new.loc[1, 'over_odds'] = -125
+    new = new.drop(index=2)
+    new.loc[3] = ['Luka Doncic', 'AST', 'FanDuel', 8.5, -110, -110]
+
+    changes = movement.diff_snapshots(props, new).set_index(['player', 'market'])
+
+    assert changes.loc[('Nikola Jokic', 'PTS'), 'status'] == 'moved'
+    assert changes.loc[('Nikola Jokic', 'PTS'), 'line_move'] == pytest.approx(1.0)
+    assert changes.loc[('Nikola Jokic', 'REB'), 'new_over_odds'] == -125
+    assert changes.loc[('Jayson Tatum', 'PTS'), 'status'] == 'removed'
+    assert changes.loc[('Luka Doncic', 'AST'), 'status'] == 'new'
+
+    # Identical snapshots produce no changes
+    assert movement.diff_snapshots(props, props).empty
+
+def test_diff_snapshots_missing_line(props):
+    """Test a line appearing or disappearing on a kept key is a move."""
+    old = props.assign(line=[None, 12.5, 27.5])
+    new = props.assign(line=[29.5, 12.5, None])
+
+    changes = movement.diff_snapshots(old, new).set_index(['player', 'market'])
+    assert changes['status'].tolist() == ['moved', 'moved']
+    assert changes.loc[('Nikola Jokic', 'PTS'), 'new_line'] == 29.5
+    assert pd.isna(changes.loc[('Jayson Tatum', 'PTS'), 'new_line'])
+
+def test_record_snapshot(data_root, props):
+    """Test only changes are appended and indexes stay current."""
+    first = movement.record_snapshot(DATE, props, ts=datetime(2024, 12, 6, 12))
+    assert len(first) == 3
+    assert movement.record_snapshot(DATE, props, ts=datetime(2024, 12, 6, 13)).empty
+    assert len(movement.list_parts(DATE)) == 1
+
+    moved = props.copy()
+    moved.loc[0, 'line'] = 30.5
+    moved = moved.drop(index=1)
+    changes = movement.record_snapshot(DATE, moved, ts=datetime(2024, 12, 6, 14))
+    assert set(changes['status']) == {'moved', 'removed'}
+
+    latest = movement.latest(DATE)
+    assert len(latest) == 2
+    assert latest.set_index('book').loc['DraftKings', 'line'] == 30.5
+
+    jokic = movement.history(DATE, player='Nikola Jokic', market='PTS')
+    assert jokic['line'].tolist() == [29.5, 30.5]
+    assert jokic['ts'].is_monotonic_increasing
+
+    full = movement.history(DATE)
+    movement.compact(DATE)
+    assert len(movement.list_parts(DATE)) == 1
+    pd.testing.assert_frame_equal(movement.history(DATE), full, check_categorical=False)
+
+def test_record_snapshot_book_scope(data_root, props):
+    """Test a single-book snapshot only removes that book's lines."""
+    movement.record_snapshot(DATE, props, ts=datetime(2024, 12, 6, 12))
+
+    draftkings = props[props['book'] == 'DraftKings'].drop(index=1)
+    changes = movement.record_snapshot(DATE, draftkings, ts=datetime(2024, 12, 6, 13))
+    assert changes[['market', 'book', 'status']].values.tolist() == [['REB', 'DraftKings', 'removed']]
+    assert sorted(movement.latest(DATE)['book'].astype(str)) == ['DraftKings', 'FanDuel']
+
+    changes = movement.record_snapshot(DATE, props.iloc[:0], ts=datetime(2024, 12, 6, 14),
+                                       books=['FanDuel'])
+    assert changes[['book', 'status']].values.tolist() == [['FanDuel', 'removed']]
+    assert movement.latest(DATE)['book'].astype(str).tolist() == ['DraftKings']
+
+def test_process_data_missing_odds(props, capsys):
+    """Test missing odds on both sides are not reported as a change."""
+    from ..process import odds_changed, process_data
+
+    old = props.assign(under_odds=pd.array([pd.NA, -100, -115], dtype='Int16'))
+    new = old.copy()
+    new.loc[0, 'line'] = 30.5
+    changes = process_data(new.to_dict('records'), old)
+
+    assert (changes['status'] == 'moved').sum() == 1
+    assert 'under_odds' not in capsys.readouterr().out
+    assert not odds_changed(float('nan'), pd.NA)
+    assert odds_changed(pd.NA, -110) and odds_changed(-110, -105)
+    assert not odds_changed(-110, -110)
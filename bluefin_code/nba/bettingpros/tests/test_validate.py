@@ -10,6 +10,8 @@ from ..validate import (
     validate_game_data,
     validate_player_data,
     validate_output,
+    check_game_data,
+    check_player_data,
     MARKET_TYPES,
     SPORTSBOOKS
 )
@@ -202,4 +204,50 @@ def test_validate_output(sample_processed_data):
     # Test timestamp format
     bad_data = sample_processed_data.copy()
     bad_data['timestamp'] = 'invalid_timestamp'
-    assert validate_output(bad_data) is False 
\ No newline at end of file
+    assert validate_output(bad_data) is False 
+
+@pytest.fixture
+def props_df() -> pd.DataFrame:
+    """Create props in the processed column layout."""
+    return pd.DataFrame({
+        'plyr': ['Player 1', 'Player 1', 'Player 2', 'Player 2'],
+        'team': ['LAL', 'LAL', 'BOS', 'BOS'],
+        'opponent': ['BOS', 'BOS', 'LAL', 'LAL'],
+        'mkt_type': [151, 151, 152, 152],
+        'book_id': ['12', '10', '12', '10'],
+        'line': [20.5, 21.5, 6.5, 6.5],
+        'o_odds': [-110, -115, -110, 105],
+        'u_odds': [-110, -105, -110, -125],
+    })
+
+def test_check_game_data(props_df):
+    """Test structured game-level error records."""
+    assert check_game_data(props_df).empty
+
+    bad = props_df.copy()
+    bad.loc[0, 'line'] = 30.5
+    bad.loc[2:3, 'opponent'] = 'NYK'
+    errors = check_game_data(bad)
+
+    assert set(errors['check']) == {'missing_reverse', 'line_discrepancy'}
+    spread = errors[errors['check'] == 'line_discrepancy'].iloc[0]
+    assert spread['plyr'] == 'Player 1'
+    assert spread['value'] == pytest.approx(9.0)
+    assert spread['message'] == "Large line discrepancy for Player 1 pts: 21.5-30.5"
+    assert sorted(errors.loc[errors['check'] == 'missing_reverse', 'team']) == ['BOS', 'LAL']
+    assert validate_game_data(bad) is False
+
+def test_check_player_data(props_df):
+    """Test structured player-level error records."""
+    assert check_player_data(props_df).empty
+
+    bad = props_df.copy()
+    bad.loc[0, 'line'] = 2.5
+    bad.loc[2, 'line'] = 25.5
+    bad.loc[3, 'o_odds'] = -2000
+    errors = check_player_data(bad).set_index('check')
+
+    assert errors.loc['low_line', 'message'] == "Player 1: Low pts line: 2.5"
+    assert errors.loc['high_line', 'value'] == 25.5
+    assert errors.loc['extreme_odds', 'value'] == 2000
+    assert validate_player_data(bad) is False
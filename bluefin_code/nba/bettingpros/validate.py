@@ -5,6 +5,8 @@ from typing import List, Dict, Tuple
 import pandas as pd
 import numpy as np
 
+from bluefin_code.core.validation import Schema
+
 # Market type mapping
 MARKET_TYPES = {
     151: "pts",
@@ -28,28 +30,33 @@ SPORTSBOOKS = [
     ('ESPN Bet', 'espn', '33'),
 ]
 
+RAW_SCHEMA = Schema(
+    'bettingpros_raw',
+    required={'required columns': [
+        'plyr', 'team', 'opponent', 'mkt_type',
+        'book_id', 'line', 'o_odds', 'u_odds'
+    ]},
+    allowed={
+        'mkt_type': MARKET_TYPES,
+        'book_id': [i for _, _, book_id in SPORTSBOOKS for i in (book_id, int(book_id))],
+    },
+)
+
+OUTPUT_SCHEMA = Schema(
+    'bettingpros_output',
+    required={'required columns': [
+        'plyr', 'team', 'opponent', 'game_id',
+        'ts', 'source', 'mkt_type', 'book',
+        'line', 'o_odds', 'u_odds'
+    ]},
+    dtypes={'ts': 'datetime'},
+    not_null=['plyr', 'team', 'opponent', 'game_id'],
+)
+
 def validate_raw_data(df: pd.DataFrame) -> bool:
     """Validate raw data format and content."""
     logger = logging.getLogger("bettingpros.validate")
-    
-    # Required columns
-    required_cols = [
-        'plyr', 'team', 'opponent', 'mkt_type',
-        'book_id', 'line', 'o_odds', 'u_odds'
-    ]
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"Missing required columns: {missing_cols}")
-    
-    # Valid market types
-    invalid_markets = df[~df['mkt_type'].isin(MARKET_TYPES)]['mkt_type'].unique()
-    if len(invalid_markets) > 0:
-        raise ValueError(f"Invalid market types found: {invalid_markets}")
-    
-    # Valid sportsbooks
-    invalid_books = df[~df['book_id'].isin(SPORTSBOOKS)]['book_id'].unique()
-    if len(invalid_books) > 0:
-        raise ValueError(f"Invalid sportsbook IDs found: {invalid_books}")
+    RAW_SCHEMA.validate(df).raise_for_errors()
     
     # Log validation summary
     logger.info(f"Validated {len(df)} rows of data")
@@ -58,158 +65,142 @@ def validate_raw_data(df: pd.DataFrame) -> bool:
     
     return True
 
-def validate_game_data(df: pd.DataFrame) -> bool:
-    """Validate game-level data consistency."""
-    logger = logging.getLogger("bettingpros.validate")
-    validation_errors = []
-    
-    # Check for teams playing themselves
+# Reasonable line ranges per market
+LINE_RANGES = {
+    'pts': (5, 45),
+    'reb': (2, 20),
+    'ast': (1, 15),
+    'threes': (0.5, 10),
+    'stl': (0.5, 5),
+    'blk': (0.5, 5),
+    'tov': (0.5, 8),
+    'pr': (10, 60),
+    'pa': (10, 55),
+    'ra': (5, 30),
+    'pra': (15, 75)
+}
+
+# Max spread between books before a line is flagged
+MAX_LINE_DISCREPANCY = 2
+MAX_ABS_ODDS = 1000
+
+ERROR_COLUMNS = ['check', 'plyr', 'team', 'opponent', 'mkt_type', 'value', 'message']
+
+def _error_frame(check: str, df: pd.DataFrame, value: pd.Series, message: pd.Series) -> pd.DataFrame:
+    """Build structured error records for the rows of df."""
+    errors = pd.DataFrame({'check': check, 'value': value, 'message': message}, index=df.index)
+    for col in ['plyr', 'team', 'opponent', 'mkt_type']:
+        errors[col] = df[col] if col in df.columns else None
+    return errors[ERROR_COLUMNS]
+
+def _concat_errors(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine error frames, keeping the schema when there are none."""
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+def _market_names(mkt_type: pd.Series) -> pd.Series:
+    """Map market IDs to names, leaving unknown IDs as-is."""
+    return mkt_type.map(MARKET_TYPES).fillna(mkt_type.astype(str))
+
+def check_game_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Find game-level inconsistencies.
+
+    Returns one record per problem with checks ``self_matchup``,
+    ``missing_reverse`` and ``line_discrepancy``.
+    """
+    # Teams playing themselves
     self_games = df[df['team'] == df['opponent']]
-    if not self_games.empty:
-        for _, row in self_games.iterrows():
-            validation_errors.append(
-                f"Team playing itself: {row['team']} vs {row['opponent']}"
-            )
-    
-    # Check for duplicate games
+    self_errors = _error_frame(
+        'self_matchup', self_games, self_games['team'],
+        "Team playing itself: " + self_games['team'].astype(str) + " vs " + self_games['opponent'].astype(str),
+    )
+
+    # Matchups without the reverse side
     games = df[['team', 'opponent']].drop_duplicates()
-    for _, game in games.iterrows():
-        reverse_game = games[
-            (games['team'] == game['opponent']) & 
-            (games['opponent'] == game['team'])
-        ]
-        if len(reverse_game) == 0:
-            validation_errors.append(
-                f"Missing reverse matchup for {game['team']} vs {game['opponent']}"
-            )
-    
-    # Check for consistent lines across books
-    for market in df['mkt_type'].unique():
-        market_data = df[df['mkt_type'] == market]
-        for _, player_data in market_data.groupby('plyr'):
-            lines = player_data['line'].unique()
-            if len(lines) > 1:
-                max_diff = lines.max() - lines.min()
-                if max_diff > 2:  # Allow small differences
-                    validation_errors.append(
-                        f"Large line discrepancy for {player_data.iloc[0]['plyr']} "
-                        f"{MARKET_TYPES[market]}: {lines.min():.1f}-{lines.max():.1f}"
-                    )
-    
-    if validation_errors:
-        for error in validation_errors:
-            logger.warning(error)
-        return False
-    
-    return True
+    reverse = games.rename(columns={'team': 'opponent', 'opponent': 'team'})
+    games = games.merge(reverse, on=['team', 'opponent'], how='left', indicator=True)
+    missing = games[games['_merge'] == 'left_only']
+    reverse_errors = _error_frame(
+        'missing_reverse', missing, missing['opponent'],
+        "Missing reverse matchup for " + missing['team'].astype(str) + " vs " + missing['opponent'].astype(str),
+    )
+
+    # Lines that disagree across books
+    spread = df.groupby(['mkt_type', 'plyr'], sort=False)['line'].agg(['min', 'max']).reset_index()
+    spread = spread[spread['max'] - spread['min'] > MAX_LINE_DISCREPANCY]
+    line_errors = _error_frame(
+        'line_discrepancy', spread, spread['max'] - spread['min'],
+        "Large line discrepancy for " + spread['plyr'].astype(str) + " "
+        + _market_names(spread['mkt_type']) + ": "
+        + spread['min'].map('{:.1f}'.format) + "-" + spread['max'].map('{:.1f}'.format),
+    )
+
+    return _concat_errors([self_errors, reverse_errors, line_errors])
+
+def check_player_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Find out-of-range lines and extreme odds.
+
+    Returns one record per problem with checks ``low_line``, ``high_line``
+    and ``extreme_odds``.
+    """
+    market = df['mkt_type'].map(MARKET_TYPES)
+    min_line = market.map({m: lo for m, (lo, _) in LINE_RANGES.items()})
+    max_line = market.map({m: hi for m, (_, hi) in LINE_RANGES.items()})
+
+    frames = []
+    for check, mask, label in [
+        ('low_line', df['line'] < min_line, 'Low'),
+        ('high_line', df['line'] > max_line, 'High'),
+    ]:
+        rows = df[mask]
+        frames.append(_error_frame(
+            check, rows, rows['line'],
+            rows['plyr'].astype(str) + f": {label} " + market[mask] + " line: "
+            + rows['line'].map('{:.1f}'.format),
+        ))
+
+    extreme = df[(df['o_odds'].abs() > MAX_ABS_ODDS) | (df['u_odds'].abs() > MAX_ABS_ODDS)]
+    frames.append(_error_frame(
+        'extreme_odds', extreme, extreme[['o_odds', 'u_odds']].abs().max(axis=1),
+        extreme['plyr'].astype(str) + ": Extreme odds: "
+        + extreme['o_odds'].astype(str) + "/" + extreme['u_odds'].astype(str),
+    ))
+
+    return _concat_errors(frames)
+
+def _log_errors(errors: pd.DataFrame, level: int = logging.WARNING) -> bool:
+    """Log error messages and return whether validation passed."""
+    logger = logging.getLogger("bettingpros.validate")
+    for message in errors['message']:
+        logger.log(level, message)
+    return errors.empty
+
+def validate_game_data(df: pd.DataFrame) -> bool:
+    """Validate game-level data consistency."""
+    return _log_errors(check_game_data(df))
 
 def validate_player_data(df: pd.DataFrame) -> bool:
     """Validate player-level data."""
-    logger = logging.getLogger("bettingpros.validate")
-    validation_errors = []
-    
-    # Check for reasonable line ranges
-    line_ranges = {
-        'pts': (5, 45),
-        'reb': (2, 20),
-        'ast': (1, 15),
-        'threes': (0.5, 10),
-        'stl': (0.5, 5),
-        'blk': (0.5, 5),
-        'tov': (0.5, 8),
-        'pr': (10, 60),
-        'pa': (10, 55),
-        'ra': (5, 30),
-        'pra': (15, 75)
-    }
-    
-    for market_id, market_name in MARKET_TYPES.items():
-        if market_name not in line_ranges:
-            continue
-            
-        market_data = df[df['mkt_type'] == market_id]
-        min_val, max_val = line_ranges[market_name]
-        
-        # Check low lines
-        low_lines = market_data[market_data['line'] < min_val]
-        if not low_lines.empty:
-            for _, row in low_lines.iterrows():
-                validation_errors.append(
-                    f"{row['plyr']}: Low {market_name} line: {row['line']:.1f}"
-                )
-        
-        # Check high lines
-        high_lines = market_data[market_data['line'] > max_val]
-        if not high_lines.empty:
-            for _, row in high_lines.iterrows():
-                validation_errors.append(
-                    f"{row['plyr']}: High {market_name} line: {row['line']:.1f}"
-                )
-    
-    # Check for reasonable odds ranges (-1000 to +1000)
-    extreme_odds = df[
-        (df['o_odds'].abs() > 1000) |
-        (df['u_odds'].abs() > 1000)
-    ]
-    if not extreme_odds.empty:
-        for _, row in extreme_odds.iterrows():
-            validation_errors.append(
-                f"{row['plyr']}: Extreme odds: {row['o_odds']}/{row['u_odds']}"
-            )
-    
-    if validation_errors:
-        for error in validation_errors:
-            logger.warning(error)
-        return False
-    
-    return True
+    return _log_errors(check_player_data(df))
 
 def validate_output(df: pd.DataFrame) -> bool:
     """Validate final output format and content."""
     logger = logging.getLogger("bettingpros.validate")
-    validation_errors = []
-    
-    # Check required columns
-    required_cols = [
-        'plyr', 'team', 'opponent', 'game_id',
-        'ts', 'source', 'mkt_type', 'book',
-        'line', 'o_odds', 'u_odds'
-    ]
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        validation_errors.append(f"Missing required columns: {missing_cols}")
-    
-    # Check for nulls in key columns
-    for col in ['plyr', 'team', 'opponent', 'game_id']:
-        if col in df.columns and df[col].isnull().any():
-            null_count = df[col].isnull().sum()
-            validation_errors.append(f"Found {null_count} null values in {col}")
-    
-    # Check data types
-    if 'ts' in df.columns:
-        if not pd.api.types.is_datetime64_any_dtype(df['ts']):
-            validation_errors.append("ts column should be datetime type")
-        else:
-            # Check for invalid timestamps
-            invalid_ts = df[df['ts'] <= pd.Timestamp.min]
-            if not invalid_ts.empty:
-                validation_errors.append(f"Found {len(invalid_ts)} invalid timestamps")
+    report = OUTPUT_SCHEMA.validate(df)
     
     # Log validation summary
     logger.info("Validation summary:")
     logger.info(f"  • {len(df)} props with complete data")
-    logger.info(f"  • {len(validation_errors)} validation errors")
+    logger.info(f"  • {len(report.errors)} validation errors")
     if 'team' in df.columns:
         # Handle null values in sorting
         teams = sorted(t for t in df['team'].unique() if pd.notna(t))
         logger.info(f"  • Teams: {teams}")
     
-    if validation_errors:
-        for error in validation_errors:
-            logger.error(error)
-        return False
-    
-    return True
+    report.log(logger)
+    return report.ok
 
 def validate_props_df(df: pd.DataFrame) -> List[str]:
     """Validate the props DataFrame meets requirements."""
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+
+"""Catalog of collected data files across NBA sources.
+
+Every artifact under ``bluefin_data/nba`` that a collector writes is one
+row in a small SQLite database (``bluefin_data/nba/catalog.sqlite``):
+source, endpoint, kind, table, key, date, path, hash, rows, bytes and
+fetched_at. Collectors call ``record`` after each write, so the catalog
+stays current without directory walks. ``scan`` backfills it (and drops
+rows for deleted files), re-hashing only files whose size or mtime
+changed. Raw payloads kept in ``rawstore`` are cataloged from its index.
+
+``has`` answers "is this artifact collected" and ``missing`` lists what a
+date still lacks, both with one indexed query that also confirms the files
+still exist. Each thread keeps one open connection per catalog, and the
+schema is only created on first use::
+
+    python -m bluefin_code.nba.catalog scan
+    python -m bluefin_code.nba.catalog missing 2024-11-20
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.nba_com.reorganize_all import load_game_dates
+from bluefin_code.nba import rawstore, utils
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_DATA_DIR = DATA_ROOT / "nba"
+CATALOG_PATH = NBA_DATA_DIR / "catalog.sqlite"
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    tbl TEXT NOT NULL,
+    key TEXT NOT NULL,
+    date TEXT,
+    hash TEXT NOT NULL,
+    rows INTEGER,
+    bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_key ON artifacts (source, endpoint, key);
+CREATE INDEX IF NOT EXISTS artifacts_date ON artifacts (date);
+"""
+
+COLUMNS = ['path', 'source', 'endpoint', 'kind', 'tbl', 'key', 'date',
+           'hash', 'rows', 'bytes', 'mtime_ns', 'fetched_at']
+
+# Sources scanned, relative to NBA_DATA_DIR
+SCAN_DIRS = ['nba_com', 'bettingpros/raw', 'ssim/raw']
+
+# Per-game NBA.com artifacts a fully collected date has: (endpoint, kind)
+GAME_ARTIFACTS = [
+    ('gamerotation', 'raw'),
+    ('gamerotation', 'processed'),
+    ('boxscoreadvancedv2', 'raw'),
+    ('boxscoreadvancedv2', 'processed'),
+    ('boxscoresummaryv2', 'raw'),
+    ('boxscoresummaryv2', 'processed'),
+]
+
+GAME_ID_RE = re.compile(r'(?:^|_)((?:00)?\d{8})(?=_|$)')
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Open connections per thread, keyed by database path
+_local = threading.local()
+
+class Artifact(NamedTuple):
+    """Catalog identity of a data file."""
+    source: str
+    endpoint: str
+    kind: str
+    tbl: str
+    key: str
+    date: Optional[str]
+
+def classify(path: Path, game_dates: Optional[Dict[str, str]] = None) -> Optional[Artifact]:
+    """Catalog identity from a file's place in the data layout, or None if not tracked.
+
+    Handles ``nba_com/{endpoint}/{raw,processed,archive}/...``,
+    ``bettingpros/raw/YYYY-MM/{date}_{book}.json`` and
+    ``ssim/raw/YYYY-MM/NBA_{date}_raw.json``.
+    """
+    parts = Path(path).parts
+    try:
+        start = len(parts) - 1 - parts[::-1].index('bluefin_data')
+    except ValueError:
+        return None
+    rel = parts[start + 2:] if parts[start + 1:start + 2] == ('nba',) else ()
+    if len(rel) < 3:
+        return None
+    name = rel[-1]
+    stem = name.split('.')[0]
+
+    if rel[0] == 'nba_com' and len(rel) >= 4 and rel[2] in ('raw', 'processed', 'archive'):
+        endpoint, kind = rel[1], rel[2]
+        match = GAME_ID_RE.search(stem)
+        if match:
+            key = match.group(1).zfill(10)
+            tbl = GAME_ID_RE.sub('', stem, count=1).strip('_')
+            return Artifact('nba_com', endpoint, kind, tbl, key, (game_dates or {}).get(key))
+        if endpoint == 'playergamelog':
+            tbl = 'gamelog' if stem.startswith('gamelog_') else ''
+            return Artifact('nba_com', endpoint, kind, tbl, stem.replace('gamelog_', ''), None)
+        return None
+
+    date = DATE_RE.search(stem)
+    if rel[0] == 'bettingpros' and rel[1] == 'raw' and date and name.endswith('.json'):
+        key = stem[date.end():].strip('_')
+        endpoint = key if key in ('events', 'markets') else 'props'
+        return Artifact('bettingpros', endpoint, 'raw', '', key, date.group(0))
+    if rel[0] == 'ssim' and rel[1] == 'raw' and date and stem.startswith('NBA_'):
+        return Artifact('ssim', 'projections', 'raw', '', date.group(0), date.group(0))
+    return None
+
+def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """This thread's connection to the catalog, opened and created on first use.
+
+    The connection stays open for reuse; use it as a context manager to
+    commit, not to close it.
+    """
+    db_path = Path(db_path) if db_path else CATALOG_PATH
+    conns = _local.__dict__.setdefault('conns', {})
+    conn = conns.get(db_path)
+    if conn is None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA)
+        conns[db_path] = conn
+    return conn
+
+def _drop_stale(conn: sqlite3.Connection, paths: List[str], what: str) -> None:
+    """Delete rows for files moved or deleted outside the collectors."""
+    if paths:
+        logger.info(f"Dropping {len(paths)} cataloged {what} files no longer on disk")
+        conn.executemany("DELETE FROM artifacts WHERE path = ?", [(p,) for p in paths])
+
+def _count_rows(data: bytes, name: str) -> Optional[int]:
+    if not name.endswith('.csv'):
+        return None
+    lines = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+    return max(lines - 1, 0)
+
+def _row(path: Path, artifact: Artifact, rows: Optional[int], fetched_at: Optional[str]) -> tuple:
+    stored = None if path.exists() else rawstore.lookup(path)
+    if stored is not None:
+        # Raw payload kept in the content-addressed store, not as a file
+        return (str(path), *artifact, stored['hash'], rows, stored['bytes'], 0,
+                fetched_at or stored['saved_at'])
+    data = path.read_bytes()
+    stat = path.stat()
+    if rows is None:
+        rows = _count_rows(data, path.name)
+    fetched_at = fetched_at or datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(timespec='seconds')
+    return (str(path), *artifact, hashlib.md5(data).hexdigest(), rows, stat.st_size,
+            stat.st_mtime_ns, fetched_at)
+
+_UPSERT = f"INSERT OR REPLACE INTO artifacts ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+def record(path: Union[str, Path], date: Optional[str] = None, rows: Optional[int] = None,
+           db_path: Optional[Path] = None) -> Optional[Artifact]:
+    """Record a file a collector just wrote. Never raises: a catalog error only logs.
+
+    Args:
+        path: File written
+        date: Game or slate date (YYYY-MM-DD) when the name does not carry it
+        rows: Row count when already known (counted for CSVs otherwise)
+        db_path: Catalog database (default ``CATALOG_PATH``)
+    """
+    path = Path(path).resolve()
+    artifact = classify(path)
+    if artifact is None:
+        logger.debug(f"Not cataloged: {path}")
+        return None
+    if date and not artifact.date:
+        artifact = artifact._replace(date=date[:10])
+    try:
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with connect(db_path) as conn:
+            conn.execute(_UPSERT, _row(path, artifact, rows, now))
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not record {path} in catalog: {e}")
+    return artifact
+
+def scan(root: Optional[Path] = None, db_path: Optional[Path] = None,
+         game_dates: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+    """Bring the catalog in line with the files on disk.
+
+    Unchanged files (same size and mtime) are skipped; rows for files that no
+    longer exist are deleted.
+
+    Returns:
+        Counts of added/updated, unchanged and removed files
+    """
+    root = Path(root) if root else NBA_DATA_DIR
+    if game_dates is None:
+        game_dates = load_game_dates(root / "nba_com" / "game_ids")
+
+    counts = {'updated': 0, 'unchanged': 0, 'removed': 0}
+    with connect(db_path) as conn:
+        known = {path: (size, mtime, date, digest) for path, size, mtime, date, digest
+                 in conn.execute("SELECT path, bytes, mtime_ns, date, hash FROM artifacts")}
+        seen, rows = set(), []
+        for subdir in SCAN_DIRS:
+            for dirpath, _, files in os.walk(root / subdir):
+                for name in files:
+                    path = Path(dirpath, name).resolve()
+                    artifact = classify(path, game_dates)
+                    if artifact is None:
+                        continue
+                    seen.add(str(path))
+                    stat = path.stat()
+                    previous = known.get(str(path))
+                    if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                        counts['unchanged'] += 1
+                        if artifact.date and previous[2] != artifact.date:
+                            conn.execute("UPDATE artifacts SET date = ? WHERE path = ?", (artifact.date, str(path)))
+                        continue
+                    rows.append(_row(path, artifact, None, None))
+
+        # Raw payloads kept in the content-addressed store
+        for logical, entry in rawstore.entries(root).items():
+            path = (root / logical).resolve()
+            artifact = classify(path, game_dates)
+            if artifact is None or str(path) in seen:
+                continue
+            seen.add(str(path))
+            previous = known.get(str(path))
+            if previous and previous[3] == entry['hash']:
+                counts['unchanged'] += 1
+                continue
+            rows.append(_row(path, artifact, None, entry['saved_at']))
+        conn.executemany(_UPSERT, rows)
+        counts['updated'] = len(rows)
+
+        # Only forget files under the scanned root
+        stale = [p for p in known if p not in seen and Path(p).is_relative_to(root.resolve())]
+        conn.executemany("DELETE FROM artifacts WHERE path = ?", [(p,) for p in stale])
+        counts['removed'] = len(stale)
+    return counts
+
+def query(sql: str = "SELECT * FROM artifacts", params: Iterable = (),
+          db_path: Optional[Path] = None) -> pd.DataFrame:
+    """Run a read query against the catalog."""
+    return pd.read_sql_query(sql, connect(db_path), params=list(params))
+
+def has(source: str, endpoint: str, key: str, kind: Optional[str] = None, tbl: Optional[str] = None,
+        date: Optional[str] = None, db_path: Optional[Path] = None) -> bool:
+    """Whether an artifact is cataloged and still on disk or in the raw store.
+
+    Game ids may be in either form. Rows whose file was moved or deleted
+    outside the collectors (e.g. by dedupe or reorganize) are dropped, so
+    a stale row never hides a missing file.
+    """
+    if source == 'nba_com' and GAME_ID_RE.fullmatch(str(key)):
+        key = str(key).zfill(10)
+    sql = "SELECT path FROM artifacts WHERE source = ? AND endpoint = ? AND key = ?"
+    params = [source, endpoint, key]
+    for column, value in (('kind', kind), ('tbl', tbl), ('date', date)):
+        if value is not None:
+            sql += f" AND {column} = ?"
+            params.append(value)
+    with connect(db_path) as conn:
+        stale = []
+        for (path,) in conn.execute(sql, params).fetchall():
+            if rawstore.exists(path):
+                break
+            stale.append(path)
+        else:
+            path = None
+        _drop_stale(conn, stale, f"{source}/{endpoint}")
+        return path is not None
+
+def forget(path: Union[str, Path], db_path: Optional[Path] = None) -> None:
+    """Drop a moved or deleted file from the catalog."""
+    with connect(db_path) as conn:
+        conn.execute("DELETE FROM artifacts WHERE path = ?", (str(Path(path).resolve()),))
+
+def expected(date: str, game_ids: Iterable[str], books: Iterable[str]) -> pd.DataFrame:
+    """Artifacts a fully collected date should have."""
+    rows = [('nba_com', endpoint, kind, str(g).zfill(10)) for g in game_ids for endpoint, kind in GAME_ARTIFACTS]
+    rows += [('bettingpros', 'props', 'raw', book) for book in books]
+    rows += [('bettingpros', 'events', 'raw', 'events'), ('ssim', 'projections', 'raw', date)]
+    return pd.DataFrame(rows, columns=['source', 'endpoint', 'kind', 'key']).assign(date=date)
+
+def missing(date: str, game_ids: Optional[Iterable[str]] = None, books: Optional[Iterable[str]] = None,
+            db_path: Optional[Path] = None) -> pd.DataFrame:
+    """Artifacts expected for a date that the catalog does not have.
+
+    One query for the whole date; like ``has``, rows whose file is gone are
+    dropped and reported missing.
+
+    Args:
+        date: Date (YYYY-MM-DD)
+        game_ids: Games played that day (default: from the game-id index)
+        books: BettingPros books expected (default: every configured book)
+    """
+    if game_ids is None:
+        game_ids = [g for g, d in load_game_dates().items() if d == date]
+    if books is None:
+        books = list(utils.BOOKS_CONFIG['sportsbooks'])
+    want = expected(date, game_ids, books)
+    # Game files are matched by game id, since not every one carries a date
+    game_keys = want.loc[want['source'] == 'nba_com', 'key'].unique().tolist()
+    have = query("SELECT source, endpoint, kind, key, path FROM artifacts "
+                 "WHERE (source != 'nba_com' AND date = ?) "
+                 f"OR (source = 'nba_com' AND key IN ({', '.join('?' * len(game_keys))}))",
+                 [date, *game_keys], db_path)
+    on_disk = have['path'].map(rawstore.exists).astype(bool)
+    with connect(db_path) as conn:
+        _drop_stale(conn, have.loc[~on_disk, 'path'].tolist(), date)
+    have = have.loc[on_disk, ['source', 'endpoint', 'kind', 'key']].drop_duplicates()
+    merged = want.merge(have, on=['source', 'endpoint', 'kind', 'key'], how='left', indicator=True)
+    return merged.loc[merged['_merge'] == 'left_only', want.columns].reset_index(drop=True)
+
+def summary(db_path: Optional[Path] = None) -> pd.DataFrame:
+    """File, row and byte totals per source, endpoint and kind."""
+    return query("SELECT source, endpoint, kind, COUNT(*) AS files, SUM(rows) AS rows, "
+                 "SUM(bytes) AS bytes, MIN(date) AS first_date, MAX(date) AS last_date "
+                 "FROM artifacts GROUP BY source, endpoint, kind ORDER BY source, endpoint, kind",
+                 db_path=db_path)
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Catalog of collected NBA data files')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('scan', help='Backfill the catalog from disk')
+    missing_parser = sub.add_parser('missing', help='List artifacts missing for a date')
+    missing_parser.add_argument('date', help='Date (YYYY-MM-DD)')
+    sub.add_parser('summary', help='Totals per source and endpoint')
+    args = parser.parse_args()
+
+    configure()
+    if args.command == 'scan':
+        counts = scan()
+        print(f"Cataloged {counts['updated']} files, {counts['unchanged']} unchanged, "
+              f"{counts['removed']} removed")
+    elif args.command == 'missing':
+        df = missing(args.date)
+        print(f"Nothing missing for {args.date}" if df.empty else df.to_string(index=False))
+    else:
+        print(summary().to_string(index=False))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
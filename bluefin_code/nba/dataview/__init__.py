@@ -0,0 +1,15 @@
+"""Merged SaberSim + BettingPros data view package."""
+
+from .merge import (
+    create_view,
+    build_view,
+    materialize_view,
+    load_ssim_data,
+    load_bpro_data,
+    VIEW_COLUMNS
+)
+
+from .reader import (
+    query,
+    available_dates
+)
@@ -1,27 +1,296 @@
 #!/usr/bin/env python3
 
-import pandas as pd
+"""Merged view of SaberSim projections and BettingPros lines (see DATA_VIEW.md)."""
+
+import hashlib
+import json
+import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from bluefin_code.core.standardization.markets import MARKET_CODES
+from bluefin_code.core.standardization.player_ids import PlayerIndex, get_player_index
+from bluefin_code.core.standardization.player_names import name_key
+from bluefin_code.core.standardization.teams import TEAM_DTYPE, standardize_codes
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+
+logger = logging.getLogger(__name__)
+
+# Bump when the merge logic or schema changes so cached views are rebuilt
+VIEW_VERSION = 4
+
+PERCENTILES = [25, 50, 75, 85, 95, 99]
+
+VIEW_COLUMNS = [
+    'date', 'player', 'player_id', 'team', 'opp', 'market', 'book',
+    'line', 'o_odds', 'u_odds',
+    'ss_proj', 'ss_std', *[f'ss_p{p}' for p in PERCENTILES],
+    'bp_proj', 'bp_value', 'bp_edge', 'bp_prob', 'bp_rating',
+]
+
+# Fixed dtypes so every per-date view file shares one parquet schema
+VIEW_DTYPES = {
+    **{col: 'string' for col in ['date', 'player', 'market', 'book']},
+    'team': TEAM_DTYPE,
+    'opp': TEAM_DTYPE,
+    **{col: 'Int64' for col in ['player_id', 'o_odds', 'u_odds', 'bp_rating']},
+    **{col: 'float64' for col in VIEW_COLUMNS
+       if col.startswith(('ss_', 'bp_')) and col != 'bp_rating'},
+    'line': 'float64',
+}
+
+# Market code -> SaberSim projection column
+SSIM_MARKET_COLUMNS = {
+    'pts': 'points',
+    'reb': 'rebounds',
+    'ast': 'assists',
+    'stl': 'steals',
+    'blk': 'blocks',
+    'to': 'turnovers',
+    '3pm': 'three_pt_fg',
+    'pr': 'points_rebounds',
+    'pa': 'points_assists',
+    'ra': 'rebounds_assists',
+    'pra': 'points_rebounds_assists',
+    'stocks': 'stocks',
+}
+
+# BettingPros processed columns -> view columns
+BPRO_COLUMNS = {
+    'prop_type': 'market',
+    'sportsbook': 'book',
+    'over_odds': 'o_odds',
+    'under_odds': 'u_odds',
+    'opponent': 'bp_opp',
+    'projected_value': 'bp_proj',
+    'projected_ev': 'bp_value',
+    'projected_probability': 'bp_prob',
+    'bet_rating': 'bp_rating',
+}
+
+def get_year_month(date: str) -> str:
+    """Get YYYY-MM for a YYYY-MM-DD date."""
+    return datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
+
+def get_ssim_path(date: str) -> Path:
+    """Get SaberSim processed file for date."""
+    return DATA_ROOT / "nba" / "ssim" / "processed" / get_year_month(date) / f"ssim_{date}.csv"
+
+def get_bpro_path(date: str) -> Path:
+    """Get BettingPros processed file for date.
+
+    Prefers the full ``props_{date}.csv`` export and falls back to the
+    ``{date}.csv`` file written by ``bettingpros/process.py``.
+    """
+    month_dir = DATA_ROOT / "nba" / "bettingpros" / "processed" / get_year_month(date)
+    props_file = month_dir / f"props_{date}.csv"
+    if props_file.exists():
+        return props_file
+    return month_dir / f"{date}.csv"
+
+def get_view_path(date: str) -> Path:
+    """Get materialized view file for date."""
+    return DATA_ROOT / "nba" / "dataview" / get_year_month(date) / f"view_{date}.parquet"
+
+def get_meta_path(date: str) -> Path:
+    """Get cache metadata file for date."""
+    return DATA_ROOT / "nba" / "dataview" / "metadata" / f"{date}_meta.json"
 
 def load_ssim_data(date: str) -> pd.DataFrame:
     """Load SaberSim processed data for date."""
-    year_month = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
-    path = Path(f"bluefin_data/nba/ssim/processed/{year_month}/ssim_{date}.csv")
-    return pd.read_csv(path)
+    return pd.read_csv(get_ssim_path(date))
 
 def load_bpro_data(date: str) -> pd.DataFrame:
     """Load BettingPros processed data for date."""
-    year_month = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
-    path = Path(f"bluefin_data/nba/bettingpros/processed/{year_month}/{date}.csv")
-    return pd.read_csv(path)
+    return pd.read_csv(get_bpro_path(date))
+
+def player_keys(player_ids: pd.Series, names: pd.Series) -> pd.Series:
+    """Join key per row: the player_id, or the normalized name when unresolved.
+
+    Players missing from the index (rookies, two-way signings) still join
+    across sources by name until the index learns them.
+    """
+    return player_ids.astype('string').fillna('name:' + name_key(names))
+
+def prepare_ssim(ssim_df: pd.DataFrame, index: PlayerIndex) -> pd.DataFrame:
+    """Reshape SaberSim projections to one row per (player, market)."""
+    df = ssim_df.copy()
+    df['player_id'] = index.resolve_series(df['name'], source='ssim')
+    if 'pid' in df.columns:
+        for pid, player_id in df[['pid', 'player_id']].dropna().drop_duplicates('pid').itertuples(index=False):
+            index.link('ssim_pid', pid, int(player_id), method='name')
+    unresolved = df['player_id'].isna()
+    if unresolved.any():
+        logger.warning(f"Unresolved SaberSim players, joining by name: "
+                       f"{sorted(df.loc[unresolved, 'name'].astype(str))}")
+    df['player_key'] = player_keys(df['player_id'], df['name'])
+    df['ss_team'] = standardize_codes(df['team'])
+    df['ss_opp'] = standardize_codes(df['opponent'])
+    df = df.drop_duplicates('player_key', keep='first')
+
+    stat_cols = {col: mkt for mkt, col in SSIM_MARKET_COLUMNS.items() if col in df.columns}
+    id_cols = ['player_key', 'name', 'ss_team', 'ss_opp', 'dk_points', 'dk_std',
+               *[f'dk_{p}_percentile' for p in PERCENTILES]]
+    id_cols = [col for col in id_cols if col in df.columns]
+
+    long_df = df.melt(id_vars=id_cols, value_vars=list(stat_cols),
+                      var_name='ss_col', value_name='ss_proj')
+    long_df['market'] = long_df['ss_col'].map(stat_cols)
+
+    # SaberSim only publishes a distribution for DK fantasy points, so it is
+    # rescaled to each market by the ratio of the stat projection to dk_points
+    if 'dk_points' in long_df.columns:
+        dk_points = pd.to_numeric(long_df['dk_points'], errors='coerce')
+        ratio = long_df['ss_proj'] / dk_points.where(dk_points > 0)
+    else:
+        ratio = pd.Series(np.nan, index=long_df.index)
+    long_df['ss_std'] = long_df.get('dk_std', np.nan) * ratio
+    for p in PERCENTILES:
+        long_df[f'ss_p{p}'] = long_df.get(f'dk_{p}_percentile', np.nan) * ratio
+
+    keep = ['player_key', 'market', 'name', 'ss_team', 'ss_opp', 'ss_proj', 'ss_std',
+            *[f'ss_p{p}' for p in PERCENTILES]]
+    return long_df[keep]
+
+def prepare_bpro(bpro_df: pd.DataFrame, index: PlayerIndex) -> pd.DataFrame:
+    """Standardize BettingPros props to view keys."""
+    df = bpro_df.rename(columns=BPRO_COLUMNS)
+    for col in BPRO_COLUMNS.values():
+        if col not in df.columns:
+            df[col] = np.nan
+    df['player_id'] = index.resolve_series(df['player'], source='bettingpros')
+    df['player_key'] = player_keys(df['player_id'], df['player'])
+    df['team'] = standardize_codes(df['team'])
+    df['bp_opp'] = standardize_codes(df['bp_opp'])
+    df['market'] = df['market'].astype(str).str.strip().str.lower().map(MARKET_CODES)
+    df['book'] = df['book'].astype(str).str.strip().str.lower()
+    return df[df['market'].notna()]
+
+def build_view(ssim_df: pd.DataFrame, bpro_df: pd.DataFrame, date: str,
+               index: Optional[PlayerIndex] = None) -> pd.DataFrame:
+    """Merge SaberSim projections onto BettingPros lines.
+
+    Sources are joined on NBA.com ``player_id`` from the player identity
+    index, or on the normalized name for players the index cannot resolve.
+    One row per (player, market, book) prop; projection columns are
+    NaN when SaberSim has no matching player.
+    """
+    index = index or get_player_index()
+    props = prepare_bpro(bpro_df, index)
+    proj = prepare_ssim(ssim_df, index)
+
+    df = props.merge(proj, on=['player_key', 'market'], how='left', validate='many_to_one')
+    df['date'] = date
+    df['team'] = df['team'].fillna(df['ss_team'])
+    df['opp'] = df['ss_opp'].fillna(df['bp_opp'])
+    df['bp_edge'] = df['bp_proj'] - df['line']
+
+    matched = df['ss_proj'].notna()
+    if (~matched).any():
+        missing = df.loc[~matched, 'player'].nunique()
+        logger.info(f"{missing} players without SaberSim projections for {date}")
+
+    df = df[VIEW_COLUMNS].sort_values(['player', 'market', 'book'], ignore_index=True)
+    for col in ['o_odds', 'u_odds', 'bp_rating']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').round()
+    return df.astype(VIEW_DTYPES)
+
+def file_hash(path: Path) -> str:
+    """Hash file contents."""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def source_fingerprint(path: Path, cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Fingerprint a source file, reusing the cached hash when mtime and size match."""
+    stat = path.stat()
+    if (cached and cached.get('path') == str(path)
+            and cached.get('mtime_ns') == stat.st_mtime_ns
+            and cached.get('size') == stat.st_size):
+        return cached
+    return {
+        'path': str(path),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'hash': file_hash(path),
+    }
+
+def load_meta(date: str) -> Dict[str, Any]:
+    """Load cache metadata for date."""
+    meta_file = get_meta_path(date)
+    if not meta_file.exists():
+        return {}
+    with open(meta_file) as f:
+        return json.load(f)
+
+def save_meta(date: str, meta: Dict[str, Any]) -> None:
+    """Save cache metadata for date."""
+    meta_file = get_meta_path(date)
+    meta_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(meta_file, 'w') as f:
+        json.dump(meta, f, indent=2)
+
+def is_view_fresh(date: str, meta: Dict[str, Any], sources: Dict[str, Dict[str, Any]],
+                  player_index: Optional[str] = None) -> bool:
+    """Check cached view against the current source fingerprints and player index version."""
+    if not meta or meta.get('version') != VIEW_VERSION or not get_view_path(date).exists():
+        return False
+    if player_index is not None and meta.get('player_index') != player_index:
+        return False
+    cached = meta.get('sources', {})
+    return all(
+        cached.get(name, {}).get('hash') == fp['hash']
+        for name, fp in sources.items()
+    )
+
+def materialize_view(date: str, force: bool = False) -> Path:
+    """Build the view file for date if it is missing or stale.
+
+    The view is materialized to ``bluefin_data/nba/dataview/YYYY-MM/view_{date}.parquet``
+    and only rebuilt when either source file changes (mtime first, then content hash)
+    or the player index has gained aliases since the view was built.
+    """
+    index = get_player_index()
+    meta = load_meta(date)
+    cached_sources = meta.get('sources', {})
+    sources = {
+        'ssim': source_fingerprint(get_ssim_path(date), cached_sources.get('ssim')),
+        'bpro': source_fingerprint(get_bpro_path(date), cached_sources.get('bpro')),
+    }
+    view_file = get_view_path(date)
+
+    if not force and is_view_fresh(date, meta, sources, index.version):
+        if sources != cached_sources:
+            # Touched but unchanged inputs - refresh mtimes so the next check is cheap
+            meta['sources'] = sources
+            save_meta(date, meta)
+        logger.debug(f"Using cached view {view_file}")
+        return view_file
+
+    logger.info(f"Building merged view for {date}")
+    df = build_view(load_ssim_data(date), load_bpro_data(date), date)
+    index.save()
+
+    view_file.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(view_file, index=False)
+    save_meta(date, {
+        'version': VIEW_VERSION,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'rows': len(df),
+        'sources': sources,
+        'player_index': index.version,
+    })
+    return view_file
 
-def create_view(date: str) -> pd.DataFrame:
+def create_view(date: str, force: bool = False) -> pd.DataFrame:
     """Create combined view of projections and lines."""
-    ssim_df = load_ssim_data(date)
-    bpro_df = load_bpro_data(date)
-    
-    # TODO: Implement merge logic
-    
-    return pd.DataFrame() 
\ No newline at end of file
+    return pd.read_parquet(materialize_view(date, force))
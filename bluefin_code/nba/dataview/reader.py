@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""Multi-date queries over the materialized data views."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+from bluefin_code.core.standardization.markets import MARKET_CODES
+from . import merge
+
+logger = logging.getLogger(__name__)
+
+def date_range(start: str, end: Optional[str] = None) -> List[str]:
+    """Get list of dates between start and end (inclusive)."""
+    current = datetime.strptime(start, "%Y-%m-%d")
+    last = datetime.strptime(end, "%Y-%m-%d") if end else current
+    dates = []
+    while current <= last:
+        dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return dates
+
+def _dates_in(directory, pattern: str, prefix: str, suffix: str) -> set:
+    """Extract dates from file names matching pattern in a directory."""
+    if not directory.exists():
+        return set()
+    return {p.name[len(prefix):-len(suffix)] for p in directory.glob(pattern)}
+
+def available_dates(start: str, end: Optional[str] = None) -> List[str]:
+    """Get dates in range that have both SaberSim and BettingPros data.
+
+    Lists each month directory once instead of probing every date.
+    """
+    wanted = date_range(start, end)
+    found = set()
+    for year_month in sorted({d[:7] for d in wanted}):
+        ssim_dir = merge.get_ssim_path(f"{year_month}-01").parent
+        bpro_dir = merge.get_bpro_path(f"{year_month}-01").parent
+        ssim_dates = _dates_in(ssim_dir, "ssim_*.csv", "ssim_", ".csv")
+        bpro_dates = (_dates_in(bpro_dir, "props_????-??-??.csv", "props_", ".csv")
+                      | _dates_in(bpro_dir, "????-??-??.csv", "", ".csv"))
+        found |= ssim_dates & bpro_dates
+    return [d for d in wanted if d in found]
+
+def _isin(field: str, values: Optional[Iterable[str]]) -> Optional[ds.Expression]:
+    """Build an isin filter expression, or None when no values are given."""
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = [values]
+    return ds.field(field).isin(list(values))
+
+def query(start: str,
+          end: Optional[str] = None,
+          players: Optional[Iterable[str]] = None,
+          markets: Optional[Iterable[str]] = None,
+          books: Optional[Iterable[str]] = None,
+          columns: Optional[List[str]] = None,
+          refresh: bool = True) -> pd.DataFrame:
+    """Query the merged view across a date range.
+
+    Only the per-date view files in range are scanned; column selection and
+    player/market/book filters are pushed down to the parquet reader.
+
+    Args:
+        start: First date (YYYY-MM-DD)
+        end: Last date, inclusive (defaults to start)
+        players: Player names to keep
+        markets: Market codes or names to keep (pts, reb, points, ...)
+        books: Book abbreviations to keep (dk, fd, ...)
+        columns: View columns to return (defaults to all)
+        refresh: Rebuild stale or missing views before reading
+
+    Returns:
+        One DataFrame for the whole range
+    """
+    dates = available_dates(start, end)
+    if refresh:
+        paths = []
+        for date in dates:
+            try:
+                paths.append(merge.materialize_view(date))
+            except FileNotFoundError as e:
+                logger.warning(f"Skipping {date}: {e}")
+    else:
+        paths = [p for p in map(merge.get_view_path, dates) if p.exists()]
+
+    columns = list(columns) if columns else list(merge.VIEW_COLUMNS)
+    unknown = [col for col in columns if col not in merge.VIEW_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown view columns: {unknown}")
+    if not paths:
+        return pd.DataFrame(columns=columns)
+
+    if markets is not None:
+        markets = [markets] if isinstance(markets, str) else markets
+        markets = [MARKET_CODES.get(str(m).strip().lower(), str(m).lower()) for m in markets]
+    if books is not None:
+        books = [books] if isinstance(books, str) else books
+        books = [str(b).strip().lower() for b in books]
+
+    expr = None
+    for part in (_isin('player', players), _isin('market', markets), _isin('book', books)):
+        if part is not None:
+            expr = part if expr is None else expr & part
+
+    dataset = ds.dataset([str(p) for p in paths], format='parquet')
+    table = dataset.to_table(columns=columns, filter=expr)
+    logger.info(f"Read {table.num_rows} rows from {len(paths)} views")
+    return table.to_pandas()
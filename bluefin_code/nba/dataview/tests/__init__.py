@@ -0,0 +1 @@
+"""Data view tests package."""
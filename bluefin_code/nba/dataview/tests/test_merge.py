@@ -0,0 +1,154 @@
+"""Test merged view creation and caching."""
+
+import os
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from .. import merge
+from bluefin_code.core.standardization.player_ids import PlayerIndex
+
+DATE = "2024-12-06"
+
+@pytest.fixture(autouse=True)
+def player_index(tmp_path, monkeypatch) -> PlayerIndex:
+    """Use a small player index persisted under a temporary directory."""
+    index = PlayerIndex(tmp_path / "player_index.csv", players=[
+        (203999, 'Nikola Jokic', True),
+        (1630530, 'Trey Murphy III', True),
+    ])
+    monkeypatch.setattr(merge, 'get_player_index', lambda: index)
+    return index
+
+@pytest.fixture
+def ssim_df() -> pd.DataFrame:
+    """Create sample SaberSim processed data."""
+    return pd.DataFrame({
+        'name': ['Nikola Jokic', 'Trey Murphy III'],
+        'team': ['DEN', 'NOP'],
+        'opponent': ['PHX', 'GS'],
+        'points': [30.0, 18.0],
+        'rebounds': [12.0, 5.0],
+        'assists': [9.0, 2.0],
+        'steals': [1.2, 1.0],
+        'blocks': [0.8, 0.6],
+        'turnovers': [3.1, 1.4],
+        'three_pt_fg': [1.5, 3.0],
+        'points_rebounds': [42.0, 23.0],
+        'points_assists': [39.0, 20.0],
+        'rebounds_assists': [21.0, 7.0],
+        'points_rebounds_assists': [51.0, 25.0],
+        'stocks': [2.0, 1.6],
+        'dk_points': [60.0, 36.0],
+        'dk_std': [12.0, 9.0],
+        'dk_25_percentile': [50.0, 30.0],
+        'dk_50_percentile': [60.0, 36.0],
+        'dk_75_percentile': [70.0, 42.0],
+        'dk_85_percentile': [75.0, 45.0],
+        'dk_95_percentile': [85.0, 50.0],
+        'dk_99_percentile': [95.0, 58.0],
+    })
+
+@pytest.fixture
+def bpro_df() -> pd.DataFrame:
+    """Create sample BettingPros processed data."""
+    return pd.DataFrame({
+        'player': ['Nikola Jokic', 'Nikola Jokic', 'Trey Murphy', 'Unknown Player'],
+        'team': ['DEN', 'DEN', 'NOR', 'BOS'],
+        'opponent': [np.nan] * 4,
+        'prop_type': ['pts', 'pts', '3pm', 'reb'],
+        'line': [29.5, 30.5, 2.5, 4.5],
+        'over_odds': [-110, -115, 105, -110],
+        'under_odds': [-110, -105, -130, -110],
+        'sportsbook': ['dk', 'fd', 'mgm', 'dk'],
+        'projected_value': [31.5, 31.5, 3.1, 5.0],
+        'projected_ev': [0.1, 0.05, 0.2, 0.0],
+        'projected_probability': [0.6, 0.55, 0.62, 0.5],
+        'bet_rating': [3, 2, 4, 1],
+    })
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch, ssim_df, bpro_df):
+    """Write sample sources under a temporary data root."""
+    monkeypatch.setattr(merge, 'DATA_ROOT', tmp_path)
+    ssim_path = merge.get_ssim_path(DATE)
+    bpro_path = tmp_path / "nba/bettingpros/processed/2024-12" / f"props_{DATE}.csv"
+    ssim_path.parent.mkdir(parents=True)
+    bpro_path.parent.mkdir(parents=True)
+    ssim_df.to_csv(ssim_path, index=False)
+    bpro_df.to_csv(bpro_path, index=False)
+    return tmp_path
+
+def test_build_view(ssim_df, bpro_df):
+    """Test merge keys, schema and rescaled percentiles."""
+    df = merge.build_view(ssim_df, bpro_df, DATE)
+
+    assert list(df.columns) == merge.VIEW_COLUMNS
+    assert len(df) == len(bpro_df)
+
+    jokic = df[(df['player'] == 'Nikola Jokic') & (df['book'] == 'dk')].iloc[0]
+    assert jokic['ss_proj'] == 30.0
+    assert jokic['ss_std'] == pytest.approx(6.0)  # 12 * 30/60
+    assert jokic['ss_p75'] == pytest.approx(35.0)  # 70 * 30/60
+    assert jokic['bp_edge'] == pytest.approx(2.0)
+    assert jokic['opp'] == 'PHX'
+    assert jokic['player_id'] == 203999
+
+    # Suffix and team variations still join
+    murphy = df[df['player'] == 'Trey Murphy'].iloc[0]
+    assert murphy['team'] == 'NOP'
+    assert murphy['opp'] == 'GSW'
+    assert murphy['ss_proj'] == 3.0
+
+    # Unmatched players keep their lines with empty projections
+    unknown = df[df['player'] == 'Unknown Player'].iloc[0]
+    assert np.isnan(unknown['ss_proj'])
+    assert unknown['line'] == 4.5
+
+def test_build_view_unresolved_players(ssim_df, bpro_df):
+    """Test players missing from the index still join by name."""
+    rookie = ssim_df.iloc[[0]].assign(name='Unknown Player', team='BOS', rebounds=6.0)
+    df = merge.build_view(pd.concat([ssim_df, rookie], ignore_index=True), bpro_df, DATE)
+
+    unknown = df[df['player'] == 'Unknown Player'].iloc[0]
+    assert unknown['ss_proj'] == 6.0
+    assert pd.isna(unknown['player_id'])
+    assert df.loc[df['player'] == 'Nikola Jokic', 'ss_proj'].tolist() == [30.0, 30.0]
+
+def test_create_view_cached(data_root, player_index, monkeypatch):
+    """Test view is served from cache until a source changes."""
+    first = merge.create_view(DATE)
+    assert merge.get_view_path(DATE).exists()
+
+    builds = []
+    original = merge.build_view
+    monkeypatch.setattr(merge, 'build_view', lambda *a: builds.append(a) or original(*a))
+
+    # Unchanged sources - no rebuild
+    pd.testing.assert_frame_equal(merge.create_view(DATE), first)
+    assert builds == []
+
+    # Touched but identical content - no rebuild
+    ssim_path = merge.get_ssim_path(DATE)
+    stat = ssim_path.stat()
+    os.utime(ssim_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    merge.create_view(DATE)
+    assert builds == []
+
+    # Changed content - rebuild
+    bpro_path = merge.get_bpro_path(DATE)
+    bpro = pd.read_csv(bpro_path)
+    bpro.loc[0, 'line'] = 28.5
+    bpro.to_csv(bpro_path, index=False)
+    rebuilt = merge.create_view(DATE)
+    assert len(builds) == 1
+    assert 28.5 in rebuilt['line'].values
+
+    # New player aliases - rebuild
+    player_index.link('bettingpros', 'Unknown Player', 203999)
+    player_index.save()
+    merge.create_view(DATE)
+    assert len(builds) == 2
+    merge.create_view(DATE)
+    assert len(builds) == 2
@@ -0,0 +1,55 @@
+"""Test multi-date view queries."""
+
+import pytest
+
+from .. import merge, reader
+from .test_merge import ssim_df, bpro_df, player_index
+
+DATES = ["2024-12-05", "2024-12-06", "2024-12-08"]
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch, ssim_df, bpro_df):
+    """Write sample sources for several dates."""
+    monkeypatch.setattr(merge, 'DATA_ROOT', tmp_path)
+    for date in DATES:
+        ssim_path = merge.get_ssim_path(date)
+        bpro_path = ssim_path.parents[3] / "bettingpros/processed/2024-12" / f"props_{date}.csv"
+        ssim_path.parent.mkdir(parents=True, exist_ok=True)
+        bpro_path.parent.mkdir(parents=True, exist_ok=True)
+        ssim_df.to_csv(ssim_path, index=False)
+        bpro_df.to_csv(bpro_path, index=False)
+
+    # SaberSim only - not queryable
+    merge.get_ssim_path("2024-12-07").write_text(ssim_df.to_csv(index=False))
+    return tmp_path
+
+def test_available_dates(data_root):
+    """Test only dates with both sources are returned."""
+    assert reader.available_dates("2024-12-01", "2024-12-31") == DATES
+    assert reader.available_dates("2024-12-07") == []
+
+def test_query_filters(data_root):
+    """Test filters and column selection across dates."""
+    df = reader.query("2024-12-01", "2024-12-31")
+    assert len(df) == 4 * len(DATES)
+    assert sorted(df['date'].unique()) == DATES
+
+    df = reader.query("2024-12-05", "2024-12-06", markets=['points'], books='dk',
+                     columns=['date', 'player', 'line', 'ss_proj'])
+    assert list(df.columns) == ['date', 'player', 'line', 'ss_proj']
+    assert len(df) == 2
+    assert (df['player'] == 'Nikola Jokic').all()
+
+    df = reader.query("2024-12-01", "2024-12-31", players=['Trey Murphy'])
+    assert len(df) == len(DATES)
+
+def test_query_without_refresh(data_root):
+    """Test refresh=False only reads existing views."""
+    assert reader.query("2024-12-05", refresh=False).empty
+    reader.query("2024-12-05")
+    assert len(reader.query("2024-12-05", refresh=False)) == 4
+
+def test_query_unknown_column(data_root):
+    """Test unknown columns are rejected."""
+    with pytest.raises(ValueError, match="Unknown view columns"):
+        reader.query("2024-12-05", columns=['nope'])
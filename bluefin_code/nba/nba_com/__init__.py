@@ -0,0 +1,6 @@
+"""NBA.com stats collection package."""
+
+from bluefin_code.nba.urls import apply_nba_url
+
+# Honor BLUEFIN_NBA_URL (e.g. the offline replay server) for every collector
+apply_nba_url()
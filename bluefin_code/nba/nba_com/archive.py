@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""Compressed archive of complete nba_api responses.
+
+Each endpoint response is stored once, with every result set, as compact
+gzipped JSON::
+
+    bluefin_data/nba/nba_com/{endpoint}/archive/YYYY-MM/{game_id}.json.gz
+
+Collectors fetch through ``fetch_frames``, which only calls the API when
+the game is not archived yet. Raw and processed CSV tables are derived
+from the archive, and ``derive`` builds a table for any archived result
+set (e.g. the advanced ``TeamStats`` the collector never kept) without
+another network call.
+"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+from bluefin_code.core.instrument import stage
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com.ids import GameId
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_COM_DIR = DATA_ROOT / "nba" / "nba_com"
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_LEVEL = 6
+
+def get_archive_dir(endpoint: str) -> Path:
+    """Get archive directory for an endpoint (e.g. ``boxscoreadvancedv2``)."""
+    return NBA_COM_DIR / endpoint / "archive"
+
+def get_archive_path(endpoint: str, game_id: str, date: str) -> Path:
+    """Get archive file for a game."""
+    return get_archive_dir(endpoint) / date[:7] / f"{GameId(game_id)}.json.gz"
+
+def find_archive(endpoint: str, game_id: str, date: Optional[str] = None) -> Optional[Path]:
+    """Locate a game's archived response, searching every month when date is unknown."""
+    if date:
+        path = get_archive_path(endpoint, game_id, date)
+        if path.exists():
+            return path
+    return next(get_archive_dir(endpoint).glob(f"*/{GameId(game_id)}.json.gz"), None)
+
+def save_response(endpoint: str, game_id: str, date: str, response: Dict[str, Any],
+                  params: Optional[Dict[str, Any]] = None) -> Path:
+    """Archive a raw response dict atomically."""
+    path = get_archive_path(endpoint, game_id, date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    record = {
+        'endpoint': endpoint,
+        'game_id': GameId(game_id),
+        'date': date,
+        'params': params or {},
+        'fetched': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'response': response,
+    }
+    tmp_path = path.with_suffix('.tmp')
+    with gzip.open(tmp_path, 'wt', compresslevel=COMPRESS_LEVEL) as f:
+        json.dump(record, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    catalog.record(path, date)
+    return path
+
+def load_response(endpoint: str, game_id: str, date: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Load an archived response dict, or None when the game is not archived."""
+    path = find_archive(endpoint, game_id, date)
+    if path is None:
+        return None
+    with gzip.open(path, 'rt') as f:
+        return json.load(f)['response']
+
+def to_frames(response: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    """Build one DataFrame per named result set."""
+    results = response.get('resultSets', response.get('resultSet', []))
+    if isinstance(results, dict):
+        results = [results]
+    return {
+        result['name']: pd.DataFrame(result.get('rowSet', []), columns=result.get('headers', []))
+        for result in results if 'name' in result
+    }
+
+def fetch_frames(endpoint: str, game_id: str, date: str, request: Callable[[], Any],
+                 force_fresh: bool = False, params: Optional[Dict[str, Any]] = None
+                 ) -> Dict[str, pd.DataFrame]:
+    """Get every result set for a game, calling the API only when not archived.
+
+    Args:
+        endpoint: Endpoint directory name
+        game_id: Game id
+        date: Game date (YYYY-MM-DD), used for the archive month
+        request: Zero-argument callable returning an nba_api endpoint instance
+        force_fresh: Re-fetch and overwrite the archived response
+        params: Request parameters recorded alongside the response
+    """
+    with stage('fetch', source='nba', key=endpoint) as s:
+        response = None if force_fresh else load_response(endpoint, game_id, date)
+        s.cache_hit = response is not None
+        if response is None:
+            start = time.perf_counter()
+            response = request().get_dict()
+            s.api_latency = round(time.perf_counter() - start, 6)
+            path = save_response(endpoint, game_id, date, response, params)
+            s.bytes = path.stat().st_size
+            logger.info("Archived %s response for %s to %s", endpoint, GameId(game_id), path)
+        frames = to_frames(response)
+        s.rows = sum(len(frame) for frame in frames.values())
+    return frames
+
+def derive(endpoint: str, result_set: str, game_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Table of one result set across archived games (all archived games by default)."""
+    if game_ids is None:
+        paths = sorted(get_archive_dir(endpoint).glob("*/*.json.gz"))
+    else:
+        paths = [p for p in (find_archive(endpoint, g) for g in game_ids) if p is not None]
+
+    frames = []
+    for path in paths:
+        with gzip.open(path, 'rt') as f:
+            frame = to_frames(json.load(f)['response']).get(result_set)
+        if frame is not None and not frame.empty:
+            frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
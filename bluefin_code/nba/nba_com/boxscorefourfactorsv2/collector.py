@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
+import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from nba_api.stats.endpoints import boxscorefourfactorsv2
 
+from bluefin_code.core.logs import configure
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com import archive
+from bluefin_code.nba.nba_com.clock import parse_minutes
+from bluefin_code.nba.nba_com.ids import GameId, find_game_file, game_file
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -13,6 +20,8 @@ BASE_DIR = DATA_ROOT / "nba" / "nba_com" / "boxscorefourfactorsv2"
 RAW_DIR = BASE_DIR / "raw"
 PROCESSED_DIR = BASE_DIR / "processed"
 
+logger = logging.getLogger(__name__)
+
 def get_year_month(date: str) -> str:
     """
     Get year-month string from date.
@@ -28,47 +37,50 @@ def get_year_month(date: str) -> str:
 
 def get_four_factors_stats(game_id: str, date: str, force_fresh: bool = False) -> Optional[pd.DataFrame]:
     """Get four factors stats for a game from NBA.com."""
-    print(f"\nFetching four factors stats for game {game_id}")
+    game_id = GameId(game_id)
+    logger.debug("Fetching four factors stats for game %s", game_id)
     
     # Get year-month for organization
     year_month = get_year_month(date)
     
     # Create cache path
     cache_dir = RAW_DIR / year_month
-    cache_path = cache_dir / f"{game_id}.csv"
+    cache_path = game_file(cache_dir, game_id)
     
-    # Return cached data if it exists and we're not forcing fresh
-    if not force_fresh and cache_path.exists():
-        print(f"Using cached data from {cache_path}")
-        return pd.read_csv(cache_path)
+    # Return cached data (canonical or legacy file name) unless forcing fresh
+    cached = find_game_file(cache_dir, game_id)
+    if not force_fresh and cached:
+        logger.debug("Using cached data from %s", cached)
+        return pd.read_csv(cached, dtype={'GAME_ID': str})
     
     # Ensure cache directory exists
     cache_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        print("Fetching data from NBA API...")
-        # Get data from NBA API
-        boxscore = boxscorefourfactorsv2.BoxScoreFourFactorsV2(
-            game_id=game_id,
-            start_period='0',  # API expects strings
-            end_period='10',
-            start_range='0',
-            end_range='28800',
-            range_type='0'
+        params = dict(start_period='0', end_period='10', start_range='0',
+                      end_range='28800', range_type='0')
+        # All result sets are archived; the raw CSV is derived from the archive
+        frames = archive.fetch_frames(
+            "boxscorefourfactorsv2", game_id, date,
+            lambda: boxscorefourfactorsv2.BoxScoreFourFactorsV2(game_id=game_id, **params),
+            force_fresh=force_fresh, params=params,
         )
         
-        # Convert to DataFrame
-        df = boxscore.get_data_frames()[0]
-        print(f"Got data with {len(df)} rows")
+        df = frames.get('sqlPlayersFourFactors')
+        if df is None or df.empty:
+            logger.warning("No data returned from API")
+            return None
+        logger.debug("Got data with %s rows", len(df))
         
         # Cache the raw data
         df.to_csv(cache_path, index=False)
-        print(f"Cached raw data to {cache_path}")
+        catalog.record(cache_path, date, len(df))
+        logger.debug("Cached raw data to %s", cache_path)
         
         return df
         
     except Exception as e:
-        print(f"Error getting data for game {game_id}: {str(e)}")
+        logger.error("Error getting data for game %s: %s", game_id, e)
         return None
 
 def process_four_factors_stats(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
@@ -100,50 +112,33 @@ def process_four_factors_stats(df: Optional[pd.DataFrame]) -> Optional[pd.DataFr
     df = df[cols.keys()].rename(columns=cols)
     
     # Convert minutes to float
-    def convert_minutes(x) -> float:
-        if pd.isna(x) or not str(x).strip():
-            return 0.0
-        x_str = str(x).strip()
-        if ':' in x_str:
-            try:
-                minutes, seconds = x_str.split(':')
-                return float(minutes) + float(seconds)/60
-            except (ValueError, IndexError):
-                print(f"Warning: Could not parse minutes value: {x_str}")
-                return 0.0
-        try:
-            return float(x_str)
-        except ValueError:
-            print(f"Warning: Could not convert minutes value to float: {x_str}")
-            return 0.0
-    
-    df['minutes'] = df['minutes'].apply(convert_minutes)
+    df['minutes'] = parse_minutes(df['minutes'])
     
     # Convert percentage columns to actual percentages
     pct_cols = [col for col in df.columns if 'pct' in col.lower()]
     for col in pct_cols:
         df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0) / 100
     
-    # Print some debug info
-    print(f"\nProcessed {len(df)} rows of four factors stats")
-    print(f"Players with minutes > 0: {len(df[df['minutes'] > 0])}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processed %s rows of four factors stats, %s players with minutes > 0",
+                     len(df), int((df['minutes'] > 0).sum()))
     
     return df
 
 def save_four_factors_stats(game_id: str, date: str, force_fresh: bool = False) -> None:
     """Get and save four factors stats for a game."""
-    print(f"\nProcessing game {game_id} from {date}")
+    logger.debug("Processing game %s from %s", game_id, date)
     
     # Get raw data
     raw_df = get_four_factors_stats(game_id, date, force_fresh)
     if raw_df is None:
-        print("Failed to get raw data")
+        logger.warning("Failed to get raw data")
         return
     
     # Process data
     df = process_four_factors_stats(raw_df)
     if df is None:
-        print("Failed to process data")
+        logger.warning("Failed to process data")
         return
     
     # Get year-month
@@ -152,12 +147,14 @@ def save_four_factors_stats(game_id: str, date: str, force_fresh: bool = False)
     save_dir.mkdir(parents=True, exist_ok=True)
     
     # Save processed data
-    save_path = save_dir / f"four_factors_{game_id}.csv"
+    save_path = game_file(save_dir, game_id, "four_factors_{game_id}.csv")
     df.to_csv(save_path, index=False)
-    print(f"Saved processed data to {save_path}")
+    catalog.record(save_path, date, len(df))
+    logger.info("Saved processed data to %s", save_path)
 
 def main():
     """Example usage."""
+    configure()
     print("\nNBA Four Factors Stats Collector")
     print("------------------------------")
     
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
+import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict
 from nba_api.stats.endpoints import boxscoresummaryv2
 
+from bluefin_code.core.logs import configure
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com import archive
+from bluefin_code.nba.nba_com.ids import GameId, find_game_file, game_file, normalize_game_ids
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -13,6 +19,8 @@ BASE_DIR = DATA_ROOT / "nba" / "nba_com" / "boxscoresummaryv2"
 RAW_DIR = BASE_DIR / "raw"
 PROCESSED_DIR = BASE_DIR / "processed"
 
+logger = logging.getLogger(__name__)
+
 def get_year_month(date: str) -> str:
     """
     Get year-month string from date.
@@ -28,17 +36,13 @@ def get_year_month(date: str) -> str:
 
 def get_summary_stats(game_id: str, date: str, force_fresh: bool = False) -> Optional[Dict[str, pd.DataFrame]]:
     """Get summary stats for a game from NBA.com."""
-    # Ensure game_id is a string and properly formatted
-    game_id = str(game_id)
-    if len(game_id) == 10:  # Already full format (0022300001)
-        api_game_id = game_id
-    elif len(game_id) == 8:  # Short format (22300001)
-        api_game_id = f"00{game_id}"
-    else:
-        print(f"Invalid game ID format: {game_id}")
+    try:
+        game_id = GameId(game_id)
+    except ValueError as e:
+        logger.error("%s", e)
         return None
     
-    print(f"\nFetching summary stats for game {game_id}")
+    logger.debug("Fetching summary stats for game %s", game_id)
     
     # Get year-month for organization
     year_month = get_year_month(date)
@@ -49,37 +53,36 @@ def get_summary_stats(game_id: str, date: str, force_fresh: bool = False) -> Opt
     
     # Cache paths for each result set
     cache_paths = {
-        'summary': cache_dir / f"{game_id}_summary.csv",
-        'line': cache_dir / f"{game_id}_line.csv"
+        'summary': game_file(cache_dir, game_id, "{game_id}_summary.csv"),
+        'line': game_file(cache_dir, game_id, "{game_id}_line.csv")
     }
     
-    # Return cached data if it exists and we're not forcing fresh
-    if not force_fresh and all(p.exists() for p in cache_paths.values()):
-        print(f"Using cached data from {cache_dir}")
-        return {
-            'summary': pd.read_csv(cache_paths['summary']),
-            'line': pd.read_csv(cache_paths['line'])
-        }
+    # Return cached data (canonical or legacy file names) unless forcing fresh
+    cached = {key: find_game_file(cache_dir, game_id, f"{{game_id}}_{key}.csv") for key in cache_paths}
+    if not force_fresh and all(cached.values()):
+        logger.debug("Using cached data from %s", cache_dir)
+        return {key: pd.read_csv(path, dtype={'GAME_ID': str}) for key, path in cached.items()}
     
     try:
-        print("Fetching data from NBA API...")
-        boxscore = boxscoresummaryv2.BoxScoreSummaryV2(game_id=api_game_id)
-        
-        # Get all result sets
-        all_dfs = boxscore.get_data_frames()
+        # All result sets are archived; the raw CSVs are derived from the archive
+        frames = archive.fetch_frames(
+            "boxscoresummaryv2", game_id, date,
+            lambda: boxscoresummaryv2.BoxScoreSummaryV2(game_id=game_id),
+            force_fresh=force_fresh,
+        )
         
-        if not all_dfs:
-            print("No data returned from API")
+        game_summary = frames.get('GameSummary')
+        line_score = frames.get('LineScore')
+        if game_summary is None or line_score is None:
+            logger.warning("No data returned from API")
             return None
-            
-        # Get relevant result sets
-        game_summary = all_dfs[0]  # GameSummary
-        line_score = all_dfs[5]    # LineScore
         
         # Cache the raw data
         game_summary.to_csv(cache_paths['summary'], index=False)
+        catalog.record(cache_paths['summary'], date, len(game_summary))
         line_score.to_csv(cache_paths['line'], index=False)
-        print(f"Cached raw data to {cache_dir}")
+        catalog.record(cache_paths['line'], date, len(line_score))
+        logger.debug("Cached raw data to %s", cache_dir)
         
         return {
             'summary': game_summary,
@@ -87,7 +90,7 @@ def get_summary_stats(game_id: str, date: str, force_fresh: bool = False) -> Opt
         }
         
     except Exception as e:
-        print(f"Error getting data for game {game_id}: {str(e)}")
+        logger.error("Error getting data for game %s: %s", game_id, e)
         return None
 
 def process_summary_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[Dict[str, pd.DataFrame]]:
@@ -145,10 +148,12 @@ def process_summary_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[D
     for col in point_cols:
         line_score[col] = pd.to_numeric(line_score[col], errors='coerce').fillna(0)
     
+    for df in (game_summary, line_score):
+        if 'game_id' in df.columns:
+            df['game_id'] = normalize_game_ids(df['game_id'])
+    
     # Print some debug info
-    print(f"\nProcessed game summary and line score data")
-    print(f"Game summary rows: {len(game_summary)}")
-    print(f"Line score rows: {len(line_score)}")
+    logger.debug("Processed game summary (%s rows) and line score (%s rows)", len(game_summary), len(line_score))
     
     return {
         'summary': game_summary,
@@ -157,18 +162,18 @@ def process_summary_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[D
 
 def save_summary_stats(game_id: str, date: str, force_fresh: bool = False) -> None:
     """Get and save summary stats for a game."""
-    print(f"\nProcessing game {game_id} from {date}")
+    logger.debug("Processing game %s from %s", game_id, date)
     
     # Get raw data
     raw_data = get_summary_stats(game_id, date, force_fresh)
     if raw_data is None:
-        print("Failed to get raw data")
+        logger.warning("Failed to get raw data")
         return
     
     # Process data
     data = process_summary_stats(raw_data)
     if data is None:
-        print("Failed to process data")
+        logger.warning("Failed to process data")
         return
     
     # Get year-month
@@ -177,15 +182,18 @@ def save_summary_stats(game_id: str, date: str, force_fresh: bool = False) -> No
     save_dir.mkdir(parents=True, exist_ok=True)
     
     # Save processed data
-    game_path = save_dir / f"summary_{game_id}.csv"
-    line_path = save_dir / f"line_{game_id}.csv"
+    game_path = game_file(save_dir, game_id, "summary_{game_id}.csv")
+    line_path = game_file(save_dir, game_id, "line_{game_id}.csv")
     
     data['summary'].to_csv(game_path, index=False)
+    catalog.record(game_path, date, len(data['summary']))
     data['line'].to_csv(line_path, index=False)
-    print(f"Saved processed data to {save_dir}")
+    catalog.record(line_path, date, len(data['line']))
+    logger.info("Saved processed data to %s", save_dir)
 
 def main():
     """Example usage."""
+    configure()
     print("\nNBA Summary Stats Collector")
     print("-------------------------")
     
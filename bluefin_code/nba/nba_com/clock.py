@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""Vectorized parsing of NBA.com minutes and game-clock values.
+
+Handles ``MM:SS`` (``34:12``), decimal (``34.2``) and ISO 8601 duration
+(``PT34M12.00S``) strings in one pass. Empty values and values that cannot
+be parsed become ``default``; unparseable values are counted and logged
+once per column rather than once per cell.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CLOCK_PATTERN = (
+    r'^(?:PT(?P<iso_m>\d+)M(?P<iso_s>\d+(?:\.\d+)?)S'
+    r'|(?P<m>-?\d+):(?P<s>\d+(?:\.\d+)?)'
+    r'|(?P<dec>-?\d+(?:\.\d+)?|-?\.\d+))$'
+)
+
+def _parse(values: pd.Series, in_minutes: bool, name: str,
+           default: Optional[float]) -> pd.Series:
+    """Parse clock strings to minutes or seconds; decimals are taken as-is."""
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        result = values.astype(float)
+        return result if default is None else result.fillna(default)
+
+    # Minutes columns repeat heavily, so only distinct values are parsed
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    parts = text.str.extract(CLOCK_PATTERN).apply(pd.to_numeric).astype(float)
+
+    minutes = parts['m'].fillna(parts['iso_m'])
+    seconds = parts['s'].fillna(parts['iso_s'])
+    # Clock strings carry their sign on the minutes part ("-1:30")
+    total = minutes * 60 + np.copysign(seconds, minutes)
+    parsed = (total / 60 if in_minutes else total).fillna(parts['dec']).to_numpy()
+
+    bad = np.isnan(parsed) & (text != '').to_numpy()
+    if bad.any():
+        count = int(np.isin(codes, np.flatnonzero(bad)).sum())
+        logger.warning(f"Could not parse {count} {name} values (e.g. {text[bad].tolist()[:5]})")
+
+    # Trailing NaN so missing values (factorize code -1) stay empty
+    result = pd.Series(np.append(parsed, np.nan)[codes], index=values.index, name=values.name)
+    return result if default is None else result.fillna(default)
+
+def parse_minutes(values: pd.Series, name: str = 'minutes',
+                  default: Optional[float] = 0.0) -> pd.Series:
+    """Parse a minutes column to float minutes (``34:30`` -> 34.5)."""
+    return _parse(values, True, name, default)
+
+def parse_seconds(values: pd.Series, name: str = 'clock',
+                  default: Optional[float] = 0.0) -> pd.Series:
+    """Parse a clock column to float seconds (``1:30`` -> 90.0).
+
+    Decimal values are taken to already be seconds.
+    """
+    return _parse(values, False, name, default)
+
+def tenths_to_seconds(values: pd.Series) -> pd.Series:
+    """Convert NBA.com tenths-of-a-second game time (e.g. ``IN_TIME_REAL``) to seconds."""
+    return pd.to_numeric(values, errors='coerce') / 10
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 
+import logging
 from pathlib import Path
 import sys
 from datetime import datetime, timedelta
 import time
 from typing import Optional, List, Tuple
 
-from boxscoreadvancedv2.collector import save_advanced_stats, get_player_ids_from_game
-from playergamelog.collector import save_player_gamelog
-from get_game_ids import get_game_ids
+from bluefin_code.core.logs import configure, track
+from bluefin_code.nba.nba_com.boxscoreadvancedv2.collector import save_advanced_stats, get_player_ids_from_game
+from bluefin_code.nba.nba_com.playergamelog.collector import save_player_gamelog
+from bluefin_code.nba.nba_com.get_game_ids import get_game_ids
+
+logger = logging.getLogger(__name__)
 
 def collect_game_data(game_id: str, date: str, season: str = "2024-25", force_fresh: bool = False) -> None:
     """Collect all data for a single game."""
-    print(f"\nCollecting data for game {game_id} on {date}")
+    logger.debug("Collecting data for game %s on %s", game_id, date)
     
     # Determine season from date
     game_date = datetime.strptime(date, "%Y-%m-%d")
@@ -48,7 +52,7 @@ def collect_games(start_date: Optional[str] = None,
     game_ids = get_game_ids(["2024-25"], force_fresh=force_fresh)  # Only 2024-25 season
     
     if game_ids is None or len(game_ids) == 0:
-        print(f"No games found between {start_date} and {end_date}")
+        logger.warning("No games found between %s and %s", start_date, end_date)
         return
     
     # Filter for date range
@@ -56,19 +60,20 @@ def collect_games(start_date: Optional[str] = None,
     date_range_df = game_ids[mask]
     
     if len(date_range_df) == 0:
-        print(f"No games found between {start_date} and {end_date}")
+        logger.warning("No games found between %s and %s", start_date, end_date)
         return
     
-    print(f"\nFound {len(date_range_df)} games to process")
-    print(f"Date range: {start_date} to {end_date}")
+    logger.info("Found %s games to process", len(date_range_df))
+    logger.debug("Date range: %s to %s", start_date, end_date)
     
     # Process each game
-    for _, row in date_range_df.iterrows():
+    for _, row in track(date_range_df.iterrows(), "nba games", total=len(date_range_df)):
         collect_game_data(row['game_id'], row['game_date'], force_fresh=force_fresh)
         time.sleep(0.05)  # 50ms between games
 
 def main():
     """Main entry point with command line argument handling."""
+    configure(progress=sys.stderr.isatty())
     print("\nNBA.com Data Collector")
     print("--------------------")
     
@@ -1,24 +1,33 @@
 #!/usr/bin/env python3
 
+import logging
 from datetime import datetime, timedelta
 import time
 from pathlib import Path
 from typing import List, Optional
 
-from get_game_ids import get_game_ids
-from gamerotation.collector import save_rotation_stats
-from playergamelog.collector import save_player_gamelog
-from boxscoreadvancedv2.collector import get_player_ids_from_game
+from bluefin_code.nba.nba_com.get_game_ids import get_game_ids
+from bluefin_code.nba.nba_com.gamerotation.collector import PROCESSED_DIR as ROTATION_DIR, save_rotation_stats
+from bluefin_code.nba.nba_com.playergamelog.collector import save_player_gamelog
+from bluefin_code.nba.nba_com.boxscoreadvancedv2.collector import get_player_ids_from_game
+from bluefin_code.core.logs import configure, track
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com.ids import find_game_file
+
+logger = logging.getLogger(__name__)
 
 def check_game_exists(game_id: str, date: str) -> bool:
-    """Check if game data already exists in both gamerotation and boxscore."""
-    # Get year-month for gamerotation
-    year_month = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
+    """Check if processed gamerotation data already exists for a game."""
+    if catalog.has('nba_com', 'gamerotation', game_id, kind='processed'):
+        return True
     
-    # Check gamerotation file
-    rotation_path = Path("bluefin_data/nba/nba_com/gamerotation/processed") / year_month / f"rotation_{game_id}.csv"
-    
-    return rotation_path.exists()
+    # Not cataloged yet: check the file under its canonical or legacy name
+    year_month = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
+    path = find_game_file(ROTATION_DIR / year_month, game_id, "rotation_{game_id}.csv")
+    if path is None:
+        return False
+    catalog.record(path, date)
+    return True
 
 def collect_daily_data(date: Optional[str] = None, force_fresh: bool = False) -> None:
     """Collect both game rotation and player game log data for a specific date."""
@@ -27,58 +36,59 @@ def collect_daily_data(date: Optional[str] = None, force_fresh: bool = False) ->
         yesterday = datetime.now() - timedelta(days=1)
         date = yesterday.strftime("%Y-%m-%d")
     
-    print(f"\nCollecting NBA data for {date}")
-    print("=" * 40)
+    logger.info("Collecting NBA data for %s", date)
     
     # 1. Get game IDs for the date
     game_ids_df = get_game_ids(force_fresh=force_fresh)
     if game_ids_df is None:
-        print("Failed to get game IDs")
+        logger.warning("Failed to get game IDs")
         return
     
     # Filter for the given date
     games = game_ids_df[game_ids_df['game_date'] == date]
     if len(games) == 0:
-        print(f"No games found for {date}")
+        logger.warning("No games found for %s", date)
         return
     
-    print(f"\nFound {len(games)} games on {date}:")
-    for _, game in games.iterrows():
-        print(f"- {game['matchup']} (ID: {game['game_id']})")
+    logger.info("Found %s games on %s", len(games), date)
+    if logger.isEnabledFor(logging.DEBUG):
+        for _, game in games.iterrows():
+            logger.debug("- %s (ID: %s)", game['matchup'], game['game_id'])
     
     # 2. Process each game
-    for _, game in games.iterrows():
+    for _, game in track(games.iterrows(), f"nba {date}", total=len(games)):
         game_id = game['game_id']
         
         # Skip if game already processed (unless force_fresh)
         if not force_fresh and check_game_exists(game_id, date):
-            print(f"\nSkipping already processed game: {game['matchup']} ({game_id})")
+            logger.debug("Skipping already processed game: %s (%s)", game['matchup'], game_id)
             continue
             
-        print(f"\nProcessing game: {game['matchup']} ({game_id})")
+        logger.debug("Processing game: %s (%s)", game['matchup'], game_id)
         
         # 2a. Get game rotation data
-        print("\nCollecting game rotation data...")
+        logger.debug("Collecting game rotation data...")
         save_rotation_stats(game_id, date, force_fresh)
         time.sleep(0.25)  # Quarter second pause between API calls
         
         # 2b. Get player game logs
-        print("\nCollecting player game logs...")
+        logger.debug("Collecting player game logs...")
         # Get player IDs from the game
         player_ids = get_player_ids_from_game(game_id, date)
         if player_ids:
-            print(f"Found {len(player_ids)} players")
+            logger.debug("Found %s players", len(player_ids))
             for player_id in player_ids:
                 save_player_gamelog(player_id, force_fresh=force_fresh)
                 time.sleep(0.05)  # 50ms between player requests
         
-        print(f"\nCompleted processing game {game_id}")
+        logger.info("Completed processing game %s", game_id)
         time.sleep(0.25)  # Quarter second pause between games
 
 def main():
     """Main entry point with basic argument handling."""
     import sys
     
+    configure(progress=sys.stderr.isatty())
     print("\nNBA Daily Data Collector")
     print("======================")
     
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+"""Migrate NBA.com files to canonical game-id names and remove duplicates.
+
+Files written before game ids were canonical use the 8-character form
+(``22300061_home.csv``), and some games were fetched again under the
+10-character form, sometimes into a different month folder. This tool
+groups every per-game file by endpoint folder and canonical name, then in
+one pass:
+
+- renames a lone legacy file to its canonical name
+- collapses byte-identical copies into one
+- for copies whose content differs, keeps the most complete one (most
+  rows, then the canonical name, then the newest) and removes the rest
+
+The surviving file goes into the month folder given by the game-id index
+when the game is indexed, otherwise it stays where it was.
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.nba_com.reorganize_all import (
+    GAME_ID_RE, NBA_COM_DIR, SUBDIRS, load_game_dates, parse_game_id,
+)
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Action:
+    """A planned dedupe step: keep ``keep`` as ``target`` and delete ``remove``."""
+    kind: str
+    keep: Path
+    target: Path
+    remove: Tuple[Path, ...] = ()
+
+def canonical_name(path: Path) -> Optional[str]:
+    """File name with its game id in canonical 10-character form."""
+    game_id = parse_game_id(path.stem)
+    if game_id is None:
+        return None
+    stem = GAME_ID_RE.sub(lambda m: m.group(0).replace(m.group(1), game_id), path.stem, count=1)
+    return stem + path.suffix
+
+def _digest(path: Path) -> str:
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+def _rows(path: Path) -> int:
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+def plan_dedupe(data_dirs: Optional[Iterable[Path]] = None,
+                game_dates: Optional[Dict[str, str]] = None) -> List[Action]:
+    """Plan renames and duplicate removals for every endpoint directory."""
+    if data_dirs is None:
+        data_dirs = sorted(d for d in NBA_COM_DIR.iterdir() if d.is_dir())
+    if game_dates is None:
+        game_dates = load_game_dates()
+
+    groups = defaultdict(list)
+    for data_dir in data_dirs:
+        for subdir in SUBDIRS:
+            base = Path(data_dir) / subdir
+            if not base.is_dir():
+                continue
+            for path in base.rglob("*.csv"):
+                name = canonical_name(path)
+                if name is not None:
+                    groups[(base, name)].append(path)
+
+    actions = []
+    for (base, name), paths in sorted(groups.items()):
+        date = game_dates.get(parse_game_id(name))
+        if len(paths) == 1:
+            target = (base / date[:7] if date else paths[0].parent) / name
+            if paths[0].name != name:
+                actions.append(Action('rename', paths[0], target))
+            continue
+
+        identical = len({_digest(p) for p in paths}) == 1
+        ranked = sorted(paths, key=lambda p: (_rows(p), p.name == name, p.stat().st_mtime), reverse=True)
+        keep = ranked[0]
+        target = (base / date[:7] if date else keep.parent) / name
+        actions.append(Action('identical' if identical else 'differs', keep, target,
+                              tuple(ranked[1:])))
+    return actions
+
+def summarize(actions: List[Action]) -> pd.DataFrame:
+    """Count planned actions per endpoint directory and kind."""
+    if not actions:
+        return pd.DataFrame(columns=['directory', 'kind', 'groups', 'removed'])
+    df = pd.DataFrame({
+        'directory': [f"{a.target.parents[2].name}/{a.target.parents[1].name}" for a in actions],
+        'kind': [a.kind for a in actions],
+        'removed': [len(a.remove) for a in actions],
+    })
+    return (df.groupby(['directory', 'kind'])
+            .agg(groups=('kind', 'size'), removed=('removed', 'sum')).reset_index())
+
+def _apply(action: Action) -> None:
+    for path in action.remove:
+        path.unlink(missing_ok=True)
+    if action.keep != action.target:
+        os.replace(action.keep, action.target)
+
+def execute(actions: List[Action], workers: int = 8) -> int:
+    """Apply planned actions in parallel; returns the number of files removed."""
+    for target_dir in {a.target.parent for a in actions}:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_apply, actions))
+    return sum(len(a.remove) for a in actions)
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Rename NBA.com files to canonical game ids and drop duplicates')
+    parser.add_argument('dirs', nargs='*', help='Endpoint directories (default: all under nba_com)')
+    parser.add_argument('--dry-run', action='store_true', help='Show the plan without changing files')
+    parser.add_argument('--workers', type=int, default=8, help='Parallel workers')
+    args = parser.parse_args()
+
+    configure()
+    actions = plan_dedupe([Path(d) for d in args.dirs] or None)
+    summary = summarize(actions)
+    print("Nothing to do" if summary.empty else summary.to_string(index=False))
+
+    removed = sum(len(a.remove) for a in actions)
+    if args.dry_run:
+        print(f"\nDry run: {len(actions)} actions, {removed} duplicate files would be removed")
+    else:
+        execute(actions, args.workers)
+        print(f"\nApplied {len(actions)} actions, removed {removed} duplicate files")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
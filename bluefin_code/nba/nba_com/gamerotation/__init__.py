@@ -1,3 +1,7 @@
 from .collector import save_rotation_stats
+from .stints import StintIndex, load_game, load_home_teams, season_lineups, season_on_off, season_stints
+from .splits import lineup_splits, player_splits, teammate_overlap
 
-__all__ = ['save_rotation_stats']
+__all__ = ['save_rotation_stats', 'StintIndex', 'load_game', 'load_home_teams',
+           'season_lineups', 'season_on_off', 'season_stints',
+           'lineup_splits', 'player_splits', 'teammate_overlap']
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 
+import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict
 from nba_api.stats.endpoints import gamerotation
 import time
 
+from bluefin_code.core.logs import configure
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com import archive
+from bluefin_code.nba.nba_com.clock import parse_seconds, tenths_to_seconds
+from bluefin_code.nba.nba_com.gamerotation.stints import fix_home_flags, load_home_teams
+from bluefin_code.nba.nba_com.ids import GameId, find_game_file, game_file, normalize_game_ids
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -19,6 +28,8 @@ RATE_LIMIT_CALLS = 240  # 4 calls per second
 RATE_LIMIT_PERIOD = 60  # Period in seconds
 MIN_CALL_GAP = 0.25  # Quarter second between calls
 
+logger = logging.getLogger(__name__)
+
 def get_year_month(date: str) -> str:
     """
     Get year-month string from date.
@@ -32,12 +43,20 @@ def get_year_month(date: str) -> str:
     dt = datetime.strptime(date, "%Y-%m-%d")
     return dt.strftime("%Y-%m")
 
+@lru_cache(maxsize=1)
+def get_home_teams() -> Dict[str, int]:
+    """Home team id per game from the game-id index, loaded once per process."""
+    return load_home_teams()
+
 def get_rotation_stats(game_id: str, date: str, force_fresh: bool = False) -> Optional[Dict[str, pd.DataFrame]]:
     """Get rotation stats for a game from NBA.com."""
-    # Ensure game_id is a string
-    game_id = str(game_id)
+    try:
+        game_id = GameId(game_id)
+    except ValueError as e:
+        logger.error("%s", e)
+        return None
     
-    print(f"\nFetching rotation stats for game {game_id}")
+    logger.debug("Fetching rotation stats for game %s", game_id)
     
     # Get year-month for organization
     year_month = get_year_month(date)
@@ -48,41 +67,37 @@ def get_rotation_stats(game_id: str, date: str, force_fresh: bool = False) -> Op
     
     # Cache paths for each result set
     cache_paths = {
-        'home': cache_dir / f"{game_id}_home.csv",
-        'away': cache_dir / f"{game_id}_away.csv"
+        'home': game_file(cache_dir, game_id, "{game_id}_home.csv"),
+        'away': game_file(cache_dir, game_id, "{game_id}_away.csv")
     }
     
-    # Return cached data if it exists and we're not forcing fresh
-    if not force_fresh and all(p.exists() for p in cache_paths.values()):
-        print(f"Using cached data from {cache_dir}")
-        return {
-            'home': pd.read_csv(cache_paths['home']),
-            'away': pd.read_csv(cache_paths['away'])
-        }
+    # Return cached data (canonical or legacy file names) unless forcing fresh
+    cached = {key: find_game_file(cache_dir, game_id, f"{{game_id}}_{key}.csv") for key in cache_paths}
+    if not force_fresh and all(cached.values()):
+        logger.debug("Using cached data from %s", cache_dir)
+        return {key: pd.read_csv(path, dtype={'GAME_ID': str}) for key, path in cached.items()}
     
     try:
-        print("Fetching data from NBA API...")
-        # Get data from NBA API - game_id should be string like "0022300001"
-        if not str(game_id).startswith('00'):
-            game_id = f"00{game_id}"
-            
-        rotation = gamerotation.GameRotation(game_id=game_id)
+        # All result sets are archived; the raw CSVs are derived from the archive
+        frames = archive.fetch_frames(
+            "gamerotation", game_id, date,
+            lambda: gamerotation.GameRotation(game_id=game_id),
+            force_fresh=force_fresh,
+        )
         
-        # Get all result sets
-        all_dfs = rotation.get_data_frames()
-        
-        if not all_dfs or len(all_dfs) < 2:
-            print("No data returned from API")
+        # Select by name: the response lists AwayTeam before HomeTeam
+        home_rotation = frames.get('HomeTeam')
+        away_rotation = frames.get('AwayTeam')
+        if home_rotation is None or away_rotation is None:
+            logger.warning("No data returned from API")
             return None
-            
-        # Get relevant result sets
-        home_rotation = all_dfs[0]  # HomeTeam
-        away_rotation = all_dfs[1]  # AwayTeam
         
         # Cache the raw data
         home_rotation.to_csv(cache_paths['home'], index=False)
+        catalog.record(cache_paths['home'], date, len(home_rotation))
         away_rotation.to_csv(cache_paths['away'], index=False)
-        print(f"Cached raw data to {cache_dir}")
+        catalog.record(cache_paths['away'], date, len(away_rotation))
+        logger.debug("Cached raw data to %s", cache_dir)
         
         # Brief pause to respect rate limit
         time.sleep(MIN_CALL_GAP)
@@ -93,12 +108,18 @@ def get_rotation_stats(game_id: str, date: str, force_fresh: bool = False) -> Op
         }
         
     except Exception as e:
-        print(f"Error getting data for game {game_id}: {str(e)}")
+        logger.error("Error getting data for game %s: %s", game_id, e)
         time.sleep(MIN_CALL_GAP)  # Brief pause on error
         return None
 
-def process_rotation_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[pd.DataFrame]:
-    """Process raw rotation stats into clean format."""
+def process_rotation_stats(data: Optional[Dict[str, pd.DataFrame]],
+                           home_teams: Optional[Dict[str, int]] = None) -> Optional[pd.DataFrame]:
+    """Process raw rotation stats into clean format.
+
+    Cached raw files written before result sets were selected by name hold
+    the away team in ``*_home.csv``; ``is_home`` is corrected from the
+    game-id index (``home_teams``, loaded once when not given).
+    """
     if data is None:
         return None
         
@@ -116,6 +137,9 @@ def process_rotation_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[
         'IN_TIME_REAL': 'in_time',
         'OUT_TIME_REAL': 'out_time',
         'ELAPSED_TIME_REAL': 'elapsed_time',
+        'PLAYER_PTS': 'pts',
+        'PT_DIFF': 'pt_diff',
+        'USG_PCT': 'usg_pct',
         'PERIOD': 'quarter',
         'SEQUENCE': 'sequence'
     }
@@ -134,58 +158,50 @@ def process_rotation_stats(data: Optional[Dict[str, pd.DataFrame]]) -> Optional[
     # Combine rotations
     df = pd.concat([home_rotation, away_rotation], ignore_index=True)
     
-    # Convert time columns to datetime
+    if 'player' not in df.columns and 'PLAYER_FIRST' in data['home'].columns:
+        names = pd.concat([data['home'], data['away']], ignore_index=True)
+        df['player'] = (names['PLAYER_FIRST'].fillna('') + ' ' + names['PLAYER_LAST'].fillna('')).str.strip()
+
+    # IN_TIME_REAL/OUT_TIME_REAL are tenths of a second of elapsed game time
     time_cols = ['in_time', 'out_time']
     for col in time_cols:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col])
+            df[col] = tenths_to_seconds(df[col])
+    
+    if 'game_id' in df.columns:
+        df['game_id'] = normalize_game_ids(df['game_id'])
+        if 'team_id' in df.columns:
+            df = fix_home_flags(df, get_home_teams() if home_teams is None else home_teams)
     
     # Convert elapsed time to seconds
     if 'elapsed_time' in df.columns:
-        def convert_elapsed_time(x) -> float:
-            if pd.isna(x) or not str(x).strip():
-                return 0.0
-            x_str = str(x).strip()
-            if ':' in x_str:
-                try:
-                    minutes, seconds = x_str.split(':')
-                    return float(minutes) * 60 + float(seconds)
-                except (ValueError, IndexError):
-                    print(f"Warning: Could not parse elapsed time value: {x_str}")
-                    return 0.0
-            try:
-                return float(x_str)
-            except ValueError:
-                print(f"Warning: Could not convert elapsed time value to float: {x_str}")
-                return 0.0
-        
-        df['elapsed_time'] = df['elapsed_time'].apply(convert_elapsed_time)
+        df['elapsed_time'] = parse_seconds(df['elapsed_time'], name='elapsed time')
     
     # Sort by sequence
     if 'sequence' in df.columns:
         df = df.sort_values(['quarter', 'sequence'])
     
     # Print some debug info
-    print(f"\nProcessed {len(df)} rotation records")
-    print(f"Home team records: {len(df[df['is_home']])}")
-    print(f"Away team records: {len(df[~df['is_home']])}")
+    if logger.isEnabledFor(logging.DEBUG):
+        home = int(df['is_home'].sum())
+        logger.debug("Processed %s rotation records (%s home, %s away)", len(df), home, len(df) - home)
     
     return df
 
 def save_rotation_stats(game_id: str, date: str, force_fresh: bool = False) -> None:
     """Get and save rotation stats for a game."""
-    print(f"\nProcessing game {game_id} from {date}")
+    logger.debug("Processing game %s from %s", game_id, date)
     
     # Get raw data
     raw_data = get_rotation_stats(game_id, date, force_fresh)
     if raw_data is None:
-        print("Failed to get raw data")
+        logger.warning("Failed to get raw data")
         return
     
     # Process data
     df = process_rotation_stats(raw_data)
     if df is None:
-        print("Failed to process data")
+        logger.warning("Failed to process data")
         return
     
     # Get year-month
@@ -194,12 +210,14 @@ def save_rotation_stats(game_id: str, date: str, force_fresh: bool = False) -> N
     save_dir.mkdir(parents=True, exist_ok=True)
     
     # Save processed data
-    save_path = save_dir / f"rotation_{game_id}.csv"
+    save_path = game_file(save_dir, game_id, "rotation_{game_id}.csv")
     df.to_csv(save_path, index=False)
-    print(f"Saved processed data to {save_dir}")
+    catalog.record(save_path, date, len(df))
+    logger.info("Saved processed data to %s", save_dir)
 
 def main():
     """Example usage."""
+    configure()
     print("\nNBA Rotation Stats Collector")
     print("-------------------------")
     
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+
+"""Season lineup, on/off and teammate splits from rotation stints.
+
+Each stint's ``pt_diff`` is the team's point differential over that
+stint, so every stint is one equation ``margin(out) - margin(in) =
+pt_diff``. Solving them together (least squares, anchored at tip-off)
+gives the running score margin at every substitution. Lineup segments
+and teammate overlaps are then differences of that margin at their
+endpoints; nothing is evaluated per second.
+
+Per-game results are cached as parquet parts under
+``bluefin_data/nba/nba_com/splits/{season}/{table}/`` and only games
+missing from the cache are computed when new rotation files arrive.
+Games cached before their line score was collected are recomputed once
+it is available.
+Season aggregates are grouped from the per-game tables on read.
+
+Net ratings here are point differential per 48 minutes: possession
+counts are not available for every collected game.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.nba_com.ids import GameId, normalize_game_ids
+from bluefin_code.nba.nba_com.gamerotation.stints import (
+    StintIndex, iter_games, list_games, season_stints,
+)
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+SPLITS_DIR = DATA_ROOT / "nba" / "nba_com" / "splits"
+LINE_SCORE_DIR = DATA_ROOT / "nba" / "nba_com" / "boxscoresummaryv2" / "processed"
+
+logger = logging.getLogger(__name__)
+
+GAME_SECONDS = 48 * 60
+
+TABLE_COLUMNS = {
+    'players': ['game_id', 'team_id', 'player_id', 'player',
+                'on_seconds', 'off_seconds', 'on_diff', 'off_diff', 'final_known'],
+    'lineups': ['game_id', 'team_id', 'lineup', 'seconds', 'diff'],
+    'pairs': ['game_id', 'team_id', 'player_a', 'player_b', 'seconds', 'diff'],
+}
+
+def get_table_dir(season: str, table: str, cache_dir: Optional[Path] = None) -> Path:
+    """Get cached per-game table directory for a season."""
+    return (Path(cache_dir) if cache_dir else SPLITS_DIR) / season / table
+
+def lineup_key(player_ids: Iterable[int]) -> str:
+    """Stable string key for a lineup (sorted player_ids joined by ``-``)."""
+    return '-'.join(str(p) for p in sorted(player_ids))
+
+def load_team_results(game_ids: Optional[Set[str]] = None,
+                      line_dir: Optional[Path] = None) -> pd.Series:
+    """Final points per (game_id, team_id) from processed line scores."""
+    line_dir = Path(line_dir) if line_dir else LINE_SCORE_DIR
+    options = pa_csv.ConvertOptions(
+        include_columns=['game_id', 'team_id', 'points'],
+        column_types={'game_id': pa.string(), 'team_id': pa.int64(), 'points': pa.float64()},
+    )
+    tables = []
+    for path in line_dir.glob("*/line_*.csv"):
+        if game_ids is not None and GameId(path.stem[5:]) not in game_ids:
+            continue
+        try:
+            tables.append(pa_csv.read_csv(path, convert_options=options))
+        except (pa.ArrowInvalid, OSError) as e:
+            logger.warning(f"Skipping line score {path.name}: {e}")
+    if not tables:
+        return pd.Series(dtype=float, index=pd.MultiIndex.from_arrays([[], []], names=['game_id', 'team_id']))
+    df = pa.concat_tables(tables).to_pandas()
+    df['game_id'] = normalize_game_ids(df['game_id'])
+    return df.drop_duplicates(['game_id', 'team_id']).set_index(['game_id', 'team_id'])['points']
+
+def solve_margin(game: StintIndex, final: Optional[float] = None) -> pd.Series:
+    """Home-team score margin at every stint boundary, indexed by seconds.
+
+    Args:
+        game: The game's stints
+        final: Known final home margin, added as an anchor at the horn
+    """
+    bounds = np.unique(np.concatenate([game.start, game.end]))
+    diff = game.stints['pt_diff'].to_numpy(dtype=float)
+    known = ~np.isnan(diff)
+
+    # One row per stint: margin[end] - margin[start] = signed pt_diff
+    rows = np.flatnonzero(known)
+    A = np.zeros((len(rows) + 2, len(bounds)))
+    A[np.arange(len(rows)), np.searchsorted(bounds, game.end[rows])] = 1
+    A[np.arange(len(rows)), np.searchsorted(bounds, game.start[rows])] -= 1
+    b = np.where(game.is_home[rows], diff[rows], -diff[rows])
+
+    # Anchors: level at tip-off and, when known, the final margin
+    A[-2, 0] = 1
+    b = np.append(b, [0, 0])
+    if final is None:
+        A, b = A[:-1], b[:-1]
+    else:
+        A[-1, -1] = 1
+        b[-1] = final
+    margin = np.linalg.lstsq(A, b, rcond=None)[0] if len(rows) else np.zeros(len(bounds))
+    return pd.Series(np.round(margin, 6), index=bounds)
+
+def _final_margin(game: StintIndex, results: Optional[pd.Series]) -> Optional[float]:
+    """Final home margin from team results, when both teams are present."""
+    if results is None:
+        return None
+    home = results.get((game.game_id, game.team_id(True)))
+    away = results.get((game.game_id, game.team_id(False)))
+    if home is None or away is None or pd.isna(home) or pd.isna(away):
+        return None
+    return float(home - away)
+
+def compute_splits(stints: pd.DataFrame, results: Optional[pd.Series] = None) -> Dict[str, pd.DataFrame]:
+    """Per-game player on/off, lineup and teammate-pair rows.
+
+    Args:
+        stints: Game-sorted stints (see ``stints.season_stints``)
+        results: Final points per (game_id, team_id); the solved margin is
+            used for the final score of games without results
+    """
+    finals, known = {}, {}
+    lineup_cols = {col: [] for col in ['game_id', 'team_id', 'lineup', 'seconds', 'diff']}
+    pair_cols = {col: [] for col in TABLE_COLUMNS['pairs']}
+
+    for game in iter_games(stints):
+        final = _final_margin(game, results)
+        margin = solve_margin(game, final)
+        times, values = margin.index.to_numpy(), margin.to_numpy()
+        finals[game.game_id] = values[-1] if final is None else final
+        known[game.game_id] = final is not None
+
+        # Lineups: each side's five over a constant segment
+        segments = game._lineup_columns()
+        seg_diff = (np.interp(segments['end'], times, values)
+                    - np.interp(segments['start'], times, values))
+        for side, col in ((True, 'home_lineup'), (False, 'away_lineup')):
+            full = np.array([len(lineup) == 5 for lineup in segments[col]], dtype=bool)
+            lineup_cols['game_id'].append(np.full(full.sum(), game.game_id, dtype=object))
+            lineup_cols['team_id'].append(np.full(full.sum(), game.team_id(side)))
+            lineup_cols['lineup'].append([lineup_key(l) for l, ok in zip(segments[col], full) if ok])
+            lineup_cols['seconds'].append(np.asarray(segments['seconds'])[full])
+            lineup_cols['diff'].append((1 if side else -1) * seg_diff[full])
+
+        # Teammate pairs: overlap of every same-team stint pair
+        for side in (True, False):
+            idx = np.flatnonzero(game.is_home == side)
+            a, b = np.meshgrid(idx, idx, indexing='ij')
+            keep = game.player_ids[a] < game.player_ids[b]
+            a, b = a[keep], b[keep]
+            lo = np.maximum(game.start[a], game.start[b])
+            hi = np.minimum(game.end[a], game.end[b])
+            shared = hi > lo
+            a, b, lo, hi = a[shared], b[shared], lo[shared], hi[shared]
+            pair_cols['game_id'].append(np.full(len(a), game.game_id, dtype=object))
+            pair_cols['team_id'].append(np.full(len(a), game.team_id(side)))
+            pair_cols['player_a'].append(game.player_ids[a])
+            pair_cols['player_b'].append(game.player_ids[b])
+            pair_cols['seconds'].append(hi - lo)
+            pair_cols['diff'].append((1 if side else -1)
+                                     * (np.interp(hi, times, values) - np.interp(lo, times, values)))
+
+    if not finals:
+        return {table: pd.DataFrame(columns=cols) for table, cols in TABLE_COLUMNS.items()}
+
+    # Player on/off: on-court differential comes straight from the stints
+    players = (stints.assign(pt_diff=stints['pt_diff'].fillna(0))
+               .groupby(['game_id', 'team_id', 'player_id', 'is_home'], as_index=False, sort=False)
+               .agg(player=('player', 'last'), on_seconds=('seconds', 'sum'), on_diff=('pt_diff', 'sum')))
+    game_seconds = stints.groupby('game_id', sort=False)['end'].max()
+    final = players['game_id'].map(finals)
+    players['off_seconds'] = players['game_id'].map(game_seconds) - players['on_seconds']
+    players['off_diff'] = final.where(players['is_home'], -final) - players['on_diff']
+    players['final_known'] = players['game_id'].map(known).astype(bool)
+
+    lineups = pd.DataFrame({col: np.concatenate(parts) if col != 'lineup' else
+                            [key for part in parts for key in part]
+                            for col, parts in lineup_cols.items()})
+    pairs = pd.DataFrame({col: np.concatenate(parts) for col, parts in pair_cols.items()})
+    return {
+        'players': players[TABLE_COLUMNS['players']],
+        'lineups': lineups.groupby(['game_id', 'team_id', 'lineup'], as_index=False, sort=False)
+                          [['seconds', 'diff']].sum()[TABLE_COLUMNS['lineups']],
+        'pairs': pairs.groupby(['game_id', 'team_id', 'player_a', 'player_b'], as_index=False, sort=False)
+                      [['seconds', 'diff']].sum()[TABLE_COLUMNS['pairs']],
+    }
+
+def cached_games(season: str, cache_dir: Optional[Path] = None) -> Set[str]:
+    """Game ids already in the season cache."""
+    table_dir = get_table_dir(season, 'players', cache_dir)
+    parts = sorted(table_dir.glob("part-*.parquet")) if table_dir.exists() else []
+    if not parts:
+        return set()
+    return set(pq.read_table(parts, columns=['game_id']).column('game_id').to_pylist())
+
+def games_without_results(season: str, cache_dir: Optional[Path] = None) -> Set[str]:
+    """Cached game ids whose final margin was solved rather than taken from a line score."""
+    table_dir = get_table_dir(season, 'players', cache_dir)
+    games = set()
+    for part in sorted(table_dir.glob("part-*.parquet")) if table_dir.exists() else []:
+        if 'final_known' not in pq.read_schema(part).names:
+            # Cached before results were tracked
+            games.update(pq.read_table(part, columns=['game_id']).column('game_id').to_pylist())
+            continue
+        df = pq.read_table(part, columns=['game_id', 'final_known']).to_pandas()
+        games.update(df.loc[~df['final_known'].astype(bool), 'game_id'])
+    return games
+
+def drop_games(season: str, game_ids: Set[str], cache_dir: Optional[Path] = None) -> None:
+    """Remove games from every cached table, rewriting only the parts that hold them."""
+    for table in TABLE_COLUMNS:
+        table_dir = get_table_dir(season, table, cache_dir)
+        for part in sorted(table_dir.glob("part-*.parquet")) if table_dir.exists() else []:
+            df = pd.read_parquet(part)
+            keep = ~df['game_id'].isin(game_ids)
+            if keep.all():
+                continue
+            if keep.any():
+                df[keep].to_parquet(part, index=False)
+            else:
+                part.unlink()
+
+def update(season: str, raw_dir: Optional[Path] = None, cache_dir: Optional[Path] = None,
+           line_dir: Optional[Path] = None) -> int:
+    """Compute splits for games not yet cached and append them as new parts.
+
+    Cached games computed without team results are recomputed once both
+    teams' line scores are available.
+
+    Returns:
+        Number of games added or recomputed
+    """
+    games = set(list_games(season, raw_dir))
+    new_games = games - cached_games(season, cache_dir)
+    pending = games & games_without_results(season, cache_dir)
+    if not new_games and not pending:
+        logger.debug(f"Splits cache for {season} is up to date")
+        return 0
+
+    results = load_team_results(new_games | pending, line_dir)
+    teams = results.dropna().groupby(level='game_id').size()
+    redo = {g for g in pending if teams.get(g, 0) >= 2}
+    if not new_games and not redo:
+        logger.debug(f"Splits cache for {season} is up to date")
+        return 0
+
+    stints = season_stints(season, new_games | redo, raw_dir)
+    tables = compute_splits(stints, results)
+    added = stints['game_id'].nunique()
+    if not added:
+        return 0
+    if redo:
+        logger.info(f"Recomputing {len(redo)} {season} games with new line scores")
+        drop_games(season, redo, cache_dir)
+
+    part = f"part-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}.parquet"
+    for table, df in tables.items():
+        table_dir = get_table_dir(season, table, cache_dir)
+        table_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(table_dir / part, index=False)
+    logger.info(f"Added {added - len(redo)} games to {season} splits")
+    return added
+
+def load_table(season: str, table: str, refresh: bool = True,
+               raw_dir: Optional[Path] = None, cache_dir: Optional[Path] = None,
+               line_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Load a cached per-game table, updating the cache first when refresh is set."""
+    if refresh:
+        update(season, raw_dir, cache_dir, line_dir)
+    table_dir = get_table_dir(season, table, cache_dir)
+    parts = sorted(table_dir.glob("part-*.parquet")) if table_dir.exists() else []
+    if not parts:
+        return pd.DataFrame(columns=TABLE_COLUMNS[table])
+    return pd.read_parquet(parts)
+
+def per48(diff: pd.Series, seconds: pd.Series) -> pd.Series:
+    """Point differential per 48 minutes."""
+    return (diff / seconds.where(seconds > 0) * GAME_SECONDS).round(2)
+
+def player_splits(season: str, **kwargs) -> pd.DataFrame:
+    """Season on/off splits per player and team."""
+    df = load_table(season, 'players', **kwargs)
+    splits = df.groupby(['player_id', 'team_id'], as_index=False).agg(
+        player=('player', 'last'), games=('game_id', 'nunique'),
+        on_seconds=('on_seconds', 'sum'), off_seconds=('off_seconds', 'sum'),
+        on_diff=('on_diff', 'sum'), off_diff=('off_diff', 'sum'))
+    splits['minutes'] = (splits['on_seconds'] / 60).round(1)
+    splits['on_net'] = per48(splits['on_diff'], splits['on_seconds'])
+    splits['off_net'] = per48(splits['off_diff'], splits['off_seconds'])
+    splits['on_off'] = splits['on_net'] - splits['off_net']
+    return splits.sort_values('on_seconds', ascending=False, ignore_index=True)
+
+def lineup_splits(season: str, min_seconds: float = 0, **kwargs) -> pd.DataFrame:
+    """Season minutes and net rating per five-man lineup."""
+    df = load_table(season, 'lineups', **kwargs)
+    splits = df.groupby(['team_id', 'lineup'], as_index=False).agg(
+        games=('game_id', 'nunique'), seconds=('seconds', 'sum'), diff=('diff', 'sum'))
+    splits = splits[splits['seconds'] >= min_seconds]
+    splits['minutes'] = (splits['seconds'] / 60).round(1)
+    splits['net'] = per48(splits['diff'], splits['seconds'])
+    return splits.sort_values('seconds', ascending=False, ignore_index=True)
+
+def teammate_overlap(season: str, min_seconds: float = 0, **kwargs) -> pd.DataFrame:
+    """Season shared minutes and net rating per teammate pair."""
+    df = load_table(season, 'pairs', **kwargs)
+    splits = df.groupby(['team_id', 'player_a', 'player_b'], as_index=False).agg(
+        games=('game_id', 'nunique'), seconds=('seconds', 'sum'), diff=('diff', 'sum'))
+    splits = splits[splits['seconds'] >= min_seconds]
+    splits['minutes'] = (splits['seconds'] / 60).round(1)
+    splits['net'] = per48(splits['diff'], splits['seconds'])
+    return splits.sort_values('seconds', ascending=False, ignore_index=True)
+
+def main() -> int:
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Update and show season on/off and lineup splits')
+    parser.add_argument('season', help='Season (e.g. 2023-24)')
+    parser.add_argument('--table', choices=['players', 'lineups', 'pairs'], default='players')
+    parser.add_argument('--min-minutes', type=float, default=0, help='Minimum minutes for lineups/pairs')
+    parser.add_argument('--top', type=int, default=25, help='Rows to show')
+    args = parser.parse_args()
+
+    configure()
+    if args.table == 'players':
+        df = player_splits(args.season)
+    elif args.table == 'lineups':
+        df = lineup_splits(args.season, min_seconds=args.min_minutes * 60)
+    else:
+        df = teammate_overlap(args.season, min_seconds=args.min_minutes * 60)
+    print(df.head(args.top).to_string(index=False))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
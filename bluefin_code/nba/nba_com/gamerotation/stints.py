@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+
+"""On-court stint engine built from GameRotation data.
+
+Each rotation row is a stint: one player on the floor from ``start`` to
+``end`` seconds of elapsed game time (``IN_TIME_REAL``/``OUT_TIME_REAL``
+are tenths of a second). ``StintIndex`` keeps a game's stints as sorted
+interval arrays and answers, without per-row Python loops:
+
+- who was on the floor at any number of time points (``on_court``)
+- how long each player played inside a window (``overlap``)
+- every distinct 10-player state and its duration (``lineups``)
+- per-player on/off seconds (``on_off``)
+
+``season_stints``/``season_lineups``/``season_on_off`` run the same over
+every raw rotation file of a season.
+
+Rotation files written before the collector selected result sets by name
+have the two teams swapped (``_home`` holds the away team). Loaders take
+the home team from the game-id index instead of trusting the file name.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from nba_api.stats.static import teams
+
+from bluefin_code.nba.nba_com.clock import tenths_to_seconds
+from bluefin_code.nba.nba_com.ids import GameId, normalize_game_ids
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+RAW_DIR = DATA_ROOT / "nba" / "nba_com" / "gamerotation" / "raw"
+GAME_IDS_DIR = DATA_ROOT / "nba" / "nba_com" / "game_ids"
+
+logger = logging.getLogger(__name__)
+
+STINT_COLUMNS = ['game_id', 'team_id', 'player_id', 'player', 'is_home', 'start', 'end', 'seconds', 'pt_diff']
+LINEUP_COLUMNS = ['game_id', 'start', 'end', 'seconds',
+                  'home_team_id', 'home_lineup', 'away_team_id', 'away_lineup', 'complete']
+
+RAW_COLUMNS = ['GAME_ID', 'TEAM_ID', 'PERSON_ID', 'PLAYER_FIRST', 'PLAYER_LAST',
+               'IN_TIME_REAL', 'OUT_TIME_REAL', 'PT_DIFF']
+RAW_TYPES = {
+    'GAME_ID': pa.string(), 'TEAM_ID': pa.int64(), 'PERSON_ID': pa.int64(),
+    'PLAYER_FIRST': pa.string(), 'PLAYER_LAST': pa.string(),
+    'IN_TIME_REAL': pa.float64(), 'OUT_TIME_REAL': pa.float64(), 'PT_DIFF': pa.float64(),
+}
+
+PERIOD_SECONDS = 12 * 60
+OVERTIME_SECONDS = 5 * 60
+
+def elapsed_seconds(period, remaining) -> np.ndarray:
+    """Convert period and seconds left on the clock to elapsed game seconds."""
+    period = np.asarray(period, dtype=float)
+    remaining = np.asarray(remaining, dtype=float)
+    before = np.minimum(period - 1, 4) * PERIOD_SECONDS + np.maximum(period - 5, 0) * OVERTIME_SECONDS
+    length = np.where(period > 4, OVERTIME_SECONDS, PERIOD_SECONDS)
+    return before + length - remaining
+
+def to_stints(df: pd.DataFrame, is_home: Optional[bool] = None) -> pd.DataFrame:
+    """Convert rotation rows to stints in seconds.
+
+    Accepts raw GameRotation frames (``IN_TIME_REAL`` in tenths) or
+    processed ones (``in_time`` in seconds). ``pt_diff`` is the player's
+    team's point differential over the stint. Zero-length rows, which
+    NBA.com emits at period boundaries, are dropped.
+    """
+    if 'IN_TIME_REAL' in df.columns:
+        stints = pd.DataFrame({
+            'game_id': normalize_game_ids(df['GAME_ID']),
+            'team_id': df['TEAM_ID'].astype('int64'),
+            'player_id': df['PERSON_ID'].astype('int64'),
+            'player': (df['PLAYER_FIRST'].fillna('') + ' ' + df['PLAYER_LAST'].fillna('')).str.strip(),
+            'start': tenths_to_seconds(df['IN_TIME_REAL']),
+            'end': tenths_to_seconds(df['OUT_TIME_REAL']),
+            'pt_diff': pd.to_numeric(df['PT_DIFF'], errors='coerce') if 'PT_DIFF' in df.columns else np.nan,
+        })
+    else:
+        stints = pd.DataFrame({
+            'game_id': normalize_game_ids(df['game_id']),
+            'team_id': df['team_id'].astype('int64'),
+            'player_id': df['player_id'].astype('int64'),
+            'player': df['player'] if 'player' in df.columns else '',
+            'start': pd.to_numeric(df['in_time'], errors='coerce'),
+            'end': pd.to_numeric(df['out_time'], errors='coerce'),
+            'pt_diff': pd.to_numeric(df['pt_diff'], errors='coerce') if 'pt_diff' in df.columns else np.nan,
+        })
+
+    if is_home is not None:
+        stints['is_home'] = is_home
+    elif 'is_home' in df.columns:
+        stints['is_home'] = df['is_home'].astype(bool).to_numpy()
+    else:
+        raise ValueError("Rotation rows need an is_home column or an explicit is_home")
+
+    stints['seconds'] = stints['end'] - stints['start']
+    stints = stints[stints['seconds'] > 0]
+    return stints[STINT_COLUMNS].reset_index(drop=True)
+
+class StintIndex:
+    """Sorted on-court intervals for one game.
+
+    Intervals are half-open, ``[start, end)``, so a player subbed out at
+    t and their replacement subbed in at t are never on together.
+    """
+
+    def __init__(self, stints: pd.DataFrame):
+        games = stints['game_id'].unique()
+        if len(games) > 1:
+            raise ValueError(f"StintIndex holds one game, got {len(games)}")
+        self.game_id = games[0] if len(games) else None
+        start = stints['start'].to_numpy(dtype=float)
+        if (np.diff(start) < 0).any():
+            stints = stints.sort_values(['start', 'end', 'player_id'], ignore_index=True)
+            start = stints['start'].to_numpy(dtype=float)
+        self.stints = stints
+        self.start = start
+        self.end = stints['end'].to_numpy(dtype=float)
+        self.player_ids = stints['player_id'].to_numpy(dtype='int64')
+        self.team_ids = stints['team_id'].to_numpy(dtype='int64')
+        self.is_home = stints['is_home'].to_numpy(dtype=bool)
+
+    @classmethod
+    def from_rotation(cls, home: pd.DataFrame, away: pd.DataFrame) -> 'StintIndex':
+        """Build from the raw home and away GameRotation frames."""
+        return cls(pd.concat([to_stints(home, True), to_stints(away, False)], ignore_index=True))
+
+    @property
+    def game_seconds(self) -> float:
+        """Game length, including any overtime."""
+        return float(self.end.max()) if len(self.end) else 0.0
+
+    def team_id(self, is_home: bool) -> int:
+        """Home or away team_id (-1 when that side has no stints)."""
+        side = np.flatnonzero(self.is_home == is_home)
+        return int(self.team_ids[side[0]]) if len(side) else -1
+
+    def active(self, times) -> np.ndarray:
+        """Boolean (len(times), n_stints) matrix of stints covering each time."""
+        times = np.atleast_1d(np.asarray(times, dtype=float))[:, None]
+        return (self.start <= times) & (times < self.end)
+
+    def on_court(self, times) -> pd.DataFrame:
+        """Players on the floor at each time, one row per (time, player)."""
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        rows, cols = np.nonzero(self.active(times))
+        result = self.stints.iloc[cols][['team_id', 'player_id', 'player', 'is_home']]
+        result.insert(0, 'time', times[rows])
+        return result.reset_index(drop=True)
+
+    def overlap(self, start: float, end: float) -> pd.DataFrame:
+        """Seconds each player was on the floor within ``[start, end)``."""
+        seconds = np.clip(np.minimum(self.end, end) - np.maximum(self.start, start), 0, None)
+        result = self.stints[['team_id', 'player_id', 'player', 'is_home']].assign(seconds=seconds)
+        result = result[result['seconds'] > 0]
+        return (result.groupby(['team_id', 'player_id', 'player', 'is_home'], as_index=False, observed=True)['seconds']
+                .sum().sort_values(['is_home', 'seconds'], ascending=False, ignore_index=True))
+
+    def lineups(self) -> pd.DataFrame:
+        """Split the game into segments with a constant 10-player state.
+
+        Lineups are tuples of sorted player_ids. ``complete`` is False for
+        segments where either side does not have exactly five players,
+        which flags gaps or overlaps in the source data.
+        """
+        return pd.DataFrame(self._lineup_columns(), columns=LINEUP_COLUMNS)
+
+    def _lineup_columns(self) -> Dict[str, np.ndarray]:
+        """Column arrays for ``lineups``, kept out of pandas for batch use."""
+        if not len(self.start):
+            return {col: [] for col in LINEUP_COLUMNS}
+
+        bounds = np.unique(np.concatenate([self.start, self.end]))
+        seg_start, seg_end = bounds[:-1], bounds[1:]
+        active = self.active((seg_start + seg_end) / 2)
+        covered = active.any(axis=1)
+        seg_start, seg_end, active = seg_start[covered], seg_end[covered], active[covered]
+
+        # Sort each side's on-court ids to the front of the row
+        sentinel = np.iinfo('int64').max
+        ids, counts = {}, {}
+        for side in (True, False):
+            mask = active & (self.is_home == side)
+            ids[side] = np.sort(np.where(mask, self.player_ids, sentinel), axis=1)
+            counts[side] = mask.sum(axis=1)
+
+        # A new lineup starts wherever either side changed or play was not contiguous
+        changed = np.ones(len(seg_start), dtype=bool)
+        changed[1:] = ((ids[True][1:] != ids[True][:-1]).any(axis=1)
+                       | (ids[False][1:] != ids[False][:-1]).any(axis=1)
+                       | (seg_start[1:] != seg_end[:-1]))
+        first = np.flatnonzero(changed)
+        last = np.append(first[1:] - 1, len(seg_start) - 1)
+
+        lineups = {}
+        for side, col in ((True, 'home_lineup'), (False, 'away_lineup')):
+            lineups[col] = [tuple(row[:n].tolist()) for row, n in zip(ids[side][first], counts[side][first])]
+        n = len(first)
+        return {
+            'game_id': np.full(n, self.game_id, dtype=object),
+            'start': seg_start[first],
+            'end': seg_end[last],
+            'seconds': seg_end[last] - seg_start[first],
+            'home_team_id': np.full(n, self.team_id(True)),
+            'home_lineup': lineups['home_lineup'],
+            'away_team_id': np.full(n, self.team_id(False)),
+            'away_lineup': lineups['away_lineup'],
+            'complete': (counts[True][first] == 5) & (counts[False][first] == 5),
+        }
+
+    def on_off(self) -> pd.DataFrame:
+        """Seconds each player spent on and off the floor."""
+        on = (self.stints.groupby(['game_id', 'team_id', 'player_id', 'player', 'is_home'],
+                                  as_index=False, observed=True)['seconds'].sum()
+              .rename(columns={'seconds': 'on_seconds'}))
+        on['off_seconds'] = self.game_seconds - on['on_seconds']
+        return on.sort_values(['is_home', 'on_seconds'], ascending=False, ignore_index=True)
+
+def list_games(season: Optional[str] = None, raw_dir: Optional[Path] = None) -> Dict[str, Tuple[Path, Path]]:
+    """Map game_id to its raw (home, away) rotation files.
+
+    Args:
+        season: Season like ``2023-24``; matched on the game_id season code
+        raw_dir: Raw rotation directory (default ``RAW_DIR``)
+    """
+    raw_dir = Path(raw_dir) if raw_dir else RAW_DIR
+    code = season[2:4] if season else None
+    games = {}
+    for home_file in sorted(raw_dir.glob("*/*_home.csv")):
+        away_file = home_file.with_name(home_file.name.replace('_home', '_away'))
+        try:
+            game_id = GameId(home_file.name.split('_')[0])
+        except ValueError:
+            logger.debug(f"Skipping {home_file}: not a game rotation file")
+            continue
+        if not away_file.exists() or (code and game_id[3:5] != code):
+            continue
+        games[game_id] = (home_file, away_file)
+    return games
+
+def read_rotation(files: Iterable[Tuple[Path, Path]]) -> pd.DataFrame:
+    """Read raw (home, away) rotation file pairs into one frame with ``is_home``."""
+    options = pa_csv.ConvertOptions(include_columns=RAW_COLUMNS, column_types=RAW_TYPES,
+                                    include_missing_columns=True)
+    tables = []
+    for home_file, away_file in files:
+        try:
+            pair = [pa_csv.read_csv(path, convert_options=options) for path in (home_file, away_file)]
+        except (pa.ArrowInvalid, OSError) as e:
+            logger.warning(f"Skipping rotation files {home_file.name}: {e}")
+            continue
+        for table, is_home in zip(pair, (True, False)):
+            tables.append(table.append_column('is_home', pa.array([is_home] * table.num_rows)))
+    if not tables:
+        return pd.DataFrame(columns=RAW_COLUMNS + ['is_home'])
+    return pa.concat_tables(tables).to_pandas()
+
+def load_home_teams(index_dir: Optional[Path] = None) -> Dict[str, int]:
+    """Map game_id to the home team id from the game-id index.
+
+    Index rows hold one team per game; ``vs.`` marks the home team and
+    ``@`` the away team, whose opponent is resolved by abbreviation.
+    """
+    index_dir = Path(index_dir) if index_dir else GAME_IDS_DIR
+    frames = [pd.read_csv(path, usecols=['game_id', 'matchup', 'team_id'], dtype={'game_id': str})
+              for path in sorted(index_dir.glob("games_*.csv"))]
+    if not frames:
+        return {}
+    df = pd.concat(frames, ignore_index=True).dropna()
+    team_ids = {team['abbreviation']: team['id'] for team in teams.get_teams()}
+    opponent = df['matchup'].str.split(' @ ').str[1].map(team_ids)
+    home = df['team_id'].where(df['matchup'].str.contains(' vs. ', regex=False), opponent)
+    df = df.assign(game_id=normalize_game_ids(df['game_id']), home=home).dropna(subset=['game_id', 'home'])
+    return dict(zip(df['game_id'], df['home'].astype(int)))
+
+def fix_home_flags(stints: pd.DataFrame, home_teams: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+    """Set ``is_home`` from known home teams, leaving games without a usable entry as read."""
+    if home_teams is None:
+        home_teams = load_home_teams()
+    if stints.empty or not home_teams:
+        return stints
+    home = stints['game_id'].map(home_teams)
+    is_home = stints['team_id'] == home
+    known = is_home.groupby(stints['game_id']).transform('any')
+    return stints.assign(is_home=is_home.where(known, stints['is_home']).astype(bool))
+
+def load_game(home_file: Path, away_file: Path,
+              home_teams: Optional[Dict[str, int]] = None) -> StintIndex:
+    """Load one game's raw rotation files into a StintIndex."""
+    return StintIndex(fix_home_flags(to_stints(read_rotation([(home_file, away_file)])), home_teams))
+
+def season_stints(season: Optional[str] = None, game_ids: Optional[Iterable[str]] = None,
+                  raw_dir: Optional[Path] = None,
+                  home_teams: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+    """All stints for a season (or the given games), sorted by game and time.
+
+    Files are read in one pass and converted together rather than game by game.
+    """
+    games = list_games(season, raw_dir)
+    if game_ids is not None:
+        wanted = {GameId(g) for g in game_ids}
+        games = {g: files for g, files in games.items() if g in wanted}
+    stints = fix_home_flags(to_stints(read_rotation(games.values())), home_teams)
+    return stints.sort_values(['game_id', 'start', 'end', 'player_id'], ignore_index=True)
+
+def iter_games(stints: pd.DataFrame) -> Iterator[StintIndex]:
+    """Split game-sorted stints (see ``season_stints``) into per-game indexes."""
+    if stints.empty:
+        return
+    game_ids = stints['game_id'].to_numpy()
+    bounds = np.flatnonzero(game_ids[1:] != game_ids[:-1]) + 1
+    for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(stints)]):
+        yield StintIndex(stints.iloc[lo:hi])
+
+def season_lineups(season: Optional[str] = None, game_ids: Optional[Iterable[str]] = None,
+                   raw_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Every lineup segment for a season (or the given games)."""
+    games = [game._lineup_columns() for game in iter_games(season_stints(season, game_ids, raw_dir))]
+    if not games:
+        return pd.DataFrame(columns=LINEUP_COLUMNS)
+    columns = {}
+    for col in LINEUP_COLUMNS:
+        if col.endswith('_lineup'):
+            columns[col] = [lineup for game in games for lineup in game[col]]
+        else:
+            columns[col] = np.concatenate([game[col] for game in games])
+    return pd.DataFrame(columns, columns=LINEUP_COLUMNS)
+
+def season_on_off(season: Optional[str] = None, game_ids: Optional[Iterable[str]] = None,
+                  raw_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Per-player on/off seconds summed over a season (or the given games)."""
+    stints = season_stints(season, game_ids, raw_dir)
+    game_seconds = stints.groupby('game_id')['end'].max()
+    games = stints.groupby(['game_id', 'player_id'], as_index=False).agg(
+        player=('player', 'last'), on_seconds=('seconds', 'sum'))
+    games['off_seconds'] = games['game_id'].map(game_seconds) - games['on_seconds']
+    return (games.groupby('player_id', as_index=False)
+            .agg(player=('player', 'last'), games=('game_id', 'nunique'),
+                 on_seconds=('on_seconds', 'sum'), off_seconds=('off_seconds', 'sum'))
+            .sort_values('on_seconds', ascending=False, ignore_index=True))
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
+import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict
 from nba_api.stats.endpoints import leaguegamefinder
 
+from bluefin_code.core.logs import configure
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -29,9 +32,11 @@ SEASON_DATES = {
     }
 }
 
+logger = logging.getLogger(__name__)
+
 def get_game_ids_for_season(season: str = CURRENT_SEASON, force_fresh: bool = False) -> Optional[pd.DataFrame]:
     """Get all game IDs for a season from NBA.com."""
-    print(f"\nFetching game IDs for season {season}")
+    logger.debug("Fetching game IDs for season %s", season)
     
     # Create cache path
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -39,7 +44,7 @@ def get_game_ids_for_season(season: str = CURRENT_SEASON, force_fresh: bool = Fa
     
     # Return cached data if it exists and we're not forcing fresh
     if not force_fresh and cache_path.exists():
-        print(f"Using cached data from {cache_path}")
+        logger.debug("Using cached data from %s", cache_path)
         df = pd.read_csv(cache_path)
         
         # Filter for regular season dates
@@ -48,7 +53,7 @@ def get_game_ids_for_season(season: str = CURRENT_SEASON, force_fresh: bool = Fa
         return df[mask]
     
     try:
-        print("Fetching data from NBA API...")
+        logger.debug("Fetching data from NBA API...")
         # Get data from NBA API
         gamefinder = leaguegamefinder.LeagueGameFinder(
             season_nullable=season,
@@ -58,7 +63,7 @@ def get_game_ids_for_season(season: str = CURRENT_SEASON, force_fresh: bool = Fa
         
         # Convert to DataFrame
         df = gamefinder.get_data_frames()[0]
-        print(f"Got data with {len(df)} rows")
+        logger.debug("Got data with %s rows", len(df))
         
         # Process the data
         df = process_game_ids(df)
@@ -73,12 +78,12 @@ def get_game_ids_for_season(season: str = CURRENT_SEASON, force_fresh: bool = Fa
         
         # Cache the processed data
         df.to_csv(cache_path, index=False)
-        print(f"Cached data to {cache_path}")
+        logger.debug("Cached data to %s", cache_path)
         
         return df
         
     except Exception as e:
-        print(f"Error getting game IDs: {str(e)}")
+        logger.error("Error getting game IDs: %s", e)
         return None
 
 def get_game_ids(seasons: List[str] = ALL_SEASONS, force_fresh: bool = False) -> Optional[pd.DataFrame]:
@@ -119,11 +124,9 @@ def process_game_ids(df: pd.DataFrame) -> pd.DataFrame:
     # Remove duplicate games (each game appears twice, once for each team)
     df = df.drop_duplicates(subset=['game_id'])
     
-    # Print some debug info
-    print(f"\nProcessed game IDs:")
-    print(f"Total games: {len(df)}")
-    print("\nGames by month:")
-    print(df['game_date'].str[:7].value_counts().sort_index())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processed %s game IDs; games by month:\n%s",
+                     len(df), df['game_date'].str[:7].value_counts().sort_index())
     
     return df
 
@@ -153,6 +156,7 @@ def get_season_for_date(date: str) -> str:
 
 def main():
     """Example usage."""
+    configure()
     print("\nNBA Game ID Collector")
     print("-------------------")
     
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""Canonical NBA.com game ids.
+
+NBA.com game ids are 10 characters (``0022300061``: ``002`` regular
+season, ``23`` for 2023-24, game ``00061``). Older collector paths wrote
+them with the leading zeros stripped (``22300061``), so the same game can
+appear under two names. ``GameId`` always holds the 10-character form;
+``find_game_file`` also matches the legacy short form so existence
+checks do not miss files written before the ids were canonical.
+"""
+
+import re
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+GAME_ID_LENGTH = 10
+SHORT_ID_LENGTH = 8
+_DIGITS_RE = re.compile(r'^\d+$')
+
+class GameId(str):
+    """A canonical 10-character NBA.com game id.
+
+    Accepts ``0022300061``, ``22300061``, ``22300061.0`` or the integer
+    ``22300061``; anything else raises ValueError. Being a ``str``, it can
+    be used anywhere a game id string was used before.
+    """
+
+    def __new__(cls, value: Union[str, int, float, 'GameId']) -> 'GameId':
+        if isinstance(value, GameId):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        text = str(value).strip()
+        if text.endswith('.0'):
+            text = text[:-2]
+        if not _DIGITS_RE.match(text) or len(text.lstrip('0')) > SHORT_ID_LENGTH or not text.lstrip('0'):
+            raise ValueError(f"Invalid game id: {value!r}")
+        return super().__new__(cls, text.zfill(GAME_ID_LENGTH))
+
+    @property
+    def short(self) -> str:
+        """Legacy 8-character form without the leading ``00``."""
+        return self[2:]
+
+    @property
+    def season(self) -> str:
+        """Season like ``2023-24``."""
+        start = 2000 + int(self[3:5])
+        return f"{start}-{(start + 1) % 100:02d}"
+
+    @property
+    def game_type(self) -> str:
+        """NBA.com game type digit (1 preseason, 2 regular season, 4 playoffs, ...)."""
+        return self[2]
+
+def normalize_game_ids(values: pd.Series) -> pd.Series:
+    """Vectorized ``GameId`` normalization of a column; invalid values become NaN."""
+    text = values.astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    valid = text.str.fullmatch(r'\d{1,10}') & (text.str.lstrip('0').str.len().between(1, SHORT_ID_LENGTH))
+    return text.str.zfill(GAME_ID_LENGTH).where(valid)
+
+def game_file(directory: Path, game_id: Union[str, int], pattern: str = "{game_id}.csv") -> Path:
+    """Canonical path of a per-game file, e.g. ``pattern="rotation_{game_id}.csv"``."""
+    return Path(directory) / pattern.format(game_id=GameId(game_id))
+
+def find_game_file(directory: Path, game_id: Union[str, int],
+                   pattern: str = "{game_id}.csv") -> Optional[Path]:
+    """Existing per-game file under its canonical or legacy short name."""
+    game_id = GameId(game_id)
+    for name in (game_id, game_id.short):
+        path = Path(directory) / pattern.format(game_id=name)
+        if path.exists():
+            return path
+    return None
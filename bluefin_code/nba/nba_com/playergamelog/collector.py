@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 
+import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from nba_api.stats.endpoints import playergamelog
 
+from bluefin_code.core.logs import configure
+from bluefin_code.nba import catalog
+from bluefin_code.nba.nba_com.clock import parse_minutes
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -13,6 +18,8 @@ BASE_DIR = DATA_ROOT / "nba" / "nba_com" / "playergamelog"
 RAW_DIR = BASE_DIR / "raw"
 PROCESSED_DIR = BASE_DIR / "processed"
 
+logger = logging.getLogger(__name__)
+
 def get_year_month(date: str) -> str:
     """
     Get year-month string from date.
@@ -31,7 +38,7 @@ def get_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: boo
     # Ensure player_id is a string
     player_id = str(player_id)
     
-    print(f"\nFetching game log for player {player_id}")
+    logger.debug("Fetching game log for player %s", player_id)
     
     # Create cache path using season
     cache_dir = RAW_DIR / season
@@ -39,14 +46,14 @@ def get_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: boo
     
     # Return cached data if it exists and we're not forcing fresh
     if not force_fresh and cache_path.exists():
-        print(f"Using cached data from {cache_path}")
+        logger.debug("Using cached data from %s", cache_path)
         return pd.read_csv(cache_path)
     
     # Ensure cache directory exists
     cache_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        print("Fetching data from NBA API...")
+        logger.debug("Fetching data from NBA API...")
         # Get data from NBA API
         gamelog = playergamelog.PlayerGameLog(
             player_id=player_id,
@@ -58,21 +65,22 @@ def get_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: boo
         all_dfs = gamelog.get_data_frames()
         
         if not all_dfs or len(all_dfs) == 0:
-            print("No data returned from API")
+            logger.warning("No data returned from API")
             return None
             
         # Get player stats
         df = all_dfs[0]  # First result set is player stats
-        print(f"Got data with {len(df)} rows")
+        logger.debug("Got data with %s rows", len(df))
         
         # Cache the raw data
         df.to_csv(cache_path, index=False)
-        print(f"Cached raw data to {cache_path}")
+        catalog.record(cache_path, rows=len(df))
+        logger.debug("Cached raw data to %s", cache_path)
         
         return df
         
     except Exception as e:
-        print(f"Error getting data for player {player_id}: {str(e)}")
+        logger.error("Error getting data for player %s: %s", player_id, e)
         return None
 
 def process_gamelog(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
@@ -109,8 +117,7 @@ def process_gamelog(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
             'PLUS_MINUS': 'plus_minus'
         }
         
-        # Print available columns for debugging
-        print("\nAvailable columns:", df.columns.tolist())
+        logger.debug("Available columns: %s", df.columns.tolist())
         
         # Select and rename columns that exist
         available_cols = [col for col in cols.keys() if col in df.columns]
@@ -121,40 +128,22 @@ def process_gamelog(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
         df['game_date'] = pd.to_datetime(df['game_date'], format='%b %d, %Y').dt.strftime('%Y-%m-%d')
         
         # Convert minutes to float
-        def convert_minutes(x) -> float:
-            if pd.isna(x) or not str(x).strip():
-                return 0.0
-            x_str = str(x).strip()
-            if ':' in x_str:
-                try:
-                    minutes, seconds = x_str.split(':')
-                    return float(minutes) + float(seconds)/60
-                except (ValueError, IndexError):
-                    print(f"Warning: Could not parse minutes value: {x_str}")
-                    return 0.0
-            try:
-                return float(x_str)
-            except ValueError:
-                print(f"Warning: Could not convert minutes value to float: {x_str}")
-                return 0.0
-        
-        df['minutes'] = df['minutes'].apply(convert_minutes)
+        df['minutes'] = parse_minutes(df['minutes'])
         
         # Convert percentage columns to actual percentages
         pct_cols = [col for col in df.columns if 'pct' in col.lower()]
         for col in pct_cols:
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
         
-        # Print some debug info
-        print(f"\nProcessed {len(df)} rows of game log data")
-        print(f"Games with minutes > 0: {len(df[df['minutes'] > 0])}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processed %s rows of game log data, %s games with minutes > 0",
+                         len(df), int((df['minutes'] > 0).sum()))
         
         return df
         
     except Exception as e:
-        print(f"Error processing game log: {str(e)}")
-        print("DataFrame head:")
-        print(df.head())
+        logger.error("Error processing game log: %s", e)
+        logger.debug("DataFrame head:\n%s", df.head())
         return None
 
 def save_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: bool = False) -> None:
@@ -162,13 +151,13 @@ def save_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: bo
     # Get raw data
     raw_df = get_player_gamelog(player_id, season, force_fresh)
     if raw_df is None:
-        print("Failed to get raw data")
+        logger.warning("Failed to get raw data")
         return
     
     # Process data
     df = process_gamelog(raw_df)
     if df is None:
-        print("Failed to process data")
+        logger.warning("Failed to process data")
         return
     
     # Save to season directory
@@ -178,10 +167,12 @@ def save_player_gamelog(player_id: str, season: str = "2024-25", force_fresh: bo
     # Save processed data
     save_path = save_dir / f"gamelog_{player_id}_{season}.csv"
     df.to_csv(save_path, index=False)
-    print(f"Saved processed data to {save_path}")
+    catalog.record(save_path, rows=len(df))
+    logger.debug("Saved processed data to %s", save_path)
 
 def main():
     """Example usage."""
+    configure()
     print("\nNBA Player Game Log Collector")
     print("----------------------------")
     
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+import logging
+import sys
 from pathlib import Path
 from collector import process_gamelog
+from bluefin_code.core.logs import configure, track
 import pandas as pd
 
 # Project paths
@@ -11,20 +14,22 @@ BASE_DIR = DATA_ROOT / "nba" / "nba_com" / "playergamelog"
 RAW_DIR = BASE_DIR / "raw"
 PROCESSED_DIR = BASE_DIR / "processed"
 
+logger = logging.getLogger(__name__)
+
 def reprocess_season(season: str):
     """Reprocess all raw files for a given season."""
-    print(f"\nReprocessing all gamelog files for {season}...")
+    logger.info("Reprocessing all gamelog files for %s...", season)
     
     # Get all raw files for the season
     raw_files = list(RAW_DIR.glob(f"{season}/*_{season}.csv"))
     total_files = len(raw_files)
     
-    print(f"Found {total_files} raw files to reprocess")
+    logger.info("Found %s raw files to reprocess", total_files)
     
     # Process each file
-    for i, raw_file in enumerate(raw_files, 1):
+    for i, raw_file in enumerate(track(raw_files, f"gamelog {season}"), 1):
         player_id = raw_file.stem.split("_")[0]
-        print(f"\nProcessing {i}/{total_files}: Player {player_id}")
+        logger.debug("Processing %s/%s: Player %s", i, total_files, player_id)
         
         try:
             # Read raw data
@@ -33,7 +38,7 @@ def reprocess_season(season: str):
             # Process data
             processed_df = process_gamelog(df)
             if processed_df is None:
-                print(f"Failed to process {raw_file}")
+                logger.warning("Failed to process %s", raw_file)
                 continue
                 
             # Save processed data
@@ -41,15 +46,16 @@ def reprocess_season(season: str):
             save_dir.mkdir(parents=True, exist_ok=True)
             save_path = save_dir / f"gamelog_{raw_file.name}"
             processed_df.to_csv(save_path, index=False)
-            print(f"Saved processed data to {save_path}")
+            logger.debug("Saved processed data to %s", save_path)
             
         except Exception as e:
-            print(f"Error processing {raw_file}: {str(e)}")
+            logger.error("Error processing %s: %s", raw_file, e)
             continue
             
-    print(f"\nReprocessing complete for {season}!")
+    logger.info("Reprocessing complete for %s", season)
 
 if __name__ == "__main__":
+    configure(progress=sys.stderr.isatty())
     # Reprocess both seasons
     reprocess_season("2023-24")
     reprocess_season("2024-25") 
\ No newline at end of file
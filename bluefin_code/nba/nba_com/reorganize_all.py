@@ -1,179 +1,207 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-from pathlib import Path
-from datetime import datetime
+"""Reorganize NBA.com data files into ``raw|processed/YYYY-MM`` folders.
+
+Each file's game date comes from the game-id index
+(``nba_com/game_ids/games_*.csv``), falling back to the first data row
+of the file (``GAME_DATE_EST``) only when the game is not indexed. All
+moves are planned before any file is touched, so ``--dry-run`` reports
+exactly what would happen, and planned moves run in parallel.
+
+Files without a game id in their name (e.g. season player game logs) are
+left where they are; files whose date cannot be resolved are reported
+rather than guessed.
+"""
+
+import argparse
+import csv
+import logging
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.nba_com.ids import GameId, normalize_game_ids
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
 NBA_COM_DIR = DATA_ROOT / "nba" / "nba_com"
+GAME_IDS_DIR = NBA_COM_DIR / "game_ids"
 
-def get_game_date(game_id: str, df: pd.DataFrame) -> str:
-    """
-    Try to get game date from the data.
-    Format: YYYY-MM-DD
-    """
+logger = logging.getLogger(__name__)
+
+# Game ids appear in file names with or without the leading "00"
+GAME_ID_RE = re.compile(r'(?:^|_)((?:00)?\d{8})(?=_|$)')
+MONTH_DIR_RE = re.compile(r'^\d{4}-\d{2}$')
+DATE_COLUMNS = ['GAME_DATE_EST', 'GAME_DATE', 'game_date', 'date']
+SUBDIRS = ['raw', 'processed']
+
+@dataclass(frozen=True)
+class Move:
+    """A planned file move."""
+    source: Path
+    target: Path
+    game_id: str
+    date_source: str
+
+def parse_game_id(name: str) -> Optional[str]:
+    """Extract a 10-character game id from a file stem, if it has one."""
+    match = GAME_ID_RE.search(name)
+    return GameId(match.group(1)) if match else None
+
+def load_game_dates(index_dir: Optional[Path] = None) -> Dict[str, str]:
+    """Map game_id to game date (YYYY-MM-DD) from the cached game-id index."""
+    index_dir = Path(index_dir) if index_dir else GAME_IDS_DIR
+    frames = [pd.read_csv(path, usecols=['game_id', 'game_date'], dtype=str)
+              for path in sorted(index_dir.glob("games_*.csv"))]
+    if not frames:
+        logger.warning(f"No game-id index found in {index_dir}")
+        return {}
+    df = pd.concat(frames, ignore_index=True).dropna()
+    return dict(zip(normalize_game_ids(df['game_id']), df['game_date'].str[:10]))
+
+def header_date(path: Path) -> Optional[str]:
+    """Read a game date from the header and first row of a CSV file."""
     try:
-        # First try to get GAME_DATE_EST from the data
-        if 'GAME_DATE_EST' in df.columns:
-            date_str = df['GAME_DATE_EST'].iloc[0]
-            return pd.to_datetime(date_str).strftime('%Y-%m-%d')
-    except:
-        pass
-    
-    # If we can't get date from data, try to infer from game ID
-    # Game IDs starting with 0022 are regular season games
-    if game_id.startswith('00224'):  # 2024-25 season
-        game_num = int(game_id[-4:])  # Last 4 digits
-        # Rough estimate: season starts in October
-        if game_num <= 200:  # October/November games
-            return f"2024-{10 + (game_num // 100):02d}-01"
-        elif game_num <= 400:  # December games
-            return "2024-12-01"
-        else:  # January onwards
-            return f"2025-{1 + (game_num - 400) // 100:02d}-01"
-    
-    # If all else fails, use current date
-    print(f"Warning: Could not get date for game {game_id}, using current date")
-    return datetime.now().strftime('%Y-%m-%d')
-
-def reorganize_directory(data_dir: Path):
-    """Reorganize data files in a directory into YYYY-MM folders."""
-    print(f"\nReorganizing {data_dir}...")
-    
-    raw_dir = data_dir / "raw"
-    processed_dir = data_dir / "processed"
-    
-    # Create directories if they don't exist
-    raw_dir.mkdir(parents=True, exist_ok=True)
-    processed_dir.mkdir(parents=True, exist_ok=True)
-    
-    # First handle season folders in raw directory
-    for season_dir in raw_dir.glob("20*-*"):
-        if season_dir.is_dir():
-            print(f"\nProcessing season directory: {season_dir}")
-            for file_path in season_dir.glob("*.csv"):
-                try:
-                    # Read the data to get the date
-                    df = pd.read_csv(file_path)
-                    game_id = file_path.stem  # filename without extension
-                    game_date = get_game_date(game_id, df)
-                    year_month = game_date[:7]  # YYYY-MM
-                    
-                    # Create new directory
-                    new_dir = raw_dir / year_month
-                    new_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Move file to new location
-                    new_path = new_dir / file_path.name
-                    print(f"Moving {file_path.name} to {new_path}")
-                    shutil.move(str(file_path), str(new_path))
-                    
-                except Exception as e:
-                    print(f"Error processing {file_path}: {str(e)}")
-            
-            # Try to remove season directory if empty
-            try:
-                season_dir.rmdir()
-                print(f"Removed empty directory {season_dir}")
-            except:
-                pass
-    
-    # Handle any remaining files in raw directory
-    for file_path in raw_dir.glob("*.csv"):
-        try:
-            # Skip if already in a YYYY-MM folder
-            if len(file_path.parts) >= 2 and file_path.parts[-2].replace('-', '').isdigit():
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            row = next(reader, [])
+    except OSError:
+        return None
+    for col in DATE_COLUMNS:
+        if col in header and header.index(col) < len(row):
+            date = pd.to_datetime(row[header.index(col)], errors='coerce')
+            if not pd.isna(date):
+                return date.strftime('%Y-%m-%d')
+    return None
+
+def plan_directory(data_dir: Path, game_dates: Dict[str, str]) -> Tuple[List[Move], List[Path]]:
+    """Plan moves for every misplaced file under data_dir/raw and data_dir/processed.
+
+    Returns:
+        (moves, unresolved files)
+    """
+    moves, unresolved = [], []
+    for subdir in SUBDIRS:
+        base = data_dir / subdir
+        if not base.is_dir():
+            continue
+        for path in base.rglob("*.csv"):
+            game_id = parse_game_id(path.stem)
+            if game_id is None:
+                continue
+
+            date, date_source = game_dates.get(game_id), 'index'
+            if date is None:
+                date, date_source = header_date(path), 'header'
+            if date is None:
+                unresolved.append(path)
+                continue
+
+            target = base / date[:7] / path.name
+            if target == path:
+                continue
+            if target.exists():
+                logger.warning(f"Not moving {path}: {target} already exists")
+                unresolved.append(path)
                 continue
-                
-            # Read the data to get the date
-            df = pd.read_csv(file_path)
-            game_id = file_path.stem  # filename without extension
-            game_date = get_game_date(game_id, df)
-            year_month = game_date[:7]  # YYYY-MM
-            
-            # Create new directory
-            new_dir = raw_dir / year_month
-            new_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Move file to new location
-            new_path = new_dir / file_path.name
-            print(f"Moving {file_path.name} to {new_path}")
-            shutil.move(str(file_path), str(new_path))
-            
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
-    
-    # Handle season folders in processed directory
-    for season_dir in processed_dir.glob("20*-*"):
-        if season_dir.is_dir():
-            print(f"\nProcessing season directory: {season_dir}")
-            for file_path in season_dir.glob("*.csv"):
-                try:
-                    # Read the data to get the date
-                    df = pd.read_csv(file_path)
-                    game_id = file_path.stem.split('_')[-1]  # Get game ID from filename
-                    game_date = get_game_date(game_id, df)
-                    year_month = game_date[:7]  # YYYY-MM
-                    
-                    # Create new directory
-                    new_dir = processed_dir / year_month
-                    new_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Move file to new location
-                    new_path = new_dir / file_path.name
-                    print(f"Moving {file_path.name} to {new_path}")
-                    shutil.move(str(file_path), str(new_path))
-                    
-                except Exception as e:
-                    print(f"Error processing {file_path}: {str(e)}")
-            
-            # Try to remove season directory if empty
+            moves.append(Move(path, target, game_id, date_source))
+    return moves, unresolved
+
+def plan_all(data_dirs: Optional[Iterable[Path]] = None,
+             game_dates: Optional[Dict[str, str]] = None) -> Tuple[List[Move], List[Path]]:
+    """Plan moves for every NBA.com endpoint directory."""
+    if data_dirs is None:
+        data_dirs = sorted(d for d in NBA_COM_DIR.iterdir() if d.is_dir())
+    if game_dates is None:
+        game_dates = load_game_dates()
+    moves, unresolved = [], []
+    for data_dir in data_dirs:
+        dir_moves, dir_unresolved = plan_directory(Path(data_dir), game_dates)
+        moves.extend(dir_moves)
+        unresolved.extend(dir_unresolved)
+    return moves, unresolved
+
+def summarize(moves: List[Move]) -> pd.DataFrame:
+    """Count planned moves per directory, source folder and target month."""
+    if not moves:
+        return pd.DataFrame(columns=['directory', 'from', 'to', 'date_source', 'files'])
+    df = pd.DataFrame({
+        'directory': [str(m.target.parent.parent.relative_to(m.target.parents[3])) for m in moves],
+        'from': [m.source.parent.name for m in moves],
+        'to': [m.target.parent.name for m in moves],
+        'date_source': [m.date_source for m in moves],
+    })
+    return (df.groupby(['directory', 'from', 'to', 'date_source']).size()
+            .rename('files').reset_index())
+
+def _move(move: Move) -> None:
+    try:
+        os.replace(move.source, move.target)
+    except OSError:
+        shutil.move(str(move.source), str(move.target))
+
+def execute(moves: List[Move], workers: int = 8) -> int:
+    """Run planned moves in parallel and remove emptied non-month folders."""
+    for target_dir in {m.target.parent for m in moves}:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_move, moves))
+
+    for source_dir in sorted({m.source.parent for m in moves}, reverse=True):
+        if source_dir.name not in SUBDIRS and not MONTH_DIR_RE.match(source_dir.name):
             try:
-                season_dir.rmdir()
-                print(f"Removed empty directory {season_dir}")
-            except:
+                source_dir.rmdir()
+                logger.info(f"Removed empty directory {source_dir}")
+            except OSError:
                 pass
-    
-    # Handle any remaining files in processed directory
-    for file_path in processed_dir.glob("*.csv"):
-        try:
-            # Skip if already in a YYYY-MM folder
-            if len(file_path.parts) >= 2 and file_path.parts[-2].replace('-', '').isdigit():
-                continue
-                
-            # Read the data to get the date
-            df = pd.read_csv(file_path)
-            game_id = file_path.stem.split('_')[-1]  # Get game ID from filename
-            game_date = get_game_date(game_id, df)
-            year_month = game_date[:7]  # YYYY-MM
-            
-            # Create new directory
-            new_dir = processed_dir / year_month
-            new_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Move file to new location
-            new_path = new_dir / file_path.name
-            print(f"Moving {file_path.name} to {new_path}")
-            shutil.move(str(file_path), str(new_path))
-            
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
-
-def main():
+    return len(moves)
+
+def reorganize_directory(data_dir: Path, game_dates: Optional[Dict[str, str]] = None,
+                         dry_run: bool = False, workers: int = 8) -> List[Move]:
+    """Reorganize one endpoint directory into YYYY-MM folders."""
+    moves, unresolved = plan_all([data_dir], game_dates)
+    if unresolved:
+        logger.warning(f"Could not place {len(unresolved)} files in {data_dir}")
+    if not dry_run:
+        execute(moves, workers)
+    return moves
+
+def main() -> int:
     """Main entry point."""
-    print("NBA.com Data Reorganizer")
-    print("----------------------")
-    
-    # Get all NBA.com data directories
-    nba_com_dirs = [d for d in NBA_COM_DIR.iterdir() if d.is_dir()]
-    
-    for data_dir in nba_com_dirs:
-        reorganize_directory(data_dir)
-    
-    print("\nReorganization complete!")
+    parser = argparse.ArgumentParser(description='Reorganize NBA.com data into YYYY-MM folders')
+    parser.add_argument('dirs', nargs='*', help='Endpoint directories (default: all under nba_com)')
+    parser.add_argument('--dry-run', action='store_true', help='Show planned moves without moving files')
+    parser.add_argument('--workers', type=int, default=8, help='Parallel move workers')
+    args = parser.parse_args()
+
+    configure()
+    moves, unresolved = plan_all([Path(d) for d in args.dirs] or None)
+
+    summary = summarize(moves)
+    if summary.empty:
+        print("All files are already in place")
+    else:
+        print(summary.to_string(index=False))
+    for path in unresolved[:20]:
+        print(f"Unresolved: {path}")
+    if len(unresolved) > 20:
+        print(f"... and {len(unresolved) - 20} more unresolved files")
+
+    if args.dry_run:
+        print(f"\nDry run: {len(moves)} files would be moved, {len(unresolved)} unresolved")
+    else:
+        execute(moves, args.workers)
+        print(f"\nMoved {len(moves)} files, {len(unresolved)} unresolved")
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""NBA.com tests package."""
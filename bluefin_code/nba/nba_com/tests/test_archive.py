@@ -0,0 +1,49 @@
+"""Test the raw-response archive."""
+
+import pandas as pd
+
+from .. import archive
+
+RESPONSE = {
+    'resource': 'gamerotation',
+    'resultSets': [
+        {'name': 'AwayTeam', 'headers': ['GAME_ID', 'TEAM_ID'], 'rowSet': [['0022300001', 2]]},
+        {'name': 'HomeTeam', 'headers': ['GAME_ID', 'TEAM_ID'], 'rowSet': [['0022300001', 1]]},
+    ],
+}
+
+class FakeEndpoint:
+    """Stand-in for an nba_api endpoint that counts requests."""
+    calls = 0
+
+    def __init__(self, response=RESPONSE):
+        FakeEndpoint.calls += 1
+        self.response = response
+
+    def get_dict(self):
+        return self.response
+
+def test_fetch_once_and_derive(tmp_path, monkeypatch):
+    """Test a response is fetched once, kept whole and derived by name."""
+    monkeypatch.setattr(archive, 'NBA_COM_DIR', tmp_path)
+    FakeEndpoint.calls = 0
+
+    frames = archive.fetch_frames('gamerotation', '22300001', '2023-10-24', FakeEndpoint)
+    assert set(frames) == {'AwayTeam', 'HomeTeam'}
+    assert frames['HomeTeam']['TEAM_ID'].tolist() == [1]
+    assert (tmp_path / 'gamerotation' / 'archive' / '2023-10' / '0022300001.json.gz').exists()
+
+    archive.fetch_frames('gamerotation', '0022300001', '2023-10-24', FakeEndpoint)
+    assert FakeEndpoint.calls == 1
+    archive.fetch_frames('gamerotation', '0022300001', '2023-10-24', FakeEndpoint, force_fresh=True)
+    assert FakeEndpoint.calls == 2
+
+    assert archive.load_response('gamerotation', '0022300001') == RESPONSE
+    away = archive.derive('gamerotation', 'AwayTeam')
+    pd.testing.assert_frame_equal(away, frames['AwayTeam'])
+    assert archive.derive('gamerotation', 'AwayTeam', ['0022300002']).empty
+
+def test_single_result_set():
+    """Test responses carrying one ``resultSet`` dict."""
+    frames = archive.to_frames({'resultSet': {'name': 'Only', 'headers': ['A'], 'rowSet': [[1], [2]]}})
+    assert frames['Only']['A'].tolist() == [1, 2]
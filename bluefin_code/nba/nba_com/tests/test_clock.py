@@ -0,0 +1,37 @@
+"""Test vectorized minutes and clock parsing."""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ..clock import parse_minutes, parse_seconds, tenths_to_seconds
+
+VALUES = pd.Series(['34:30', 'PT12M34.00S', '12.5', '', None, np.nan, '0:45', '-1:30'])
+
+def test_parse_minutes():
+    """Test every supported format parses to minutes."""
+    result = parse_minutes(VALUES)
+    expected = [34.5, 12 + 34 / 60, 12.5, 0.0, 0.0, 0.0, 0.75, -1.5]
+    np.testing.assert_allclose(result, expected)
+    assert result.index.equals(VALUES.index)
+
+    # Numeric columns pass straight through
+    assert parse_minutes(pd.Series([30, None])).tolist() == [30.0, 0.0]
+    assert parse_minutes(pd.Series(['', None]), default=None).isna().all()
+
+def test_parse_seconds():
+    """Test clock strings parse to seconds and decimals pass through."""
+    result = parse_seconds(VALUES)
+    np.testing.assert_allclose(result, [2070.0, 754.0, 12.5, 0.0, 0.0, 0.0, 45.0, -90.0])
+    assert tenths_to_seconds(pd.Series([7200, '28774'])).tolist() == [720.0, 2877.4]
+
+def test_bad_values_reported_once(caplog):
+    """Test unparseable values are counted in one aggregate warning."""
+    values = pd.Series(['DNP', '30:00', 'DNP', 'n/a'])
+    with caplog.at_level(logging.WARNING):
+        result = parse_minutes(values)
+
+    assert result.tolist() == [0.0, 30.0, 0.0, 0.0]
+    assert len(caplog.records) == 1
+    assert "Could not parse 3 minutes values" in caplog.records[0].message
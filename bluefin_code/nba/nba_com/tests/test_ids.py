@@ -0,0 +1,61 @@
+"""Test canonical game ids and duplicate file migration."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from ..dedupe import canonical_name, execute, plan_dedupe
+from ..ids import GameId, find_game_file, game_file, normalize_game_ids
+
+def test_game_id():
+    """Test every known spelling maps to one canonical id."""
+    for value in ['0022300061', '22300061', 22300061, 22300061.0, '22300061.0']:
+        assert GameId(value) == '0022300061'
+    game_id = GameId('22300061')
+    assert game_id.short == '22300061' and game_id.season == '2023-24' and game_id.game_type == '2'
+    for bad in ['', 'abc', '123456789012', '0']:
+        with pytest.raises(ValueError):
+            GameId(bad)
+
+    ids = normalize_game_ids(pd.Series(['22300061', '0022300061', 22300061, 'abc', None]))
+    assert ids[:3].tolist() == ['0022300061'] * 3 and ids[3:].isna().all()
+
+def test_find_game_file(tmp_path):
+    """Test existence checks see legacy short-id files."""
+    assert game_file(tmp_path, '22300061', "rotation_{game_id}.csv").name == "rotation_0022300061.csv"
+    assert find_game_file(tmp_path, '0022300061', "rotation_{game_id}.csv") is None
+    legacy = tmp_path / "rotation_22300061.csv"
+    legacy.write_text("x\n")
+    assert find_game_file(tmp_path, '0022300061', "rotation_{game_id}.csv") == legacy
+
+def test_dedupe(tmp_path):
+    """Test renames, identical copies and differing copies are resolved in one pass."""
+    raw = tmp_path / "gamerotation" / "raw"
+    (raw / "2023-10").mkdir(parents=True)
+    (raw / "2023-11").mkdir(parents=True)
+    (raw / "2023-10" / "22300061_home.csv").write_text("a\n1\n")
+    (raw / "2023-10" / "22300062_home.csv").write_text("a\n1\n")
+    (raw / "2023-10" / "0022300062_home.csv").write_text("a\n1\n")
+    short = raw / "2023-10" / "22300063_home.csv"
+    short.write_text("a\n1\n2\n")
+    (raw / "2023-11" / "0022300063_home.csv").write_text("a\n1\n")
+    os.utime(short, (0, 0))
+
+    assert canonical_name(short) == "0022300063_home.csv"
+    game_dates = {'0022300063': '2023-11-01'}
+    actions = {a.target.name: a for a in plan_dedupe([tmp_path / "gamerotation"], game_dates)}
+    assert {name: a.kind for name, a in actions.items()} == {
+        '0022300061_home.csv': 'rename',
+        '0022300062_home.csv': 'identical',
+        '0022300063_home.csv': 'differs',
+    }
+    # The longer legacy copy wins and lands in the indexed month
+    assert actions['0022300063_home.csv'].keep == short
+
+    assert execute(list(actions.values()), workers=2) == 2
+    files = sorted(str(p.relative_to(raw)) for p in raw.rglob("*.csv"))
+    assert files == ['2023-10/0022300061_home.csv', '2023-10/0022300062_home.csv',
+                     '2023-11/0022300063_home.csv']
+    assert (raw / "2023-11" / "0022300063_home.csv").read_text() == "a\n1\n2\n"
+    assert plan_dedupe([tmp_path / "gamerotation"], game_dates) == []
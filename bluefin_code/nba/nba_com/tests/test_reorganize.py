@@ -0,0 +1,51 @@
+"""Test index-driven data reorganization."""
+
+from ..reorganize_all import (
+    header_date, load_game_dates, parse_game_id, plan_directory, execute, summarize,
+)
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+def test_parse_game_id():
+    """Test game ids are found with or without the 00 prefix."""
+    assert parse_game_id('0022300061') == '0022300061'
+    assert parse_game_id('22300061_home') == '0022300061'
+    assert parse_game_id('rotation_0022300061') == '0022300061'
+    assert parse_game_id('203992_2024-25') is None
+
+def test_plan_and_execute(tmp_path):
+    """Test dates come from the index, then file headers, and nothing is guessed."""
+    index_dir = tmp_path / "game_ids"
+    write(index_dir / "games_2023_24.csv",
+          "game_id,game_date,team\n0022300061,2023-10-24,LAL\n0022300001,2023-11-03,CLE\n")
+    game_dates = load_game_dates(index_dir)
+    assert game_dates['0022300061'] == '2023-10-24'
+
+    data_dir = tmp_path / "gamerotation"
+    season_file = write(data_dir / "raw" / "2023-24" / "22300061_home.csv", "GAME_ID\n1\n")
+    misplaced = write(data_dir / "processed" / "2023-10" / "rotation_0022300001.csv", "x\n1\n")
+    placed = write(data_dir / "raw" / "2023-10" / "22300061_away.csv", "GAME_ID\n1\n")
+    header = write(data_dir / "raw" / "0022399999_line.csv", "GAME_DATE_EST,PTS\n2024-01-05T00:00:00,100\n")
+    unknown = write(data_dir / "raw" / "0022399998.csv", "PTS\n100\n")
+    write(data_dir / "raw" / "2023-24" / "203992_2023-24.csv", "PTS\n1\n")
+    assert header_date(header) == '2024-01-05'
+
+    moves, unresolved = plan_directory(data_dir, game_dates)
+    targets = {m.source.name: (m.target.parent.name, m.date_source) for m in moves}
+    assert targets == {
+        '22300061_home.csv': ('2023-10', 'index'),
+        'rotation_0022300001.csv': ('2023-11', 'index'),
+        '0022399999_line.csv': ('2024-01', 'header'),
+    }
+    assert unresolved == [unknown]
+    assert summarize(moves)['files'].sum() == 3
+
+    assert execute(moves, workers=2) == 3
+    assert not season_file.exists() and not misplaced.exists() and placed.exists()
+    assert (data_dir / "raw" / "2023-10" / "22300061_home.csv").exists()
+    # Season folder still holds an unplaceable file, so it is kept
+    assert (data_dir / "raw" / "2023-24" / "203992_2023-24.csv").exists()
+    assert plan_directory(data_dir, game_dates)[0] == []
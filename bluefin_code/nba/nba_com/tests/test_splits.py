@@ -0,0 +1,100 @@
+"""Test season lineup and on/off splits."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..gamerotation import splits
+from ..gamerotation.stints import StintIndex
+
+def rotation(game_id, team_id, stints):
+    """Raw GameRotation rows from (player_id, in_seconds, out_seconds, pt_diff)."""
+    return pd.DataFrame({
+        'GAME_ID': game_id,
+        'TEAM_ID': team_id,
+        'PERSON_ID': [s[0] for s in stints],
+        'PLAYER_FIRST': 'Player',
+        'PLAYER_LAST': [str(s[0]) for s in stints],
+        'IN_TIME_REAL': [s[1] * 10 for s in stints],
+        'OUT_TIME_REAL': [s[2] * 10 for s in stints],
+        'PT_DIFF': [s[3] for s in stints],
+    })
+
+def game(game_id='0022300001'):
+    """Home leads 6-0 at half with player 5, then wins the second half 4-0 with player 6."""
+    home = rotation(game_id, 1, [(p, 0, 2880, 10) for p in range(1, 5)]
+                    + [(5, 0, 1440, 6), (6, 1440, 2880, 4)])
+    away = rotation(game_id, 2, [(p, 0, 2880, -10) for p in range(11, 16)])
+    return home, away
+
+def test_solve_margin():
+    """Test the running margin is recovered at each substitution."""
+    margin = splits.solve_margin(StintIndex.from_rotation(*game()))
+    np.testing.assert_allclose(margin.to_numpy(), [0, 6, 10], atol=1e-9)
+
+def test_compute_splits():
+    """Test player on/off, lineup and pair rows for one game."""
+    tables = splits.compute_splits(StintIndex.from_rotation(*game()).stints)
+
+    players = tables['players'].set_index('player_id')
+    assert players.loc[5, 'on_diff'] == 6 and players.loc[5, 'off_diff'] == pytest.approx(4)
+    assert players.loc[11, 'off_seconds'] == 0
+
+    lineups = tables['lineups'].set_index('lineup')
+    assert lineups.loc['1-2-3-4-5', 'diff'] == pytest.approx(6)
+    assert lineups.loc['1-2-3-4-6', 'diff'] == pytest.approx(4)
+    assert lineups.loc['11-12-13-14-15', 'diff'] == pytest.approx(-10)
+
+    pairs = tables['pairs'].set_index(['player_a', 'player_b'])
+    assert pairs.loc[(1, 5), 'seconds'] == 1440
+    assert pairs.loc[(1, 6), 'diff'] == pytest.approx(4)
+    assert (5, 6) not in pairs.index
+
+def test_incremental_cache(tmp_path):
+    """Test only new games are computed and season aggregates combine them."""
+    raw_dir, cache_dir = tmp_path / "raw", tmp_path / "splits"
+    month = raw_dir / "2023-10"
+    month.mkdir(parents=True)
+    for game_id in ['0022300001', '0022300002']:
+        home, away = game(game_id)
+        home.to_csv(month / f"{game_id}_home.csv", index=False)
+        away.to_csv(month / f"{game_id}_away.csv", index=False)
+
+    kwargs = dict(raw_dir=raw_dir, cache_dir=cache_dir, line_dir=tmp_path)
+    assert splits.update('2023-24', **kwargs) == 2
+    assert splits.update('2023-24', **kwargs) == 0
+
+    home, away = game('0022300003')
+    home.to_csv(month / "0022300003_home.csv", index=False)
+    away.to_csv(month / "0022300003_away.csv", index=False)
+    assert splits.update('2023-24', **kwargs) == 1
+    assert len(list((cache_dir / '2023-24' / 'players').glob('part-*.parquet'))) == 2
+
+    players = splits.player_splits('2023-24', refresh=False, cache_dir=cache_dir).set_index('player_id')
+    assert players.loc[5, 'games'] == 3
+    assert players.loc[5, 'on_net'] == pytest.approx(12.0)
+    lineups = splits.lineup_splits('2023-24', refresh=False, cache_dir=cache_dir)
+    assert lineups['games'].max() == 3
+
+def test_recompute_when_results_arrive(tmp_path):
+    """Test a game cached without line scores is recomputed once they exist."""
+    raw_dir, cache_dir, line_dir = tmp_path / "raw", tmp_path / "splits", tmp_path / "lines"
+    (raw_dir / "2023-10").mkdir(parents=True)
+    (line_dir / "2023-10").mkdir(parents=True)
+    home, away = game()
+    home.to_csv(raw_dir / "2023-10" / "0022300001_home.csv", index=False)
+    away.to_csv(raw_dir / "2023-10" / "0022300001_away.csv", index=False)
+
+    kwargs = dict(raw_dir=raw_dir, cache_dir=cache_dir, line_dir=line_dir)
+    assert splits.update('2023-24', **kwargs) == 1
+    assert splits.games_without_results('2023-24', cache_dir) == {'0022300001'}
+    assert splits.update('2023-24', **kwargs) == 0
+
+    pd.DataFrame({'game_id': ['0022300001'] * 2, 'team_id': [1, 2], 'points': [100, 88]}) \
+        .to_csv(line_dir / "2023-10" / "line_0022300001.csv", index=False)
+    assert splits.update('2023-24', **kwargs) == 1
+    assert splits.games_without_results('2023-24', cache_dir) == set()
+
+    players = splits.load_table('2023-24', 'players', **kwargs).set_index('player_id')
+    assert len(players) == 11
+    assert players.loc[5, 'off_diff'] == pytest.approx(6)
@@ -0,0 +1,104 @@
+"""Test the rotation stint engine."""
+
+import numpy as np
+import pandas as pd
+
+from ..gamerotation.stints import (
+    StintIndex, elapsed_seconds, load_home_teams, season_lineups, season_on_off, season_stints,
+)
+
+def rotation(team_id, stints):
+    """Raw GameRotation rows from (player_id, in_seconds, out_seconds)."""
+    return pd.DataFrame({
+        'GAME_ID': '0022300001',
+        'TEAM_ID': team_id,
+        'PERSON_ID': [p for p, _, _ in stints],
+        'PLAYER_FIRST': 'Player',
+        'PLAYER_LAST': [str(p) for p, _, _ in stints],
+        'IN_TIME_REAL': [start * 10 for _, start, _ in stints],
+        'OUT_TIME_REAL': [end * 10 for _, _, end in stints],
+    })
+
+# Home: player 5 subs for player 4 at 600s. Away: same five all game.
+# The zero-length row mirrors NBA.com's period-boundary rows.
+HOME = rotation(1, [(1, 0, 2880), (2, 0, 2880), (3, 0, 2880), (4, 0, 600),
+                    (5, 600, 2880), (6, 0, 2880), (6, 1440, 1440)])
+AWAY = rotation(2, [(p, 0, 2880) for p in range(11, 16)])
+
+def test_on_court_and_overlap():
+    """Test point queries honour half-open intervals."""
+    game = StintIndex.from_rotation(HOME, AWAY)
+    assert game.game_seconds == 2880
+    on = game.on_court([599.9, 600])
+    assert 4 in on.loc[on['time'] == 599.9, 'player_id'].tolist()
+    assert 5 in on.loc[on['time'] == 600, 'player_id'].tolist()
+    assert on.groupby('time').size().tolist() == [10, 10]
+
+    window = game.overlap(500, 700).set_index('player_id')['seconds']
+    assert window[4] == 100 and window[5] == 100 and window[11] == 200
+
+def test_lineups_and_on_off():
+    """Test lineup segmentation and on/off seconds."""
+    game = StintIndex.from_rotation(HOME, AWAY)
+    lineups = game.lineups()
+    assert lineups['start'].tolist() == [0, 600]
+    assert lineups['home_lineup'].tolist() == [(1, 2, 3, 4, 6), (1, 2, 3, 5, 6)]
+    assert lineups['seconds'].sum() == 2880
+    assert lineups['complete'].all()
+
+    on_off = game.on_off().set_index('player_id')
+    assert on_off.loc[4, 'on_seconds'] == 600
+    assert on_off.loc[4, 'off_seconds'] == 2280
+
+def test_season_batch(tmp_path):
+    """Test season functions read raw files named with and without the 00 prefix."""
+    month = tmp_path / "2023-10"
+    month.mkdir()
+    HOME.to_csv(month / "0022300001_home.csv", index=False)
+    AWAY.to_csv(month / "0022300001_away.csv", index=False)
+    HOME.assign(GAME_ID='0022300002').to_csv(month / "22300002_home.csv", index=False)
+    AWAY.assign(GAME_ID='0022300002').to_csv(month / "22300002_away.csv", index=False)
+    # Stray files in the raw folders are skipped
+    HOME.to_csv(month / "backup_home.csv", index=False)
+    AWAY.to_csv(month / "backup_away.csv", index=False)
+
+    lineups = season_lineups('2023-24', raw_dir=tmp_path)
+    assert lineups['game_id'].unique().tolist() == ['0022300001', '0022300002']
+    assert season_lineups('2022-23', raw_dir=tmp_path).empty
+
+    on_off = season_on_off(raw_dir=tmp_path).set_index('player_id')
+    assert on_off.loc[4, 'games'] == 2
+    assert on_off.loc[4, 'on_seconds'] == 1200
+
+def test_home_flags_from_index(tmp_path):
+    """Test legacy swapped files take the home team from the game-id index."""
+    raw, index = tmp_path / "raw", tmp_path / "game_ids"
+    (raw / "2023-10").mkdir(parents=True)
+    index.mkdir()
+    AWAY.to_csv(raw / "2023-10" / "0022300001_home.csv", index=False)
+    HOME.to_csv(raw / "2023-10" / "0022300001_away.csv", index=False)
+    pd.DataFrame({'game_id': ['0022300001', '0022300002'], 'matchup': ['IND vs. CLE', 'LAL @ DEN'],
+                  'team_id': [1, 1610612747]}).to_csv(index / "games_2023_24.csv", index=False)
+
+    home_teams = load_home_teams(index)
+    assert home_teams == {'0022300001': 1, '0022300002': 1610612743}
+    stints = season_stints(raw_dir=raw, home_teams=home_teams)
+    assert stints.groupby('team_id')['is_home'].all().to_dict() == {1: True, 2: False}
+
+    # Games whose index entry matches neither team keep the file's sides
+    stints = season_stints(raw_dir=raw, home_teams={'0022300001': 99})
+    assert stints.groupby('team_id')['is_home'].all().to_dict() == {1: False, 2: True}
+
+def test_processed_home_flags():
+    """Test processing cached legacy files corrects the swapped sides."""
+    from ..gamerotation.collector import process_rotation_stats
+
+    df = process_rotation_stats({'home': AWAY, 'away': HOME}, home_teams={'0022300001': 1})
+    assert df.groupby('team_id')['is_home'].all().to_dict() == {1: True, 2: False}
+    df = process_rotation_stats({'home': HOME, 'away': AWAY}, home_teams={})
+    assert df.groupby('team_id')['is_home'].all().to_dict() == {1: True, 2: False}
+
+def test_elapsed_seconds():
+    """Test period/clock conversion including overtime."""
+    np.testing.assert_array_equal(elapsed_seconds([1, 2, 4, 5, 6], [720, 0, 0, 300, 0]),
+                                  [0, 1440, 2880, 2880, 3480])
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+
+"""Intraday polling service for BettingPros props and SaberSim projections.
+
+Each source runs on its own schedule. The interval tightens as the next
+tip-off approaches (event ``scheduled`` times) and relaxes once every game
+has started. BettingPros fetches are conditional (ETag / Last-Modified,
+then a payload hash); SaberSim's POST endpoint sends no validators, so its
+payload is always downloaded and compared by hash. Either way an unchanged
+payload is neither written nor reprocessed, and BettingPros lines are
+recorded through ``bettingpros.movement`` so only changed props are stored.
+
+Poll health is written to ``bluefin_data/nba/poller/status.json``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import requests
+
+from bluefin_code.core.logs import configure
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+
+logger = logging.getLogger(__name__)
+
+# (seconds before next tip-off, poll interval in seconds), tightest first
+SCHEDULE = [
+    (30 * 60, 60),
+    (2 * 60 * 60, 180),
+    (6 * 60 * 60, 600),
+]
+IDLE_INTERVAL = 30 * 60    # Far from tip-off or no events known
+DONE_INTERVAL = 60 * 60    # Every game on the slate has started
+
+@dataclass
+class SourceState:
+    """Conditional-fetch and health state for one polled source."""
+    name: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    payload_hash: Optional[str] = None
+    last_poll: Optional[str] = None
+    last_change: Optional[str] = None
+    next_poll: Optional[str] = None
+    polls: int = 0
+    changes: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+
+    def record_error(self, error: Exception) -> None:
+        """Count a failed poll and keep its message."""
+        self.errors += 1
+        self.last_error = f"{utcnow().isoformat(timespec='seconds')} {error}"
+
+    def status(self, now: datetime) -> Dict[str, Any]:
+        """Status entry including seconds since the last successful poll."""
+        entry = {k: v for k, v in asdict(self).items() if k not in ('etag', 'last_modified')}
+        entry['lag_seconds'] = (
+            round((now - datetime.fromisoformat(self.last_poll)).total_seconds())
+            if self.last_poll else None
+        )
+        return entry
+
+@dataclass
+class PollerState:
+    """State shared by all source loops.
+
+    Polls run in worker threads, so ``sources`` is only changed and read
+    under ``lock``; use ``snapshot()`` to iterate it.
+    """
+    date: str
+    sources: Dict[str, SourceState] = field(default_factory=dict)
+    tipoffs: List[datetime] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def source(self, name: str) -> SourceState:
+        with self.lock:
+            if name not in self.sources:
+                self.sources[name] = SourceState(name)
+            return self.sources[name]
+
+    def snapshot(self) -> List[SourceState]:
+        """Sources sorted by name, copied under the lock."""
+        with self.lock:
+            return [src for _, src in sorted(self.sources.items())]
+
+def utcnow() -> datetime:
+    """Current UTC time."""
+    return datetime.now(timezone.utc)
+
+def get_status_path() -> Path:
+    """Get poller status file."""
+    return DATA_ROOT / "nba" / "poller" / "status.json"
+
+def write_status(state: PollerState) -> None:
+    """Write per-source poll status atomically."""
+    now = utcnow()
+    status = {
+        'date': state.date,
+        'updated': now.isoformat(timespec='seconds'),
+        'next_tipoff': next((t.isoformat() for t in sorted(state.tipoffs) if t > now), None),
+        'sources': {src.name: src.status(now) for src in state.snapshot()},
+    }
+    status_file = get_status_path()
+    status_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = status_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(status, f, indent=2)
+    tmp_file.replace(status_file)
+
+def parse_tipoffs(events: List[Dict[str, Any]]) -> List[datetime]:
+    """Extract tip-off times (UTC) from BettingPros events."""
+    times = pd.to_datetime([e.get('scheduled') for e in events], errors='coerce', utc=True)
+    return sorted(t.to_pydatetime() for t in times if not pd.isna(t))
+
+def poll_interval(tipoffs: List[datetime], now: datetime) -> int:
+    """Seconds until the next poll given the slate's tip-off times."""
+    if not tipoffs:
+        return IDLE_INTERVAL
+    upcoming = [t for t in tipoffs if t > now]
+    if not upcoming:
+        return DONE_INTERVAL
+    until_tip = (min(upcoming) - now).total_seconds()
+    for window, interval in SCHEDULE:
+        if until_tip <= window:
+            return interval
+    return IDLE_INTERVAL
+
+def payload_hash(content: bytes) -> str:
+    """Hash a response body."""
+    return hashlib.md5(content).hexdigest()
+
+def conditional_get(session: requests.Session, url: str, state: SourceState,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    timeout: int = 30) -> Optional[Dict[str, Any]]:
+    """GET url, returning parsed JSON only when the payload changed.
+
+    Sends ``If-None-Match``/``If-Modified-Since`` from the previous response
+    and falls back to comparing a body hash for servers that ignore them.
+    """
+    request_headers = dict(headers or {})
+    if state.etag:
+        request_headers['If-None-Match'] = state.etag
+    if state.last_modified:
+        request_headers['If-Modified-Since'] = state.last_modified
+
+    response = session.get(url, params=params, headers=request_headers, timeout=timeout)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    state.etag = response.headers.get('ETag', state.etag)
+    state.last_modified = response.headers.get('Last-Modified', state.last_modified)
+    digest = payload_hash(response.content)
+    if digest == state.payload_hash:
+        return None
+    state.payload_hash = digest
+    return response.json()
+
+def poll_bettingpros(state: PollerState, session: requests.Session) -> int:
+    """Poll events and every book; record line movement when any book changed.
+
+    A failed request is recorded on its own source's state and the other
+    books are still polled.
+    """
+    from bluefin_code.nba.bettingpros import fetch, process
+    from bluefin_code.nba.bettingpros.movement import record_snapshot
+    from bluefin_code.nba import rawstore
+    from bluefin_code.nba.utils import BOOKS_CONFIG, MARKETS_CONFIG
+
+    config = fetch.create_default_config()
+    raw_dir = fetch.get_data_dir(state.date)
+
+    events_src = state.source('bettingpros:events')
+    try:
+        events = conditional_get(session, config.base_url, events_src, headers=config.headers, params={
+            'sport': 'NBA', 'date': state.date, 'include_events': 'true',
+            'include_markets': 'false', 'limit': '1',
+        })
+    except Exception as e:
+        events_src.record_error(e)
+        logger.error(f"bettingpros:events poll failed: {e}")
+    else:
+        events_src.polls += 1
+        events_src.last_poll = utcnow().isoformat(timespec='seconds')
+        if events is not None:
+            events_data = {'events': events.get('events', [])}
+            rawstore.save_json(raw_dir / f"{state.date}_events.json", events_data)
+            state.tipoffs = parse_tipoffs(events_data['events'])
+            events_src.changes += 1
+            events_src.last_change = events_src.last_poll
+
+    market_ids = ','.join(m['market_id'] for m in MARKETS_CONFIG['markets'].values())
+    changed_books = 0
+    for book in config.sportsbooks:
+        src = state.source(f"bettingpros:{book.abbreviation}")
+        try:
+            data = conditional_get(session, config.base_url, src, headers=config.headers, params={
+                'sport': 'NBA', 'date': state.date,
+                'book_id': BOOKS_CONFIG['sportsbooks'][book.abbreviation]['book_id'],
+                'market_id': market_ids, 'include_markets': 'true',
+                'include_events': 'true', 'limit': '9999',
+            })
+        except Exception as e:
+            src.record_error(e)
+            logger.error(f"{src.name} poll failed: {e}")
+            continue
+        src.polls += 1
+        src.last_poll = utcnow().isoformat(timespec='seconds')
+        if data is None:
+            continue
+        rawstore.save_json(raw_dir / f"{state.date}_{book.abbreviation}.json", data)
+        src.changes += 1
+        src.last_change = src.last_poll
+        changed_books += 1
+
+    if changed_books:
+        games = process.load_events(state.date)
+        records = [r for book in config.sportsbooks
+                   for r in process.process_book_data(state.date, book.abbreviation, games)]
+        if records:
+            changes = record_snapshot(state.date, pd.DataFrame(records))
+            logger.info(f"BettingPros: {changed_books} books changed, {len(changes)} line changes")
+    return changed_books
+
+def poll_sabersim(state: PollerState) -> int:
+    """Poll SaberSim projections and reprocess when the payload hash changed.
+
+    The endpoint is a POST without ETag / Last-Modified, so every poll
+    downloads the full payload; only saving and processing are skipped.
+    """
+    from bluefin_code.nba.ssim import fetch as ssim_fetch
+    from bluefin_code.nba.ssim.process import process_date
+
+    src = state.source('sabersim')
+    data = ssim_fetch.fetch_projections(state.date)
+    src.polls += 1
+    src.last_poll = utcnow().isoformat(timespec='seconds')
+
+    digest = ssim_fetch.get_data_hash(data)
+    if digest == src.payload_hash:
+        return 0
+    src.payload_hash = digest
+    ssim_fetch.save_raw_data(data, state.date)
+    process_date(state.date)
+    src.changes += 1
+    src.last_change = src.last_poll
+    logger.info(f"SaberSim: {len(data.get('players', []))} projections updated")
+    return 1
+
+async def run_source(name: str, poll, state: PollerState, once: bool = False) -> None:
+    """Run one source's poll loop on its own schedule."""
+    while True:
+        try:
+            await asyncio.to_thread(poll)
+        except Exception as e:
+            state.source(name).record_error(e)
+            logger.error(f"{name} poll failed: {e}")
+
+        interval = poll_interval(state.tipoffs, utcnow())
+        next_poll = utcnow().timestamp() + interval
+        for src in state.snapshot():
+            if src.name.split(':')[0] == name:
+                src.next_poll = datetime.fromtimestamp(next_poll, timezone.utc).isoformat(timespec='seconds')
+        write_status(state)
+        if once:
+            return
+        await asyncio.sleep(interval)
+
+async def run(date: str, sources: List[str], once: bool = False) -> PollerState:
+    """Poll the given sources until cancelled (or once)."""
+    state = PollerState(date=date)
+    session = requests.Session()
+    loops = {
+        'bettingpros': lambda: poll_bettingpros(state, session),
+        'sabersim': lambda: poll_sabersim(state),
+    }
+    await asyncio.gather(*(run_source(name, loops[name], state, once) for name in sources))
+    return state
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Poll props and projections through the day')
+    parser.add_argument('--date', default=datetime.now().strftime('%Y-%m-%d'), help='Slate date (YYYY-MM-DD)')
+    parser.add_argument('--sources', nargs='+', default=['bettingpros', 'sabersim'],
+                        choices=['bettingpros', 'sabersim'], help='Sources to poll')
+    parser.add_argument('--once', action='store_true', help='Run a single poll cycle and exit')
+    args = parser.parse_args()
+
+    configure()
+    try:
+        asyncio.run(run(args.date, args.sources, args.once))
+    except KeyboardInterrupt:
+        logger.info("Poller stopped")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
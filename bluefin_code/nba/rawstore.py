@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+"""Content-addressed, compressed store for raw API payloads.
+
+Each distinct raw payload is stored once, compressed, under its SHA-256::
+
+    bluefin_data/nba/rawstore/objects/ab/ab12...ef.json.zst
+
+A thin append-only index maps every raw file's place in the data layout
+(which carries source, date and book, e.g.
+``bettingpros/raw/2024-12/2024-12-06_dk.json``) to its blob, one JSONL
+file per month::
+
+    bluefin_data/nba/rawstore/index/2024-12.jsonl
+
+The last line for a path wins. A re-poll or ``--force`` run that returns
+the same payload adds an index line but no blob.
+
+Writers call ``save_json(path, data)`` with the path they used to write
+to. Readers call ``load_json(path)``, which reads the store and falls back
+to a plain JSON file at path, so ``load_book_data``, ``load_raw_data``
+and friends keep their behavior whether or not a file was migrated. Paths
+outside a ``bluefin_data/nba`` tree are plain files.
+
+Blobs are zstd compressed when ``zstandard`` is installed and gzip
+otherwise; both are always readable. Top-level keys in ``VOLATILE`` (the
+SaberSim fetch ``metadata`` with its timestamp) are kept in the index
+line instead of the blob, so they do not defeat dedupe::
+
+    python -m bluefin_code.nba.rawstore migrate    # move raw JSON files into the store
+    python -m bluefin_code.nba.rawstore stats
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from bluefin_code.core.logs import configure
+
+try:
+    import zstandard
+except ImportError:  # gzip blobs until zstandard is installed
+    zstandard = None
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_DATA_DIR = DATA_ROOT / "nba"
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = "rawstore"
+ZSTD_LEVEL = 9
+GZIP_LEVEL = 6
+
+# Raw directories (relative to bluefin_data/nba) kept in the store
+RAW_DIRS = ['bettingpros/raw', 'ssim/raw']
+
+# Top-level keys stored in the index line instead of the blob, per raw directory
+VOLATILE = {'ssim/raw': 'metadata'}
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+PathLike = Union[str, Path]
+
+_lock = threading.Lock()
+_indexes: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+
+def _codecs() -> Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    codecs = {'gz': (lambda b: gzip.compress(b, GZIP_LEVEL, mtime=0), gzip.decompress)}
+    if zstandard is not None:
+        codecs['zst'] = (zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress,
+                         lambda b: zstandard.ZstdDecompressor().decompress(b))
+    return codecs
+
+def default_codec() -> str:
+    return 'zst' if zstandard is not None else 'gz'
+
+def locate(path: PathLike) -> Optional[Tuple[Path, str]]:
+    """Store root and logical path for a raw file, or None outside the store.
+
+    ``.../bluefin_data/nba/bettingpros/raw/2024-12/2024-12-06_dk.json`` gives
+    (``.../bluefin_data/nba/rawstore``, ``bettingpros/raw/2024-12/2024-12-06_dk.json``).
+    """
+    parts = Path(path).parts
+    for i in range(len(parts) - 2, -1, -1):
+        if parts[i:i + 2] == ('bluefin_data', 'nba'):
+            logical = '/'.join(parts[i + 2:])
+            if any(logical.startswith(d + '/') for d in RAW_DIRS):
+                return Path(*parts[:i + 2]) / STORE_DIRNAME, logical
+            return None
+    return None
+
+def blob_path(root: Path, digest: str, codec: str) -> Path:
+    return root / "objects" / digest[:2] / f"{digest}.json.{codec}"
+
+def index_path(root: Path, logical: str) -> Path:
+    date = DATE_RE.search(logical.rsplit('/', 1)[-1])
+    return root / "index" / f"{date.group(0)[:7] if date else 'undated'}.jsonl"
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+def put_blob(root: Path, body: bytes) -> Tuple[str, str, int, bool]:
+    """Store body once; returns (hash, codec, stored bytes, newly written)."""
+    digest = hashlib.sha256(body).hexdigest()
+    for codec in _codecs():
+        existing = blob_path(root, digest, codec)
+        if existing.exists():
+            return digest, codec, existing.stat().st_size, False
+    codec = default_codec()
+    compressed = _codecs()[codec][0](body)
+    _write_atomic(blob_path(root, digest, codec), compressed)
+    return digest, codec, len(compressed), True
+
+def read_blob(root: Path, digest: str, codec: str) -> bytes:
+    return _codecs()[codec][1](blob_path(root, digest, codec).read_bytes())
+
+def _load_index(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Latest entry per logical path, cached until the index file changes."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+    version = (stat.st_size, stat.st_mtime_ns)
+    cached = _indexes.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+    entries = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:  # line cut off by a crash
+                continue
+            entries[entry['path']] = entry
+    _indexes[path] = (version, entries)
+    return entries
+
+def lookup(path: PathLike) -> Optional[Dict[str, Any]]:
+    """Index entry for a raw file, or None when it is not in the store."""
+    located = locate(path)
+    if located is None:
+        return None
+    root, logical = located
+    return _load_index(index_path(root, logical)).get(logical)
+
+def exists(path: PathLike) -> bool:
+    """Whether a raw file is in the store or on disk."""
+    return lookup(path) is not None or Path(path).exists()
+
+def save_json(path: PathLike, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a raw payload under path's logical name; returns its index entry.
+
+    A plain file at path is removed once the payload is stored. Paths
+    outside a ``bluefin_data/nba`` raw directory are written as plain JSON.
+    """
+    path = Path(path)
+    located = locate(path)
+    if located is None:
+        body = json.dumps(data).encode()
+        _write_atomic(path, body)
+        return {'path': str(path), 'bytes': len(body), 'stored': len(body), 'new': True}
+
+    root, logical = located
+    volatile = next((key for d, key in VOLATILE.items() if logical.startswith(d + '/')), None)
+    payload, meta = data, None
+    if volatile and volatile in data:
+        payload = {k: v for k, v in data.items() if k != volatile}
+        meta = {volatile: data[volatile]}
+    body = json.dumps(payload, separators=(',', ':')).encode()
+    digest, codec, stored, new = put_blob(root, body)
+    entry = {'path': logical, 'hash': digest, 'codec': codec, 'bytes': len(body), 'stored': stored,
+             'meta': meta, 'saved_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+    index = index_path(root, logical)
+    index.parent.mkdir(parents=True, exist_ok=True)
+    with _lock, open(index, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+    if path.exists():
+        path.unlink()
+    logger.debug(f"Stored {logical} as {digest[:12]} ({'new' if new else 'dedupe'}, {stored} bytes)")
+    return {**entry, 'new': new}
+
+def load_json(path: PathLike) -> Dict[str, Any]:
+    """Read a raw payload from the store, or from a plain JSON file at path."""
+    located = locate(path)
+    entry = lookup(path) if located else None
+    if entry is None:
+        with open(path) as f:
+            return json.load(f)
+    data = json.loads(read_blob(located[0], entry['hash'], entry['codec']))
+    data.update(entry.get('meta') or {})
+    return data
+
+def entries(nba_dir: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """Latest index entry for every stored raw file, keyed by logical path."""
+    root = (Path(nba_dir) if nba_dir else NBA_DATA_DIR) / STORE_DIRNAME
+    out = {}
+    for path in sorted((root / "index").glob("*.jsonl")):
+        out.update(_load_index(path))
+    return out
+
+def glob(directory: PathLike, pattern: str) -> List[Path]:
+    """Raw files in directory matching pattern, stored or on disk."""
+    directory = Path(directory)
+    found = set(directory.glob(pattern))
+    located = locate(directory / '_')
+    if located:
+        root, logical = located
+        prefix = logical[:-1]
+        depth = len(Path(pattern).parts)
+        for name in entries(root.parent):
+            relative = Path(name[len(prefix):])
+            if name.startswith(prefix) and len(relative.parts) == depth and relative.match(pattern):
+                found.add(directory / relative)
+    return sorted(found)
+
+def migrate(nba_dir: Optional[Path] = None, keep: bool = False) -> Dict[str, int]:
+    """Move plain raw JSON files into the store (keep leaves the files in place)."""
+    nba_dir = Path(nba_dir) if nba_dir else NBA_DATA_DIR
+    counts = {'files': 0, 'new': 0, 'bytes': 0, 'stored': 0}
+    for raw_dir in RAW_DIRS:
+        for path in sorted((nba_dir / raw_dir).glob("*/*.json")):
+            with open(path) as f:
+                data = json.load(f)
+            if keep:
+                tmp = path.with_name(path.name + '.keep')
+                path.rename(tmp)
+                entry = save_json(path, data)
+                tmp.rename(path)
+            else:
+                entry = save_json(path, data)
+            counts['files'] += 1
+            counts['new'] += entry['new']
+            counts['bytes'] += entry['bytes']
+            counts['stored'] += entry['stored'] if entry['new'] else 0
+    return counts
+
+def stats(nba_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Logical vs stored size of the store."""
+    root = (Path(nba_dir) if nba_dir else NBA_DATA_DIR) / STORE_DIRNAME
+    current = entries(nba_dir)
+    blobs = list((root / "objects").glob("*/*.json.*"))
+    return {
+        'files': len(current),
+        'blobs': len(blobs),
+        'logical_mb': round(sum(e['bytes'] for e in current.values()) / 1e6, 3),
+        'stored_mb': round(sum(p.stat().st_size for p in blobs) / 1e6, 3),
+        'codec': default_codec(),
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Content-addressed raw payload store")
+    parser.add_argument('command', choices=['migrate', 'stats'])
+    parser.add_argument('--data-dir', type=Path, help='bluefin_data/nba directory (default: project data)')
+    parser.add_argument('--keep', action='store_true', help='migrate: leave the plain files in place')
+    args = parser.parse_args()
+    configure()
+
+    if args.command == 'migrate':
+        counts = migrate(args.data_dir, args.keep)
+        logger.info(f"Migrated {counts['files']} files into {counts['new']} new blobs: "
+                    f"{counts['bytes'] / 1e6:.1f} MB -> {counts['stored'] / 1e6:.1f} MB")
+    for key, value in stats(args.data_dir).items():
+        print(f"{key:<12} {value}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
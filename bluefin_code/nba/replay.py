@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+
+"""Offline replay server for BettingPros, SaberSim and NBA.com.
+
+Serves recorded responses from ``bluefin_data/nba`` so fetchers, backfills
+and the poller can be load-tested and tested without the live APIs:
+
+- ``GET  /bettingpros/v3/props``: ``bettingpros/raw/YYYY-MM/{date}_{book}.json``
+  (``{date}_events.json`` for the events-only request)
+- ``POST /sabersim/endpoints/get_player_projections``: ``ssim/raw/YYYY-MM/NBA_{date}_raw.json``
+- ``GET  /nba/stats/{endpoint}``: the archived nba_api response
+  (``nba_com/{endpoint}/archive``), else one rebuilt from the raw CSVs
+- ``GET  /_replay/stats``: request counters
+
+Latency, server errors, injected 429s and a per-source rate limit are
+configurable and seeded, so runs are repeatable. Point the fetchers at the
+server with the ``bluefin_code.nba.urls`` overrides::
+
+    python -m bluefin_code.nba.replay --port 8765 --latency 0.05 --rate-limit 10
+    eval "$(python -m bluefin_code.nba.replay --port 8765 --print-env)"
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba import rawstore
+from bluefin_code.nba.nba_com.ids import GameId, find_game_file
+from bluefin_code.nba.urls import BPRO_URL_ENV, NBA_URL_ENV, SSIM_URL_ENV
+from bluefin_code.nba.utils import books_config
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_DATA_DIR = DATA_ROOT / "nba"
+
+logger = logging.getLogger(__name__)
+
+BPRO_PATH = '/bettingpros/v3/props'
+SSIM_PATH = '/sabersim/endpoints/get_player_projections'
+NBA_PATH = '/nba/stats/'
+STATS_PATH = '/_replay/stats'
+
+# Result sets rebuilt from raw CSVs when a game has no archived response
+RAW_RESULT_SETS = {
+    'boxscoreadvancedv2': {'PlayerStats': '{game_id}.csv'},
+    'boxscorefourfactorsv2': {'sqlPlayersFourFactors': '{game_id}.csv'},
+    'boxscorescoringv2': {'sqlPlayersScoring': '{game_id}.csv'},
+    'boxscoreusagev2': {'sqlPlayersUsage': '{game_id}.csv'},
+    'boxscoresummaryv2': {'GameSummary': '{game_id}_summary.csv', 'LineScore': '{game_id}_line.csv'},
+    'gamerotation': {'HomeTeam': '{game_id}_home.csv', 'AwayTeam': '{game_id}_away.csv'},
+}
+
+@dataclass
+class ReplayConfig:
+    """Fault and timing settings for the replay server.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Extra random latency, uniform in [0, jitter]
+        error_rate: Probability of a 503 response
+        throttle_rate: Probability of an injected 429 response
+        rate_limit: Requests per second allowed per source (0 = unlimited);
+            requests over the limit get a 429 with ``Retry-After``
+        burst: Requests a source may make at once before the limit applies
+        seed: Seed for latency, error and throttle draws
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit: float = 0.0
+    burst: int = 1
+    seed: int = 0
+
+class TokenBucket:
+    """Rate limiter: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; returns 0 on success, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+def replay_env(url: str) -> Dict[str, str]:
+    """Environment overrides pointing the fetchers at a replay server at url."""
+    url = url.rstrip('/')
+    return {BPRO_URL_ENV: url + BPRO_PATH, SSIM_URL_ENV: url + SSIM_PATH,
+            NBA_URL_ENV: url + NBA_PATH.rstrip('/')}
+
+def _month_dirs(base: Path) -> Iterator[Path]:
+    return (d for d in sorted(base.iterdir(), reverse=True) if d.is_dir()) if base.exists() else iter(())
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    if not rawstore.exists(path):
+        return None
+    return rawstore.load_json(path)
+
+def _result_set(name: str, df: pd.DataFrame) -> Dict[str, Any]:
+    rows = df.astype(object).where(df.notna(), None).values.tolist()
+    return {'name': name, 'headers': list(df.columns), 'rowSet': rows}
+
+def _rebuilt_response(endpoint: str, params: Dict[str, str], frames: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+    """Response from raw CSV frames; result sets not kept are sent empty.
+
+    nba_api endpoint classes read every result set they expect, so the
+    missing ones must be present.
+    """
+    module = importlib.import_module(f"nba_api.stats.endpoints.{endpoint}")
+    expected = next((getattr(module, name).expected_data for name in dir(module)
+                     if name.lower() == endpoint and hasattr(getattr(module, name), 'expected_data')), {})
+    result_sets = [_result_set(name, frames[name]) if name in frames
+                   else {'name': name, 'headers': headers, 'rowSet': []}
+                   for name, headers in expected.items()]
+    result_sets += [_result_set(name, df) for name, df in frames.items() if name not in expected]
+    return {'resource': endpoint, 'parameters': params, 'resultSets': result_sets}
+
+class Recordings:
+    """Recorded responses under a data root (default ``bluefin_data/nba``)."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else NBA_DATA_DIR
+        self.book_ids = {str(book['book_id']): abbrev for abbrev, book in books_config()['sportsbooks'].items()}
+        self._home_teams: Optional[Dict[str, int]] = None
+
+    def home_teams(self) -> Dict[str, int]:
+        if self._home_teams is None:
+            from bluefin_code.nba.nba_com.gamerotation.stints import load_home_teams
+
+            self._home_teams = load_home_teams(self.root / "nba_com" / "game_ids")
+        return self._home_teams
+
+    def _combined_rotation(self, month: Path, game_id: GameId) -> Optional[Dict[str, pd.DataFrame]]:
+        """Split a legacy one-file rotation into HomeTeam/AwayTeam by the indexed home team."""
+        path = find_game_file(month, game_id)
+        home = self.home_teams().get(game_id)
+        if path is None or home is None:
+            return None
+        df = pd.read_csv(path, dtype={'GAME_ID': str})
+        is_home = df['TEAM_ID'] == home
+        return {'HomeTeam': df[is_home], 'AwayTeam': df[~is_home]}
+
+    def bettingpros(self, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        date = params.get('date', '')
+        raw_dir = self.root / "bettingpros" / "raw" / date[:7]
+        if 'book_id' not in params:
+            return _read_json(raw_dir / f"{date}_events.json")
+        book = self.book_ids.get(params['book_id'])
+        return _read_json(raw_dir / f"{date}_{book}.json") if book else None
+
+    def sabersim(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        date = str(body.get('date', ''))
+        if len(date) == 8 and date.isdigit():
+            date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+        return _read_json(self.root / "ssim" / "raw" / date[:7] / f"NBA_{date}_raw.json")
+
+    def nba(self, endpoint: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        base = self.root / "nba_com" / endpoint
+        if endpoint == 'playergamelog':
+            season = params.get('Season', '')
+            path = base / "raw" / season / f"{params.get('PlayerID')}_{season}.csv"
+            if not path.exists():
+                return None
+            return _rebuilt_response(endpoint, params, {'PlayerGameLog': pd.read_csv(path, dtype={'Game_ID': str})})
+
+        try:
+            game_id = GameId(params.get('GameID', ''))
+        except ValueError:
+            return None
+        archived = next((base / "archive").glob(f"*/{game_id}.json.gz"), None)
+        if archived:
+            with gzip.open(archived, 'rt') as f:
+                return json.load(f)['response']
+
+        for month in _month_dirs(base / "raw"):
+            paths = {name: find_game_file(month, game_id, pattern)
+                     for name, pattern in RAW_RESULT_SETS.get(endpoint, {}).items()}
+            if paths and all(paths.values()):
+                return _rebuilt_response(endpoint, params, {
+                    name: pd.read_csv(path, dtype={'GAME_ID': str}) for name, path in paths.items()
+                })
+            if endpoint == 'gamerotation':
+                frames = self._combined_rotation(month, game_id)
+                if frames:
+                    return _rebuilt_response(endpoint, params, frames)
+        return None
+
+class ReplayServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the recordings, fault settings and counters."""
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: ReplayConfig, recordings: Recordings):
+        super().__init__(address, ReplayHandler)
+        self.config = config
+        self.recordings = recordings
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.counts: Counter = Counter()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        """Environment overrides pointing the fetchers at this server."""
+        return replay_env(self.url)
+
+    def draw(self, source: str) -> Tuple[float, Optional[int], float]:
+        """Delay, injected status (or None) and Retry-After seconds for a request."""
+        config = self.config
+        with self.lock:
+            self.counts[f"{source}.requests"] += 1
+            delay = config.latency + (self.random.uniform(0, config.jitter) if config.jitter else 0.0)
+            if config.rate_limit > 0:
+                bucket = self.buckets.setdefault(source, TokenBucket(config.rate_limit, config.burst))
+                wait = bucket.take()
+                if wait:
+                    self.counts[f"{source}.rate_limited"] += 1
+                    return delay, 429, wait
+            roll = self.random.random()
+            if roll < config.error_rate:
+                self.counts[f"{source}.errors"] += 1
+                return delay, 503, 0.0
+            if roll < config.error_rate + config.throttle_rate:
+                self.counts[f"{source}.throttled"] += 1
+                return delay, 429, 1.0
+        return delay, None, 0.0
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Routes requests to the recordings."""
+    server: ReplayServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path == STATS_PATH:
+            self._send(200, dict(self.server.counts))
+        elif url.path == BPRO_PATH:
+            self._replay('bettingpros', lambda: self.server.recordings.bettingpros(params))
+        elif url.path.startswith(NBA_PATH):
+            endpoint = url.path[len(NBA_PATH):].strip('/').lower()
+            self._replay('nba', lambda: self.server.recordings.nba(endpoint, params))
+        else:
+            self._send(404, {'error': f"Unknown path {url.path}"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send(400, {'error': 'Invalid JSON body'})
+            return
+        if urlsplit(self.path).path == SSIM_PATH:
+            self._replay('sabersim', lambda: self.server.recordings.sabersim(body))
+        else:
+            self._send(404, {'error': f"Unknown path {self.path}"})
+
+    def _replay(self, source: str, load) -> None:
+        delay, status, retry_after = self.server.draw(source)
+        if delay:
+            time.sleep(delay)
+        if status:
+            headers = {'Retry-After': str(max(math.ceil(retry_after), 1))} if status == 429 else {}
+            self._send(status, {'error': 'Too Many Requests' if status == 429 else 'Service Unavailable'}, headers)
+            return
+        data = load()
+        if data is None:
+            with self.server.lock:
+                self.server.counts[f"{source}.missing"] += 1
+            self._send(404, {'error': 'No recorded response'})
+            return
+        self._send(200, data, conditional=True)
+
+    def _send(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None,
+              conditional: bool = False) -> None:
+        body = json.dumps(data, separators=(',', ':')).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if conditional and self.headers.get('If-None-Match') == etag:
+            status, body = 304, b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if conditional:
+            self.send_header('ETag', etag)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+def create_server(host: str = '127.0.0.1', port: int = 0, config: Optional[ReplayConfig] = None,
+                  root: Optional[Path] = None) -> ReplayServer:
+    """Bind a replay server (port 0 picks a free port)."""
+    return ReplayServer((host, port), config or ReplayConfig(), Recordings(root))
+
+@contextmanager
+def serve(config: Optional[ReplayConfig] = None, root: Optional[Path] = None,
+          host: str = '127.0.0.1', port: int = 0) -> Iterator[ReplayServer]:
+    """Run a replay server in a background thread for the duration of the block."""
+    server = create_server(host, port, config, root)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Serve recorded BettingPros, SaberSim and NBA.com responses')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind')
+    parser.add_argument('--root', type=Path, help='Data directory (default bluefin_data/nba)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a 503')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Probability of an injected 429')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests per second per source (0 = off)')
+    parser.add_argument('--burst', type=int, default=1, help='Requests allowed at once under --rate-limit')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for latency and fault draws')
+    parser.add_argument('--print-env', action='store_true', help='Print the URL overrides as shell exports and exit')
+    args = parser.parse_args()
+
+    configure()
+    config = ReplayConfig(args.latency, args.jitter, args.error_rate, args.throttle_rate,
+                          args.rate_limit, args.burst, args.seed)
+    exports = '\n'.join(f"export {key}={value}"
+                        for key, value in replay_env(f"http://{args.host}:{args.port}").items())
+    print(exports)
+    if args.print_env:
+        return 0
+
+    server = create_server(args.host, args.port, config, args.root)
+    logger.info(f"Replaying {server.recordings.root} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"Requests: {dict(server.counts)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+
+"""Embedded SQL over the processed datasets in ``bluefin_data/nba``.
+
+Each dataset is registered as a DuckDB view over its CSV files, so season
+joins run in DuckDB's vectorized engine instead of pandas loops::
+
+    from bluefin_code.nba import sql
+    df = sql.query('''
+        SELECT g.game_date, a.team, MAX(a.pace) AS pace
+        FROM advanced a JOIN game_ids g USING (game_id)
+        GROUP BY ALL
+    ''', start='2023-11-01', end='2023-11-30')
+
+Views only cover the partitions in ``start``..``end``: month folders
+(``YYYY-MM``), season folders (``2023-24``) and dates in file names are
+pruned before DuckDB opens a file. Column types are sniffed once from a
+sample of files rather than per file. NBA.com game ids are normalized to
+the 10-character form in every view so datasets join on ``game_id``.
+
+``props`` covers both processed BettingPros shapes: the full
+``props_{date}.csv`` export and, for dates without one, the slim
+``{date}.csv`` file. Legacy column names are renamed to the slim ones
+(``prop_type`` -> ``market``, ``sportsbook`` -> ``book``) and book codes are
+lowercased, so the two shapes union by name. Files without a ``date``
+column take it from the file name.
+
+CLI::
+
+    python -m bluefin_code.nba.sql --list
+    python -m bluefin_code.nba.sql "SELECT team, COUNT(*) FROM advanced GROUP BY 1" --start 2024-11-01
+"""
+
+import argparse
+import csv
+import logging
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import duckdb
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+NBA_DATA_DIR = DATA_ROOT / "nba"
+
+logger = logging.getLogger(__name__)
+
+MONTH_RE = re.compile(r'^\d{4}-\d{2}$')
+SEASON_RE = re.compile(r'^(\d{4})[-_](\d{2})$')
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Partition date of a file, from the last date in its name
+FILE_DATE_SQL = r"CAST(regexp_extract(filename, '(\d{4}-\d{2}-\d{2})[^/]*$', 1) AS DATE)"
+
+# Files sniffed per dataset for column types
+SAMPLE_FILES = 10
+
+@dataclass(frozen=True)
+class Dataset:
+    """A processed dataset: CSV files under ``directory`` matching ``pattern``.
+
+    ``fallback_pattern`` files are read for dates with no ``pattern`` file;
+    ``renames`` maps old column names to the view's and ``lowercase``
+    columns are lowercased. With ``file_dates`` every row gets a ``date``,
+    taken from the file name when the file has no such column.
+    """
+    name: str
+    directory: str
+    pattern: str
+    description: str
+    game_id_columns: Sequence[str] = ()
+    fallback_pattern: Optional[str] = None
+    renames: Sequence[Tuple[str, str]] = ()
+    lowercase: Sequence[str] = ()
+    file_dates: bool = False
+
+DATASETS = {d.name: d for d in [
+    Dataset('props', 'bettingpros/processed', '*/props_????-??-??.csv',
+            'BettingPros player props, one row per player/market/book',
+            fallback_pattern='*/????-??-??.csv',
+            renames=(('prop_type', 'market'), ('sportsbook', 'book')), lowercase=('book',),
+            file_dates=True),
+    Dataset('ssim', 'ssim/processed', '*/ssim_????-??-??.csv',
+            'SaberSim projections, one row per player/date'),
+    Dataset('advanced', 'nba_com/boxscoreadvancedv2/processed', '*/advanced_*.csv',
+            'NBA.com advanced box scores, one row per player/game', ('game_id',)),
+    Dataset('rotations', 'nba_com/gamerotation/processed', '*/rotation_*.csv',
+            'NBA.com rotation stints, one row per player stint', ('game_id',)),
+    Dataset('gamelogs', 'nba_com/playergamelog/processed', '*/gamelog_*.csv',
+            'NBA.com player game logs, one row per player/game', ('game_id',)),
+    Dataset('game_ids', 'nba_com/game_ids', 'games_*.csv',
+            'NBA.com game-id index, one row per game', ('game_id',)),
+]}
+
+def _season_bounds(start_year: int) -> tuple:
+    return f"{start_year}-07-01", f"{start_year + 1}-06-30"
+
+def _season_start(partition: str) -> Optional[int]:
+    """Start year of a season folder such as ``2024-25``, else None.
+
+    Season folders look like month folders, so ``2024-25`` only counts as a
+    season when its suffix is the following year; ``2024-11`` is a month.
+    """
+    season = SEASON_RE.match(partition)
+    if season and int(season.group(2)) == (int(season.group(1)) + 1) % 100:
+        return int(season.group(1))
+    return None
+
+def _in_range(partition: str, start: Optional[str], end: Optional[str]) -> bool:
+    """Whether a month, season or date partition overlaps start..end."""
+    lo, hi = start or '0000-00-00', end or '9999-99-99'
+    if DATE_RE.fullmatch(partition):
+        return lo <= partition <= hi
+    season = _season_start(partition)
+    if season is not None:
+        first, last = _season_bounds(season)
+        return first <= hi and last >= lo
+    if MONTH_RE.match(partition):
+        return lo[:7] <= partition <= hi[:7]
+    return True
+
+def files(dataset: Dataset, start: Optional[str] = None, end: Optional[str] = None,
+          root: Optional[Path] = None) -> List[Path]:
+    """Dataset files whose folder and file-name partitions overlap start..end."""
+    base = (Path(root) if root else NBA_DATA_DIR) / dataset.directory
+    paths = _matching(base, dataset.pattern, start, end)
+    if dataset.fallback_pattern:
+        covered = {DATE_RE.search(path.stem).group(0) for path in paths}
+        paths += [path for path in _matching(base, dataset.fallback_pattern, start, end)
+                  if DATE_RE.search(path.stem).group(0) not in covered]
+    return sorted(paths)
+
+def _matching(base: Path, pattern: str, start: Optional[str], end: Optional[str]) -> List[Path]:
+    paths = []
+    for path in sorted(base.glob(pattern)):
+        folder = path.parent.name if path.parent != base else None
+        if folder and not _in_range(folder, start, end):
+            continue
+        partition = DATE_RE.search(path.stem) or SEASON_RE.search(path.stem.split('_', 1)[-1])
+        if partition and not _in_range(partition.group(0), start, end):
+            continue
+        paths.append(path)
+    return paths
+
+def _file_list(paths: Iterable[Path]) -> str:
+    return '[' + ', '.join(f"'{p.as_posix()}'" for p in paths) + ']'
+
+def _schema(conn: duckdb.DuckDBPyConnection, dataset: Dataset, paths: List[Path]) -> Dict[str, str]:
+    """Column types sniffed from an evenly spaced sample of files."""
+    sample = paths[::max(len(paths) // SAMPLE_FILES, 1)]
+    rows = conn.execute(f"DESCRIBE SELECT * FROM read_csv({_file_list(sample)}, header = true, "
+                        "union_by_name = true)").fetchall()
+    renames = dict(dataset.renames)
+    types = {}
+    for name, dtype, *_ in rows:
+        types.setdefault(renames.get(name, name), dtype)
+    types.update({col: 'VARCHAR' for col in dataset.game_id_columns if col in types})
+    return types
+
+def _view_sql(conn: duckdb.DuckDBPyConnection, dataset: Dataset, paths: List[Path]) -> str:
+    """View over the files, with types fixed up front so DuckDB skips per-file sniffing.
+
+    Files are grouped by header line; each group is read with its own column
+    order and the groups are combined by column name.
+    """
+    groups = defaultdict(list)
+    for path in paths:
+        with open(path) as f:
+            groups[f.readline().strip()].append(path)
+
+    types = _schema(conn, dataset, paths)
+    renames = dict(dataset.renames)
+    selects = []
+    for header, group in groups.items():
+        names = [renames.get(col, col) for col in next(csv.reader([header]))]
+        columns = ', '.join(f"'{col}': '{types.get(col, 'VARCHAR')}'" for col in names)
+        reader = f"read_csv({_file_list(group)}, header = true, auto_detect = false, columns = {{{columns}}}"
+        if dataset.file_dates and 'date' not in names:
+            selects.append(f"SELECT * EXCLUDE (filename), {FILE_DATE_SQL} AS date FROM {reader}, filename = true)")
+        else:
+            selects.append(f"SELECT * FROM {reader})")
+    source = ' UNION ALL BY NAME '.join(selects)
+    replacements = ([f"lpad({col}, 10, '0') AS {col}" for col in dataset.game_id_columns]
+                    + [f"lower({col}) AS {col}" for col in dataset.lowercase if col in types])
+    if not replacements:
+        return f"CREATE OR REPLACE VIEW {dataset.name} AS {source}"
+    replace = ', '.join(replacements)
+    return f"CREATE OR REPLACE VIEW {dataset.name} AS SELECT * REPLACE ({replace}) FROM ({source})"
+
+def connect(start: Optional[str] = None, end: Optional[str] = None,
+            datasets: Optional[Iterable[str]] = None, root: Optional[Path] = None,
+            conn: Optional[duckdb.DuckDBPyConnection] = None) -> duckdb.DuckDBPyConnection:
+    """In-memory DuckDB connection with a view per dataset.
+
+    Args:
+        start: First date (YYYY-MM-DD) to include; open-ended when omitted
+        end: Last date, inclusive
+        datasets: Dataset names to register (default: all)
+        root: Data directory (default ``bluefin_data/nba``)
+        conn: Existing connection to register the views on
+    """
+    conn = conn or duckdb.connect()
+    names = list(datasets) if datasets is not None else list(DATASETS)
+    unknown = [name for name in names if name not in DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown datasets: {unknown}")
+    for name in names:
+        paths = files(DATASETS[name], start, end, root)
+        if not paths:
+            logger.debug(f"No {name} files between {start} and {end}; view not registered")
+            continue
+        conn.execute(_view_sql(conn, DATASETS[name], paths))
+    return conn
+
+def query(sql: str, start: Optional[str] = None, end: Optional[str] = None,
+          params: Optional[Sequence[Any]] = None, root: Optional[Path] = None) -> pd.DataFrame:
+    """Run SQL against the dataset views and return a DataFrame.
+
+    Only datasets named in the SQL are registered.
+    """
+    used = [name for name in DATASETS if re.search(rf'\b{name}\b', sql)]
+    with connect(start, end, used, root) as conn:
+        return conn.execute(sql, params or []).df()
+
+def describe(start: Optional[str] = None, end: Optional[str] = None,
+             root: Optional[Path] = None) -> pd.DataFrame:
+    """Datasets with their file counts in range."""
+    return pd.DataFrame([
+        {'dataset': d.name, 'files': len(files(d, start, end, root)), 'description': d.description}
+        for d in DATASETS.values()
+    ])
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Run SQL over bluefin_data/nba datasets')
+    parser.add_argument('sql', nargs='?', help='SQL query (reads stdin when "-")')
+    parser.add_argument('--start', help='First date (YYYY-MM-DD)')
+    parser.add_argument('--end', help='Last date, inclusive')
+    parser.add_argument('--list', action='store_true', help='List datasets and file counts')
+    parser.add_argument('--csv', action='store_true', help='Write results as CSV')
+    parser.add_argument('--limit', type=int, default=50, help='Rows to print (table output)')
+    args = parser.parse_args()
+
+    configure()
+    if args.list or not args.sql:
+        print(describe(args.start, args.end).to_string(index=False))
+        return 0
+
+    sql = sys.stdin.read() if args.sql == '-' else args.sql
+    try:
+        df = query(sql, args.start, args.end)
+    except duckdb.Error as e:
+        print(f"Query failed: {e}", file=sys.stderr)
+        return 1
+    if args.csv:
+        df.to_csv(sys.stdout, index=False)
+    else:
+        print(df.head(args.limit).to_string(index=False))
+        if len(df) > args.limit:
+            print(f"... {len(df)} rows")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
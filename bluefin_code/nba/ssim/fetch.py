@@ -16,6 +16,10 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from ratelimit import limits, sleep_and_retry
 import hashlib
 
+from bluefin_code.core.instrument import stage
+from bluefin_code.nba import catalog, rawstore
+from bluefin_code.nba.urls import ssim_url
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
@@ -107,6 +111,7 @@ def load_config() -> Dict[str, Any]:
     
     # Merge token config into main config
     config.update(token_config)
+    config['api_url'] = ssim_url(config['api_url'])
     
     # Validate required config fields
     required_fields = ['api_url', 'token', 'slate_id']
@@ -150,11 +155,19 @@ def has_data_changed(new_data: Dict[str, Any], cache_file: Path) -> bool:
     return new_hash != cached_hash
 
 def fetch_projections(date: Optional[str] = None) -> Dict[str, Any]:
-    """Fetch projections from SaberSim API."""
+    """Fetch projections from SaberSim API.
+
+    Args:
+        date: Slate date as YYYYMMDD (the API's format), YYYY-MM-DD or "today"
+    """
     config = load_config()
     token = config['token']
     slate_id = config['slate_id']
-    cache_file = get_cache_file_path(date or datetime.now().strftime('%Y-%m-%d'))
+    if date is None or date.lower() == 'today':
+        day = datetime.now()
+    else:
+        day = datetime.strptime(date, '%Y%m%d' if date.isdigit() else '%Y-%m-%d')
+    cache_file = get_cache_file_path(day.strftime('%Y-%m-%d'))
 
     url = config['api_url']
     headers = {
@@ -174,7 +187,7 @@ def fetch_projections(date: Optional[str] = None) -> Dict[str, Any]:
         'user-agent': random.choice(config['user_agents'])
     }
     data = {
-        'date': date or datetime.now().strftime('%Y%m%d'),
+        'date': day.strftime('%Y%m%d'),
         'sport': 'nba',
         'slate': slate_id,
         'percentile': '0',
@@ -184,11 +197,15 @@ def fetch_projections(date: Optional[str] = None) -> Dict[str, Any]:
     }
 
     try:
-        response = make_api_request(url, headers, data)
-        if not response:
-            raise SSIMFetchError("No response received from API")
-            
-        json_data = handle_response(response)
+        with stage('fetch', source='ssim') as s:
+            response = make_api_request(url, headers, data)
+            if not response:
+                raise SSIMFetchError("No response received from API")
+            s.api_latency = response.elapsed.total_seconds()
+            s.bytes = len(response.content)
+                
+            json_data = handle_response(response)
+            s.rows = len(json_data['players'])
         
         # Check if data has changed
         if has_data_changed(json_data, cache_file):
@@ -270,8 +287,9 @@ def save_raw_data(data: Dict[str, Any], date: str) -> Path:
     }
     
     # Save data
-    with open(json_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    with stage('write', source='ssim') as s:
+        s.rows, s.bytes = len(data.get('players', [])), rawstore.save_json(json_file, data)['stored']
+    catalog.record(json_file, date, len(data.get('players', [])))
     
     logger.info(f"Saved {len(data.get('players', []))} players to {json_file}")
     return json_file
@@ -295,31 +313,30 @@ def fix_directory_structure() -> None:
         logger.warning("Raw directory not found")
         return
         
-    # Find all JSON files recursively
-    json_files = list(raw_dir.rglob("NBA_*.json"))
+    # Cataloged projection files that are not in their month folder
+    files = catalog.query("SELECT path, date FROM artifacts WHERE source = 'ssim' AND endpoint = 'projections'")
     
-    for file_path in json_files:
+    for path, date in files.itertuples(index=False):
         try:
-            # Extract date from filename (NBA_YYYY-MM-DD_raw.json)
-            date_str = file_path.name.split("_")[1][:7]  # Gets YYYY-MM
-            
-            # Construct correct directory
-            correct_dir = raw_dir / date_str
-            correct_dir.mkdir(parents=True, exist_ok=True)
+            file_path = Path(path)
             
-            # Construct correct path
+            # Construct correct path from the file's date
+            correct_dir = raw_dir / date[:7]
             correct_path = correct_dir / file_path.name
             
             # Skip if file is already in correct location
-            if file_path == correct_path:
+            if file_path.parent.name == date[:7] or not file_path.exists():
                 continue
                 
             # Move file to correct location
+            correct_dir.mkdir(parents=True, exist_ok=True)
             file_path.rename(correct_path)
+            catalog.forget(file_path)
+            catalog.record(correct_path, date)
             logger.info(f"Moved {file_path.name} to {correct_path}")
             
         except Exception as e:
-            logger.error(f"Error moving {file_path}: {e}")
+            logger.error(f"Error moving {path}: {e}")
             continue
             
     logger.info("Directory structure cleanup complete")
@@ -1 +1,3 @@
-from .evaluation import calculate_win_probability, calculate_ev, calculate_bet_rating 
\ No newline at end of file
+from .evaluation import calculate_win_probability, win_probabilities, calculate_ev, calculate_bet_rating
+from .distribution import over_under, score, probabilities, backtest_scorer
+from .simulate import SimModel, fit, over_probabilities, simulate_slate
@@ -1,15 +1,34 @@
 #!/usr/bin/env python3
 
+import argparse
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple, Dict, List
-from .evaluation import calculate_win_probability, calculate_ev, calculate_bet_rating
+from typing import Tuple, Dict, List, Optional, Sequence
+from .evaluation import calculate_win_probability, win_probabilities, calculate_ev, calculate_bet_rating
+from .distribution import PERCENTILE_COLUMNS, score
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 DATA_ROOT = PROJECT_ROOT / "bluefin_data"
 
+SAMPLE_DATES = [
+    "2024-12-05",
+    "2024-12-06"
+]
+
+# Merged view columns -> BettingPros prop columns
+VIEW_PROP_COLUMNS = {
+    'player': 'player',
+    'market': 'prop_type',
+    'line': 'line',
+    'o_odds': 'over_odds',
+    'ss_proj': 'ss_proj',
+    'bp_prob': 'projected_probability',
+    'bp_value': 'projected_ev',
+    'bp_rating': 'bet_rating',
+}
+
 def get_ssim_projection(ssim_row: pd.Series, prop_type: str) -> float:
     """Get the correct projection value based on prop type"""
     # Clean prop type - remove any trailing numbers or whitespace
@@ -193,10 +212,6 @@ def analyze_metric_comparison(ssim_row: pd.Series, bpros_row: pd.Series) -> None
 
 def analyze_all_props(ssim_df: pd.DataFrame, bpros_df: pd.DataFrame) -> None:
     """Analyze all props in the dataset"""
-    # Store metrics for distribution analysis
-    our_metrics = []
-    bpros_metrics = []
-    
     # Map BettingPros prop types to our internal types
     prop_type_map = {
         'BLK': 'blocks',
@@ -222,6 +237,7 @@ def analyze_all_props(ssim_df: pd.DataFrame, bpros_df: pd.DataFrame) -> None:
         'FTA': 'fta',
     }
     
+    matched = []
     for _, bpros_row in bpros_df.iterrows():
         if bpros_row['player'] in ssim_df['name'].values:
             ssim_row = ssim_df[ssim_df['name'] == bpros_row['player']].iloc[0]
@@ -235,29 +251,55 @@ def analyze_all_props(ssim_df: pd.DataFrame, bpros_df: pd.DataFrame) -> None:
             # Skip if we couldn't get a valid projection
             if projection == 0.0:
                 continue
-            
-            # Calculate our metrics
-            prob = calculate_win_probability(projection, bpros_row['line'])
-            ev = calculate_ev(prob, bpros_row['over_odds'])
-            rating = calculate_bet_rating(ev, prob)
-            
-            # Print individual prop analysis
-            print(f"\n{bpros_row['player']} {bpros_row['prop_type'].upper()} (Line: {bpros_row['line']:.1f})")
-            print(f"SaberSim Proj: {projection:.1f} | Prob: {prob:.3f} | EV: {ev:.3f} | Rating: {rating}")
-            print(f"BettingPros:   {bpros_row['projected_probability']:.3f} | EV: {bpros_row['projected_ev']:.3f} | Rating: {int(bpros_row['bet_rating'])}")
-            
-            # Store metrics for distribution analysis
-            our_metrics.append({
-                'probability': prob,
-                'ev': ev,
-                'rating': rating
-            })
-            
-            bpros_metrics.append({
-                'projected_probability': bpros_row['projected_probability'],
-                'projected_ev': bpros_row['projected_ev'],
-                'bet_rating': bpros_row['bet_rating']
-            })
+            matched.append((bpros_row, projection))
+    
+    report_props(matched)
+
+def analyze_view(view: pd.DataFrame) -> None:
+    """Analyze props from the merged data view, scored with the view's ss_std and percentiles"""
+    props = view[view['ss_proj'] > 0].dropna(subset=['ss_proj', 'o_odds', 'bp_prob', 'bp_value', 'bp_rating'])
+    props = score(props).dropna(subset=['ss_over']).rename(columns=VIEW_PROP_COLUMNS)
+    rows = props.to_dict('records')
+    report_props([(row, row['ss_proj']) for row in rows], [row['ss_over'] for row in rows])
+
+def report_props(matched: List[Tuple[Dict, float]], probs: Optional[Sequence[float]] = None) -> None:
+    """Print our metrics against BettingPros for (prop row, projection) pairs
+
+    probs are the over probabilities of each pair; when omitted they come
+    from the projection alone (win_probabilities).
+    """
+    # Store metrics for distribution analysis
+    our_metrics = []
+    bpros_metrics = []
+    
+    # Win probabilities for every matched prop at once
+    if probs is None:
+        probs = win_probabilities([projection for _, projection in matched],
+                                  [row['line'] for row, _ in matched],
+                                  markets=[row['prop_type'] for row, _ in matched])
+    
+    for (bpros_row, projection), prob in zip(matched, probs):
+        # Calculate our metrics
+        ev = calculate_ev(prob, bpros_row['over_odds'])
+        rating = calculate_bet_rating(ev, prob)
+        
+        # Print individual prop analysis
+        print(f"\n{bpros_row['player']} {bpros_row['prop_type'].upper()} (Line: {bpros_row['line']:.1f})")
+        print(f"SaberSim Proj: {projection:.1f} | Prob: {prob:.3f} | EV: {ev:.3f} | Rating: {rating}")
+        print(f"BettingPros:   {bpros_row['projected_probability']:.3f} | EV: {bpros_row['projected_ev']:.3f} | Rating: {int(bpros_row['bet_rating'])}")
+        
+        # Store metrics for distribution analysis
+        our_metrics.append({
+            'probability': prob,
+            'ev': ev,
+            'rating': rating
+        })
+        
+        bpros_metrics.append({
+            'projected_probability': bpros_row['projected_probability'],
+            'projected_ev': bpros_row['projected_ev'],
+            'bet_rating': bpros_row['bet_rating']
+        })
     
     if our_metrics:
         # Convert to DataFrames for analysis
@@ -272,25 +314,28 @@ def analyze_all_props(ssim_df: pd.DataFrame, bpros_df: pd.DataFrame) -> None:
     else:
         print("\nNo matching props found for analysis")
 
-def get_dates_to_analyze() -> List[str]:
-    """Get list of dates to analyze"""
-    return [
-        "2024-12-05",
-        "2024-12-06"
-    ]
+def load_view(start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+    """Load merged view rows for a date range in one query (sample dates by default)"""
+    from bluefin_code.nba.dataview import query
+    if start is None:
+        start, end = SAMPLE_DATES[0], SAMPLE_DATES[-1]
+    return query(start, end, columns=['date', *VIEW_PROP_COLUMNS, 'ss_std', *PERCENTILE_COLUMNS])
 
 def main():
     """Main entry point for analysis"""
-    # Get list of dates to analyze
-    dates = get_dates_to_analyze()
+    parser = argparse.ArgumentParser(description="Compare SaberSim metrics with BettingPros")
+    parser.add_argument("--start", help="First date to analyze (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last date to analyze (YYYY-MM-DD)")
+    args = parser.parse_args()
+    
+    view = load_view(args.start, args.end)
+    if view.empty:
+        print("No data found for the requested dates")
     
-    for date in dates:
+    for date, day in view.groupby('date', sort=True):
         print(f"\nAnalyzing {date}:")
         try:
-            ssim_df, bpros_df = load_comparison_data(date)
-            analyze_all_props(ssim_df, bpros_df)
-        except FileNotFoundError:
-            print(f"No data found for {date}")
+            analyze_view(day)
         except Exception as e:
             print(f"Error analyzing {date}: {str(e)}")
             import traceback
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+"""Over/under probabilities from SaberSim projection distributions.
+
+Every prop gets P(over), P(under) and P(push) for its line from a
+per-player distribution, evaluated for the whole slate in one NumPy pass:
+
+- points and combo markets: a piecewise-linear CDF through the view's
+  ``ss_p25..ss_p99`` percentiles (monotone by construction), anchored at
+  0 and with an exponential tail past the 99th percentile
+- single count stats (``COUNT_MARKETS``): a negative binomial with mean
+  ``ss_proj`` and variance ``ss_std**2``, or Poisson when that is not
+  overdispersed. The rescaled DK fantasy percentiles are far too narrow
+  for a 0.7-steal projection, where the count itself dominates.
+- rows without percentiles fall back to a normal with ``ss_std``
+
+Stats are integers, so continuous CDFs are read with a continuity
+correction: over an integer line of 20 means 21 or more.
+
+``probabilities(date)`` scores a date's merged view and caches the result
+per (date, snapshot), where the snapshot is the hash of both source files
+and the player index version the view was built from::
+
+    python -m bluefin_code.nba.ssim.metrics.distribution --date 2024-12-06
+"""
+
+import argparse
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+DATA_ROOT = PROJECT_ROOT / "bluefin_data"
+
+logger = logging.getLogger(__name__)
+
+# Bump when the probability model changes so cached results are recomputed
+MODEL_VERSION = 1
+
+PERCENTILES = [25, 50, 75, 85, 95, 99]
+PERCENTILE_COLUMNS = [f'ss_p{p}' for p in PERCENTILES]
+
+# Markets scored with a count distribution instead of the percentiles
+COUNT_MARKETS = {'reb', 'ast', 'stl', 'blk', 'to', '3pm', 'stocks'}
+
+PROB_COLUMNS = ['ss_p_over', 'ss_p_under', 'ss_p_push', 'ss_over', 'ss_model']
+
+KEYS = ['date', 'player_id', 'market', 'book', 'line']
+
+_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+def normal_cdf(x: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """Normal CDF (Abramowitz-Stegun 7.1.26 erf, error < 2e-7)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (np.asarray(x, dtype=float) - mean) / (np.asarray(std, dtype=float) * np.sqrt(2))
+    t = 1 / (1 + 0.3275911 * np.abs(z))
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = np.sign(z) * (1 - poly * np.exp(-z * z))
+    return 0.5 * (1 + erf)
+
+def percentile_cdf(x: np.ndarray, knots: np.ndarray, levels: np.ndarray = np.array(PERCENTILES) / 100) -> np.ndarray:
+    """CDF at x interpolated through per-row percentile knots.
+
+    knots is (rows, len(levels)); x is one value per row. Knots are made
+    non-decreasing, (0, 0) is prepended and past the last knot the upper
+    tail decays exponentially at the rate of the last two knots.
+    """
+    x = np.asarray(x, dtype=float)
+    knots = np.maximum.accumulate(np.maximum(np.asarray(knots, dtype=float), 0), axis=1)
+    rows = np.arange(len(x))
+    xs = np.column_stack([np.zeros(len(x)), knots])
+    ps = np.concatenate([[0.0], levels])
+
+    seg = np.clip((x[:, None] >= xs).sum(axis=1) - 1, 0, xs.shape[1] - 2)
+    lo, hi = xs[rows, seg], xs[rows, seg + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frac = np.where(hi > lo, (x - lo) / (hi - lo), 1.0)
+    inside = ps[seg] + np.clip(frac, 0, 1) * (ps[seg + 1] - ps[seg])
+
+    # 1 - F falls from 1 - levels[-2] to 1 - levels[-1] over the last gap; keep that rate
+    last, prev = xs[:, -1], xs[:, -2]
+    rate = np.log((1 - levels[-2]) / (1 - levels[-1])) / np.maximum(last - prev, 1e-9)
+    tail = 1 - (1 - levels[-1]) * np.exp(-rate * np.maximum(x - last, 0))
+    cdf = np.where(x > last, tail, inside)
+    return np.where(x < 0, 0.0, cdf)
+
+def count_cdf_table(mean: np.ndarray, var: np.ndarray, top: int) -> np.ndarray:
+    """P(X <= k) for k = 0..top per row: negative binomial with mean and variance, Poisson unless var > mean."""
+    mean = np.maximum(np.asarray(mean, dtype=float), 1e-9)
+    var = np.asarray(var, dtype=float)
+    overdispersed = var > mean * (1 + 1e-6)
+    table = np.empty((len(mean), top + 1))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        size = np.where(overdispersed, mean ** 2 / (var - mean), np.inf)
+        q = np.where(overdispersed, mean / (size + mean), 0.0)
+        pmf = np.where(overdispersed, np.exp(size * np.log1p(-q)), np.exp(-mean))
+        table[:, 0] = pmf
+        for j in range(top):
+            pmf = pmf * np.where(overdispersed, (j + size) / (j + 1) * q, mean / (j + 1))
+            table[:, j + 1] = table[:, j] + pmf
+    return np.clip(table, 0, 1)
+
+def count_cdf(k: np.ndarray, mean: np.ndarray, var: Optional[np.ndarray] = None) -> np.ndarray:
+    """P(X <= k) for a negative binomial with mean and variance (Poisson unless var > mean).
+
+    k is floored; the pmf is built by recurrence up to the largest k, so
+    the cost is rows x max(k).
+    """
+    k = np.floor(np.asarray(k, dtype=float))
+    mean = np.asarray(mean, dtype=float)
+    table = count_cdf_table(mean, mean if var is None else var, int(np.nanmax(k, initial=0)))
+    index = np.clip(np.nan_to_num(k, nan=0), 0, table.shape[1] - 1).astype(int)
+    cdf = np.where(k >= 0, table[np.arange(len(k)), index], 0.0)
+    return np.where(np.isnan(k), np.nan, cdf)
+
+def over_under(line: np.ndarray, proj: np.ndarray, std: np.ndarray, knots: np.ndarray,
+               count: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """P(over), P(under) and P(push) of each line.
+
+    count marks rows scored with the count distribution; the others use
+    the percentile knots, or a normal with std where knots are missing.
+    """
+    line, proj, std = (np.asarray(a, dtype=float) for a in (line, proj, std))
+    knots = np.asarray(knots, dtype=float)
+    count = np.asarray(count, dtype=bool)
+    # Integer outcomes: over wins at floor(line) + 1, under at ceil(line) - 1
+    over_at, under_at = np.floor(line) + 1, np.ceil(line) - 1
+
+    has_knots = ~np.isnan(knots).any(axis=1)
+    filled = np.where(has_knots[:, None], knots, 0.0)
+    f_over = np.where(has_knots, percentile_cdf(over_at - 0.5, filled),
+                      normal_cdf(over_at - 0.5, proj, std))
+    f_under = np.where(has_knots, percentile_cdf(under_at + 0.5, filled),
+                       normal_cdf(under_at + 0.5, proj, std))
+
+    if count.any():
+        var = np.where(np.isnan(std), proj, std ** 2)
+        rows = count & ~np.isnan(proj)
+        f_over[rows] = count_cdf(over_at[rows] - 1, proj[rows], var[rows])
+        f_under[rows] = count_cdf(under_at[rows], proj[rows], var[rows])
+
+    p_over, p_under = 1 - f_over, f_under
+    missing = np.isnan(proj) | (~count & ~has_knots & np.isnan(std))
+    p_over[missing] = np.nan
+    p_under[missing] = np.nan
+    return p_over, p_under, np.clip(1 - p_over - p_under, 0, 1)
+
+def score(df: pd.DataFrame) -> pd.DataFrame:
+    """Add over/under/push probabilities to rows with view columns.
+
+    Needs ``market``, ``line``, ``ss_proj``, ``ss_std`` and the ``ss_p*``
+    percentiles. Adds ``ss_p_over``, ``ss_p_under``, ``ss_p_push``,
+    ``ss_over`` (P(over) given the bet is decided) and ``ss_model``.
+    """
+    df = df.copy()
+    for col in ['ss_std', *PERCENTILE_COLUMNS]:
+        if col not in df.columns:
+            df[col] = np.nan
+    count = df['market'].isin(COUNT_MARKETS).to_numpy()
+    p_over, p_under, p_push = over_under(
+        df['line'].to_numpy(dtype=float), df['ss_proj'].to_numpy(dtype=float),
+        df['ss_std'].to_numpy(dtype=float), df[PERCENTILE_COLUMNS].to_numpy(dtype=float), count)
+    df['ss_p_over'], df['ss_p_under'], df['ss_p_push'] = p_over, p_under, p_push
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['ss_over'] = p_over / (p_over + p_under)
+    has_knots = df[PERCENTILE_COLUMNS].notna().all(axis=1).to_numpy()
+    df['ss_model'] = np.select([np.isnan(p_over), count, has_knots], [None, 'count', 'percentile'], 'normal')
+    return df
+
+def snapshot(date: str) -> str:
+    """Id of the source files and player index the date's view was built from (plus the model version)."""
+    from bluefin_code.nba.dataview.merge import load_meta
+
+    meta = load_meta(date)
+    sources = meta.get('sources', {})
+    key = f"{MODEL_VERSION}:" + ':'.join(sources.get(name, {}).get('hash', '') for name in ('ssim', 'bpro'))
+    key += f":{meta.get('player_index', '')}"
+    return hashlib.md5(key.encode()).hexdigest()[:12]
+
+def get_cache_path(date: str, snap: str) -> Path:
+    return DATA_ROOT / "nba" / "dataview" / "probs" / date[:7] / f"probs_{date}_{snap}.parquet"
+
+def probabilities(date: str, force: bool = False) -> pd.DataFrame:
+    """Scored view for date, cached per (date, snapshot) in memory and on disk."""
+    from bluefin_code.nba.dataview.merge import materialize_view
+
+    view_file = materialize_view(date, force)
+    snap = snapshot(date)
+    path = get_cache_path(date, snap)
+    if not force and (date, snap) in _cache:
+        return _cache[(date, snap)]
+    if not force and path.exists():
+        logger.debug(f"Using cached probabilities {path}")
+        result = pd.read_parquet(path)
+    else:
+        result = score(pd.read_parquet(view_file))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        result.to_parquet(path, index=False)
+        logger.info(f"Scored {len(result)} props for {date} ({snap})")
+    _cache[(date, snap)] = result
+    return result
+
+def backtest_scorer(joined: pd.DataFrame) -> pd.DataFrame:
+    """Backtest scorer: adds SaberSim probabilities for every date with a merged view.
+
+    Props on dates without SaberSim data get NaN probabilities and are not bet.
+    """
+    from bluefin_code.nba.dataview.merge import get_bpro_path, get_ssim_path
+
+    frames = []
+    for date in sorted(joined['date'].unique()):
+        if not (get_ssim_path(date).exists() and get_bpro_path(date).exists()):
+            continue
+        frames.append(probabilities(date)[[*KEYS, 'ss_proj', *PROB_COLUMNS]])
+    if not frames:
+        logger.warning("No dates with SaberSim projections in range")
+        return joined.assign(ss_proj=np.nan, **{col: np.nan for col in PROB_COLUMNS})
+    probs = pd.concat(frames, ignore_index=True).astype({'player_id': 'Int64', 'date': str, 'market': str, 'book': str})
+    probs = probs.drop_duplicates(KEYS)
+    return joined.merge(probs, on=KEYS, how='left')
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Over/under probabilities from SaberSim distributions')
+    parser.add_argument('--date', required=True, help='Date (YYYY-MM-DD)')
+    parser.add_argument('--force', action='store_true', help='Rebuild the view and recompute')
+    args = parser.parse_args()
+    configure()
+
+    df = probabilities(args.date, args.force)
+    cols = ['player', 'market', 'book', 'line', 'ss_proj', 'ss_p_over', 'ss_p_under', 'ss_p_push', 'bp_prob', 'ss_model']
+    print(df[cols].round(3).to_string(index=False))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,27 +3,46 @@ Core evaluation metrics for SaberSim projections
 Matches BettingPros methodology for comparative analysis
 """
 
-def calculate_win_probability(projection: float, line: float) -> float:
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from bluefin_code.core.standardization.markets import MARKET_CODES
+from .distribution import COUNT_MARKETS, PERCENTILES, over_under
+
+def win_probabilities(projections: Sequence[float], lines: Sequence[float],
+                      stds: Optional[Sequence[float]] = None,
+                      markets: Optional[Sequence[str]] = None) -> np.ndarray:
     """
-    Calculate probability of projection beating the line
-    
-    Based on BettingPros distribution:
-    - Range: 0.50 - 0.91
-    - Mean: ~0.60
-    - High confidence: >0.67
+    Probability of each over beating its line, given the bet is decided
+
+    Vectorized form of ``distribution.over_under`` for props without
+    percentiles:
+    - Count markets: negative binomial (Poisson unless std is wider)
+    - Others: normal with std (default sqrt(projection))
+    - Pushes excluded; price the result with the over odds
     """
-    # Calculate edge percentage
-    edge_pct = (projection - line) / line
-    
-    # Scale to match BettingPros distribution
-    if edge_pct > 0:
-        # Positive edge: 0.55 - 0.91
-        prob = min(0.91, 0.55 + (edge_pct * 3))  # Increased multiplier
-    else:
-        # Negative edge: 0.50 - 0.55
-        prob = max(0.50, 0.55 + (edge_pct * 2))
-        
-    return prob
+    proj = np.asarray(projections, dtype=float)
+    std = np.full(len(proj), np.nan) if stds is None else np.asarray(stds, dtype=float)
+    std = np.maximum(np.where(np.isnan(std), np.sqrt(np.maximum(proj, 0)), std), 1e-9)
+    codes = pd.Series(markets if markets is not None else [None] * len(proj), dtype=object)
+    count = codes.str.lower().map(MARKET_CODES).isin(COUNT_MARKETS).to_numpy()
+    p_over, p_under, _ = over_under(np.asarray(lines, dtype=float), proj, std,
+                                    np.full((len(proj), len(PERCENTILES)), np.nan), count)
+    decided = p_over + p_under
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(decided > 0, p_over / decided, 0.5)
+
+def calculate_win_probability(projection: float, line: float, std: Optional[float] = None,
+                              market: Optional[str] = None) -> float:
+    """
+    Calculate probability of the over beating the line (pushes excluded)
+
+    Single-prop form of ``win_probabilities``; score whole slates with
+    ``win_probabilities`` or ``distribution.score`` instead.
+    """
+    return float(win_probabilities([projection], [line], None if std is None else [std], [market])[0])
 
 def calculate_ev(probability: float, odds: int, stake: float = 1.0) -> float:
     """
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""Monte Carlo simulation of correlated player stat lines.
+
+Combo markets (PRA, PR, PA, RA, stocks) are sums of correlated stats, so
+their spread is not the sum of the parts. The simulator draws whole stat
+lines instead:
+
+- marginals: per stat, a negative binomial with the SaberSim projection as
+  mean and the league dispersion (variance / mean) from the game logs
+- dependence: a Gaussian copula whose correlation is estimated from
+  within-player normal scores of the game logs (``fit``)
+
+Draws for a chunk of players are made in one array operation (normal
+draws correlated through the Cholesky factor, then mapped through each
+player's count CDF), summed per market and histogrammed, so every line of
+every single and combo market is priced from the same draws. Memory is
+bounded by ``chunk_size`` x ``draws``; results are reproducible for a
+given seed and chunk size::
+
+    python -m bluefin_code.nba.ssim.metrics.simulate --date 2024-12-06
+    python -m bluefin_code.nba.ssim.metrics.simulate --date 2024-12-06 --draws 50000 --seed 7
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluefin_code.core.logs import configure
+from bluefin_code.nba.backtest.engine import MARKET_STATS, load_gamelogs
+from .distribution import count_cdf_table
+
+logger = logging.getLogger(__name__)
+
+# Simulated stats (game-log names); every market is a sum of these
+STATS = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers', 'three_pointers_made']
+
+# Game-log stat -> SaberSim projection column
+SSIM_COLUMNS = {
+    'points': 'points',
+    'rebounds': 'rebounds',
+    'assists': 'assists',
+    'steals': 'steals',
+    'blocks': 'blocks',
+    'turnovers': 'turnovers',
+    'three_pointers_made': 'three_pt_fg',
+}
+
+DRAWS = 10000
+CHUNK_SIZE = 32
+
+# Normal-scale bound for draws and CDF thresholds in draw(); no draw gets near it
+Z_BOUND = 50.0
+
+# Players need this many games to contribute to the fitted model
+MIN_GAMES = 20
+
+# Game-log history used to fit the model for a slate
+HISTORY_DAYS = 730
+
+SIM_COLUMNS = ['sim_p_over', 'sim_p_under', 'sim_p_push', 'sim_over', 'sim_mean', 'sim_std']
+
+@dataclass
+class SimModel:
+    """Copula correlation and per-stat dispersion (variance / mean) of simulated stats."""
+    corr: np.ndarray
+    dispersion: np.ndarray
+    stats: Tuple[str, ...] = tuple(STATS)
+    games: int = 0
+
+    @classmethod
+    def independent(cls, stats: Tuple[str, ...] = tuple(STATS)) -> 'SimModel':
+        """Uncorrelated Poisson stats (a baseline, and for synthetic slates)."""
+        return cls(np.eye(len(stats)), np.ones(len(stats)), tuple(stats))
+
+def normal_ppf(u: np.ndarray) -> np.ndarray:
+    """Standard normal quantile (Acklam's rational approximation, error < 1.2e-9)."""
+    a = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+    b = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01]
+    c = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+    d = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00]
+    u = np.clip(np.asarray(u, dtype=float), 1e-12, 1 - 1e-12)
+    tail = np.minimum(u, 1 - u)
+    t = np.sqrt(-2 * np.log(tail))
+    outer = (((((c[0] * t + c[1]) * t + c[2]) * t + c[3]) * t + c[4]) * t + c[5]) / \
+        ((((d[0] * t + d[1]) * t + d[2]) * t + d[3]) * t + 1)
+    outer = np.where(u < 0.5, outer, -outer)
+    q = u - 0.5
+    r = q * q
+    inner = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+        (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+    return np.where(tail < 0.02425, outer, inner)
+
+def fit(gamelogs: pd.DataFrame, min_games: int = MIN_GAMES) -> SimModel:
+    """Estimate the copula correlation and dispersion from game logs.
+
+    Each player's games are ranked per stat and mapped to normal scores,
+    so the pooled correlation measures how stats move together around that
+    player's own level rather than between players of different roles.
+    """
+    df = gamelogs[pd.to_numeric(gamelogs['minutes'], errors='coerce') > 0]
+    games = df.groupby('player_id')['player_id'].transform('size')
+    df = df[games >= min_games]
+    if df.empty:
+        raise ValueError(f"No players with {min_games}+ games to fit the simulation model")
+    grouped = df.groupby('player_id')[STATS]
+
+    ranks = grouped.rank(method='average').to_numpy(dtype=float)
+    n = df.groupby('player_id')['player_id'].transform('size').to_numpy(dtype=float)[:, None]
+    scores = normal_ppf((ranks - 0.5) / n)
+    corr = np.corrcoef(scores, rowvar=False)
+
+    means, variances = grouped.mean(), grouped.var()
+    ratio = (variances / means.where(means > 0.2)).median()
+    dispersion = np.maximum(ratio.reindex(STATS).fillna(1.0).to_numpy(), 1.0)
+    logger.info(f"Fitted simulation model on {len(df)} games of {df['player_id'].nunique()} players")
+    return SimModel(corr, dispersion, tuple(STATS), len(df))
+
+def fit_history(date: str, days: int = HISTORY_DAYS, root: Optional[Path] = None) -> SimModel:
+    """Model fitted on the game logs of the days before date."""
+    end = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=1)
+    start = end - timedelta(days=days)
+    return fit(load_gamelogs(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"), root))
+
+def draw(means: np.ndarray, model: SimModel, draws: int, rng: np.random.Generator) -> np.ndarray:
+    """Correlated stat lines, (players, stats, draws), for a (players, stats) array of means."""
+    n, k = means.shape
+    means = np.nan_to_num(np.maximum(means, 0.0))
+    var = means * model.dispersion
+    chol = np.linalg.cholesky(model.corr + 1e-9 * np.eye(k))
+    z = (rng.standard_normal((n, k, draws)).transpose(0, 2, 1) @ chol.T).transpose(0, 2, 1).reshape(n * k, draws)
+
+    # X = k where F(k - 1) < Phi(z) <= F(k), i.e. the count of thresholds Phi^-1(F(j)) below z,
+    # so each (player, stat) CDF is inverted on the normal scale without Phi over every draw
+    top = int(np.ceil(np.max(means + 10 * np.sqrt(var), initial=0))) + 5
+    thresholds = normal_ppf(count_cdf_table(means.ravel(), var.ravel(), top))
+    thresholds[:, -1] = np.inf
+
+    # One searchsorted for every row: thresholds and draws are clipped to +-Z_BOUND and
+    # shifted by 4 * Z_BOUND per row, so the rows form one sorted array. NaN (F = 1) and
+    # +inf thresholds clip to the top, where they stay above every draw.
+    rows = np.arange(n * k)[:, None]
+    shift = 4 * Z_BOUND * rows
+    edges = np.clip(np.nan_to_num(thresholds, nan=Z_BOUND), -Z_BOUND, Z_BOUND) + shift
+    z = np.clip(z, 1 - Z_BOUND, Z_BOUND - 1) + shift
+    counts = np.searchsorted(edges.ravel(), z.ravel()).reshape(n * k, draws) - (top + 1) * rows
+    return counts.astype(np.int16).reshape(n, k, draws)
+
+def chunks(means: pd.DataFrame, model: SimModel, draws: int = DRAWS, seed: int = 0,
+           chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[pd.Index, np.ndarray]]:
+    """(player keys, draws) per chunk of players; chunk i draws from rng seeded (seed, i)."""
+    values = means.reindex(columns=list(model.stats)).to_numpy(dtype=float)
+    for i, first in enumerate(range(0, len(means), chunk_size)):
+        rng = np.random.default_rng([seed, i])
+        yield means.index[first:first + chunk_size], draw(values[first:first + chunk_size], model, draws, rng)
+
+def over_probabilities(props: pd.DataFrame, means: pd.DataFrame, model: SimModel, key: str = 'player_id',
+                       draws: int = DRAWS, seed: int = 0, chunk_size: int = CHUNK_SIZE) -> pd.DataFrame:
+    """Simulated over/under/push probabilities for every prop line.
+
+    props has key, ``market`` (a ``MARKET_STATS`` code) and ``line``;
+    means is indexed by key with a column per stat in ``STATS``. Adds
+    ``sim_p_over``, ``sim_p_under``, ``sim_p_push``, ``sim_over`` (P(over)
+    given a decision) and the simulated ``sim_mean`` and ``sim_std`` of the
+    market. Props of players without means, or of other markets, are NaN.
+    """
+    props = props.reset_index(drop=True)
+    out = np.full((len(props), len(SIM_COLUMNS)), np.nan)
+    stat_index = {stat: i for i, stat in enumerate(model.stats)}
+    wanted = means[means.index.isin(props[key]) & ~means.index.duplicated()]
+    line = props['line'].to_numpy(dtype=float)
+
+    for players, sims in chunks(wanted, model, draws, seed, chunk_size):
+        position = pd.Series(np.arange(len(players)), index=players)
+        in_chunk = props[key].isin(players).to_numpy()
+        for market, cols in MARKET_STATS.items():
+            rows = np.flatnonzero(in_chunk & (props['market'] == market).to_numpy())
+            if not len(rows):
+                continue
+            totals = sims[:, [stat_index[c] for c in cols], :].sum(axis=1, dtype=np.int32)
+            # CDF per player from one offset bincount over the chunk
+            width = int(totals.max(initial=0)) + 1
+            hist = np.bincount((totals + np.arange(len(players))[:, None] * width).ravel(),
+                               minlength=len(players) * width).reshape(len(players), width)
+            cdf = np.cumsum(hist, axis=1) / draws
+
+            pos = position.reindex(props.loc[rows, key]).to_numpy()
+            over_at, under_at = np.floor(line[rows]), np.ceil(line[rows]) - 1
+            f_over = np.where(over_at >= width, 1.0, cdf[pos, np.clip(over_at, 0, width - 1).astype(int)])
+            f_under = np.where(under_at < 0, 0.0, cdf[pos, np.clip(under_at, 0, width - 1).astype(int)])
+            p_over, p_under = 1 - f_over, f_under
+            with np.errstate(divide='ignore', invalid='ignore'):
+                decided = p_over / (p_over + p_under)
+            out[rows] = np.column_stack([p_over, p_under, 1 - p_over - p_under, decided,
+                                         totals.mean(axis=1)[pos], totals.std(axis=1)[pos]])
+    return props.assign(**{col: out[:, i] for i, col in enumerate(SIM_COLUMNS)})
+
+def slate_means(ssim_df: pd.DataFrame, index=None) -> pd.DataFrame:
+    """SaberSim projections as simulation means, indexed by ``player_id``."""
+    from bluefin_code.core.standardization.player_ids import get_player_index
+
+    index = index or get_player_index()
+    df = ssim_df.assign(player_id=index.resolve_series(ssim_df['name'], source='ssim'))
+    df = df.dropna(subset=['player_id']).drop_duplicates('player_id')
+    means = df.set_index(df['player_id'].astype(int))[list(SSIM_COLUMNS.values())]
+    return means.rename(columns={v: k for k, v in SSIM_COLUMNS.items()}).apply(pd.to_numeric, errors='coerce')
+
+def simulate_slate(date: str, model: Optional[SimModel] = None, draws: int = DRAWS, seed: int = 0,
+                   chunk_size: int = CHUNK_SIZE) -> pd.DataFrame:
+    """Simulated probabilities for every prop in the date's merged view."""
+    from bluefin_code.nba.dataview import create_view, load_ssim_data
+
+    view = create_view(date)
+    model = model or fit_history(date)
+    return over_probabilities(view, slate_means(load_ssim_data(date)), model, draws=draws,
+                              seed=seed, chunk_size=chunk_size)
+
+def combo_spread(result: pd.DataFrame) -> pd.DataFrame:
+    """Mean simulated std per market next to the std if the stats were independent."""
+    singles = (result.drop_duplicates(['player_id', 'market'])
+               .pivot(index='player_id', columns='market', values='sim_std'))
+    rows: List[Dict[str, float]] = []
+    for market, cols in MARKET_STATS.items():
+        codes = [code for code, parts in MARKET_STATS.items() if len(parts) == 1 and parts[0] in cols]
+        if market not in singles or not all(code in singles for code in codes):
+            continue
+        independent = np.sqrt((singles[codes] ** 2).sum(axis=1, min_count=len(codes)))
+        rows.append({'market': market, 'sim_std': singles[market].mean(), 'independent_std': independent.mean()})
+    return pd.DataFrame(rows).round(3)
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Monte Carlo over probabilities for a slate')
+    parser.add_argument('--date', required=True, help='Date (YYYY-MM-DD)')
+    parser.add_argument('--draws', type=int, default=DRAWS, help=f'Draws per player (default {DRAWS})')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Players simulated per array operation')
+    parser.add_argument('--csv', action='store_true', help='Write rows as CSV')
+    args = parser.parse_args()
+    configure()
+
+    start = datetime.now()
+    df = simulate_slate(args.date, draws=args.draws, seed=args.seed, chunk_size=args.chunk_size)
+    if args.csv:
+        df.to_csv(sys.stdout, index=False)
+        return 0
+    cols = ['player', 'market', 'book', 'line', 'ss_proj', 'sim_mean', 'sim_std', 'sim_p_over', 'bp_prob']
+    print(df[cols].round(3).head(50).to_string(index=False))
+    print(f"\n{combo_spread(df).to_string(index=False)}")
+    print(f"\n{df['sim_p_over'].notna().sum()} of {len(df)} props simulated in "
+          f"{(datetime.now() - start).total_seconds():.1f}s")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
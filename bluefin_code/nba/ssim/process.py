@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import sys
-import json
 import logging
 import argparse
 from pathlib import Path
@@ -9,7 +8,10 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 import hashlib
 import pandas as pd
+from bluefin_code.core.instrument import stage
+from bluefin_code.nba import rawstore
 from bluefin_code.core.output import format_change, format_player_update
+from bluefin_code.core.standardization.teams import standardize_codes, unmapped_codes
 from colorama import Fore, Style
 
 # Project paths
@@ -29,11 +31,10 @@ def get_processed_file_path(date: str) -> Path:
 def load_raw_data(date: str) -> Dict[str, Any]:
     """Load raw data for a given date."""
     raw_file = get_raw_file_path(date)
-    if not raw_file.exists():
+    if not rawstore.exists(raw_file):
         raise FileNotFoundError(f"Raw data file not found: {raw_file}")
         
-    with open(raw_file) as f:
-        return json.load(f)
+    return rawstore.load_json(raw_file)
 
 def process_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Process raw data into standardized format."""
@@ -129,8 +130,13 @@ def process_date(date: str, force: bool = False) -> None:
             old_data = {row['name']: row for _, row in old_df.iterrows()}
         
         # Process new data
-        raw_data = load_raw_data(date)
-        processed_data = process_data(raw_data)
+        with stage('load', source='ssim') as s:
+            raw_data = load_raw_data(date)
+            entry = rawstore.lookup(get_raw_file_path(date))
+            s.bytes = entry['bytes'] if entry else get_raw_file_path(date).stat().st_size
+        with stage('parse', source='ssim') as s:
+            processed_data = process_data(raw_data)
+            s.rows = len(processed_data)
         
         # Track and display changes
         for player in processed_data:
@@ -145,8 +151,19 @@ def process_date(date: str, force: bool = False) -> None:
                     print(format_player_update(name, updates))
         
         # Save processed data
-        df = pd.DataFrame(processed_data)
-        df.to_csv(output_file, index=False)
+        with stage('normalize', source='ssim') as s:
+            df = pd.DataFrame(processed_data)
+            for col in ['team', 'opponent']:
+                codes = standardize_codes(df[col])
+                unmapped = unmapped_codes(df[col], codes)
+                if unmapped:
+                    logger.warning(f"Unmapped {col} codes for {date}: {unmapped}")
+                df[col] = codes
+            s.rows = len(df)
+        with stage('write', source='ssim') as s:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(output_file, index=False)
+            s.rows, s.bytes = len(df), output_file.stat().st_size
             
         logger.info(f"✓ Processed {len(processed_data)} players")
         
@@ -164,10 +181,7 @@ def process_all_raw_files(force: bool = False) -> None:
         return
         
     # Find all raw JSON files
-    raw_files = []
-    for month_dir in raw_dir.iterdir():
-        if month_dir.is_dir():
-            raw_files.extend(month_dir.glob("NBA_*_raw.json"))
+    raw_files = rawstore.glob(raw_dir, "*/NBA_*_raw.json")
     
     logger.info(f"Found {len(raw_files)} raw files")
     
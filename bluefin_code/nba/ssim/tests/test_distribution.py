@@ -0,0 +1,54 @@
+"""Test over/under probabilities from SaberSim distributions."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluefin_code.nba.ssim.metrics import calculate_win_probability
+from bluefin_code.nba.ssim.metrics.distribution import count_cdf, normal_cdf, percentile_cdf, score
+
+def test_percentile_cdf_is_monotone_through_knots():
+    """Test the CDF passes through each percentile and never decreases."""
+    knots = np.array([[20.0, 25.0, 30.0, 33.0, 38.0, 44.0]])
+    levels = [0.25, 0.50, 0.75, 0.85, 0.95, 0.99]
+    for value, level in zip(knots[0], levels):
+        assert percentile_cdf(np.array([value]), knots)[0] == pytest.approx(level)
+    x = np.linspace(-5, 80, 500)
+    cdf = percentile_cdf(x, np.repeat(knots, len(x), axis=0))
+    assert (np.diff(cdf) >= 0).all()
+    assert cdf[0] == 0 and 0.999 < cdf[-1] < 1
+
+def test_count_cdf_matches_poisson_and_negative_binomial():
+    k = np.arange(6.0)
+    poisson = [sum(math.exp(-1.5) * 1.5 ** j / math.factorial(j) for j in range(int(i) + 1)) for i in k]
+    assert count_cdf(k, np.full(6, 1.5)) == pytest.approx(poisson)
+    # Negative binomial with size 1 is geometric: P(X <= k) = 1 - (mean / (1 + mean)) ** (k + 1)
+    assert count_cdf(k, np.full(6, 2.0), np.full(6, 6.0)) == pytest.approx(1 - (2 / 3) ** (k + 1))
+    assert normal_cdf(np.array([1.96]), 0.0, 1.0)[0] == pytest.approx(0.975, abs=1e-4)
+
+def test_score_whole_slate():
+    df = pd.DataFrame({
+        'market': ['pts', 'stl', 'pts', 'pts', 'reb'],
+        'line': [24.5, 0.5, 24.0, 24.5, 8.5],
+        'ss_proj': [26.0, 1.0, 26.0, 26.0, np.nan],
+        'ss_std': [6.0, 0.4, 6.0, 6.0, 2.0],
+        **{f'ss_p{p}': [v, 0.7, v, np.nan, 7.0] for p, v in
+           zip([25, 50, 75, 85, 95, 99], [21.0, 25.5, 30.0, 33.0, 37.0, 43.0])},
+    })
+    scored = score(df)
+    assert list(scored['ss_model']) == ['percentile', 'count', 'percentile', 'normal', None]
+    # 25 or more points, between the 50th (25.5) and 25th percentile knots
+    assert scored.loc[0, 'ss_p_over'] == pytest.approx(1 - (0.25 + 0.25 * 3.5 / 4.5))
+    assert scored.loc[1, 'ss_p_over'] == pytest.approx(1 - math.exp(-1.0))
+    assert scored.loc[2, 'ss_p_push'] > 0
+    assert scored.loc[:3, ['ss_p_over', 'ss_p_under', 'ss_p_push']].sum(axis=1).tolist() == pytest.approx([1] * 4)
+    assert scored.loc[3, 'ss_p_over'] == pytest.approx(1 - normal_cdf(np.array([24.5]), 26.0, 6.0)[0])
+    assert np.isnan(scored.loc[4, 'ss_over'])
+
+def test_win_probability_is_over_probability():
+    assert calculate_win_probability(25.0, 22.5) == pytest.approx(1 - calculate_win_probability(25.0, 27.5))
+    assert 0.5 < calculate_win_probability(25.0, 22.5) < calculate_win_probability(25.0, 20.5) < 1
+    assert calculate_win_probability(10.0, 20.5) < 0.01
+    assert calculate_win_probability(1.0, 0.5, market='stl') == pytest.approx(1 - math.exp(-1.0))
@@ -0,0 +1,75 @@
+"""Test the correlated stat-line simulator."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluefin_code.nba.ssim.metrics.simulate import STATS, SimModel, draw, fit, over_probabilities
+
+MEANS = pd.DataFrame([[25.0, 8.0, 6.0, 1.0, 0.5, 2.5, 2.0],
+                      [12.0, 3.0, 2.0, 0.8, 0.3, 1.0, 1.5]], index=[1, 2], columns=STATS)
+
+def correlated_model(rho: float = 0.6) -> SimModel:
+    corr = np.eye(len(STATS))
+    corr[0, 1] = corr[1, 0] = corr[0, 2] = corr[2, 0] = corr[1, 2] = corr[2, 1] = rho
+    return SimModel(corr, np.array([3.0, 1.5, 1.3, 1.0, 1.0, 1.0, 1.2]))
+
+def test_draws_match_marginals_and_correlation():
+    model = correlated_model()
+    sims = draw(MEANS.to_numpy(), model, 40000, np.random.default_rng(0))
+    assert sims.shape == (2, len(STATS), 40000)
+    assert sims.mean(axis=2) == pytest.approx(MEANS.to_numpy(), rel=0.03, abs=0.02)
+    assert sims[0].var(axis=1) == pytest.approx(MEANS.iloc[0].to_numpy() * model.dispersion, rel=0.06)
+    assert np.corrcoef(sims[0, 0], sims[0, 1])[0, 1] > 0.4
+    assert abs(np.corrcoef(sims[0, 0], sims[0, 3])[0, 1]) < 0.03
+
+def test_draws_of_empty_means_are_zero():
+    means = MEANS.to_numpy().copy()
+    means[0, 3], means[1, 4] = 0.0, np.nan
+    sims = draw(means, SimModel.independent(), 5000, np.random.default_rng(2))
+    assert not sims[0, 3].any() and not sims[1, 4].any()
+    assert sims[0, 0].min() >= 0 and sims[0, 0].mean() == pytest.approx(25.0, rel=0.03)
+
+def test_over_probabilities_prices_singles_and_combos():
+    props = pd.DataFrame({
+        'player_id': [1, 1, 1, 1, 2, 3],
+        'market': ['stl', 'pra', 'pra', 'pts', 'stocks', 'pts'],
+        'line': [0.5, 38.5, 39.0, 24.5, 0.5, 10.5],
+    })
+    result = over_probabilities(props, MEANS, SimModel.independent(), draws=20000, seed=3, chunk_size=1)
+    assert result.loc[0, 'sim_p_over'] == pytest.approx(1 - math.exp(-1.0), abs=0.015)
+    assert result.loc[1, 'sim_mean'] == pytest.approx(39.0, abs=0.2)
+    assert result.loc[1, 'sim_std'] == pytest.approx(math.sqrt(39.0), rel=0.03)
+    assert result.loc[2, 'sim_p_push'] > 0
+    assert result.loc[:4, ['sim_p_over', 'sim_p_under', 'sim_p_push']].sum(axis=1).tolist() == pytest.approx([1] * 5)
+    assert result.loc[4, 'sim_p_over'] == pytest.approx(1 - math.exp(-1.1), abs=0.015)
+    assert result.loc[5, ['sim_p_over', 'sim_mean']].isna().all()
+
+    again = over_probabilities(props, MEANS, SimModel.independent(), draws=20000, seed=3, chunk_size=1)
+    pd.testing.assert_frame_equal(result, again)
+    # Correlated stats widen the combo but not the single markets
+    correlated = over_probabilities(props, MEANS, correlated_model(), draws=20000, seed=3)
+    independent = over_probabilities(props, MEANS, correlated_model(0.0), draws=20000, seed=3)
+    assert correlated.loc[1, 'sim_std'] > independent.loc[1, 'sim_std'] * 1.1
+    assert correlated.loc[3, 'sim_std'] == pytest.approx(independent.loc[3, 'sim_std'], rel=0.03)
+
+def test_fit_recovers_correlation():
+    rng = np.random.default_rng(1)
+    minutes = rng.uniform(20, 38, (30, 40))
+    shared = rng.gamma(4, 0.25, (30, 40))
+    logs = pd.DataFrame({
+        'player_id': np.repeat(np.arange(30), 40),
+        'minutes': minutes.ravel(),
+        'points': rng.poisson(minutes * 0.6 * shared).ravel(),
+        'rebounds': rng.poisson(minutes * 0.2 * shared).ravel(),
+        **{stat: rng.poisson(1.5, 1200) for stat in STATS[2:]},
+    })
+    model = fit(logs)
+    assert model.games == 1200
+    assert model.corr[0, 1] > 0.3
+    assert abs(model.corr[2, 3]) < 0.1
+    assert model.dispersion[0] > 1.5 and (model.dispersion >= 1).all()
+    with pytest.raises(ValueError):
+        fit(logs, min_games=41)
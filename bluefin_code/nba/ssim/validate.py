@@ -4,37 +4,92 @@
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Union, List, Dict
 import logging
 from pathlib import Path
-import yaml
 
-# Load config
+from bluefin_code.core.validation import Schema, ValidationReport, load_column_schema, load_yaml
+
 CONFIG_PATH = Path(__file__).parent / "config/config.yaml"
-with open(CONFIG_PATH) as f:
-    CONFIG = yaml.safe_load(f)
+COLUMNS_PATH = Path(__file__).parent / "config/columns.yaml"
+
+VALID_STATUSES = ['ACTIVE', 'OUT', 'GTD', 'QUESTIONABLE', 'PROBABLE']
+
+def get_config() -> Dict:
+    """Load config on first use."""
+    return load_yaml(str(CONFIG_PATH))
+
+@lru_cache(maxsize=None)
+def raw_schema() -> Schema:
+    """Schema for raw projection frames."""
+    config = get_config()
+    return Schema(
+        'ssim_raw',
+        required={
+            'required columns': config['required_fields'],
+            'required player fields': config['required_player_fields'],
+        },
+        allowed={'status': VALID_STATUSES},
+    )
+
+@lru_cache(maxsize=None)
+def player_schema() -> Schema:
+    """Schema for player-level projection sanity checks."""
+    return Schema(
+        'ssim_player',
+        ranges={
+            'fg_pct': (0, 1),
+            'three_pt_pct': (0, 1),
+            'ft_pct': (0, 1),
+            'points': (None, 100),
+            'rebounds': (None, 40),
+            'assists': (None, 30),
+        },
+    )
+
+def output_schema() -> Schema:
+    """Schema for processed output, compiled from columns.yaml."""
+    return load_column_schema(
+        str(COLUMNS_PATH), 'ssim_output',
+        required_groups=(('core', 'core field'), ('props', 'calculated field'),
+                         ('percentiles', 'percentile field')),
+        ordering_groups=('percentiles',),
+    )
+
+def check_raw_data(df: pd.DataFrame) -> ValidationReport:
+    """Validate raw data and return a structured report."""
+    return raw_schema().validate(df)
+
+def check_player_data(df: pd.DataFrame) -> ValidationReport:
+    """Validate player stats and return a structured report.
+
+    Projection ceilings and impossible stat combinations are warnings;
+    invalid percentages are errors.
+    """
+    report = player_schema().validate(df)
+    soft = report.errors['column'].isin(['points', 'rebounds', 'assists'])
+    report.errors.loc[soft, 'severity'] = 'warning'
+
+    extra = []
+    for stat in ['assists', 'blocks']:
+        if stat in df.columns and 'points' in df.columns:
+            count = int((df[stat] > df['points']).sum())
+            if count:
+                extra.append(('relation', stat, 'warning', count,
+                              f"Found players with more {stat} than points"))
+    if extra:
+        report.errors = pd.concat([report.errors, pd.DataFrame(extra, columns=report.errors.columns)],
+                                  ignore_index=True)
+    return report
+
+def check_output_format(df: pd.DataFrame) -> ValidationReport:
+    """Validate processed output and return a structured report."""
+    return output_schema().validate(df)
 
 def validate_raw_data(df: pd.DataFrame) -> bool:
     """Validate raw data structure and basic content."""
-    required_fields = CONFIG['required_fields']
-    required_player_fields = CONFIG['required_player_fields']
-    
-    # Check required fields
-    missing_fields = [f for f in required_fields if f not in df.columns]
-    if missing_fields:
-        raise ValueError(f"Missing required columns: {missing_fields}")
-    
-    # Check player fields
-    missing_player_fields = [f for f in required_player_fields if f not in df.columns]
-    if missing_player_fields:
-        raise ValueError(f"Missing required player fields: {missing_player_fields}")
-    
-    # Validate status values
-    valid_statuses = ['ACTIVE', 'OUT', 'GTD', 'QUESTIONABLE', 'PROBABLE']
-    invalid_status = ~df['status'].isin(valid_statuses)
-    if invalid_status.any():
-        raise ValueError(f"Invalid status values: {df.loc[invalid_status, 'status'].unique()}")
-    
+    check_raw_data(df).raise_for_errors()
     return True
 
 def validate_game_data(df: pd.DataFrame) -> bool:
@@ -50,7 +105,7 @@ def validate_game_data(df: pd.DataFrame) -> bool:
         raise ValueError("Invalid game times found")
     
     # Check team codes
-    valid_teams = set(CONFIG['team_codes'].values())
+    valid_teams = set(get_config()['team_codes'].values())
     invalid_home = ~df['home_team'].isin(valid_teams)
     invalid_away = ~df['away_team'].isin(valid_teams)
     
@@ -61,63 +116,12 @@ def validate_game_data(df: pd.DataFrame) -> bool:
 
 def validate_player_data(df: pd.DataFrame) -> bool:
     """Validate player-level statistics."""
-    # Check for impossible stats
-    if (df['assists'] > df['points']).any():
-        logging.warning("Found players with more assists than points")
-    
-    if (df['blocks'] > df['points']).any():
-        logging.warning("Found players with more blocks than points")
-    
-    # Validate percentages
-    pct_cols = ['fg_pct', 'three_pt_pct', 'ft_pct']
-    for col in pct_cols:
-        if col in df.columns:
-            invalid_pct = (df[col] < 0) | (df[col] > 1)
-            if invalid_pct.any():
-                raise ValueError(f"Invalid {col} values found")
-    
-    # Check for unreasonable projections
-    if (df['points'] > 100).any():
-        logging.warning("Found unusually high point projections")
-    
-    if (df['rebounds'] > 40).any():
-        logging.warning("Found unusually high rebound projections")
-    
-    if (df['assists'] > 30).any():
-        logging.warning("Found unusually high assist projections")
-    
+    report = check_player_data(df)
+    report.log()
+    report.raise_for_errors()
     return True
 
 def validate_output_format(df: pd.DataFrame) -> bool:
     """Validate the final output format."""
-    # Load column definitions
-    with open(Path(__file__).parent / "config/columns.yaml") as f:
-        COLUMNS = yaml.safe_load(f)
-    
-    # Check core fields
-    for field, dtype in COLUMNS['core'].items():
-        if field not in df.columns:
-            raise ValueError(f"Missing core field: {field}")
-        if not pd.api.types.is_dtype_equal(df[field].dtype, dtype):
-            raise ValueError(f"Invalid dtype for {field}: expected {dtype}, got {df[field].dtype}")
-    
-    # Check calculated fields
-    for field in COLUMNS['props']:
-        if field not in df.columns:
-            raise ValueError(f"Missing calculated field: {field}")
-    
-    # Validate percentiles
-    for field in COLUMNS['percentiles']:
-        if field not in df.columns:
-            raise ValueError(f"Missing percentile field: {field}")
-        
-        # Check percentile ordering
-        base = field.split('_')[0]
-        p25 = f"{base}_25"
-        p50 = f"{base}_50"
-        p75 = f"{base}_75"
-        
-        if not (df[p25] <= df[p50]).all() or not (df[p50] <= df[p75]).all():
-            raise ValueError(f"Invalid percentile ordering for {base}")
-    
-    return True 
\ No newline at end of file
+    check_output_format(df).raise_for_errors()
+    return True
@@ -0,0 +1 @@
+"""NBA tests package."""
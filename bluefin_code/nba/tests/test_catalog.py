@@ -0,0 +1,61 @@
+"""Test the data catalog."""
+
+import os
+
+from .. import catalog
+
+def write(path, text="a,b\n1,2\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+def test_classify(tmp_path):
+    """Test catalog identity comes from the data layout."""
+    nba = tmp_path / "bluefin_data" / "nba"
+    rotation = catalog.classify(nba / "nba_com/gamerotation/raw/2023-10/22300001_home.csv",
+                                {'0022300001': '2023-10-24'})
+    assert rotation == ('nba_com', 'gamerotation', 'raw', 'home', '0022300001', '2023-10-24')
+    assert catalog.classify(nba / "nba_com/playergamelog/processed/2023-24/gamelog_101108_2023-24.csv") == \
+        ('nba_com', 'playergamelog', 'processed', 'gamelog', '101108_2023-24', None)
+    assert catalog.classify(nba / "bettingpros/raw/2024-11/2024-11-01_dk.json") == \
+        ('bettingpros', 'props', 'raw', '', 'dk', '2024-11-01')
+    assert catalog.classify(nba / "ssim/raw/NBA_2024-11-01_raw.json").date == '2024-11-01'
+    assert catalog.classify(nba / "bettingpros/cache/2024-11-01_dk_cache.json") is None
+    assert catalog.classify(tmp_path / "elsewhere.csv") is None
+
+def test_scan_record_and_missing(tmp_path):
+    """Test incremental scans, collector records and the missing report."""
+    nba, db = tmp_path / "bluefin_data" / "nba", tmp_path / "catalog.sqlite"
+    dates = {'0022400001': '2024-11-01', '0022400002': '2024-11-01'}
+    rotation = write(nba / "nba_com/gamerotation/processed/2024-11/rotation_22400001.csv")
+    write(nba / "bettingpros/raw/2024-11/2024-11-01_dk.json", "{}")
+
+    assert catalog.scan(nba, db, dates) == {'updated': 2, 'unchanged': 0, 'removed': 0}
+    assert catalog.scan(nba, db, dates)['unchanged'] == 2
+    assert catalog.has('nba_com', 'gamerotation', '22400001', kind='processed', db_path=db)
+    assert catalog.query("SELECT rows FROM artifacts WHERE tbl = 'rotation'", db_path=db)['rows'][0] == 1
+
+    missing = catalog.missing('2024-11-01', list(dates), ['dk', 'fd'], db_path=db)
+    assert ('gamerotation', 'processed', '0022400001') not in set(zip(missing['endpoint'], missing['kind'], missing['key']))
+    assert ('gamerotation', 'processed', '0022400002') in set(zip(missing['endpoint'], missing['kind'], missing['key']))
+    assert missing.loc[missing['source'] == 'bettingpros', 'key'].tolist() == ['fd', 'events']
+
+    # A collector write is visible without another scan
+    line = write(nba / "nba_com/boxscoresummaryv2/raw/2024-11/0022400002_line.csv")
+    assert catalog.record(line, '2024-11-01', rows=2, db_path=db).key == '0022400002'
+    assert catalog.has('nba_com', 'boxscoresummaryv2', '0022400002', date='2024-11-01', db_path=db)
+
+    os.remove(rotation)
+    assert catalog.scan(nba, db, dates)['removed'] == 1
+    assert not catalog.has('nba_com', 'gamerotation', '0022400001', db_path=db)
+
+    # Files removed outside the collectors (dedupe, reorganize) are not reported as collected
+    os.remove(line)
+    assert not catalog.has('nba_com', 'boxscoresummaryv2', '0022400002', db_path=db)
+    assert catalog.query("SELECT COUNT(*) AS n FROM artifacts WHERE key = '0022400002'", db_path=db)['n'][0] == 0
+
+    # missing confirms files too, in one query per date
+    os.remove(nba / "bettingpros/raw/2024-11/2024-11-01_dk.json")
+    missing = catalog.missing('2024-11-01', [], ['dk', 'fd'], db_path=db)
+    assert missing['key'].tolist() == ['dk', 'fd', 'events', '2024-11-01']
+    assert catalog.connect(db) is catalog.connect(db)
@@ -0,0 +1,112 @@
+"""Test poll scheduling, conditional fetches and status output."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from .. import poller
+
+NOW = datetime(2024, 12, 6, 22, 0, tzinfo=timezone.utc)
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, body=b'{}', headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+class FakeSession:
+    """Replays queued responses and records request headers."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent.append(headers)
+        return self.responses.pop(0)
+
+@pytest.mark.parametrize('minutes, expected', [
+    (15, 60),
+    (90, 180),
+    (300, 600),
+    (600, poller.IDLE_INTERVAL),
+    (-30, poller.DONE_INTERVAL),
+])
+def test_poll_interval(minutes, expected):
+    """Test interval tightens toward tip-off."""
+    tipoffs = [NOW + timedelta(minutes=minutes)]
+    assert poller.poll_interval(tipoffs, NOW) == expected
+    assert poller.poll_interval([], NOW) == poller.IDLE_INTERVAL
+
+def test_conditional_get():
+    """Test ETag reuse, 304 handling and hash fallback."""
+    state = poller.SourceState('test')
+    session = FakeSession([
+        FakeResponse(body=b'{"props": [1]}', headers={'ETag': '"v1"'}),
+        FakeResponse(status_code=304),
+        FakeResponse(body=b'{"props": [1]}', headers={'ETag': '"v1"'}),
+        FakeResponse(body=b'{"props": [2]}', headers={'ETag': '"v2"'}),
+    ])
+
+    assert poller.conditional_get(session, 'url', state) == {'props': [1]}
+    assert poller.conditional_get(session, 'url', state) is None
+    assert session.sent[1]['If-None-Match'] == '"v1"'
+    assert poller.conditional_get(session, 'url', state) is None  # Same body, no 304
+    assert poller.conditional_get(session, 'url', state) == {'props': [2]}
+    assert state.etag == '"v2"'
+
+def test_write_status(tmp_path, monkeypatch):
+    """Test status file reports lag per source."""
+    monkeypatch.setattr(poller, 'DATA_ROOT', tmp_path)
+    monkeypatch.setattr(poller, 'utcnow', lambda: NOW)
+
+    state = poller.PollerState(date='2024-12-06', tipoffs=poller.parse_tipoffs([
+        {'scheduled': '2024-12-07T00:00:00Z'}, {'scheduled': None},
+    ]))
+    state.source('sabersim').last_poll = (NOW - timedelta(seconds=90)).isoformat()
+    poller.write_status(state)
+
+    status = json.loads(poller.get_status_path().read_text())
+    assert status['next_tipoff'] == '2024-12-07T00:00:00+00:00'
+    assert status['sources']['sabersim']['lag_seconds'] == 90
+
+def test_book_errors_are_isolated(monkeypatch):
+    """Test a failing book is recorded on its own state and the rest are polled."""
+    from bluefin_code.nba.bettingpros.fetch import create_default_config
+
+    books = [book.abbreviation for book in create_default_config().sportsbooks]
+    failing = books[0]
+
+    def fake_get(session, url, state, params=None, headers=None):
+        if state.name == f"bettingpros:{failing}":
+            raise ConnectionError('reset')
+        return None
+    monkeypatch.setattr(poller, 'conditional_get', fake_get)
+
+    state = poller.PollerState(date='2024-12-06')
+    assert poller.poll_bettingpros(state, session=None) == 0
+    assert state.source(f"bettingpros:{failing}").errors == 1
+    assert 'reset' in state.source(f"bettingpros:{failing}").last_error
+    assert all(state.source(f"bettingpros:{book}").polls == 1 for book in books[1:])
+
+def test_failed_events_poll_is_not_counted(monkeypatch):
+    """Test a failed events request counts as an error, not a poll."""
+    def fake_get(session, url, state, params=None, headers=None):
+        if state.name == 'bettingpros:events':
+            raise ConnectionError('timeout')
+        return None
+    monkeypatch.setattr(poller, 'conditional_get', fake_get)
+
+    state = poller.PollerState(date='2024-12-06')
+    poller.poll_bettingpros(state, session=None)
+    events = state.source('bettingpros:events')
+    assert (events.polls, events.errors, events.last_poll) == (0, 1, None)
@@ -0,0 +1,76 @@
+"""Test the content-addressed raw payload store."""
+
+import json
+
+import pytest
+
+from .. import catalog, rawstore
+from ..bench import synthetic
+from ..ssim import process as ssim_process
+
+DATE = '2024-12-06'
+
+@pytest.fixture
+def nba_dir(tmp_path):
+    """An empty bluefin_data/nba tree."""
+    path = tmp_path / "bluefin_data" / "nba"
+    path.mkdir(parents=True)
+    return path
+
+def test_save_load_dedupe(nba_dir):
+    """Test round trips, dedupe of repeated payloads and volatile metadata."""
+    book = nba_dir / "bettingpros" / "raw" / "2024-12" / f"{DATE}_dk.json"
+    props = {'props': [{'market_id': 156, 'line': 24.5}]}
+    first = rawstore.save_json(book, props)
+    again = rawstore.save_json(book, props)
+    assert first['new'] and not again['new'] and first['hash'] == again['hash']
+    assert not book.exists() and rawstore.exists(book)
+    assert rawstore.load_json(book) == props
+    assert rawstore.stats(nba_dir)['blobs'] == 1
+
+    # Same projections fetched twice differ only in metadata
+    ssim = nba_dir / "ssim" / "raw" / "2024-12" / f"NBA_{DATE}_raw.json"
+    for stamp in ['10:00', '10:05']:
+        entry = rawstore.save_json(ssim, {'players': [{'name': 'A'}], 'metadata': {'fetch_timestamp': stamp}})
+    assert not entry['new']
+    assert rawstore.load_json(ssim)['metadata'] == {'fetch_timestamp': '10:05'}
+    assert rawstore.glob(ssim.parent.parent, "*/NBA_*_raw.json") == [ssim]
+    stats = rawstore.stats(nba_dir)
+    assert (stats['files'], stats['blobs']) == (2, 2)
+
+def test_plain_files_and_migrate(nba_dir, tmp_path):
+    """Test unmigrated files still load, migrate moves them, and other paths stay plain."""
+    events = nba_dir / "bettingpros" / "raw" / "2024-12" / f"{DATE}_events.json"
+    events.parent.mkdir(parents=True)
+    events.write_text(json.dumps({'events': [{'home': 'BOS', 'visitor': 'NYK'}]}))
+    assert rawstore.lookup(events) is None
+    assert rawstore.load_json(events)['events'][0]['home'] == 'BOS'
+
+    counts = rawstore.migrate(nba_dir)
+    assert counts['files'] == 1 and not events.exists()
+    assert rawstore.load_json(events)['events'][0]['home'] == 'BOS'
+
+    db = tmp_path / "catalog.sqlite"
+    assert catalog.record(events, rows=1, db_path=db).key == 'events'
+    assert catalog.has('bettingpros', 'events', 'events', date=DATE, db_path=db)
+    assert catalog.scan(nba_dir, db_path=db, game_dates={})['removed'] == 0
+    assert catalog.has('bettingpros', 'events', 'events', date=DATE, db_path=db)
+
+    outside = tmp_path / "replay" / "bettingpros" / "raw" / f"{DATE}_dk.json"
+    rawstore.save_json(outside, {'props': []})
+    assert json.loads(outside.read_text()) == {'props': []}
+    with pytest.raises(FileNotFoundError):
+        rawstore.load_json(tmp_path / "missing.json")
+
+def test_process_store_only_date(nba_dir, monkeypatch):
+    """Test SaberSim processing reads a raw payload that only exists in the store."""
+    monkeypatch.setattr(ssim_process, 'DATA_ROOT', nba_dir.parent)
+    raw_file = ssim_process.get_raw_file_path(DATE)
+    payload = synthetic.ssim_payload(synthetic.slate(0.1), DATE)
+    rawstore.save_json(raw_file, payload)
+    assert not raw_file.exists()
+
+    ssim_process.process_date(DATE)
+    processed = ssim_process.get_processed_file_path(DATE)
+    assert processed.exists()
+    assert len(processed.read_text().splitlines()) == len(payload['players']) + 1
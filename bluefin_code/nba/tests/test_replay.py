@@ -0,0 +1,90 @@
+"""Test the offline replay server."""
+
+import gzip
+import json
+
+import pytest
+import requests
+from nba_api.stats.endpoints import boxscoreadvancedv2, gamerotation
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from .. import replay, urls
+from ..bettingpros.fetch import create_default_config
+
+DATE = '2024-12-06'
+GAME_ID = '0022400321'
+
+@pytest.fixture
+def data_root(tmp_path):
+    """Recorded BettingPros, SaberSim and NBA.com responses for one date."""
+    bpro = tmp_path / "bettingpros" / "raw" / "2024-12"
+    bpro.mkdir(parents=True)
+    (bpro / f"{DATE}_dk.json").write_text(json.dumps({'props': [{'market_id': 151}]}))
+    (bpro / f"{DATE}_events.json").write_text(json.dumps({'events': [{'id': 1}]}))
+
+    ssim = tmp_path / "ssim" / "raw" / "2024-12"
+    ssim.mkdir(parents=True)
+    (ssim / f"NBA_{DATE}_raw.json").write_text(json.dumps({'players': [{'name': 'A'}], 'timestamp': '1'}))
+
+    archive = tmp_path / "nba_com" / "boxscoreadvancedv2" / "archive" / "2024-12"
+    archive.mkdir(parents=True)
+    response = {'resultSets': [{'name': 'PlayerStats', 'headers': ['GAME_ID', 'PLAYER_ID'],
+                                'rowSet': [[GAME_ID, 1], [GAME_ID, 2]]},
+                               {'name': 'TeamStats', 'headers': ['GAME_ID'], 'rowSet': []}]}
+    with gzip.open(archive / f"{GAME_ID}.json.gz", 'wt') as f:
+        json.dump({'response': response}, f)
+
+    rotation = tmp_path / "nba_com" / "gamerotation" / "raw" / "2024-12"
+    rotation.mkdir(parents=True)
+    for side, player in [('home', 1), ('away', 2)]:
+        (rotation / f"{GAME_ID}_{side}.csv").write_text(f"GAME_ID,PERSON_ID\n{GAME_ID},{player}\n")
+    return tmp_path
+
+def test_replays_each_source(data_root, monkeypatch):
+    """Test fetchers pointed at the server get the recorded responses."""
+    with replay.serve(root=data_root) as server:
+        for key, value in server.env().items():
+            monkeypatch.setenv(key, value)
+
+        config = create_default_config()
+        assert config.base_url == server.url + replay.BPRO_PATH
+        props = requests.get(config.base_url, params={'date': DATE, 'book_id': '12'})
+        assert props.json() == {'props': [{'market_id': 151}]}
+        events = requests.get(config.base_url, params={'date': DATE, 'limit': '1'})
+        assert events.json()['events'] == [{'id': 1}]
+        again = requests.get(config.base_url, params={'date': DATE, 'book_id': '12'},
+                             headers={'If-None-Match': props.headers['ETag']})
+        assert again.status_code == 304
+
+        ssim = requests.post(urls.ssim_url('https://live.invalid'), json={'date': '20241206'})
+        assert ssim.json()['players'] == [{'name': 'A'}]
+
+        monkeypatch.setattr(NBAStatsHTTP, 'base_url', NBAStatsHTTP.base_url)
+        urls.apply_nba_url()
+        frames = boxscoreadvancedv2.BoxScoreAdvancedV2(game_id=GAME_ID).get_data_frames()
+        assert frames[0]['PLAYER_ID'].tolist() == [1, 2]
+        rotation = gamerotation.GameRotation(game_id=GAME_ID).get_normalized_dict()
+        assert [row['PERSON_ID'] for row in rotation['HomeTeam']] == [1]
+
+        missing = requests.get(server.url + replay.NBA_PATH + 'boxscoreadvancedv2', params={'GameID': '22400999'})
+        assert missing.status_code == 404
+        stats = requests.get(server.url + replay.STATS_PATH).json()
+        assert stats['bettingpros.requests'] == 3
+        assert stats['nba.missing'] == 1
+
+def test_fault_injection(data_root):
+    """Test injected errors, 429s and rate limiting."""
+    params = {'date': DATE, 'book_id': '12'}
+    with replay.serve(replay.ReplayConfig(error_rate=1.0), data_root) as server:
+        assert requests.get(server.url + replay.BPRO_PATH, params=params).status_code == 503
+
+    with replay.serve(replay.ReplayConfig(throttle_rate=1.0), data_root) as server:
+        response = requests.get(server.url + replay.BPRO_PATH, params=params)
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '1'
+
+    with replay.serve(replay.ReplayConfig(rate_limit=0.5, burst=2), data_root) as server:
+        url = server.url + replay.BPRO_PATH
+        codes = [requests.get(url, params=params).status_code for _ in range(3)]
+        assert codes == [200, 200, 429]
+        assert requests.get(server.url + replay.STATS_PATH).json()['bettingpros.rate_limited'] == 1
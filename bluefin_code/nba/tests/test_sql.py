@@ -0,0 +1,76 @@
+"""Test the embedded SQL layer."""
+
+import pandas as pd
+import pytest
+
+from .. import sql
+
+@pytest.fixture
+def data_root(tmp_path):
+    """Two months of advanced box scores plus a game-id index."""
+    advanced = tmp_path / "nba_com" / "boxscoreadvancedv2" / "processed"
+    for month, game_id, pace in [('2023-11', 22300101, 98.5), ('2023-12', 22300301, 101.0)]:
+        (advanced / month).mkdir(parents=True)
+        pd.DataFrame({'game_id': [game_id, game_id], 'team_id': [1, 2], 'pace': [pace, pace]}) \
+            .to_csv(advanced / month / f"advanced_{game_id}.csv", index=False)
+    index = tmp_path / "nba_com" / "game_ids"
+    index.mkdir(parents=True)
+    pd.DataFrame({'game_id': ['0022300101', '0022300301'], 'game_date': ['2023-11-10', '2023-12-10']}) \
+        .to_csv(index / "games_2023_24.csv", index=False)
+    return tmp_path
+
+def test_partition_pruning(data_root):
+    """Test month folders outside the range are never read."""
+    dataset = sql.DATASETS['advanced']
+    assert len(sql.files(dataset, root=data_root)) == 2
+    assert [p.parent.name for p in sql.files(dataset, '2023-12-01', '2023-12-31', data_root)] == ['2023-12']
+    assert sql.files(sql.DATASETS['game_ids'], '2022-11-01', '2022-11-30', data_root) == []
+    assert len(sql.files(sql.DATASETS['game_ids'], '2024-01-01', '2024-01-01', data_root)) == 1
+
+def test_season_partitions(tmp_path):
+    """Test season folders are pruned by season, not read as months."""
+    gamelogs = tmp_path / "nba_com" / "playergamelog" / "processed"
+    for season, game_id in [('2023-24', 22300101), ('2024-25', 22400301)]:
+        (gamelogs / season).mkdir(parents=True)
+        pd.DataFrame({'game_id': [game_id], 'pts': [20]}) \
+            .to_csv(gamelogs / season / f"gamelog_{game_id}.csv", index=False)
+    dataset = sql.DATASETS['gamelogs']
+    assert [p.parent.name for p in sql.files(dataset, '2024-12-06', '2024-12-06', tmp_path)] == ['2024-25']
+    assert [p.parent.name for p in sql.files(dataset, '2024-06-01', '2024-07-31', tmp_path)] == ['2023-24', '2024-25']
+    assert sql._in_range('2024-25', '2024-12-06', '2024-12-06')
+    assert not sql._in_range('2024-11', '2024-12-06', '2024-12-06')
+    assert sql._in_range('2023_24', '2024-01-01', None)
+
+def test_join_on_normalized_game_ids(data_root):
+    """Test short and canonical game ids join across datasets."""
+    df = sql.query("SELECT g.game_date, COUNT(*) AS teams, MAX(a.pace) AS pace "
+                   "FROM advanced a JOIN game_ids g USING (game_id) GROUP BY ALL ORDER BY 1",
+                   root=data_root)
+    assert df['game_date'].astype(str).tolist() == ['2023-11-10', '2023-12-10']
+    assert df['teams'].tolist() == [2, 2]
+
+    df = sql.query("SELECT game_id FROM advanced", start='2023-11-01', end='2023-11-30', root=data_root)
+    assert set(df['game_id']) == {'0022300101'}
+
+def test_props_file_shapes(tmp_path):
+    """Test slim {date}.csv props fill dates without a props_ export and share its columns."""
+    month = tmp_path / "bettingpros" / "processed" / "2024-12"
+    month.mkdir(parents=True)
+    pd.DataFrame({'player': ['A'], 'prop_type': ['pts'], 'line': [20.5], 'sportsbook': ['fd']}) \
+        .to_csv(month / "props_2024-12-04.csv", index=False)
+    for date in ['2024-12-04', '2024-12-05']:
+        pd.DataFrame({'date': [date], 'player': ['B'], 'market': ['reb'], 'line': [7.5], 'book': ['FD']}) \
+            .to_csv(month / f"{date}.csv", index=False)
+
+    dataset = sql.DATASETS['props']
+    assert [p.name for p in sql.files(dataset, root=tmp_path)] == ['2024-12-05.csv', 'props_2024-12-04.csv']
+    assert [p.name for p in sql.files(dataset, '2024-12-05', '2024-12-05', tmp_path)] == ['2024-12-05.csv']
+
+    df = sql.query("SELECT CAST(date AS VARCHAR) AS date, player, market, book, line "
+                   "FROM props ORDER BY player", root=tmp_path)
+    assert df.to_dict('records') == [
+        {'date': '2024-12-04', 'player': 'A', 'market': 'pts', 'book': 'fd', 'line': 20.5},
+        {'date': '2024-12-05', 'player': 'B', 'market': 'reb', 'book': 'fd', 'line': 7.5},
+    ]
+    df = sql.query("SELECT CAST(date AS VARCHAR) AS date FROM props", '2024-12-04', '2024-12-04', root=tmp_path)
+    assert df['date'].tolist() == ['2024-12-04']
@@ -0,0 +1,47 @@
+"""Base URLs of the upstream APIs, overridable from the environment.
+
+Setting an override points a fetcher at another server, e.g. the offline
+replay server (``bluefin_code.nba.replay``)::
+
+    BLUEFIN_BPRO_URL=http://127.0.0.1:8765/bettingpros/v3/props
+    BLUEFIN_SSIM_URL=http://127.0.0.1:8765/sabersim/endpoints/get_player_projections
+    BLUEFIN_NBA_URL=http://127.0.0.1:8765/nba/stats
+
+Overrides are read when a fetcher builds its config; the NBA.com override
+is applied to nba_api when ``bluefin_code.nba.nba_com`` is imported (or by
+calling ``apply_nba_url``).
+"""
+
+import os
+from typing import Optional
+
+BPRO_URL = "https://api.bettingpros.com/v3/props"
+NBA_URL = "https://stats.nba.com/stats"
+
+BPRO_URL_ENV = 'BLUEFIN_BPRO_URL'
+SSIM_URL_ENV = 'BLUEFIN_SSIM_URL'
+NBA_URL_ENV = 'BLUEFIN_NBA_URL'
+
+def bpro_url() -> str:
+    """BettingPros props endpoint."""
+    return os.environ.get(BPRO_URL_ENV) or BPRO_URL
+
+def ssim_url(default: str) -> str:
+    """SaberSim projections endpoint (``default`` comes from the SaberSim config)."""
+    return os.environ.get(SSIM_URL_ENV) or default
+
+def nba_url() -> str:
+    """NBA.com stats base URL; endpoint names are appended."""
+    return (os.environ.get(NBA_URL_ENV) or NBA_URL).rstrip('/')
+
+def apply_nba_url(url: Optional[str] = None) -> None:
+    """Point nba_api stats requests at url (default: the environment override).
+
+    Does nothing, and does not import nba_api, when neither is set.
+    """
+    url = url or os.environ.get(NBA_URL_ENV)
+    if not url:
+        return
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    NBAStatsHTTP.base_url = url.rstrip('/') + '/{endpoint}'
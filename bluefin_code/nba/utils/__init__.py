@@ -1,20 +1,34 @@
 """NBA utilities module."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
-# Load configurations
 CONFIG_DIR = Path(__file__).parent
 
-with open(CONFIG_DIR / "bks_config.json") as f:
-    BOOKS_CONFIG = json.load(f)
+@lru_cache(maxsize=None)
+def books_config() -> dict:
+    """Sportsbook config, loaded on first use."""
+    with open(CONFIG_DIR / "bks_config.json") as f:
+        return json.load(f)
 
-with open(CONFIG_DIR / "plyr_mrkts.json") as f:
-    MARKETS_CONFIG = json.load(f)
+@lru_cache(maxsize=None)
+def markets_config() -> dict:
+    """Player market config, loaded on first use."""
+    with open(CONFIG_DIR / "plyr_mrkts.json") as f:
+        return json.load(f)
+
+# BOOKS_CONFIG / MARKETS_CONFIG stay importable but are read lazily
+_CONFIGS = {'BOOKS_CONFIG': books_config, 'MARKETS_CONFIG': markets_config}
+
+def __getattr__(name: str):
+    if name in _CONFIGS:
+        return _CONFIGS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_market_name(market_id: str) -> str:
     """Get standardized market name from market ID."""
-    for market in MARKETS_CONFIG['markets'].values():
+    for market in markets_config()['markets'].values():
         if market['market_id'] == market_id:
             return market['abbreviation']
     return 'unknown'
@@ -22,6 +36,6 @@ def get_market_name(market_id: str) -> str:
 def get_book_name(book: str) -> str:
     """Get standardized book name."""
     book = book.lower()
-    if book in BOOKS_CONFIG['sportsbooks']:
-        return BOOKS_CONFIG['sportsbooks'][book]['abbreviation']
-    return book 
\ No newline at end of file
+    if book in books_config()['sportsbooks']:
+        return books_config()['sportsbooks'][book]['abbreviation']
+    return book
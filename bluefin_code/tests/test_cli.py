@@ -0,0 +1,72 @@
+"""Test the bluefin command."""
+
+import subprocess
+import sys
+
+import pytest
+
+from .. import cli
+
+def test_help_skips_heavy_imports():
+    """Test parsing and --help import none of the pipeline dependencies."""
+    code = ("import sys; from bluefin_code import cli; cli.build_parser().parse_args(['fetch']); "
+            "print(sorted(m for m in ('pandas', 'nba_api', 'requests', 'yaml', 'duckdb') if m in sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == '[]'
+
+def test_backfill_runs_each_date(monkeypatch, tmp_path):
+    """Test sources default to all and a failing date does not stop the rest."""
+    from bluefin_code.core.instrument import stages
+
+    monkeypatch.setattr(stages, 'RUNS_DIR', tmp_path)
+    calls = []
+    monkeypatch.setattr(cli, 'FETCHERS', {s: (lambda d, f, s=s: calls.append(('fetch', s, d))) for s in cli.SOURCES})
+
+    def process(date, force):
+        if date == '2024-11-02':
+            raise RuntimeError('boom')
+        calls.append(('process', date))
+    monkeypatch.setattr(cli, 'PROCESSORS', {s: process for s in cli.SOURCES})
+
+    assert cli.main(['backfill', 'ssim', '--start', '2024-11-01', '--end', '2024-11-03']) == 1
+    assert calls == [('fetch', 'ssim', '2024-11-01'), ('process', '2024-11-01'),
+                     ('fetch', 'ssim', '2024-11-02'), ('fetch', 'ssim', '2024-11-03'), ('process', '2024-11-03')]
+    events = stages.load_events(stages.run_files(tmp_path))
+    assert [e['event'] for e in events if e['event'] != 'stage'] == ['start', 'end']
+    assert events[-1]['status'] == 'failed'
+    assert [e['key'] for e in events if e.get('stage') == 'process'] == ['2024-11-01', '2024-11-02', '2024-11-03']
+    assert cli.build_parser().parse_args(['fetch']).sources == []
+    with pytest.raises(SystemExit):
+        cli.main(['fetch', 'nosuch'])
+
+def test_failed_source_does_not_stop_others(monkeypatch, tmp_path):
+    """Test a failed fetch skips only that source's processing for the date."""
+    from bluefin_code.core.instrument import stages
+
+    monkeypatch.setattr(stages, 'RUNS_DIR', tmp_path)
+    calls = []
+
+    def fetch(date, force, source):
+        if source == 'bpro':
+            raise RuntimeError('boom')
+        calls.append(('fetch', source))
+    monkeypatch.setattr(cli, 'FETCHERS', {s: (lambda d, f, s=s: fetch(d, f, s)) for s in cli.SOURCES})
+    monkeypatch.setattr(cli, 'PROCESSORS', {s: (lambda d, f, s=s: calls.append(('process', s))) for s in cli.SOURCES})
+
+    assert cli.main(['backfill', 'bpro', 'ssim', '--start', '2024-11-01', '--end', '2024-11-01']) == 1
+    assert calls == [('fetch', 'ssim'), ('process', 'ssim')]
+
+def test_fetch_ssim_honors_force(monkeypatch):
+    """Test an already fetched SaberSim date is only refetched with --force."""
+    from bluefin_code.nba import rawstore
+    from bluefin_code.nba.ssim import fetch
+
+    fetched = []
+    monkeypatch.setattr(rawstore, 'exists', lambda path: True)
+    monkeypatch.setattr(fetch, 'fetch_projections', lambda date: fetched.append(date) or {'players': [{}]})
+    monkeypatch.setattr(fetch, 'save_raw_data', lambda data, date: None)
+
+    cli.fetch_ssim('2024-12-06', force=False)
+    assert fetched == []
+    cli.fetch_ssim('2024-12-06', force=True)
+    assert fetched == ['2024-12-06']
@@ -6,8 +6,8 @@ from datetime import datetime
 from pathlib import Path
 
 from bluefin_code.nba.bettingpros.run_bpro_pipeline import run_pipeline as run_bpro_pipeline
-from bluefin_code.nba.ssim.fetch import fetch_projections
-from bluefin_code.nba.ssim.process import process_data
+from bluefin_code.nba.ssim.fetch import fetch_projections, save_raw_data
+from bluefin_code.nba.ssim.process import process_date
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +18,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 def main():
+    """Run one update; see bluefin_code/nba/poller.py for continuous polling."""
     parser = argparse.ArgumentParser()
     parser.add_argument('--date', type=str, help='Date in YYYY-MM-DD format')
     parser.add_argument('--force', action='store_true', help='Force update even if no changes')
@@ -38,11 +39,11 @@ def main():
         # Run SaberSim pipeline
         logger.info("\n=== Running SaberSim Pipeline ===")
         # First fetch new projections
-        data = fetch_projections()
+        data = fetch_projections(date.strftime('%Y%m%d'))
         if data:
+            save_raw_data(data, date_str)
             logger.info("✓ Projections updated")
-            # Then process the data - note that process_data only takes the data argument
-            process_data(data)
+            process_date(date_str)
             logger.info("✓ Processing complete")
         else:
             logger.error("Failed to fetch projections")